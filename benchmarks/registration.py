@@ -0,0 +1,56 @@
+"""Measure addon import/registration time and registered class count.
+
+Run from the repository root with:
+    blender --background --factory-startup --python benchmarks/registration.py
+"""
+
+
+import importlib
+import os
+import sys
+import time
+
+import bpy
+
+
+REPEATS = 5
+
+
+def main():
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+    start = time.perf_counter()
+    addon = importlib.import_module('mesh_mesh_align_plus')
+    import_time = time.perf_counter() - start
+    maplus_sys = importlib.import_module('mesh_mesh_align_plus.utils.system')
+
+    register_times = []
+    unregister_times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        addon.register()
+        register_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        addon.unregister()
+        unregister_times.append(time.perf_counter() - start)
+
+    # Older versions of the addon only have the static classes tuple
+    if hasattr(maplus_sys, 'get_classes'):
+        class_count = len(maplus_sys.get_classes())
+    else:
+        class_count = len(maplus_sys.classes)
+
+    print('Mesh Align Plus registration benchmark (Blender %s)' % (
+        bpy.app.version_string
+    ))
+    print('  registered classes: %d' % class_count)
+    print('  import:             %.1f ms' % (import_time * 1000))
+    print('  register (best):    %.1f ms' % (min(register_times) * 1000))
+    print('  register (first):   %.1f ms' % (register_times[0] * 1000))
+    print('  unregister (best):  %.1f ms' % (min(unregister_times) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@ import bpy
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
+import mesh_mesh_align_plus.utils.storage as maplus_storage
 
 
 # Custom list, for displaying combined list of all primitives (Used at top
@@ -36,6 +37,8 @@ class MAPLUS_UL_MAPlusList(bpy.types.UIList):
             layout.label(text=item.name, icon="NODETREE")
         elif item.kind == 'TRANSFORMATION':
             layout.label(text=item.name, icon="GRAPH")
+        if item.needs_update:
+            layout.label(text="", icon="ERROR")
 
 
 class MAPLUS_OT_AddListItemBase(bpy.types.Operator):
@@ -48,50 +51,48 @@ class MAPLUS_OT_AddListItemBase(bpy.types.Operator):
         prims = addon_data.prim_list
 
         # Add Name.001 or Name.002 (numbers at the end if the name is
-        # already in use)
-        name_list = {n.name for n in prims}
-        name_counter = 0
-        num_postfix_group = 1
-        base_name = 'Item'
-        cur_item_name = base_name
-        num_format = '.{0:0>3}'
-        keep_naming = True
-        while keep_naming:
-            name_counter += 1
-            cur_item_name = base_name + num_format.format(str(name_counter))
-            if num_postfix_group > 16:
-                raise maplus_except.UniqueNameError('Cannot add, unique name error.')
-            if name_counter == 999:
-                name_counter = 0
-                base_name += num_format.format('1')
-                num_postfix_group += 1
-
-            if not (base_name in name_list):
-                cur_item_name = base_name
-                keep_naming = False
-                continue
-            elif cur_item_name in name_list:
-                continue
-            else:
-                keep_naming = False
-                continue
+        # already in use), the name index makes this constant time
+        cur_item_name = maplus_storage.get_name_index().allocate('Item')
 
-        new_item = addon_data.prim_list.add()
-        new_item.name = cur_item_name
-        new_item.kind = self.new_kind
+        new_item = maplus_storage.add_prim(cur_item_name, self.new_kind)
         addon_data.active_list_item = len(prims) - 1
         return new_item
 
     def execute(self, context):
-        try:
-            self.add_new_named()
-        except maplus_except.UniqueNameError:
-            self.report({'ERROR'}, 'Cannot add item, unique name error.')
-            return {'CANCELLED'}
-
+        self.add_new_named()
         return {'FINISHED'}
 
 
+def add_new_items(kind, count, base_name='Item'):
+    '''Add many items to the advanced tools list in one call.
+
+    Arguments:
+        kind
+            the kind of the new items, in ('POINT', 'LINE', 'PLANE',
+            'CALCULATION', 'TRANSFORMATION')
+        count
+            the number of items to add
+        base_name
+            new items are named base_name, base_name.001, etc.
+
+    Returns:
+        Return a list of the new items (the last one is made active).
+    '''
+    addon_data = bpy.context.scene.maplus_data
+    prims = addon_data.prim_list
+
+    new_names = maplus_storage.get_name_index().allocate_many(
+        count,
+        base_name
+    )
+    new_items = [
+        maplus_storage.add_prim(new_name, kind) for new_name in new_names
+    ]
+    if new_items:
+        addon_data.active_list_item = len(prims) - 1
+    return new_items
+
+
 class MAPLUS_OT_RemoveListItem(bpy.types.Operator):
     bl_idname = "maplus.removelistitem"
     bl_label = "Remove an item"
@@ -105,7 +106,7 @@ class MAPLUS_OT_RemoveListItem(bpy.types.Operator):
             self.report({'WARNING'}, "Nothing to remove")
             return {'CANCELLED'}
         else:
-            prims.remove(addon_data.active_list_item)
+            maplus_storage.remove_prims([addon_data.active_list_item])
             if len(prims) == 0 or addon_data.active_list_item == 0:
                 # ^ The extra or prevents act=0 from going to the else below
                 addon_data.active_list_item = 0
@@ -117,6 +118,42 @@ class MAPLUS_OT_RemoveListItem(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class MAPLUS_OT_MoveListItemBase(bpy.types.Operator):
+    bl_idname = "maplus.movelistitembase"
+    bl_label = "Move an item"
+    bl_options = {'REGISTER', 'UNDO'}
+    # Offset to move the active item by, provided by derived classes
+    offset = None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+
+        new_row = addon_data.active_list_item + self.offset
+        if len(prims) == 0 or not 0 <= new_row < len(prims):
+            return {'CANCELLED'}
+        maplus_storage.move_prim(addon_data.active_list_item, new_row)
+        addon_data.active_list_item = new_row
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_MoveListItemUp(MAPLUS_OT_MoveListItemBase):
+    bl_idname = "maplus.movelistitemup"
+    bl_label = "Move item up"
+    bl_description = "Moves the active item up in the list"
+    bl_options = {'REGISTER', 'UNDO'}
+    offset = -1
+
+
+class MAPLUS_OT_MoveListItemDown(MAPLUS_OT_MoveListItemBase):
+    bl_idname = "maplus.movelistitemdown"
+    bl_label = "Move item down"
+    bl_description = "Moves the active item down in the list"
+    bl_options = {'REGISTER', 'UNDO'}
+    offset = 1
+
+
 class MAPLUS_OT_AddNewPoint(MAPLUS_OT_AddListItemBase):
     bl_idname = "maplus.addnewpoint"
     bl_label = "Add a new item"
@@ -172,11 +209,7 @@ class MAPLUS_OT_DuplicateItemBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
-        try:
-            new_item = MAPLUS_OT_AddListItemBase.add_new_named(self)
-        except maplus_except.UniqueNameError:
-            self.report({'ERROR'}, 'Cannot add item, unique name error.')
-            return {'CANCELLED'}
+        new_item = MAPLUS_OT_AddListItemBase.add_new_named(self)
 
         new_item.kind = self.new_kind
 
@@ -203,6 +236,9 @@ class MAPLUS_OT_DuplicateItemBase(bpy.types.Operator):
         if active_item.kind in attrib_copy:
             for att in attrib_copy[active_item.kind]:
                 setattr(new_item, att, getattr(active_item, att))
+        # The copy follows the same mesh elements
+        for att in ("bind_object", "bind_element", "bind_indices"):
+            setattr(new_item, att, getattr(active_item, att))
 
         return {'FINISHED'}
 
@@ -497,6 +533,26 @@ class MAPLUS_OT_ChangeTransfToAlignPlanes(MAPLUS_OT_ChangeTransfBaseClass):
         return True
 
 
+class MAPLUS_OT_ChangeTransfToTransfStack(MAPLUS_OT_ChangeTransfBaseClass):
+    bl_idname = "maplus.changetransftotransfstack"
+    bl_label = "Change transformation to a transformation stack"
+    bl_description = (
+        "Change the transformation type to a transformation stack"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target_transf = 'TRANSFSTACK'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = bpy.context.scene.maplus_data.prim_list
+        active_item = prims[addon_data.active_list_item]
+
+        if active_item.transf_type == cls.target_transf:
+            return False
+        return True
+
+
 class MAPLUS_OT_SpecialsAddFromActiveBase(bpy.types.Operator):
     bl_idname = "maplus.specialsaddfromactivebase"
     bl_label = "Specials Menu Item Base Class, Add Geometry Item From Active"
@@ -527,11 +583,7 @@ class MAPLUS_OT_SpecialsAddFromActiveBase(bpy.types.Operator):
             return {'CANCELLED'}
 
         target_data = dict(zip(self.vert_attribs_to_set, vert_data))
-        try:
-            new_item = MAPLUS_OT_AddListItemBase.add_new_named(self)
-        except maplus_except.UniqueNameError:
-            self.report({'ERROR'}, 'Cannot add item, unique name error.')
-            return {'CANCELLED'}
+        new_item = MAPLUS_OT_AddListItemBase.add_new_named(self)
         new_item.kind = self.new_kind
 
         for key, val in target_data.items():
@@ -640,6 +692,17 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
             icon='X',
             text=""
         )
+        move_items = add_remove_data_col.column(align=True)
+        move_items.operator(
+            "maplus.movelistitemup",
+            icon='TRIA_UP',
+            text=""
+        )
+        move_items.operator(
+            "maplus.movelistitemdown",
+            icon='TRIA_DOWN',
+            text=""
+        )
 
         # Items below data management section, this consists of either the
         # empty list message or the Primitive type selector (for when the
@@ -664,6 +727,21 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                 'kind',
                 text=""
             )
+            if active_item.needs_update:
+                update_row = basic_item_attribs_col.row()
+                update_row.label(
+                    text=(
+                        "Inputs changed, re-run to apply"
+                        if active_item.kind == 'TRANSFORMATION'
+                        else "Inputs changed, result is out of date"
+                    ),
+                    icon='ERROR'
+                )
+                update_row.operator(
+                    "maplus.updatedependentitems",
+                    icon='FILE_REFRESH',
+                    text="Update"
+                )
             basic_item_attribs_col.separator()
 
             # Item-specific UI elements (primitive-specific data like coords
@@ -1046,10 +1124,13 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         'single_calc_result',
                         text="Result"
                     )
-                    # Check if the target pointer is valid, since we attempt
-                    # to access that index in prims at the beginning here.
-                    if active_item.single_calc_target < len(prims):
-                        calc_target = prims[active_item.single_calc_target]
+                    # Check if the target pointer is valid, since the target
+                    # item may have been removed from the list
+                    calc_target = maplus_storage.get_reference(
+                        active_item,
+                        'single_calc_target'
+                    )
+                    if calc_target:
                         if calc_target.kind == 'POINT':
                             item_info_col.operator(
                                 "maplus.composenewlinefrompoint",
@@ -1111,16 +1192,17 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         'multi_calc_result',
                         text="Result"
                     )
-                    # Check if the target pointers are valid, since we attempt
-                    # to access those indices in prims at the beginning here.
-                    if (active_item.multi_calc_target_one < len(prims) and
-                            active_item.multi_calc_target_two < len(prims)):
-                        calc_target_one = prims[
-                            active_item.multi_calc_target_one
-                        ]
-                        calc_target_two = prims[
-                            active_item.multi_calc_target_two
-                        ]
+                    # Check if the target pointers are valid, since the
+                    # target items may have been removed from the list
+                    calc_target_one = maplus_storage.get_reference(
+                        active_item,
+                        'multi_calc_target_one'
+                    )
+                    calc_target_two = maplus_storage.get_reference(
+                        active_item,
+                        'multi_calc_target_two'
+                    )
+                    if calc_target_one and calc_target_two:
                         type_combo = {
                             calc_target_one.kind,
                             calc_target_two.kind
@@ -1198,6 +1280,11 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                     icon='FORCE_MAGNETIC',
                     text="Axis Rotate"
                 )
+                item_info_col.operator(
+                    "maplus.changetransftotransfstack",
+                    icon='LINENUMBERS_ON',
+                    text="Transformation Stack"
+                )
                 item_info_col.separator()
 
                 if active_item.transf_type == "UNDEFINED":
@@ -1216,15 +1303,29 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         )
                         mesh_appliers = apply_buttons.row(align=True)
                         mesh_appliers.operator(
-                            "maplus.alignpointsmeshselected",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignpointsmeshselected",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Mesh Piece"
                         )
                         mesh_appliers.operator(
-                            "maplus.alignpointswholemesh",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignpointswholemesh",
+                                addon_data
+                            ),
                             icon='NONE',
                             text=" Whole Mesh"
                         )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignpointsvertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
                     elif active_item.transf_type == 'DIRECTIONALSLIDE':
                         apply_buttons_header.label(text=
                             'Apply Directional Slide to:'
@@ -1237,14 +1338,28 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         )
                         mesh_appliers = apply_buttons.row(align=True)
                         mesh_appliers.operator(
-                            "maplus.directionalslidemeshselected",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.directionalslidemeshselected",
+                                addon_data
+                            ),
                             icon='NONE', text="Mesh Piece"
                         )
                         mesh_appliers.operator(
-                            "maplus.directionalslidewholemesh",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.directionalslidewholemesh",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Whole Mesh"
                         )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.directionalslidevertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
                     elif active_item.transf_type == 'SCALEMATCHEDGE':
                         apply_buttons_header.label(text=
                             'Apply Scale Match Edge to:'
@@ -1257,14 +1372,28 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         )
                         mesh_appliers = apply_buttons.row(align=True)
                         mesh_appliers.operator(
-                            "maplus.scalematchedgemeshselected",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.scalematchedgemeshselected",
+                                addon_data
+                            ),
                             icon='NONE', text="Mesh Piece"
                         )
                         mesh_appliers.operator(
-                            "maplus.scalematchedgewholemesh",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.scalematchedgewholemesh",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Whole Mesh"
                         )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.scalematchedgevertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
                     elif active_item.transf_type == 'AXISROTATE':
                         apply_buttons_header.label(
                             text='Apply Axis Rotate to:'
@@ -1277,14 +1406,28 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         )
                         mesh_appliers = apply_buttons.row(align=True)
                         mesh_appliers.operator(
-                            "maplus.axisrotatemeshselected",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.axisrotatemeshselected",
+                                addon_data
+                            ),
                             icon='NONE', text="Mesh Piece"
                         )
                         mesh_appliers.operator(
-                            "maplus.axisrotatewholemesh",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.axisrotatewholemesh",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Whole Mesh"
                         )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.axisrotatevertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
                     elif active_item.transf_type == 'ALIGNLINES':
                         apply_buttons_header.label(
                             text='Apply Align Lines to:'
@@ -1297,15 +1440,29 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         )
                         mesh_appliers = apply_buttons.row(align=True)
                         mesh_appliers.operator(
-                            "maplus.alignlinesmeshselected",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignlinesmeshselected",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Mesh Piece"
                         )
                         mesh_appliers.operator(
-                            "maplus.alignlineswholemesh",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignlineswholemesh",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Whole Mesh"
                         )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignlinesvertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
                     elif active_item.transf_type == 'ALIGNPLANES':
                         apply_buttons_header.label(
                             text='Apply Align Planes to:'
@@ -1318,15 +1475,64 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                         )
                         mesh_appliers = apply_buttons.row(align=True)
                         mesh_appliers.operator(
-                            "maplus.alignplanesmeshselected",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignplanesmeshselected",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Mesh Piece"
                         )
                         mesh_appliers.operator(
-                            "maplus.alignplaneswholemesh",
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignplaneswholemesh",
+                                addon_data
+                            ),
                             icon='NONE',
                             text="Whole Mesh"
                         )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.alignplanesvertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
+                    elif active_item.transf_type == 'TRANSFSTACK':
+                        apply_buttons_header.label(
+                            text='Apply Transformation Stack to:'
+                        )
+                        apply_buttons = item_info_col.split(factor=.33)
+                        apply_buttons.operator(
+                            "maplus.applytransfstackobject",
+                            icon='NONE',
+                            text="Object"
+                        )
+                        mesh_appliers = apply_buttons.row(align=True)
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.applytransfstackmeshselected",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Mesh Piece"
+                        )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.applytransfstackwholemesh",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Whole Mesh"
+                        )
+                        mesh_appliers.operator(
+                            maplus_guitools.mesh_op_id(
+                                "maplus.applytransfstackvertexgroup",
+                                addon_data
+                            ),
+                            icon='NONE',
+                            text="Vertex Group"
+                        )
                     item_info_col.separator()
                     experiment_toggle = apply_buttons_header.column()
                     experiment_toggle.prop(
@@ -1334,11 +1540,21 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                             'use_experimental',
                             text='Enable Experimental Mesh Ops.'
                     )
+                    experiment_toggle.prop(
+                            addon_data,
+                            'vertex_group_blend',
+                            text='Blend Vertex Group Weights'
+                    )
+                    maplus_guitools.layout_mesh_falloff(
+                            experiment_toggle,
+                            addon_data
+                    )
 
                     active_transf = bpy.types.AnyType(active_item)
 
-                    if (active_item.transf_type != 'SCALEMATCHEDGE' and
-                            active_item.transf_type != 'AXISROTATE'):
+                    if active_item.transf_type not in {'SCALEMATCHEDGE',
+                                                       'AXISROTATE',
+                                                       'TRANSFSTACK'}:
                         item_info_col.label(text='Transformation Modifiers:')
                         item_mods_box = item_info_col.box()
                         mods_row_1 = item_mods_box.row()
@@ -1516,3 +1732,49 @@ class MAPLUS_PT_MAPlusGui(bpy.types.Panel):
                             "apl_dest_plane",
                             type='DEFAULT'
                         )
+                    if active_item.transf_type == "TRANSFSTACK":
+                        item_info_col.label(
+                            text="Steps (applied from top to bottom):"
+                        )
+                        stack_steps = item_info_col.row()
+                        stack_steps.template_list(
+                            "MAPLUS_UL_TransfStackSteps",
+                            "transf_stack_steps",
+                            active_transf,
+                            "transf_stack",
+                            active_transf,
+                            "transf_stack_active",
+                            type='DEFAULT'
+                        )
+                        step_buttons = stack_steps.column(align=True)
+                        step_buttons.operator(
+                            "maplus.removetransfstackstep",
+                            icon='X',
+                            text=""
+                        )
+                        step_buttons.operator(
+                            "maplus.movetransfstackstepup",
+                            icon='TRIA_UP',
+                            text=""
+                        )
+                        step_buttons.operator(
+                            "maplus.movetransfstackstepdown",
+                            icon='TRIA_DOWN',
+                            text=""
+                        )
+                        item_info_col.separator()
+                        item_info_col.label(text="Transformation to Add")
+                        item_info_col.template_list(
+                            "MAPLUS_UL_MAPlusList",
+                            "transf_stack_picklist",
+                            maplus_data_ptr,
+                            "prim_list",
+                            active_transf,
+                            "transf_stack_pick",
+                            type='DEFAULT'
+                        )
+                        item_info_col.operator(
+                            "maplus.addtransfstackstep",
+                            icon='ADD',
+                            text="Add Step"
+                        )
@@ -3,8 +3,21 @@
 
 import bpy
 import mathutils
+import numpy
 
 import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.spatial as maplus_spatial
+
+
+# Global directions for drop to surface (see quick_drop_direction)
+DROP_DIRECTIONS = {
+    'NEG_Z': (0.0, 0.0, -1.0),
+    'POS_Z': (0.0, 0.0, 1.0),
+    'NEG_X': (-1.0, 0.0, 0.0),
+    'POS_X': (1.0, 0.0, 0.0),
+    'NEG_Y': (0.0, -1.0, 0.0),
+    'POS_Y': (0.0, 1.0, 0.0),
+}
 
 
 class MAPLUS_OT_QuickAlignObjects(bpy.types.Operator):
@@ -55,6 +68,360 @@ class MAPLUS_OT_QuickAlignObjects(bpy.types.Operator):
         return {'FINISHED'}
 
 
+# Global axis indices for bounds align/distribute
+BOUNDS_AXES = {
+    'X': 0,
+    'Y': 1,
+    'Z': 2,
+}
+
+
+def get_bound_corners(objects, world_matrices):
+    '''Return the global bounding box corners of many objects at once.
+
+    Arguments:
+        objects
+            a sequence of n Blender objects
+        world_matrices
+            (n, 4, 4) array of the objects' world matrices
+
+    Returns:
+        Return an (n, 8, 3) array, the 8 corners of each object's
+        bound_box transformed to global space.
+    '''
+    local_corners = numpy.array(
+        [item.bound_box for item in objects],
+        dtype=numpy.float64
+    ).reshape(-1, 8, 3)
+    return (
+        numpy.einsum('nij,nkj->nki', world_matrices[:, :3, :3], local_corners)
+        + world_matrices[:, numpy.newaxis, :3, 3]
+    )
+
+
+def get_aligned_positions(low, high, anchor, reference):
+    '''Compute new positions along an axis to line up object bounds.
+
+    Arguments:
+        low, high
+            (n,) arrays of each object's bounds along the axis
+        anchor
+            'MIN', 'CENTER' or 'MAX', the part of each bound to line up
+        reference
+            (low, high) bounds to line up with
+
+    Returns:
+        Return an (n,) array of translations along the axis.
+    '''
+    if anchor == 'MIN':
+        return reference[0] - low
+    if anchor == 'MAX':
+        return reference[1] - high
+    return (reference[0] + reference[1]) / 2 - (low + high) / 2
+
+
+def get_distributed_positions(low, high, spacing):
+    '''Compute translations that spread object bounds out evenly.
+
+    Objects keep their order (by center) along the axis, and the two
+    outermost objects stay where they are.
+
+    Arguments:
+        low, high
+            (n,) arrays of each object's bounds along the axis
+        spacing
+            'CENTERS' (equal distance between centers) or 'GAPS' (equal
+            empty space between neighbouring bounds)
+
+    Returns:
+        Return an (n,) array of translations along the axis.
+    '''
+    centers = (low + high) / 2
+    order = numpy.argsort(centers, kind='stable')
+    steps = numpy.arange(len(order))
+    translations = numpy.zeros(len(order))
+    if spacing == 'CENTERS':
+        new_centers = numpy.linspace(
+            centers[order[0]],
+            centers[order[-1]],
+            len(order)
+        )
+        translations[order] = new_centers - centers[order]
+        return translations
+
+    sizes = (high - low)[order]
+    start = low[order[0]]
+    end = high[order[-1]]
+    gap = (end - start - sizes.sum()) / (len(order) - 1)
+    new_lows = (
+        start +
+        numpy.concatenate(([0.0], numpy.cumsum(sizes)[:-1])) +
+        steps * gap
+    )
+    translations[order] = new_lows - low[order]
+    return translations
+
+
+def get_drop_points(objects, world_matrices, direction):
+    '''Find where each object touches down when dropped.
+
+    Arguments:
+        objects
+            a sequence of n Blender objects
+        world_matrices
+            (n, 4, 4) array of the objects' world matrices
+        direction
+            unit drop direction, as a (3,) array
+
+    Returns:
+        Return a tuple (bottoms, heights): the lowest point of each
+        object's bounding box (below its center, lowest meaning furthest
+        along direction) as an (n, 3) array, and each bounding box's
+        extent along direction as an (n,) array.
+    '''
+    corners = get_bound_corners(objects, world_matrices)
+    along = corners @ direction
+    centers = corners.mean(axis=1)
+    bottoms = centers + numpy.outer(
+        along.max(axis=1) - centers @ direction,
+        direction
+    )
+    return bottoms, along.max(axis=1) - along.min(axis=1)
+
+
+class MAPLUS_OT_QuickDropToSurface(bpy.types.Operator):
+    bl_idname = "maplus.quickdroptosurface"
+    bl_label = "Drop to Surface"
+    bl_description = (
+        "Drops every selected object onto the active (mesh) object, each"
+        " object moves by its own distance to the surface"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        ground = maplus_geom.get_active_object()
+        if not ground or ground.type != 'MESH':
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: the active object (the surface to'
+                 ' drop onto) must be a mesh.')
+            )
+            return {'CANCELLED'}
+        targets = [
+            item for item in bpy.context.scene.objects
+            if maplus_geom.get_select_state(item) and item != ground
+        ]
+        if not targets:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: no objects selected to drop.'
+            )
+            return {'CANCELLED'}
+
+        direction = numpy.array(
+            DROP_DIRECTIONS[addon_data.quick_drop_direction]
+        )
+        world_matrices = numpy.array(
+            [item.matrix_world for item in targets],
+            dtype=numpy.float64
+        )
+        bottoms, heights = get_drop_points(
+            targets,
+            world_matrices,
+            direction
+        )
+        # Cast from the top of each bounding box, so objects that are
+        # already sunk into the surface are lifted back onto it
+        ray_origins = bottoms - numpy.outer(heights, direction)
+
+        ground_bvh = maplus_spatial.get_object_bvh(ground)[0]
+        ray_direction = mathutils.Vector(direction)
+        hit_points = numpy.zeros((len(targets), 3))
+        hit_normals = numpy.zeros((len(targets), 3))
+        hit = numpy.zeros(len(targets), dtype=bool)
+        for row, origin in enumerate(ray_origins.tolist()):
+            location, normal, index, distance = ground_bvh.ray_cast(
+                mathutils.Vector(origin),
+                ray_direction
+            )
+            if location is not None:
+                hit_points[row] = location
+                hit_normals[row] = normal
+                hit[row] = True
+        if not hit.any():
+            self.report(
+                {'WARNING'},
+                'No object is above the surface (in the drop direction).'
+            )
+            return {'CANCELLED'}
+
+        # Move each bottom point onto its hit point (plus the offset)
+        translations = (
+            hit_points[hit] -
+            direction * addon_data.quick_drop_offset -
+            bottoms[hit]
+        )
+        new_matrices = world_matrices[hit].copy()
+        new_matrices[:, :3, 3] += translations
+        if addon_data.quick_drop_align_normal:
+            # Tilt around the landing point, "up" (against the drop
+            # direction) onto the surface normal, facing the object
+            normals = hit_normals[hit]
+            normals[normals @ direction > 0] *= -1
+            rotations = maplus_geom.get_rotations_between(
+                numpy.tile(-direction, (len(normals), 1)),
+                normals
+            )
+            pivots = bottoms[hit] + translations
+            tilts = numpy.zeros((len(normals), 4, 4))
+            tilts[:, :3, :3] = rotations
+            tilts[:, :3, 3] = (
+                pivots - numpy.einsum('nij,nj->ni', rotations, pivots)
+            )
+            tilts[:, 3, 3] = 1.0
+            new_matrices = tilts @ new_matrices
+        maplus_geom.set_world_matrices(
+            [item for item, landed in zip(targets, hit.tolist()) if landed],
+            new_matrices
+        )
+
+        missed = len(targets) - numpy.count_nonzero(hit)
+        if missed:
+            self.report(
+                {'WARNING'},
+                '{0} objects missed the surface and were left alone'.format(
+                    missed
+                )
+            )
+        return {'FINISHED'}
+
+
+def has_ancestor_in(item, objects):
+    # Whether any parent (up the whole chain) of an object is in objects
+    parent = item.parent
+    while parent is not None:
+        if parent in objects:
+            return True
+        parent = parent.parent
+    return False
+
+
+# Not registered (it lays nothing out), only its derived classes are
+class MAPLUS_OT_QuickBoundsLayoutBase(bpy.types.Operator):
+    bl_idname = "maplus.quickboundslayoutbase"
+    bl_label = "Bounds Layout Base Class"
+    bl_description = (
+        "The base class for laying out selected objects by their bounds"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # Fewest selected objects that make sense for this layout
+    min_objects = 1
+
+    def get_translations(self, addon_data, objects, low, high):
+        # Translations (along the layout axis) for each object, provided
+        # by derived classes (None cancels the layout)
+        return None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        selected = [
+            item for item in bpy.context.scene.objects
+            if maplus_geom.get_select_state(item)
+        ]
+        if len(selected) < self.min_objects:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: select at least {0} objects.'.format(
+                    self.min_objects
+                )
+            )
+            return {'CANCELLED'}
+
+        # Read every object's world matrix and global bounds in one pass,
+        # then lay them out along the chosen axis all at once
+        axis = BOUNDS_AXES[addon_data.quick_bounds_axis]
+        world_matrices = numpy.array(
+            [item.matrix_world for item in selected],
+            dtype=numpy.float64
+        ).reshape(-1, 4, 4)
+        along = get_bound_corners(selected, world_matrices)[:, :, axis]
+        low = along.min(axis=1)
+        high = along.max(axis=1)
+
+        translations = self.get_translations(
+            addon_data,
+            selected,
+            low,
+            high
+        )
+        if translations is None:
+            return {'CANCELLED'}
+        world_matrices[:, axis, 3] += translations
+        # Write the moved objects, and the selected objects below a moved
+        # one (written after their parent, they keep their own place)
+        moved = {
+            selected[index] for index in numpy.flatnonzero(translations)
+        }
+        written = [
+            index for index, item in enumerate(selected)
+            if item in moved or has_ancestor_in(item, moved)
+        ]
+        maplus_geom.set_world_matrices(
+            [selected[index] for index in written],
+            world_matrices[written]
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_QuickAlignObjectBounds(MAPLUS_OT_QuickBoundsLayoutBase):
+    bl_idname = "maplus.quickalignobjectbounds"
+    bl_label = "Align Bounds"
+    bl_description = (
+        "Lines up the selected objects' bounding boxes (min, center or"
+        " max) along a global axis"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def get_translations(self, addon_data, objects, low, high):
+        if addon_data.quick_bounds_align_to == 'ACTIVE':
+            active_object = maplus_geom.get_active_object()
+            if active_object not in objects:
+                self.report(
+                    {'ERROR'},
+                    'Cannot complete: the active object is not selected.'
+                )
+                return None
+            active_index = objects.index(active_object)
+            reference = (low[active_index], high[active_index])
+        else:
+            reference = (low.min(), high.max())
+        return get_aligned_positions(
+            low,
+            high,
+            addon_data.quick_bounds_anchor,
+            reference
+        )
+
+
+class MAPLUS_OT_QuickDistributeObjectBounds(MAPLUS_OT_QuickBoundsLayoutBase):
+    bl_idname = "maplus.quickdistributeobjectbounds"
+    bl_label = "Distribute Bounds"
+    bl_description = (
+        "Spreads the selected objects out evenly along a global axis,"
+        " between the two outermost objects"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    min_objects = 3
+
+    def get_translations(self, addon_data, objects, low, high):
+        return get_distributed_positions(
+            low,
+            high,
+            addon_data.quick_bounds_spacing
+        )
+
+
 class MAPLUS_PT_QuickAlignObjectsGUI(bpy.types.Panel):
     bl_idname = "MAPLUS_PT_QuickAlignObjectsGUI"
     bl_label = "Quick Align Objects"
@@ -74,3 +441,35 @@ class MAPLUS_PT_QuickAlignObjectsGUI(bpy.types.Panel):
                 "maplus.quickalignobjects",
                 text="Align Objects"
         )
+
+        bounds_box = layout.box()
+        bounds_box.label(text="Align/Distribute Bounds (Selected)")
+        bounds_box.row().prop(addon_data, 'quick_bounds_axis', expand=True)
+        align_row = bounds_box.row(align=True)
+        align_row.prop(addon_data, 'quick_bounds_anchor', text="")
+        align_row.prop(addon_data, 'quick_bounds_align_to', text="")
+        align_row.operator(
+            "maplus.quickalignobjectbounds",
+            text="Align"
+        )
+        distribute_row = bounds_box.row(align=True)
+        distribute_row.prop(addon_data, 'quick_bounds_spacing', text="")
+        distribute_row.operator(
+            "maplus.quickdistributeobjectbounds",
+            text="Distribute"
+        )
+
+        drop_box = layout.box()
+        drop_box.label(text="Drop to Surface (Active Object)")
+        drop_settings = drop_box.row(align=True)
+        drop_settings.prop(addon_data, 'quick_drop_direction', text="")
+        drop_settings.prop(addon_data, 'quick_drop_offset', text="Offset")
+        drop_box.prop(
+            addon_data,
+            'quick_drop_align_normal',
+            text="Align to Surface Normal"
+        )
+        drop_box.operator(
+            "maplus.quickdroptosurface",
+            icon='SORT_ASC'
+        )
@@ -1,20 +1,35 @@
 """Align Planes tool, internals & UI."""
 
 
-import bmesh
 import bpy
 import mathutils
 
+import mesh_mesh_align_plus.calculate_compose as maplus_calc_compose
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
+import mesh_mesh_align_plus.utils.mesh_targets as maplus_mesh_targets
+import mesh_mesh_align_plus.utils.redo_cache as maplus_redo_cache
 
 
-class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
+class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator,
+                                maplus_redo_cache.RedoInputsMixin):
     bl_idname = "maplus.alignplanesbase"
     bl_label = "Align Planes base"
     bl_description = "Align Planes base class"
     bl_options = {'REGISTER', 'UNDO'}
+    target = None
+    # Journaled (undo-light) variants record their mesh changes in the
+    # addon's journal instead of Blender's undo, see undo_journal.py
+    journal = False
+
+    # Redo panel copy of the transformation item's flip, see execute()
+    apl_flip_normal: bpy.props.BoolProperty(
+        name="Flip Normal",
+        description="Flips the normal of the source plane",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -24,12 +39,31 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
             active_item = prims[addon_data.active_list_item]
         else:
             active_item = addon_data.quick_align_planes_transf
+        # Inputs resolved by the run the redo panel is repeating, if any
+        redo_inputs = maplus_redo_cache.get_inputs(self)
+        if (hasattr(self, 'quick_op_target')
+                and addon_data.quick_align_planes_set_origin_mode):
+            # Set Origin mode grabs its source per object, every run
+            redo_inputs = None
+        # The redo panel edits the operator's copy of the normal flip
+        # (written back to the item), a first run copies it from the item
+        if self.redo_token:
+            active_item.apl_flip_normal = self.apl_flip_normal
+        else:
+            self.apl_flip_normal = active_item.apl_flip_normal
         # Gather selected Blender object(s) to apply the transform to
-        multi_edit_targets = [
-            item for item in bpy.context.scene.objects if (
-                maplus_geom.get_select_state(item)
-            )
-        ]
+        # (already known when redoing)
+        if redo_inputs:
+            multi_edit_targets = redo_inputs['targets']
+        else:
+            multi_edit_targets = [
+                item for item in bpy.context.scene.objects if (
+                    maplus_geom.get_select_state(item)
+                )
+            ]
+        inputs = redo_inputs or maplus_redo_cache.new_inputs(
+            multi_edit_targets
+        )
         # Check prerequisites for mesh level transforms, need an active/selected object
         if (self.target != 'OBJECT' and not (maplus_geom.get_active_object()
                 and maplus_geom.get_select_state(maplus_geom.get_active_object()))):
@@ -49,30 +83,59 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                      ' without an active (and selected) object.')
                 )
                 return {'CANCELLED'}
-            if maplus_geom.get_active_object().type != 'MESH':
+            if not maplus_geom.is_grab_source(maplus_geom.get_active_object()):
                 self.report(
                     {'ERROR'},
                     ('Cannot complete: cannot auto-grab source verts '
-                     ' from a non-mesh object.')
+                     ' from this type of object.')
                 )
                 return {'CANCELLED'}
 
         # Proceed only if selected Blender objects are compatible with the transform target
         # (Do not allow mesh-level transforms when there are non-mesh objects selected)
-        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
-                and [item for item in multi_edit_targets if item.type != 'MESH']):
+        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}
+                and maplus_mesh_targets.get_incompatible_targets(
+                    multi_edit_targets,
+                    self.target,
+                    self.journal)):
 
             if not hasattr(self, "quick_op_target"):
-                if (prims[active_item.apl_src_plane].kind != 'PLANE' or
-                        prims[active_item.apl_dest_plane].kind != 'PLANE'):
+                try:
+                    src_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'apl_src_plane'
+                    )
+                    dest_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'apl_dest_plane'
+                    )
+                except maplus_except.DependencyCycleError:
+                    self.report(
+                        {'ERROR'},
+                        ('Dependency cycle: an item used by this'
+                         ' transformation depends on itself')
+                    )
+                    return {'CANCELLED'}
+                if not (src_item and dest_item):
+                    self.report(
+                        {'ERROR'},
+                        ('Missing operands: an item used by this'
+                         ' transformation was removed from the list')
+                    )
+                    return {'CANCELLED'}
+                if src_item.kind != 'PLANE' or dest_item.kind != 'PLANE':
                     self.report(
                         {'ERROR'},
                         ('Wrong operands: "Align Planes" can only operate on '
                          'two planes')
                     )
                     return {'CANCELLED'}
+                active_item.needs_update = False
 
-            if maplus_geom.get_active_object().type == 'MESH':
+            # (Not needed when redoing, nothing is grabbed or read
+            # through a bmesh then)
+            if (not redo_inputs
+                    and maplus_geom.get_active_object().type == 'MESH'):
                 # a bmesh can only be initialized in edit mode...
                 if previous_mode != 'EDIT':
                     bpy.ops.object.editmode_toggle()
@@ -94,21 +157,25 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                         'plane_pt_b',
                         'plane_pt_c'
                     )
-                    try:
-                        vert_data = maplus_geom.return_selected_verts(
-                            maplus_geom.get_active_object(),
-                            len(vert_attribs_to_set),
-                            maplus_geom.get_active_object().matrix_world
-                        )
-                    except maplus_except.InsufficientSelectionError:
-                        self.report({'ERROR'}, 'Not enough vertices selected.')
-                        return {'CANCELLED'}
-                    except maplus_except.NonMeshGrabError:
-                        self.report(
-                            {'ERROR'},
-                            'Cannot grab coords: non-mesh or no active object.'
-                        )
-                        return {'CANCELLED'}
+                    if redo_inputs:
+                        vert_data = redo_inputs['src_verts']
+                    else:
+                        try:
+                            vert_data = maplus_geom.return_selected_verts(
+                                maplus_geom.get_active_object(),
+                                len(vert_attribs_to_set),
+                                maplus_geom.get_active_object().matrix_world
+                            )
+                        except maplus_except.InsufficientSelectionError:
+                            self.report({'ERROR'}, 'Not enough vertices selected.')
+                            return {'CANCELLED'}
+                        except maplus_except.NonMeshGrabError:
+                            self.report(
+                                {'ERROR'},
+                                'Cannot grab coords: non-mesh or no active object.'
+                            )
+                            return {'CANCELLED'}
+                        inputs['src_verts'] = vert_data
 
                     maplus_geom.set_item_coords(
                         addon_data.quick_align_planes_src,
@@ -127,11 +194,11 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
 
             else:
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.apl_src_plane],
+                    geometry=src_item,
                     kind='PLANE'
                 )
                 dest_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.apl_dest_plane],
+                    geometry=dest_item,
                     kind='PLANE'
                 )
 
@@ -218,6 +285,27 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
             else:
                 print('Error: Could not find MAPlus transform orientation...')
 
+            if (self.journal and hasattr(self, 'quick_op_target')
+                    and addon_data.quick_align_planes_set_origin_mode):
+                # Set Origin mode moves objects too, which the journal
+                # can't revert
+                self.report(
+                    {'ERROR'},
+                    ('Cannot complete: Set Origin mode is not supported'
+                     ' with the mesh journal (undo-light mode) on.')
+                )
+                return {'CANCELLED'}
+            if (hasattr(self, 'quick_op_target')
+                    and addon_data.quick_align_planes_set_origin_mode
+                    and [item for item in multi_edit_targets
+                         if item.type != 'MESH']):
+                # Set Origin mode writes each target through a bmesh
+                self.report(
+                    {'ERROR'},
+                    ('Cannot complete: Set Origin mode only supports'
+                     ' mesh objects.')
+                )
+                return {'CANCELLED'}
             if hasattr(self, 'quick_op_target') and addon_data.quick_align_planes_set_origin_mode:
                 # TODO: Refactor this feature or possibly make it a new full operator
 
@@ -341,8 +429,7 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                          ' on objects with non-uniform scaling'
                          ' are not currently supported.')
                     )
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
+                    src_mesh = maplus_mesh_targets.load_bmesh(item)
 
                     item_matrix_unaltered_loc = item.matrix_world.copy()
                     unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
@@ -468,7 +555,7 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                         )
                         bpy.context.view_layer.update()
 
-                if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
+                if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}:
                     for item in multi_edit_targets:
                         self.report(
                             {'WARNING'},
@@ -476,8 +563,21 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                              ' on objects with non-uniform scaling'
                              ' are not currently supported.')
                         )
-                        src_mesh = bmesh.new()
-                        src_mesh.from_mesh(item.data)
+                        # Init source mesh (not needed when redoing, or for
+                        # array path targets: apply_mesh_transform() reads
+                        # and writes those itself)
+                        use_array_path = (
+                            bool(redo_inputs) or
+                            maplus_mesh_targets.uses_array_path(
+                                self.target,
+                                addon_data,
+                                self.journal,
+                                item
+                            )
+                        )
+                        src_mesh = None
+                        if not use_array_path:
+                            src_mesh = maplus_mesh_targets.load_bmesh(item)
 
                         item_matrix_unaltered_loc = item.matrix_world.copy()
                         unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
@@ -543,7 +643,10 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                             src_pivot_to_loc_origin
                         )
 
-                        if self.target == 'MESH_SELECTED':
+                        if src_mesh is None:
+                            # Written by apply_mesh_transform() below
+                            pass
+                        elif self.target == 'MESH_SELECTED':
                             src_mesh.transform(
                                 mesh_coplanar,
                                 filter={'SELECT'}
@@ -559,7 +662,42 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
                             src_mesh.transform(mesh_coplanar.inverted())
 
                         bpy.ops.object.mode_set(mode='OBJECT')
-                        src_mesh.to_mesh(item.data)
+                        if not redo_inputs:
+                            inputs['weights'][item.name] = (
+                                maplus_mesh_targets.get_target_weights(
+                                    item,
+                                    self.target,
+                                    addon_data,
+                                    bm=src_mesh
+                                )
+                            )
+                        if use_array_path:
+                            key_timings = maplus_mesh_targets.apply_mesh_transform(
+                                item,
+                                mesh_coplanar,
+                                self.target,
+                                addon_data,
+                                journal=self.journal,
+                                weights=inputs['weights'][item.name]
+                            )
+                            if key_timings is None:
+                                self.report(
+                                    {'WARNING'},
+                                    'Skipped "{0}": no active vertex group.'.format(
+                                        item.name
+                                    )
+                                )
+                            elif key_timings:
+                                self.report(
+                                    {'INFO'},
+                                    maplus_mesh_targets.format_key_timings(
+                                        item,
+                                        key_timings
+                                    )
+                                )
+                        else:
+                            src_mesh.to_mesh(item.data)
+                            src_mesh.free()
 
             # Go back to whatever mode we were in before doing this
             bpy.ops.object.mode_set(mode=previous_mode)
@@ -575,6 +713,8 @@ class MAPLUS_OT_AlignPlanesBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
+        if not redo_inputs:
+            maplus_redo_cache.store_inputs(self, inputs)
         return {'FINISHED'}
 
 
@@ -648,6 +788,24 @@ class MAPLUS_OT_AlignPlanesWholeMesh(MAPLUS_OT_AlignPlanesBase):
         return True
 
 
+class MAPLUS_OT_AlignPlanesVertexGroup(MAPLUS_OT_AlignPlanesBase):
+    bl_idname = "maplus.alignplanesvertexgroup"
+    bl_label = "Align Planes Vertex Group"
+    bl_description = (
+        "Makes planes coplanar (flat against each other), moving"
+        " the verts in the active vertex group"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
 class MAPLUS_OT_QuickAlignPlanesMeshSelected(MAPLUS_OT_AlignPlanesBase):
     bl_idname = "maplus.quickalignplanesmeshselected"
     bl_label = "Align Planes"
@@ -684,6 +842,27 @@ class MAPLUS_OT_QuickAlignPlanesWholeMesh(MAPLUS_OT_AlignPlanesBase):
         return True
 
 
+class MAPLUS_OT_QuickAlignPlanesVertexGroup(MAPLUS_OT_AlignPlanesBase):
+    bl_idname = "maplus.quickalignplanesvertexgroup"
+    bl_label = "Quick Align Planes Vertex Group"
+    bl_description = (
+        "Makes planes coplanar (flat against each other), moving"
+        " the verts in the active vertex group"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+    quick_op_target = True
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        if addon_data.quick_align_planes_set_origin_mode:
+            return False
+        return True
+
+
 class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
     bl_idname = "MAPLUS_PT_QuickAlignPlanesGUI"
     bl_label = "Quick Align Planes"
@@ -1189,13 +1368,32 @@ class MAPLUS_PT_QuickAlignPlanesGUI(bpy.types.Panel):
         )
         apl_mesh_apply_items = apl_apply_items.column(align=True)
         apl_mesh_apply_items.operator(
-            "maplus.quickalignplanesmeshselected",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickalignplanesmeshselected",
+                addon_data
+            ),
             text="Mesh Piece"
         )
         apl_mesh_apply_items.operator(
-            "maplus.quickalignplaneswholemesh",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickalignplaneswholemesh",
+                addon_data
+            ),
             text="Whole Mesh"
         )
+        apl_mesh_apply_items.operator(
+            maplus_guitools.mesh_op_id(
+                "maplus.quickalignplanesvertexgroup",
+                addon_data
+            ),
+            text="Vertex Group"
+        )
+        apl_mesh_apply_items.prop(
+            addon_data,
+            'vertex_group_blend',
+            text="Blend Weights"
+        )
+        maplus_guitools.layout_mesh_falloff(apl_mesh_apply_items, addon_data)
 
         # Disable relevant items depending on whether set origin mode
         # is enabled or not
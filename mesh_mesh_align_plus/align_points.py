@@ -1,21 +1,36 @@
 """Align Points tool, internals & UI."""
 
 
-import bmesh
 import bpy
 import mathutils
 
+import mesh_mesh_align_plus.calculate_compose as maplus_calc_compose
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
+import mesh_mesh_align_plus.utils.mesh_targets as maplus_mesh_targets
+import mesh_mesh_align_plus.utils.redo_cache as maplus_redo_cache
 
 
-class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
+class MAPLUS_OT_AlignPointsBase(bpy.types.Operator,
+                                maplus_redo_cache.RedoInputsMixin):
     bl_idname = "maplus.alignpointsbase"
     bl_label = "Align Points Base"
     bl_description = "Align points base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Journaled (undo-light) variants record their mesh changes in the
+    # addon's journal instead of Blender's undo, see undo_journal.py
+    journal = False
+
+    # Redo panel copy of the transformation item's multiplier, see execute()
+    apt_multiplier: bpy.props.FloatProperty(
+        name="Multiplier",
+        description="Multiply the move by this amount",
+        default=1.0,
+        precision=6,
+        options={'SKIP_SAVE'}
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -25,12 +40,27 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
             active_item = prims[addon_data.active_list_item]
         else:
             active_item = addon_data.quick_align_pts_transf
+        # Inputs resolved by the run the redo panel is repeating, if any
+        redo_inputs = maplus_redo_cache.get_inputs(self)
+        # The redo panel edits the operator's copy of the multiplier (written
+        # back to the item), a first run copies it from the item
+        if self.redo_token:
+            active_item.apt_multiplier = self.apt_multiplier
+        else:
+            self.apt_multiplier = active_item.apt_multiplier
         # Gather selected Blender object(s) to apply the transform to
-        multi_edit_targets = [
-            item for item in bpy.context.scene.objects if (
-                maplus_geom.get_select_state(item)
-            )
-        ]
+        # (already known when redoing)
+        if redo_inputs:
+            multi_edit_targets = redo_inputs['targets']
+        else:
+            multi_edit_targets = [
+                item for item in bpy.context.scene.objects if (
+                    maplus_geom.get_select_state(item)
+                )
+            ]
+        inputs = redo_inputs or maplus_redo_cache.new_inputs(
+            multi_edit_targets
+        )
         # Check prerequisites for mesh level transforms, need an active/selected object
         if (self.target != 'OBJECT' and not (maplus_geom.get_active_object()
                 and maplus_geom.get_select_state(maplus_geom.get_active_object()))):
@@ -50,32 +80,61 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
                      ' without an active (and selected) object.')
                 )
                 return {'CANCELLED'}
-            if maplus_geom.get_active_object().type != 'MESH':
+            if not maplus_geom.is_grab_source(maplus_geom.get_active_object()):
                 self.report(
                     {'ERROR'},
                     ('Cannot complete: cannot auto-grab source verts '
-                     ' from a non-mesh object.')
+                     ' from this type of object.')
                 )
                 return {'CANCELLED'}
 
         # Proceed only if selected Blender objects are compatible with the transform target
         # (Do not allow mesh-level transforms when there are non-mesh objects selected)
-        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
-                and [item for item in multi_edit_targets if item.type != 'MESH']):
+        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}
+                and maplus_mesh_targets.get_incompatible_targets(
+                    multi_edit_targets,
+                    self.target,
+                    self.journal)):
 
             # todo: use a bool check and put on all derived classes
             # instead of hasattr
             if not hasattr(self, 'quick_op_target'):
-                if (prims[active_item.apt_pt_one].kind != 'POINT' or
-                        prims[active_item.apt_pt_two].kind != 'POINT'):
+                try:
+                    src_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'apt_pt_one'
+                    )
+                    dest_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'apt_pt_two'
+                    )
+                except maplus_except.DependencyCycleError:
+                    self.report(
+                        {'ERROR'},
+                        ('Dependency cycle: an item used by this'
+                         ' transformation depends on itself')
+                    )
+                    return {'CANCELLED'}
+                if not (src_item and dest_item):
+                    self.report(
+                        {'ERROR'},
+                        ('Missing operands: an item used by this'
+                         ' transformation was removed from the list')
+                    )
+                    return {'CANCELLED'}
+                if src_item.kind != 'POINT' or dest_item.kind != 'POINT':
                     self.report(
                         {'ERROR'},
                         ('Wrong operands: "Align Points" can only operate on '
                          'two points')
                     )
                     return {'CANCELLED'}
+                active_item.needs_update = False
 
-            if maplus_geom.get_active_object().type == 'MESH':
+            # (Not needed when redoing, nothing is grabbed or read
+            # through a bmesh then)
+            if (not redo_inputs
+                    and maplus_geom.get_active_object().type == 'MESH'):
                 # a bmesh can only be initialized in edit mode...todo/better way?
                 if previous_mode != 'EDIT':
                     bpy.ops.object.editmode_toggle()
@@ -92,21 +151,29 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
             if hasattr(self, 'quick_op_target'):
                 if addon_data.quick_align_pts_auto_grab_src:
                     vert_attribs_to_set = ('point',)
-                    try:
-                        vert_data = maplus_geom.return_selected_verts(
-                            maplus_geom.get_active_object(),
-                            len(vert_attribs_to_set),
-                            maplus_geom.get_active_object().matrix_world
-                        )
-                    except maplus_except.InsufficientSelectionError:
-                        self.report({'ERROR'}, 'Not enough vertices selected.')
-                        return {'CANCELLED'}
-                    except maplus_except.NonMeshGrabError:
-                        self.report(
-                            {'ERROR'},
-                            'Cannot grab coords: non-mesh or no active object.'
-                        )
-                        return {'CANCELLED'}
+                    if redo_inputs:
+                        vert_data = redo_inputs['src_verts']
+                    else:
+                        try:
+                            vert_data = maplus_geom.return_selected_verts(
+                                maplus_geom.get_active_object(),
+                                len(vert_attribs_to_set),
+                                maplus_geom.get_active_object().matrix_world
+                            )
+                        except maplus_except.InsufficientSelectionError:
+                            self.report(
+                                {'ERROR'},
+                                'Not enough vertices selected.'
+                            )
+                            return {'CANCELLED'}
+                        except maplus_except.NonMeshGrabError:
+                            self.report(
+                                {'ERROR'},
+                                ('Cannot grab coords: non-mesh'
+                                 ' or no active object.')
+                            )
+                            return {'CANCELLED'}
+                        inputs['src_verts'] = vert_data
 
                     maplus_geom.set_item_coords(
                         addon_data.quick_align_pts_src,
@@ -125,11 +192,11 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
 
             else:
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.apt_pt_one],
+                    geometry=src_item,
                     kind='POINT'
                 )
                 dest_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.apt_pt_two],
+                    geometry=dest_item,
                     kind='POINT'
                 )
 
@@ -153,7 +220,7 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
 
                     item.location += align_points
 
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
+            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}:
                 for item in multi_edit_targets:
                     self.report(
                         {'WARNING'},
@@ -161,9 +228,21 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
                          ' on objects with non-uniform scaling'
                          ' are not currently supported.')
                     )
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
+                    # Init source mesh (not needed when redoing, or for
+                    # array path targets: apply_mesh_transform() reads
+                    # and writes those itself)
+                    use_array_path = (
+                        bool(redo_inputs) or
+                        maplus_mesh_targets.uses_array_path(
+                            self.target,
+                            addon_data,
+                            self.journal,
+                            item
+                        )
+                    )
+                    src_mesh = None
+                    if not use_array_path:
+                        src_mesh = maplus_mesh_targets.load_bmesh(item)
 
                     active_obj_transf = maplus_geom.get_active_object().matrix_world.copy()
                     inverse_active = active_obj_transf.copy()
@@ -195,7 +274,10 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
                         align_points_vec
                     )
 
-                    if self.target == 'MESH_SELECTED':
+                    if src_mesh is None:
+                        # Written by apply_mesh_transform() below
+                        pass
+                    elif self.target == 'MESH_SELECTED':
                         src_mesh.transform(
                             align_points_loc,
                             filter={'SELECT'}
@@ -212,8 +294,42 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
 
                     # write and then release the mesh data
                     bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
+                    if not redo_inputs:
+                        inputs['weights'][item.name] = (
+                            maplus_mesh_targets.get_target_weights(
+                                item,
+                                self.target,
+                                addon_data,
+                                bm=src_mesh
+                            )
+                        )
+                    if use_array_path:
+                        key_timings = maplus_mesh_targets.apply_mesh_transform(
+                            item,
+                            align_points_loc,
+                            self.target,
+                            addon_data,
+                            journal=self.journal,
+                            weights=inputs['weights'][item.name]
+                        )
+                        if key_timings is None:
+                            self.report(
+                                {'WARNING'},
+                                'Skipped "{0}": no active vertex group.'.format(
+                                    item.name
+                                )
+                            )
+                        elif key_timings:
+                            self.report(
+                                {'INFO'},
+                                maplus_mesh_targets.format_key_timings(
+                                    item,
+                                    key_timings
+                                )
+                            )
+                    else:
+                        src_mesh.to_mesh(item.data)
+                        src_mesh.free()
 
             # Go back to whatever mode we were in before doing this
             bpy.ops.object.mode_set(mode=previous_mode)
@@ -229,6 +345,8 @@ class MAPLUS_OT_AlignPointsBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
+        if not redo_inputs:
+            maplus_redo_cache.store_inputs(self, inputs)
         return {'FINISHED'}
 
 
@@ -323,6 +441,24 @@ class MAPLUS_OT_AlignPointsWholeMesh(MAPLUS_OT_AlignPointsBase):
         return True
 
 
+class MAPLUS_OT_AlignPointsVertexGroup(MAPLUS_OT_AlignPointsBase):
+    bl_idname = "maplus.alignpointsvertexgroup"
+    bl_label = "Align Points Vertex Group"
+    bl_description = (
+        "Match the location of one vertex on a mesh to another"
+        " (moves the verts in the active vertex group)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
 class MAPLUS_OT_QuickAlignPointsWholeMesh(MAPLUS_OT_AlignPointsBase):
     bl_idname = "maplus.quickalignpointswholemesh"
     bl_label = "Quick Align Points Whole Mesh"
@@ -339,6 +475,25 @@ class MAPLUS_OT_QuickAlignPointsWholeMesh(MAPLUS_OT_AlignPointsBase):
         return True
 
 
+class MAPLUS_OT_QuickAlignPointsVertexGroup(MAPLUS_OT_AlignPointsBase):
+    bl_idname = "maplus.quickalignpointsvertexgroup"
+    bl_label = "Quick Align Points Vertex Group"
+    bl_description = (
+        "Match the location of one vertex on a mesh to another"
+        " (moves the verts in the active vertex group)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+    quick_op_target = True
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
 class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
     bl_idname = "MAPLUS_PT_QuickAlignPointsGUI"
     bl_label = "Quick Align Points"
@@ -613,10 +768,29 @@ class MAPLUS_PT_QuickAlignPointsGUI(bpy.types.Panel):
         )
         apt_mesh_apply_items = apt_apply_items.column(align=True)
         apt_mesh_apply_items.operator(
-            "maplus.quickalignpointsmeshselected",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickalignpointsmeshselected",
+                addon_data
+            ),
             text="Mesh Piece"
         )
         apt_mesh_apply_items.operator(
-            "maplus.quickalignpointswholemesh",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickalignpointswholemesh",
+                addon_data
+            ),
             text="Whole Mesh"
         )
+        apt_mesh_apply_items.operator(
+            maplus_guitools.mesh_op_id(
+                "maplus.quickalignpointsvertexgroup",
+                addon_data
+            ),
+            text="Vertex Group"
+        )
+        apt_mesh_apply_items.prop(
+            addon_data,
+            'vertex_group_blend',
+            text="Blend Weights"
+        )
+        maplus_guitools.layout_mesh_falloff(apt_mesh_apply_items, addon_data)
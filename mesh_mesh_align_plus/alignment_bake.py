@@ -0,0 +1,387 @@
+"""Frame range alignment baking (bulk keyframes), internals & UI."""
+
+
+import bpy
+import mathutils
+import numpy
+
+import mesh_mesh_align_plus.transformation_stack as maplus_transf_stack
+import mesh_mesh_align_plus.utils.exceptions as maplus_except
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+
+
+# Action group the baked transform channels are created in (the same one
+# Blender's own keying uses)
+BAKE_ACTION_GROUP = "Object Transforms"
+# Rotation channel (data path) keyed for each object rotation mode
+# (every other mode is an euler order, keyed as rotation_euler)
+ROTATION_PATHS = {
+    'QUATERNION': 'rotation_quaternion',
+    'AXIS_ANGLE': 'rotation_axis_angle',
+}
+
+
+def get_bake_frames(addon_data, scene):
+    # The frames to key, as an int array (may be empty)
+    if addon_data.bake_use_scene_range:
+        start, end = scene.frame_start, scene.frame_end
+    else:
+        start, end = addon_data.bake_frame_start, addon_data.bake_frame_end
+    return numpy.arange(start, end + 1, addon_data.bake_frame_step)
+
+
+def sample_world_matrices(objects, frames, scene):
+    '''Step through frames, reading the world matrix of each object.
+
+    The scene is stepped once per frame for all objects, then put back on
+    the frame it was on.
+
+    Returns:
+        Return an (objects, frames, 4, 4) float64 array.
+    '''
+    matrices = numpy.empty((len(objects), len(frames), 4, 4))
+    current_frame = scene.frame_current
+    current_subframe = scene.frame_subframe
+    for frame_index, frame in enumerate(frames.tolist()):
+        scene.frame_set(frame)
+        for object_index, item in enumerate(objects):
+            matrices[object_index, frame_index] = item.matrix_world
+    scene.frame_set(current_frame, subframe=current_subframe)
+    return matrices
+
+
+def get_ancestors(item):
+    # The parent chain of an object, nearest first
+    ancestors = []
+    while item.parent:
+        item = item.parent
+        ancestors.append(item)
+    return ancestors
+
+
+def get_parent_worlds(item, sampled_worlds, baked_worlds):
+    '''Get a target's parent's world matrix on every baked frame.
+
+    A parent that is baked itself has its baked worlds. One below a baked
+    ancestor moves with it (its sampled worlds carried along by the
+    ancestor's change), any other keeps its sampled worlds.
+
+    Arguments:
+        item
+            the (parented) target object
+        sampled_worlds
+            dict of (frames, 4, 4) arrays, the sampled world matrices of
+            every ancestor of a target
+        baked_worlds
+            dict of (frames, 4, 4) arrays, the world matrices of the
+            targets baked so far (every target ancestor of item)
+    '''
+    parent = item.parent
+    if parent in baked_worlds:
+        return baked_worlds[parent]
+    for ancestor in get_ancestors(parent):
+        if ancestor in baked_worlds:
+            return (
+                baked_worlds[ancestor] @
+                numpy.linalg.inv(sampled_worlds[ancestor]) @
+                sampled_worlds[parent]
+            )
+    return sampled_worlds[parent]
+
+
+def get_baked_transforms(transf, operand_coords, motion):
+    '''Compute a transformation item's world matrix on every baked frame.
+
+    Each destination operand (the last operand, or the only one for
+    slides and axis rotations) follows the reference object, the source
+    operand stays where it was grabbed on the target.
+
+    Arguments:
+        transf
+            a transformation item (not a stack)
+        operand_coords
+            its operands' global coords on the bind frame, see
+            maplus_transf_stack.get_operand_coords()
+        motion
+            (frames, 4, 4) array, the reference object's world matrix
+            on each frame relative to the bind frame
+
+    Returns:
+        Return a (frames, 4, 4) float64 array, or None if the
+        transformation can't be computed on some frame (degenerate
+        operands).
+    '''
+    build_matrix = maplus_transf_stack.TRANSF_MATRICES[transf.transf_type]
+    dest_coords = numpy.array(operand_coords[-1], dtype=numpy.float64)
+    # Every frame's destination coords, moved along in one pass
+    moved_coords = (
+        numpy.einsum('fij,kj->fki', motion[:, :3, :3], dest_coords) +
+        motion[:, numpy.newaxis, :3, 3]
+    )
+
+    transforms = numpy.empty((len(motion), 4, 4))
+    for frame_index, frame_coords in enumerate(moved_coords.tolist()):
+        frame_operands = operand_coords[:-1] + [
+            [mathutils.Vector(co) for co in frame_coords]
+        ]
+        frame_transform = build_matrix(transf, frame_operands)
+        if frame_transform is None:
+            return None
+        transforms[frame_index] = frame_transform
+    return transforms
+
+
+def get_channel_values(target, basis_matrices):
+    '''Decompose local (basis) matrices into transform channel values.
+
+    Rotations are kept continuous across frames (no euler flips or
+    quaternion sign changes between neighbouring keys).
+
+    Returns:
+        Return a list of (data path, (frames, n) array) tuples for the
+        location, rotation (in the target's rotation mode) and scale.
+    '''
+    rotation_mode = target.rotation_mode
+    locations = []
+    rotations = []
+    scales = []
+    previous = None
+    for basis in basis_matrices.tolist():
+        location, quat, scale = mathutils.Matrix(basis).decompose()
+        if rotation_mode == 'QUATERNION':
+            if previous is not None:
+                quat.make_compatible(previous)
+            previous = quat
+            rotation = quat[:]
+        elif rotation_mode == 'AXIS_ANGLE':
+            axis, angle = quat.to_axis_angle()
+            rotation = (angle,) + axis[:]
+        else:
+            if previous is None:
+                previous = quat.to_euler(rotation_mode)
+            else:
+                previous = quat.to_euler(rotation_mode, previous)
+            rotation = previous[:]
+        locations.append(location[:])
+        rotations.append(rotation)
+        scales.append(scale[:])
+    return [
+        ('location', numpy.array(locations)),
+        (
+            ROTATION_PATHS.get(rotation_mode, 'rotation_euler'),
+            numpy.array(rotations)
+        ),
+        ('scale', numpy.array(scales)),
+    ]
+
+
+def ensure_fcurve(item, data_path, index):
+    # The F-Curve of one channel of an object's action, made if missing.
+    # Layered actions (Blender 4.4+) have their F-Curves in the object's
+    # slot, fcurve_ensure_for_datablock() also adds and assigns the slot
+    action = item.animation_data.action
+    if hasattr(action, 'fcurve_ensure_for_datablock'):
+        return action.fcurve_ensure_for_datablock(
+            item,
+            data_path,
+            index=index,
+            group_name=BAKE_ACTION_GROUP
+        )
+    fcurve = action.fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = action.fcurves.new(
+            data_path,
+            index=index,
+            action_group=BAKE_ACTION_GROUP
+        )
+    return fcurve
+
+
+def write_channel_keys(item, data_path, values, frames):
+    '''Key every index of a channel on all frames, in bulk.
+
+    Keys go in the object's action (which must be assigned), see
+    ensure_fcurve(). Keys already on the baked frames are replaced. The
+    new keys are added all at once and their coords written with a
+    single keyframe_points.foreach_set() per F-Curve.
+    '''
+    for index in range(values.shape[1]):
+        fcurve = ensure_fcurve(item, data_path, index)
+        points = fcurve.keyframe_points
+        existing = numpy.empty(len(points) * 2, dtype=numpy.float32)
+        points.foreach_get('co', existing)
+        existing = existing.reshape(-1, 2)
+        # (whole frames are exact in float32)
+        replaced = numpy.isin(existing[:, 0], frames.astype(numpy.float32))
+        for point_index in numpy.flatnonzero(replaced)[::-1].tolist():
+            points.remove(points[point_index], fast=True)
+        kept = existing[~replaced]
+
+        baked = numpy.empty((len(frames), 2), dtype=numpy.float32)
+        baked[:, 0] = frames
+        baked[:, 1] = values[:, index]
+        points.add(len(frames))
+        points.foreach_set('co', numpy.concatenate((kept, baked)).ravel())
+        # Sorts the keys and recalculates their (auto) handles
+        fcurve.update()
+
+
+class MAPLUS_OT_BakeAlignment(bpy.types.Operator):
+    bl_idname = "maplus.bakealignment"
+    bl_label = "Bake Alignment"
+    bl_description = (
+        "Keys the selected objects over a frame range, so they stay"
+        " aligned (by the active transformation item) to a moving"
+        " reference object"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        scene = bpy.context.scene
+        prims = addon_data.prim_list
+        if not prims:
+            self.report({'ERROR'}, 'The advanced tools list is empty.')
+            return {'CANCELLED'}
+        active_item = prims[addon_data.active_list_item]
+        if (active_item.kind != 'TRANSFORMATION'
+                or active_item.transf_type not in
+                maplus_transf_stack.TRANSF_OPERAND_KINDS):
+            self.report(
+                {'ERROR'},
+                ('Wrong operand: the active item must be a transformation'
+                 ' (transformation stacks are not supported).')
+            )
+            return {'CANCELLED'}
+        reference = addon_data.bake_reference_object
+        if not reference:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: no reference object chosen.'
+            )
+            return {'CANCELLED'}
+        targets = [
+            item for item in scene.objects
+            if maplus_geom.get_select_state(item) and item != reference
+        ]
+        if not targets:
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: select the objects to bake (other'
+                 ' than the reference object).')
+            )
+            return {'CANCELLED'}
+        frames = get_bake_frames(addon_data, scene)
+        if not len(frames):
+            self.report({'ERROR'}, 'Cannot complete: empty frame range.')
+            return {'CANCELLED'}
+
+        try:
+            operand_coords = maplus_transf_stack.get_operand_coords(
+                active_item,
+                maplus_transf_stack.TRANSF_OPERAND_KINDS[
+                    active_item.transf_type
+                ]
+            )
+        except maplus_except.DependencyCycleError:
+            self.report(
+                {'ERROR'},
+                ('Dependency cycle: an item used by this'
+                 ' transformation depends on itself')
+            )
+            return {'CANCELLED'}
+        if operand_coords is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: an item used by this transformation'
+                 ' was removed from the list, or has the wrong type')
+            )
+            return {'CANCELLED'}
+
+        # Parents are keyed before their children (fewer ancestors first),
+        # children are keyed relative to their parent's baked motion
+        targets.sort(key=lambda item: len(get_ancestors(item)))
+        # The item's coords were grabbed on the current (bind) frame, the
+        # targets are keyed relative to their pose on it
+        bind_reference = numpy.array(reference.matrix_world)
+        bind_targets = numpy.array([item.matrix_world for item in targets])
+        ancestors = list({
+            ancestor for item in targets for ancestor in get_ancestors(item)
+        })
+        sampled = sample_world_matrices(
+            [reference] + ancestors,
+            frames,
+            scene
+        )
+        sampled_worlds = dict(zip(ancestors, sampled[1:]))
+        baked_worlds = {}
+
+        motion = sampled[0] @ numpy.linalg.inv(bind_reference)
+        transforms = get_baked_transforms(active_item, operand_coords, motion)
+        if transforms is None:
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: the transformation is degenerate on'
+                 ' some frame (zero length/area operands).')
+            )
+            return {'CANCELLED'}
+
+        for item, bind_matrix in zip(targets, bind_targets):
+            worlds = transforms @ bind_matrix
+            baked_worlds[item] = worlds
+            if item.parent:
+                worlds = numpy.linalg.inv(
+                    get_parent_worlds(item, sampled_worlds, baked_worlds) @
+                    numpy.array(item.matrix_parent_inverse)
+                ) @ worlds
+            if not item.animation_data:
+                item.animation_data_create()
+            if not item.animation_data.action:
+                item.animation_data.action = bpy.data.actions.new(
+                    '{0}Action'.format(item.name)
+                )
+            for data_path, values in get_channel_values(item, worlds):
+                write_channel_keys(
+                    item,
+                    data_path,
+                    values,
+                    frames
+                )
+
+        self.report(
+            {'INFO'},
+            'Baked {0} frames on {1} objects'.format(
+                len(frames),
+                len(targets)
+            )
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_PT_AlignmentBakeGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_AlignmentBakeGUI"
+    bl_label = "Mesh Align Plus Alignment Bake"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        maplus_data_ptr = bpy.types.AnyType(bpy.context.scene.maplus_data)
+        addon_data = bpy.context.scene.maplus_data
+
+        layout.label(text="Keep selected objects aligned by the active")
+        layout.label(text="transformation item, its destination following:")
+        layout.prop(maplus_data_ptr, 'bake_reference_object', text="")
+        layout.prop(
+            maplus_data_ptr,
+            'bake_use_scene_range',
+            text="Scene Frame Range"
+        )
+        frames_row = layout.row(align=True)
+        if not addon_data.bake_use_scene_range:
+            frames_row.prop(maplus_data_ptr, 'bake_frame_start', text="Start")
+            frames_row.prop(maplus_data_ptr, 'bake_frame_end', text="End")
+        frames_row.prop(maplus_data_ptr, 'bake_frame_step', text="Step")
+        layout.operator("maplus.bakealignment", icon='KEYINGSET')
@@ -3,21 +3,40 @@
 
 import math
 
-import bmesh
 import bpy
 import mathutils
+import numpy
 
+import mesh_mesh_align_plus.calculate_compose as maplus_calc_compose
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
+import mesh_mesh_align_plus.utils.mesh_targets as maplus_mesh_targets
+import mesh_mesh_align_plus.utils.redo_cache as maplus_redo_cache
 
 
-class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
+class MAPLUS_OT_AxisRotateBase(bpy.types.Operator,
+                               maplus_redo_cache.RedoInputsMixin):
     bl_idname = "maplus.axisrotatebase"
     bl_label = "Axis Rotate Base"
     bl_description = "Axis rotate base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Journaled (undo-light) variants record their mesh changes in the
+    # addon's journal instead of Blender's undo, see undo_journal.py
+    journal = False
+
+    # Redo panel copy of the transformation item's amount, see execute()
+    axr_amount: bpy.props.FloatProperty(
+        name="Amount",
+        description=(
+            "How much to rotate around the specified axis"
+            " (units are set to radians or degrees"
+            " depending on Blender user settings)"
+        ),
+        precision=6,
+        options={'SKIP_SAVE'}
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -27,12 +46,27 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
             active_item = prims[addon_data.active_list_item]
         else:
             active_item = addon_data.quick_axis_rotate_transf
+        # Inputs resolved by the run the redo panel is repeating, if any
+        redo_inputs = maplus_redo_cache.get_inputs(self)
+        # The redo panel edits the operator's copy of the amount (written
+        # back to the item), a first run copies it from the item
+        if self.redo_token:
+            active_item.axr_amount = self.axr_amount
+        else:
+            self.axr_amount = active_item.axr_amount
         # Gather selected Blender object(s) to apply the transform to
-        multi_edit_targets = [
-            item for item in bpy.context.scene.objects if (
-                maplus_geom.get_select_state(item)
-            )
-        ]
+        # (already known when redoing)
+        if redo_inputs:
+            multi_edit_targets = redo_inputs['targets']
+        else:
+            multi_edit_targets = [
+                item for item in bpy.context.scene.objects if (
+                    maplus_geom.get_select_state(item)
+                )
+            ]
+        inputs = redo_inputs or maplus_redo_cache.new_inputs(
+            multi_edit_targets
+        )
         # Check prerequisites for mesh level transforms, need an active/selected object
         if (self.target != 'OBJECT' and not (maplus_geom.get_active_object()
                 and maplus_geom.get_select_state(maplus_geom.get_active_object()))):
@@ -52,29 +86,55 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                      ' without an active (and selected) object.')
                 )
                 return {'CANCELLED'}
-            if maplus_geom.get_active_object().type != 'MESH':
+            if not maplus_geom.is_grab_source(maplus_geom.get_active_object()):
                 self.report(
                     {'ERROR'},
                     ('Cannot complete: cannot auto-grab source verts '
-                     ' from a non-mesh object.')
+                     ' from this type of object.')
                 )
                 return {'CANCELLED'}
 
         # Proceed only if selected Blender objects are compatible with the transform target
         # (Do not allow mesh-level transforms when there are non-mesh objects selected)
-        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
-                and [item for item in multi_edit_targets if item.type != 'MESH']):
+        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}
+                and maplus_mesh_targets.get_incompatible_targets(
+                    multi_edit_targets,
+                    self.target,
+                    self.journal)):
 
             if not hasattr(self, "quick_op_target"):
-                if prims[active_item.axr_axis].kind != 'LINE':
+                try:
+                    src_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'axr_axis'
+                    )
+                except maplus_except.DependencyCycleError:
+                    self.report(
+                        {'ERROR'},
+                        ('Dependency cycle: an item used by this'
+                         ' transformation depends on itself')
+                    )
+                    return {'CANCELLED'}
+                if not src_item:
+                    self.report(
+                        {'ERROR'},
+                        ('Missing operands: an item used by this'
+                         ' transformation was removed from the list')
+                    )
+                    return {'CANCELLED'}
+                if src_item.kind != 'LINE':
                     self.report(
                         {'ERROR'},
                         ('Wrong operands: "Axis Rotate" can only operate on '
                          'a line')
                     )
                     return {'CANCELLED'}
+                active_item.needs_update = False
 
-            if maplus_geom.get_active_object().type == 'MESH':
+            # (Not needed when redoing, nothing is grabbed or read
+            # through a bmesh then)
+            if (not redo_inputs
+                    and maplus_geom.get_active_object().type == 'MESH'):
                 # a bmesh can only be initialized in edit mode...
                 if previous_mode != 'EDIT':
                     bpy.ops.object.editmode_toggle()
@@ -91,21 +151,25 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
             if hasattr(self, 'quick_op_target'):
                 if addon_data.quick_axis_rotate_auto_grab_src:
                     vert_attribs_to_set = ('line_start', 'line_end')
-                    try:
-                        vert_data = maplus_geom.return_selected_verts(
-                            maplus_geom.get_active_object(),
-                            len(vert_attribs_to_set),
-                            maplus_geom.get_active_object().matrix_world
-                        )
-                    except maplus_except.InsufficientSelectionError:
-                        self.report({'ERROR'}, 'Not enough vertices selected.')
-                        return {'CANCELLED'}
-                    except maplus_except.NonMeshGrabError:
-                        self.report(
-                            {'ERROR'},
-                            'Cannot grab coords: non-mesh or no active object.'
-                        )
-                        return {'CANCELLED'}
+                    if redo_inputs:
+                        vert_data = redo_inputs['src_verts']
+                    else:
+                        try:
+                            vert_data = maplus_geom.return_selected_verts(
+                                maplus_geom.get_active_object(),
+                                len(vert_attribs_to_set),
+                                maplus_geom.get_active_object().matrix_world
+                            )
+                        except maplus_except.InsufficientSelectionError:
+                            self.report({'ERROR'}, 'Not enough vertices selected.')
+                            return {'CANCELLED'}
+                        except maplus_except.NonMeshGrabError:
+                            self.report(
+                                {'ERROR'},
+                                'Cannot grab coords: non-mesh or no active object.'
+                            )
+                            return {'CANCELLED'}
+                        inputs['src_verts'] = vert_data
 
                     maplus_geom.set_item_coords(
                         addon_data.quick_axis_rotate_src,
@@ -120,7 +184,7 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
 
             else:
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.axr_axis],
+                    geometry=src_item,
                     kind='LINE'
                 )
 
@@ -174,7 +238,7 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                     item.location += pivot_to_dest
                     bpy.context.view_layer.update()
 
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
+            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}:
                 for item in multi_edit_targets:
                     self.report(
                         {'WARNING'},
@@ -185,9 +249,21 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                     # (Note that there are no transformation modifiers for this
                     # transformation type, so that section is omitted here)
 
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
+                    # Init source mesh (not needed when redoing, or for
+                    # array path targets: apply_mesh_transform() reads
+                    # and writes those itself)
+                    use_array_path = (
+                        bool(redo_inputs) or
+                        maplus_mesh_targets.uses_array_path(
+                            self.target,
+                            addon_data,
+                            self.journal,
+                            item
+                        )
+                    )
+                    src_mesh = None
+                    if not use_array_path:
+                        src_mesh = maplus_mesh_targets.load_bmesh(item)
 
                     # Get the object world matrix
                     item_matrix_unaltered_loc = item.matrix_world.copy()
@@ -228,7 +304,10 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                         src_pivot_to_loc_origin
                     )
 
-                    if self.target == 'MESH_SELECTED':
+                    if src_mesh is None:
+                        # Written by apply_mesh_transform() below
+                        pass
+                    elif self.target == 'MESH_SELECTED':
                         src_mesh.transform(
                             axis_rotate_loc,
                             filter={'SELECT'}
@@ -244,8 +323,42 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
                         src_mesh.transform(axis_rotate_loc.inverted())
 
                     bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
+                    if not redo_inputs:
+                        inputs['weights'][item.name] = (
+                            maplus_mesh_targets.get_target_weights(
+                                item,
+                                self.target,
+                                addon_data,
+                                bm=src_mesh
+                            )
+                        )
+                    if use_array_path:
+                        key_timings = maplus_mesh_targets.apply_mesh_transform(
+                            item,
+                            axis_rotate_loc,
+                            self.target,
+                            addon_data,
+                            journal=self.journal,
+                            weights=inputs['weights'][item.name]
+                        )
+                        if key_timings is None:
+                            self.report(
+                                {'WARNING'},
+                                'Skipped "{0}": no active vertex group.'.format(
+                                    item.name
+                                )
+                            )
+                        elif key_timings:
+                            self.report(
+                                {'INFO'},
+                                maplus_mesh_targets.format_key_timings(
+                                    item,
+                                    key_timings
+                                )
+                            )
+                    else:
+                        src_mesh.to_mesh(item.data)
+                        src_mesh.free()
 
             # Go back to whatever mode we were in before doing this
             bpy.ops.object.mode_set(mode=previous_mode)
@@ -261,6 +374,8 @@ class MAPLUS_OT_AxisRotateBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
+        if not redo_inputs:
+            maplus_redo_cache.store_inputs(self, inputs)
         return {'FINISHED'}
 
 
@@ -327,6 +442,24 @@ class MAPLUS_OT_AxisRotateWholeMesh(MAPLUS_OT_AxisRotateBase):
         return True
 
 
+class MAPLUS_OT_AxisRotateVertexGroup(MAPLUS_OT_AxisRotateBase):
+    bl_idname = "maplus.axisrotatevertexgroup"
+    bl_label = "Axis Rotate Vertex Group"
+    bl_description = (
+        "Rotates the verts in the active vertex group around an"
+        " axis"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
 class MAPLUS_OT_QuickAxisRotateMeshSelected(MAPLUS_OT_AxisRotateBase):
     bl_idname = "maplus.quickaxisrotatemeshselected"
     bl_label = "Axis Rotate"
@@ -359,6 +492,238 @@ class MAPLUS_OT_QuickAxisRotateWholeMesh(MAPLUS_OT_AxisRotateBase):
         return True
 
 
+class MAPLUS_OT_QuickAxisRotateVertexGroup(MAPLUS_OT_AxisRotateBase):
+    bl_idname = "maplus.quickaxisrotatevertexgroup"
+    bl_label = "Quick Axis Rotate Vertex Group"
+    bl_description = (
+        "Rotates the verts in the active vertex group around an"
+        " axis"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+    quick_op_target = True
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
+# Custom property holding an object's stored axis: a line in the object's
+# local space, as 6 floats (start xyz, end xyz)
+AXIS_PROPERTY_KEY = 'maplus_axis'
+LOCAL_AXIS_COLUMNS = {
+    'LOCAL_X': 0,
+    'LOCAL_Y': 1,
+    'LOCAL_Z': 2,
+}
+
+
+def get_object_axes(objects, world_matrices, axis_mode):
+    '''Derive a global axis line for every object.
+
+    Arguments:
+        objects
+            a sequence of n Blender objects
+        world_matrices
+            (n, 4, 4) array of the objects' world matrices
+        axis_mode
+            see quick_axr_batch_axis
+
+    Returns:
+        Return a tuple (starts, directions, valid): (n, 3) arrays of axis
+        start points and (unnormalized) directions, and an (n,) bool
+        array, False for objects without a usable axis.
+    '''
+    object_count = len(objects)
+    if axis_mode in LOCAL_AXIS_COLUMNS:
+        starts = world_matrices[:, :3, 3]
+        directions = world_matrices[:, :3, LOCAL_AXIS_COLUMNS[axis_mode]]
+    else:
+        local_starts = numpy.zeros((object_count, 3))
+        local_ends = numpy.zeros((object_count, 3))
+        stored = numpy.ones(object_count, dtype=bool)
+        if axis_mode == 'BOUND_BOX':
+            corners = numpy.array([item.bound_box for item in objects])
+            low = corners.min(axis=1)
+            high = corners.max(axis=1)
+            # Longest edge measured in global space (the objects can be
+            # scaled non-uniformly)
+            global_edges = (
+                world_matrices[:, :3, :3] *
+                (high - low)[:, numpy.newaxis, :]
+            )
+            longest = numpy.linalg.norm(global_edges, axis=1).argmax(axis=1)
+            rows = numpy.arange(object_count)
+            local_starts[:] = (low + high) / 2
+            local_starts[rows, longest] = low[rows, longest]
+            local_ends[:] = local_starts
+            local_ends[rows, longest] = high[rows, longest]
+        else:
+            for row, item in enumerate(objects):
+                stored_axis = item.get(AXIS_PROPERTY_KEY)
+                if stored_axis is None or len(stored_axis) != 6:
+                    stored[row] = False
+                    continue
+                local_starts[row] = stored_axis[0:3]
+                local_ends[row] = stored_axis[3:6]
+        starts = (
+            numpy.einsum('nij,nj->ni', world_matrices[:, :3, :3], local_starts)
+            + world_matrices[:, :3, 3]
+        )
+        directions = numpy.einsum(
+            'nij,nj->ni',
+            world_matrices[:, :3, :3],
+            local_ends - local_starts
+        )
+        if axis_mode == 'STORED':
+            directions[~stored] = 0.0
+
+    valid = numpy.linalg.norm(directions, axis=1) > 0
+    return starts, directions, valid
+
+
+def axis_rotation_matrices(starts, directions, angle):
+    '''Build a stack of 4x4 rotations, one per axis line.
+
+    Each matrix rotates by angle (radians) around its axis line
+    (Rodrigues' formula, for every axis at once).
+
+    Returns:
+        Return an (n, 4, 4) float64 array.
+    '''
+    axis_count = len(starts)
+    units = (
+        directions /
+        numpy.linalg.norm(directions, axis=1)[:, numpy.newaxis]
+    )
+    cross = numpy.zeros((axis_count, 3, 3))
+    cross[:, 0, 1] = -units[:, 2]
+    cross[:, 0, 2] = units[:, 1]
+    cross[:, 1, 0] = units[:, 2]
+    cross[:, 1, 2] = -units[:, 0]
+    cross[:, 2, 0] = -units[:, 1]
+    cross[:, 2, 1] = units[:, 0]
+    rotations = (
+        numpy.eye(3) +
+        math.sin(angle) * cross +
+        (1 - math.cos(angle)) * (cross @ cross)
+    )
+
+    # Rotate about the axis start: T(start) R T(-start)
+    matrices = numpy.zeros((axis_count, 4, 4))
+    matrices[:, :3, :3] = rotations
+    matrices[:, :3, 3] = (
+        starts - numpy.einsum('nij,nj->ni', rotations, starts)
+    )
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+class MAPLUS_OT_QuickAxisRotateEachObject(bpy.types.Operator):
+    bl_idname = "maplus.quickaxisrotateeachobject"
+    bl_label = "Rotate Each Object"
+    bl_description = (
+        "Rotates every selected object around its own axis (a local axis,"
+        " its longest bounding box edge or a stored axis line)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        targets = [
+            item for item in bpy.context.scene.objects
+            if maplus_geom.get_select_state(item)
+        ]
+        if not targets:
+            self.report({'ERROR'}, 'Cannot complete: no objects selected.')
+            return {'CANCELLED'}
+
+        # Get rotation in proper units (radians)
+        rot_amount = addon_data.quick_axis_rotate_transf.axr_amount
+        if (bpy.context.scene.unit_settings.system_rotation != 'RADIANS'):
+            rot_amount = math.radians(rot_amount)
+
+        world_matrices = numpy.array(
+            [item.matrix_world for item in targets],
+            dtype=numpy.float64
+        )
+        starts, directions, valid = get_object_axes(
+            targets,
+            world_matrices,
+            addon_data.quick_axr_batch_axis
+        )
+        if not valid.any():
+            self.report(
+                {'ERROR'},
+                'Cannot complete: no selected object has a usable axis.'
+            )
+            return {'CANCELLED'}
+
+        new_matrices = (
+            axis_rotation_matrices(
+                starts[valid],
+                directions[valid],
+                rot_amount
+            ) @ world_matrices[valid]
+        )
+        maplus_geom.set_world_matrices(
+            [item for item, ok in zip(targets, valid.tolist()) if ok],
+            new_matrices
+        )
+
+        skipped = len(targets) - numpy.count_nonzero(valid)
+        if skipped:
+            self.report(
+                {'WARNING'},
+                '{0} objects without a usable axis were skipped'.format(
+                    skipped
+                )
+            )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_QuickAxisRotateStoreAxis(bpy.types.Operator):
+    bl_idname = "maplus.quickaxisrotatestoreaxis"
+    bl_label = "Store Axis on Objects"
+    bl_description = (
+        "Stores the source axis line on every selected object (in the"
+        " object's local space), for rotating each object around its"
+        " stored axis"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        targets = [
+            item for item in bpy.context.scene.objects
+            if maplus_geom.get_select_state(item)
+        ]
+        if not targets:
+            self.report({'ERROR'}, 'Cannot complete: no objects selected.')
+            return {'CANCELLED'}
+
+        axis_start, axis_end = maplus_geom.get_modified_global_coords(
+            geometry=addon_data.quick_axis_rotate_src,
+            kind='LINE'
+        )
+        if (axis_end - axis_start).length == 0:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: the source axis has zero length.'
+            )
+            return {'CANCELLED'}
+        for item in targets:
+            to_local = item.matrix_world.inverted_safe()
+            item[AXIS_PROPERTY_KEY] = (
+                list(to_local @ axis_start) + list(to_local @ axis_end)
+            )
+
+        return {'FINISHED'}
+
+
 class MAPLUS_PT_QuickAxisRotateGUI(bpy.types.Panel):
     bl_idname = "MAPLUS_PT_QuickAxisRotateGUI"
     bl_label = "Quick Axis Rotate"
@@ -537,6 +902,17 @@ class MAPLUS_PT_QuickAxisRotateGUI(bpy.types.Panel):
             'axr_amount',
             text='Amount'
         )
+        axr_each_object = axr_mods.row(align=True)
+        axr_each_object.prop(addon_data, 'quick_axr_batch_axis', text="")
+        axr_each_object.operator(
+            "maplus.quickaxisrotatestoreaxis",
+            icon='PINNED',
+            text=""
+        )
+        axr_each_object.operator(
+            "maplus.quickaxisrotateeachobject",
+            icon='PIVOT_INDIVIDUAL'
+        )
         axr_apply_header = axr_gui.row()
         axr_apply_header.label(text="Apply to:")
         axr_apply_header.prop(
@@ -556,10 +932,29 @@ class MAPLUS_PT_QuickAxisRotateGUI(bpy.types.Panel):
         )
         axr_mesh_apply_items = axr_apply_items.column(align=True)
         axr_mesh_apply_items.operator(
-            "maplus.quickaxisrotatemeshselected",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickaxisrotatemeshselected",
+                addon_data
+            ),
             text="Mesh Piece"
         )
         axr_mesh_apply_items.operator(
-            "maplus.quickaxisrotatewholemesh",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickaxisrotatewholemesh",
+                addon_data
+            ),
             text="Whole Mesh"
         )
+        axr_mesh_apply_items.operator(
+            maplus_guitools.mesh_op_id(
+                "maplus.quickaxisrotatevertexgroup",
+                addon_data
+            ),
+            text="Vertex Group"
+        )
+        axr_mesh_apply_items.prop(
+            addon_data,
+            'vertex_group_blend',
+            text="Blend Weights"
+        )
+        maplus_guitools.layout_mesh_falloff(axr_mesh_apply_items, addon_data)
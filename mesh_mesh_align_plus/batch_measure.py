@@ -0,0 +1,447 @@
+"""Batch (all-pairs) measurements, internals & UI."""
+
+
+import csv
+
+import bpy
+import bpy_extras.io_utils
+import numpy
+
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.packed_storage as maplus_packed
+
+
+# Item kind measured by each measurement type
+MEASURED_KINDS = {
+    'DISTANCE': 'POINT',
+    'ANGLE': 'LINE',
+}
+
+
+def gather_measure_items(addon_data, measurement):
+    '''Pack the items to measure into a numpy array.
+
+    Arguments:
+        addon_data
+            the scene's MAPlusData
+        measurement
+            'DISTANCE' (packs point locations) or 'ANGLE' (packs unit
+            line directions, zero length lines become NaN)
+
+    Returns:
+        Return a tuple (ids, names, data): stable IDs (list items or
+        packed library items), item names, and an (n, 3) float64 array.
+    '''
+    kind = MEASURED_KINDS[measurement]
+    if addon_data.batch_measure_source == 'PACKED':
+        library = maplus_packed.get_library()
+        ids, coords = library.coords_by_kind(kind)
+        names = [library.name(item_id) for item_id in ids.tolist()]
+        if kind == 'POINT':
+            data = coords[:, 0]
+        else:
+            data = coords[:, 1] - coords[:, 0]
+    else:
+        items = [
+            item for item in addon_data.prim_list if item.kind == kind
+        ]
+        ids = numpy.array([item.uid for item in items], dtype=numpy.int64)
+        names = [item.name for item in items]
+        data = numpy.zeros((len(items), 3))
+        for row, item in enumerate(items):
+            # Item modifiers are applied, like the single item calcs
+            global_data = maplus_geom.get_modified_global_coords(
+                geometry=item,
+                kind=kind
+            )
+            if kind == 'POINT':
+                data[row] = global_data[0]
+            else:
+                data[row] = global_data[1] - global_data[0]
+
+    data = numpy.asarray(data, dtype=numpy.float64)
+    if kind == 'LINE':
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            data = data / numpy.linalg.norm(data, axis=1)[:, numpy.newaxis]
+    return ids, names, data
+
+
+def pairwise_blocks(data, measurement, chunk_size, degrees=False):
+    '''Compute the all-pairs matrix in blocks of rows.
+
+    Only chunk_size rows of the (n, n) matrix exist at any one time, so
+    memory stays bounded for large item counts.
+
+    Yields:
+        Tuples (first_row, block), block is a (rows, n) float64 array.
+    '''
+    for first_row in range(0, len(data), chunk_size):
+        rows = data[first_row:first_row + chunk_size]
+        if measurement == 'DISTANCE':
+            block = numpy.sqrt(
+                ((rows[:, numpy.newaxis, :] - data) ** 2).sum(axis=2)
+            )
+        else:
+            block = numpy.arccos(numpy.clip(rows @ data.T, -1.0, 1.0))
+            if degrees:
+                block = numpy.degrees(block)
+        yield first_row, block
+
+
+def pair_mask(block, first_row, filter_mode, nominal, tolerance):
+    # Upper triangle of the block (each unordered pair once, no self
+    # pairs) combined with the tolerance filter. NaN values (zero length
+    # lines) never pass a tolerance filter
+    row_numbers = numpy.arange(first_row, first_row + block.shape[0])
+    mask = numpy.arange(block.shape[1]) > row_numbers[:, numpy.newaxis]
+    deviation = numpy.abs(block - nominal)
+    with numpy.errstate(invalid='ignore'):
+        if filter_mode == 'WITHIN':
+            mask &= deviation <= tolerance
+        elif filter_mode == 'OUTSIDE':
+            mask &= deviation > tolerance
+    return mask
+
+
+def measure_all_pairs(addon_data, block_handler=None, items=None):
+    '''Measure every pair of items with the scene's batch settings.
+
+    Arguments:
+        addon_data
+            the scene's MAPlusData (holds the batch_measure_* settings)
+        block_handler
+            optional callable(first_row, block, ids, names), called with
+            each block of the full matrix as it is computed (used to
+            stream exports)
+        items
+            optional (ids, names, data) from gather_measure_items(), to
+            reuse items that were already gathered
+
+    Returns:
+        Return a dict with the item 'ids' and 'names', the number of
+        'pairs', 'min'/'max'/'mean' over every pair, the number of pairs
+        'kept' by the filter and (unless every pair is kept) the kept
+        pairs as index arrays 'kept_a'/'kept_b' and 'kept_values'.
+    '''
+    measurement = addon_data.batch_measure_kind
+    if items is None:
+        items = gather_measure_items(addon_data, measurement)
+    ids, names, data = items
+    degrees = (
+        measurement == 'ANGLE' and
+        bpy.context.scene.unit_settings.system_rotation != 'RADIANS'
+    )
+
+    kept_a = []
+    kept_b = []
+    kept_values = []
+    running_min = numpy.inf
+    running_max = -numpy.inf
+    running_sum = 0.0
+    valid_count = 0
+    for first_row, block in pairwise_blocks(
+            data,
+            measurement,
+            addon_data.batch_measure_chunk_size,
+            degrees):
+        if block_handler:
+            block_handler(first_row, block, ids, names)
+
+        upper = pair_mask(block, first_row, 'ALL', 0.0, 0.0)
+        upper_values = block[upper]
+        upper_values = upper_values[~numpy.isnan(upper_values)]
+        if len(upper_values):
+            running_min = min(running_min, upper_values.min())
+            running_max = max(running_max, upper_values.max())
+            running_sum += upper_values.sum()
+            valid_count += len(upper_values)
+
+        if addon_data.batch_measure_filter == 'ALL':
+            # Every pair is kept, don't collect them
+            continue
+        rows, cols = numpy.nonzero(
+            pair_mask(
+                block,
+                first_row,
+                addon_data.batch_measure_filter,
+                addon_data.batch_measure_nominal,
+                addon_data.batch_measure_tolerance
+            )
+        )
+        kept_a.append(rows + first_row)
+        kept_b.append(cols)
+        kept_values.append(block[rows, cols])
+
+    pair_count = len(data) * (len(data) - 1) // 2
+    empty = numpy.zeros(0, dtype=numpy.int64)
+    return {
+        'ids': ids,
+        'names': names,
+        'pairs': pair_count,
+        'kept': (
+            pair_count if addon_data.batch_measure_filter == 'ALL'
+            else sum(len(values) for values in kept_values)
+        ),
+        'min': running_min if valid_count else None,
+        'max': running_max if valid_count else None,
+        'mean': running_sum / valid_count if valid_count else None,
+        'kept_a': numpy.concatenate(kept_a) if kept_a else empty,
+        'kept_b': numpy.concatenate(kept_b) if kept_b else empty,
+        'kept_values': (
+            numpy.concatenate(kept_values) if kept_values
+            else numpy.zeros(0)
+        ),
+    }
+
+
+def format_summary(results):
+    if not results['pairs']:
+        return 'Nothing to measure: at least two items are needed'
+    if results['min'] is None:
+        return '{0} pairs, no valid measurements'.format(results['pairs'])
+    return (
+        '{0} pairs, min {1:.6g}, max {2:.6g}, mean {3:.6g}, {4} kept'
+    ).format(
+        results['pairs'],
+        results['min'],
+        results['max'],
+        results['mean'],
+        results['kept']
+    )
+
+
+class MAPLUS_OT_BatchMeasure(bpy.types.Operator):
+    bl_idname = "maplus.batchmeasure"
+    bl_label = "Measure All Pairs"
+    bl_description = (
+        "Measures every pair of items (distances between points or angles"
+        " between lines) and reports the results"
+    )
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+
+        results = measure_all_pairs(addon_data)
+        if not results['pairs']:
+            self.report({'ERROR'}, format_summary(results))
+            return {'CANCELLED'}
+        self.report({'INFO'}, format_summary(results))
+
+        return {'FINISHED'}
+
+
+class CsvMatrixWriter(object):
+    # Streams matrix blocks to a CSV file (the header row and the first
+    # column hold the item names)
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.export_file = None
+
+    def __call__(self, first_row, block, ids, names):
+        if self.export_file is None:
+            self.export_file = open(self.filepath, 'w', newline='')
+            self.writer = csv.writer(self.export_file)
+            self.writer.writerow([''] + names)
+        for offset, row in enumerate(block):
+            self.writer.writerow(
+                [names[first_row + offset]] +
+                numpy.char.mod('%.9g', row).tolist()
+            )
+
+    def close(self):
+        if self.export_file is not None:
+            self.export_file.close()
+            self.export_file = None
+
+
+class NpyMatrixWriter(object):
+    # Streams matrix blocks into a memory mapped .npy file, the matrix is
+    # never held in memory as a whole
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.matrix = None
+
+    def __call__(self, first_row, block, ids, names):
+        if self.matrix is None:
+            self.matrix = numpy.lib.format.open_memmap(
+                self.filepath,
+                mode='w+',
+                dtype=numpy.float64,
+                shape=(len(ids), len(ids))
+            )
+        self.matrix[first_row:first_row + len(block)] = block
+
+    def close(self):
+        if self.matrix is not None:
+            self.matrix.flush()
+            self.matrix = None
+
+
+def write_pairs_csv(filepath, results):
+    names = results['names']
+    with open(filepath, 'w', newline='') as export_file:
+        writer = csv.writer(export_file)
+        writer.writerow(['item_a', 'item_b', 'value'])
+        for index_a, index_b, value in zip(
+                results['kept_a'].tolist(),
+                results['kept_b'].tolist(),
+                results['kept_values'].tolist()):
+            writer.writerow([names[index_a], names[index_b], '%.9g' % value])
+
+
+def write_pairs_npy(filepath, results):
+    # Structured array of (stable ID, stable ID, value) records
+    pairs = numpy.zeros(
+        len(results['kept_values']),
+        dtype=[
+            ('id_a', numpy.int64),
+            ('id_b', numpy.int64),
+            ('value', numpy.float64)
+        ]
+    )
+    pairs['id_a'] = results['ids'][results['kept_a']]
+    pairs['id_b'] = results['ids'][results['kept_b']]
+    pairs['value'] = results['kept_values']
+    numpy.save(filepath, pairs)
+
+
+MATRIX_WRITERS = {
+    'CSV': CsvMatrixWriter,
+    'NPY': NpyMatrixWriter,
+}
+PAIR_WRITERS = {
+    'CSV': write_pairs_csv,
+    'NPY': write_pairs_npy,
+}
+
+
+class MAPLUS_OT_ExportBatchMeasureBase(bpy.types.Operator,
+                                       bpy_extras.io_utils.ExportHelper):
+    bl_idname = "maplus.exportbatchmeasurebase"
+    bl_label = "Export Batch Measurements Base"
+    bl_description = "Export batch measurements base class"
+    bl_options = {'REGISTER'}
+    # File format, provided by derived classes
+    export_format = None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+
+        # Check for pairs before any file is opened (the matrix writers
+        # create/truncate the export file on the first block)
+        items = gather_measure_items(
+            addon_data,
+            addon_data.batch_measure_kind
+        )
+        if len(items[2]) < 2:
+            self.report({'ERROR'}, format_summary({'pairs': 0}))
+            return {'CANCELLED'}
+
+        # The full matrix is exported (streamed while it is computed) when
+        # every pair is kept, otherwise only the kept pairs are
+        if addon_data.batch_measure_filter == 'ALL':
+            matrix_writer = MATRIX_WRITERS[self.export_format](self.filepath)
+            try:
+                results = measure_all_pairs(
+                    addon_data,
+                    matrix_writer,
+                    items
+                )
+            finally:
+                matrix_writer.close()
+        else:
+            results = measure_all_pairs(addon_data, items=items)
+        if addon_data.batch_measure_filter != 'ALL':
+            PAIR_WRITERS[self.export_format](self.filepath, results)
+
+        self.report(
+            {'INFO'},
+            '{0} (exported to {1})'.format(
+                format_summary(results),
+                bpy.path.basename(self.filepath)
+            )
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_ExportBatchMeasureCSV(MAPLUS_OT_ExportBatchMeasureBase):
+    bl_idname = "maplus.exportbatchmeasurecsv"
+    bl_label = "Export Measurements (CSV)"
+    bl_description = (
+        "Measures every pair of items and writes the matrix (or the"
+        " pairs kept by the filter) to a CSV file"
+    )
+    bl_options = {'REGISTER'}
+    export_format = 'CSV'
+    filename_ext = ".csv"
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.csv",
+        options={'HIDDEN'}
+    )
+
+
+class MAPLUS_OT_ExportBatchMeasureNPY(MAPLUS_OT_ExportBatchMeasureBase):
+    bl_idname = "maplus.exportbatchmeasurenpy"
+    bl_label = "Export Measurements (NPY)"
+    bl_description = (
+        "Measures every pair of items and writes the matrix (or the"
+        " pairs kept by the filter) to a NumPy .npy file"
+    )
+    bl_options = {'REGISTER'}
+    export_format = 'NPY'
+    filename_ext = ".npy"
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.npy",
+        options={'HIDDEN'}
+    )
+
+
+class MAPLUS_PT_BatchMeasureGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_BatchMeasureGUI"
+    bl_label = "Mesh Align Plus Batch Measurements"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        maplus_data_ptr = bpy.types.AnyType(bpy.context.scene.maplus_data)
+
+        settings = layout.column(align=True)
+        settings.prop(maplus_data_ptr, 'batch_measure_kind', text="")
+        settings.prop(maplus_data_ptr, 'batch_measure_source', text="")
+        layout.prop(maplus_data_ptr, 'batch_measure_filter', text="Filter")
+        tolerance_row = layout.row(align=True)
+        tolerance_row.prop(
+            maplus_data_ptr,
+            'batch_measure_nominal',
+            text="Nominal"
+        )
+        tolerance_row.prop(
+            maplus_data_ptr,
+            'batch_measure_tolerance',
+            text="Tolerance"
+        )
+        layout.prop(
+            maplus_data_ptr,
+            'batch_measure_chunk_size',
+            text="Rows per Chunk"
+        )
+        layout.operator("maplus.batchmeasure", icon='DRIVER_DISTANCE')
+        export_row = layout.row(align=True)
+        export_row.operator(
+            "maplus.exportbatchmeasurecsv",
+            icon='EXPORT',
+            text="Export CSV"
+        )
+        export_row.operator(
+            "maplus.exportbatchmeasurenpy",
+            icon='EXPORT',
+            text="Export NPY"
+        )
@@ -6,11 +6,365 @@ import math
 import bpy
 import mathutils
 
+import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.storage as maplus_storage
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
 
 
+# Calculation recipes: the math behind each calc/compose operator, shared by
+# the operators and by the dependency graph (which re-runs the recipe that
+# produced an item when one of its inputs changes, see evaluate_item()).
+# Numeric recipes return the result, compose recipes fill in result_item
+# and return whether they succeeded
+def calc_line_length(targets):
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='LINE'
+    )
+    src_line = src_global_data[1] - src_global_data[0]
+    return src_line.length
+
+
+def calc_rotational_diff(targets):
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='LINE'
+    )
+    dest_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[1],
+        kind='LINE'
+    )
+    src_line = src_global_data[1] - src_global_data[0]
+    dest_line = dest_global_data[1] - dest_global_data[0]
+
+    axis, angle = (
+        src_line.rotation_difference(dest_line).to_axis_angle()
+    )
+    # Get rotation in proper units (radians)
+    if (bpy.context.scene.unit_settings.system_rotation == 'RADIANS'):
+        return angle
+    return math.degrees(angle)
+
+
+def calc_distance_between_points(targets):
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='POINT'
+    )
+    dest_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[1],
+        kind='POINT'
+    )
+    src_pt = src_global_data[0]
+    dest_pt = dest_global_data[0]
+
+    return (dest_pt - src_pt).length
+
+
+def compose_line_from_origin(targets, result_item):
+    start_loc = mathutils.Vector((0, 0, 0))
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='LINE'
+    )
+    src_line = src_global_data[1] - src_global_data[0]
+
+    result_item.kind = 'LINE'
+    result_item.line_start = start_loc
+    result_item.line_end = (
+        start_loc + src_line
+    )
+    return True
+
+
+def compose_normal_from_plane(targets, result_item):
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='PLANE'
+    )
+    line_BA = (
+        src_global_data[0] -
+        src_global_data[1]
+    )
+    line_BC = (
+        src_global_data[2] -
+        src_global_data[1]
+    )
+    normal = line_BA.cross(line_BC)
+    normal.normalize()
+    start_loc = mathutils.Vector(src_global_data[1])
+
+    result_item.kind = 'LINE'
+    result_item.line_start = start_loc
+    result_item.line_end = start_loc + normal
+    return True
+
+
+def compose_line_from_point(targets, result_item):
+    start_loc = mathutils.Vector((0, 0, 0))
+
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='POINT'
+    )
+
+    result_item.kind = 'LINE'
+    result_item.line_start = start_loc
+    result_item.line_end = src_global_data[0]
+    return True
+
+
+def compose_line_at_point_location(targets, result_item):
+    targets_by_kind = {item.kind: item for item in targets}
+    pt_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets_by_kind['POINT'],
+        kind='POINT'
+    )
+    line_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets_by_kind['LINE'],
+        kind='LINE'
+    )
+    start_loc = pt_global_data[0]
+    src_line = line_global_data[1] - line_global_data[0]
+
+    result_item.kind = 'LINE'
+    result_item.line_start = start_loc
+    result_item.line_end = start_loc + src_line
+    return True
+
+
+def compose_line_from_points(targets, result_item):
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='POINT'
+    )
+    dest_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[1],
+        kind='POINT'
+    )
+    src_pt = src_global_data[0]
+    dest_pt = dest_global_data[0]
+
+    result_item.kind = 'LINE'
+    result_item.line_start = src_pt
+    result_item.line_end = dest_pt
+    return True
+
+
+def _line_vectors(targets):
+    start_loc = mathutils.Vector((0, 0, 0))
+
+    src_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[0],
+        kind='LINE'
+    )
+    dest_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets[1],
+        kind='LINE'
+    )
+    src_line = src_global_data[1] - src_global_data[0]
+    dest_line = dest_global_data[1] - dest_global_data[0]
+    return start_loc, src_line, dest_line
+
+
+def compose_line_vector_addition(targets, result_item):
+    start_loc, src_line, dest_line = _line_vectors(targets)
+
+    result_item.kind = 'LINE'
+    result_item.line_start = start_loc
+    result_item.line_end = src_line + dest_line
+    return True
+
+
+def compose_line_vector_subtraction(targets, result_item):
+    start_loc, src_line, dest_line = _line_vectors(targets)
+
+    result_item.kind = 'LINE'
+    result_item.line_start = start_loc
+    result_item.line_end = src_line - dest_line
+    return True
+
+
+def compose_point_intersecting_line_plane(targets, result_item):
+    targets_by_kind = {item.kind: item for item in targets}
+    line_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets_by_kind['LINE'],
+        kind='LINE'
+    )
+    plane_global_data = maplus_geom.get_modified_global_coords(
+        geometry=targets_by_kind['PLANE'],
+        kind='PLANE'
+    )
+
+    plane_line_ba = plane_global_data[0] - plane_global_data[1]
+    plane_line_bc = plane_global_data[2] - plane_global_data[1]
+    plane_normal = plane_line_ba.cross(plane_line_bc)
+    intersection = mathutils.geometry.intersect_line_plane(
+        line_global_data[0],
+        line_global_data[1],
+        plane_global_data[1],
+        plane_normal
+    )
+    if not intersection:
+        return False
+
+    result_item.kind = 'POINT'
+    result_item.point = intersection
+    return True
+
+
+# Recipe name (stored on items as calc_recipe) -> (function, is numeric)
+CALC_RECIPES = {
+    'LINELENGTH': (calc_line_length, True),
+    'ROTATIONALDIFF': (calc_rotational_diff, True),
+    'DISTANCEBETWEENPOINTS': (calc_distance_between_points, True),
+    'LINEFROMORIGIN': (compose_line_from_origin, False),
+    'NORMALFROMPLANE': (compose_normal_from_plane, False),
+    'LINEFROMPOINT': (compose_line_from_point, False),
+    'LINEATPOINTLOCATION': (compose_line_at_point_location, False),
+    'LINEFROMPOINTS': (compose_line_from_points, False),
+    'LINEVECTORADDITION': (compose_line_vector_addition, False),
+    'LINEVECTORSUBTRACTION': (compose_line_vector_subtraction, False),
+    'POINTINTERSECTINGLINEPLANE': (
+        compose_point_intersecting_line_plane,
+        False
+    ),
+}
+
+
+def calc_result_attrib(calculation):
+    if calculation.calc_type == 'SINGLEITEM':
+        return 'single_calc_result'
+    return 'multi_calc_result'
+
+
+def get_calc_targets(calculation, scene=None, visiting=None):
+    # The (evaluated) target items of a calculation item, in order, or
+    # None if a target was removed from the list
+    targets = []
+    for attrib in maplus_storage.CALC_REFERENCES[calculation.calc_type]:
+        target = maplus_storage.get_reference(calculation, attrib, scene)
+        if target is None:
+            return None
+        targets.append(evaluate_item(target, scene, visiting))
+    return targets
+
+
+def evaluate_item(item, scene=None, visiting=None):
+    '''Bring an item (and everything it depends on) up to date.
+
+    Only items flagged with needs_update are recomputed, everything else
+    is used as-is (each item stores its own last result, so results are
+    memoized in the items themselves). Items whose inputs were removed
+    are left flagged and unchanged.
+
+    Arguments:
+        item
+            a MAPlusPrimitive from prim_list
+        scene
+            the scene holding prim_list (defaults to the context scene)
+
+    Returns:
+        Return the item.
+
+    Raises DependencyCycleError if the item (indirectly) depends on
+    itself.
+    '''
+    if not item.needs_update:
+        return item
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    visiting = visiting if visiting is not None else set()
+    if item.uid in visiting:
+        raise maplus_except.DependencyCycleError()
+    visiting.add(item.uid)
+
+    if item.derived_from_uid:
+        # Composed item: re-run its recipe on the calc's current targets
+        calc_row = maplus_storage.get_prim_row(item.derived_from_uid, scene)
+        calculation = prims[calc_row] if calc_row is not None else None
+    elif item.kind == 'CALCULATION':
+        calculation = item
+    else:
+        calculation = None
+
+    if calculation is not None:
+        targets = get_calc_targets(calculation, scene, visiting)
+        recipe = CALC_RECIPES.get(item.calc_recipe)
+        if targets is not None and recipe is not None:
+            function, is_numeric = recipe
+            if is_numeric:
+                setattr(item, calc_result_attrib(item), function(targets))
+                item.needs_update = False
+            elif item is not calculation:
+                if function(targets, item):
+                    item.needs_update = False
+            else:
+                # Compose recipes don't store anything on the calc itself
+                item.needs_update = False
+    elif item.kind == 'TRANSFORMATION':
+        # Transformations are only brought up to date by running them,
+        # but their inputs can be evaluated ahead of time
+        for attrib in maplus_storage.TRANSF_REFERENCES[item.transf_type]:
+            target = maplus_storage.get_reference(item, attrib, scene)
+            if target is not None:
+                evaluate_item(target, scene, visiting)
+        for step in item.transf_stack:
+            row = maplus_storage.get_prim_row(step.uid, scene)
+            if row is not None:
+                evaluate_item(prims[row], scene, visiting)
+    else:
+        item.needs_update = False
+
+    visiting.discard(item.uid)
+    return item
+
+
+def get_evaluated_reference(item, attrib, scene=None):
+    # Like storage.get_reference(), but brings the target up to date first
+    target = maplus_storage.get_reference(item, attrib, scene)
+    if target is not None:
+        evaluate_item(target, scene)
+    return target
+
+
+class MAPLUS_OT_UpdateDependentItems(bpy.types.Operator):
+    bl_idname = "maplus.updatedependentitems"
+    bl_label = "Update Dependent Items"
+    bl_description = (
+        "Recomputes every calculation result and composed item whose"
+        " inputs have changed"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        prims = bpy.context.scene.maplus_data.prim_list
+        stale_count = 0
+        for item in prims:
+            if not item.needs_update:
+                continue
+            try:
+                evaluate_item(item)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: "{0}" (indirectly) depends on'
+                     ' itself').format(item.name)
+                )
+                return {'CANCELLED'}
+            if item.needs_update and item.kind != 'TRANSFORMATION':
+                stale_count += 1
+
+        if stale_count:
+            self.report(
+                {'WARNING'},
+                ('{0} item(s) could not be updated, an item they use was'
+                 ' removed from the list').format(stale_count)
+            )
+        return {'FINISHED'}
+
+
 class MAPLUS_OT_CalcLineLengthBase(bpy.types.Operator):
     bl_idname = "maplus.calclinelengthbase"
     bl_label = "Calculate Line Length"
@@ -27,7 +381,27 @@ class MAPLUS_OT_CalcLineLengthBase(bpy.types.Operator):
         else:
             active_calculation = prims[addon_data.active_list_item]
             result_attrib = 'single_calc_result'
-            calc_target_item = prims[active_calculation.single_calc_target]
+            calc_target_item = maplus_storage.get_reference(
+                active_calculation,
+                'single_calc_target'
+            )
+        if calc_target_item is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operand: the target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and calc_target_item.kind != 'LINE'):
@@ -46,13 +420,10 @@ class MAPLUS_OT_CalcLineLengthBase(bpy.types.Operator):
                      ' calculation (type should be set to "Line").')
                 )
 
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_item,
-            kind='LINE'
-        )
-        src_line = src_global_data[1] - src_global_data[0]
-        result = src_line.length
+        result = calc_line_length([calc_target_item])
         setattr(active_calculation, result_attrib, result)
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(active_calculation, 'LINELENGTH')
         if addon_data.calc_result_to_clipboard:
             bpy.context.window_manager.clipboard = str(result)
 
@@ -104,8 +475,31 @@ class MAPLUS_OT_CalcRotationalDiffBase(bpy.types.Operator):
         else:
             active_calculation = prims[addon_data.active_list_item]
             result_attrib = 'multi_calc_result'
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and not (calc_target_one.kind == 'LINE'
@@ -127,27 +521,12 @@ class MAPLUS_OT_CalcRotationalDiffBase(bpy.types.Operator):
                      ' set to "Line").')
                 )
 
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_one,
-            kind='LINE'
-        )
-        dest_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_two,
-            kind='LINE'
+        result = calc_rotational_diff(
+            [calc_target_one, calc_target_two]
         )
-        src_line = src_global_data[1] - src_global_data[0]
-        dest_line = dest_global_data[1] - dest_global_data[0]
-
-        axis, angle = (
-            src_line.rotation_difference(dest_line).to_axis_angle()
-        )
-        # Get rotation in proper units (radians)
-        if (bpy.context.scene.unit_settings.system_rotation == 'RADIANS'):
-            result = angle
-        else:
-            result = math.degrees(angle)
-
         setattr(active_calculation, result_attrib, result)
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(active_calculation, 'ROTATIONALDIFF')
         if addon_data.calc_result_to_clipboard:
             bpy.context.window_manager.clipboard = str(result)
 
@@ -200,7 +579,27 @@ class MAPLUS_OT_ComposeNewLineFromOriginBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_item = prims[active_calculation.single_calc_target]
+            calc_target_item = maplus_storage.get_reference(
+                active_calculation,
+                'single_calc_target'
+            )
+        if calc_target_item is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operand: the target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and calc_target_item.kind != 'LINE'):
@@ -219,18 +618,14 @@ class MAPLUS_OT_ComposeNewLineFromOriginBase(bpy.types.Operator):
                      ' calculation (type should be set to "Line").')
                 )
 
-        start_loc = mathutils.Vector((0, 0, 0))
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_item,
-            kind='LINE'
-        )
-        src_line = src_global_data[1] - src_global_data[0]
-
-        result_item.kind = 'LINE'
-        result_item.line_start = start_loc
-        result_item.line_end = (
-            start_loc + src_line
-        )
+        compose_line_from_origin([calc_target_item], result_item)
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(active_calculation, 'LINEFROMORIGIN')
+            maplus_storage.record_recipe(
+                result_item,
+                'LINEFROMORIGIN',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -287,7 +682,27 @@ class MAPLUS_OT_ComposeNormalFromPlaneBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_item = prims[active_calculation.single_calc_target]
+            calc_target_item = maplus_storage.get_reference(
+                active_calculation,
+                'single_calc_target'
+            )
+        if calc_target_item is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operand: the target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and not calc_target_item.kind == 'PLANE'):
@@ -306,27 +721,14 @@ class MAPLUS_OT_ComposeNormalFromPlaneBase(bpy.types.Operator):
                      ' calculation (type should be set to "Plane").')
                 )
 
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_item,
-            kind='PLANE'
-        )
-        line_BA = (
-            src_global_data[0] -
-            src_global_data[1]
-        )
-        line_BC = (
-            src_global_data[2] -
-            src_global_data[1]
-        )
-        normal = line_BA.cross(line_BC)
-        normal.normalize()
-        start_loc = mathutils.Vector(
-            calc_target_item.plane_pt_b[0:3]
-        )
-
-        result_item.kind = 'LINE'
-        result_item.line_start = start_loc
-        result_item.line_end = start_loc + normal
+        compose_normal_from_plane([calc_target_item], result_item)
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(active_calculation, 'NORMALFROMPLANE')
+            maplus_storage.record_recipe(
+                result_item,
+                'NORMALFROMPLANE',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -386,7 +788,27 @@ class MAPLUS_OT_ComposeNewLineFromPointBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_item = prims[active_calculation.single_calc_target]
+            calc_target_item = maplus_storage.get_reference(
+                active_calculation,
+                'single_calc_target'
+            )
+        if calc_target_item is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operand: the target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and calc_target_item.kind != 'POINT'):
@@ -405,16 +827,14 @@ class MAPLUS_OT_ComposeNewLineFromPointBase(bpy.types.Operator):
                      ' calculation (type should be set to "Point").')
                 )
 
-        start_loc = mathutils.Vector((0, 0, 0))
-
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_item,
-            kind='POINT'
-        )
-
-        result_item.kind = 'LINE'
-        result_item.line_start = start_loc
-        result_item.line_end = src_global_data[0]
+        compose_line_from_point([calc_target_item], result_item)
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(active_calculation, 'LINEFROMPOINT')
+            maplus_storage.record_recipe(
+                result_item,
+                'LINEFROMPOINT',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -478,8 +898,31 @@ class MAPLUS_OT_ComposeNewLineAtPointLocationBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
         targets_by_kind = {
             item.kind: item for item in [calc_target_one, calc_target_two]
         }
@@ -492,20 +935,20 @@ class MAPLUS_OT_ComposeNewLineAtPointLocationBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
-        pt_global_data = maplus_geom.get_modified_global_coords(
-            geometry=targets_by_kind['POINT'],
-            kind='POINT'
-        )
-        line_global_data = maplus_geom.get_modified_global_coords(
-            geometry=targets_by_kind['LINE'],
-            kind='LINE'
+        compose_line_at_point_location(
+            [calc_target_one, calc_target_two],
+            result_item
         )
-        start_loc = pt_global_data[0]
-        src_line = line_global_data[1] - line_global_data[0]
-
-        result_item.kind = 'LINE'
-        result_item.line_start = start_loc
-        result_item.line_end = start_loc + src_line
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(
+                active_calculation,
+                'LINEATPOINTLOCATION'
+            )
+            maplus_storage.record_recipe(
+                result_item,
+                'LINEATPOINTLOCATION',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -569,8 +1012,31 @@ class MAPLUS_OT_CalcDistanceBetweenPointsBase(bpy.types.Operator):
         else:
             active_calculation = prims[addon_data.active_list_item]
             result_attrib = 'multi_calc_result'
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and not (calc_target_one.kind == 'POINT'
@@ -592,19 +1058,15 @@ class MAPLUS_OT_CalcDistanceBetweenPointsBase(bpy.types.Operator):
                      ' set to "Point").')
                 )
 
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_one,
-            kind='POINT'
-        )
-        dest_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_two,
-            kind='POINT'
+        result = calc_distance_between_points(
+            [calc_target_one, calc_target_two]
         )
-        src_pt = src_global_data[0]
-        dest_pt = dest_global_data[0]
-
-        result = (dest_pt - src_pt).length
         setattr(active_calculation, result_attrib, result)
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(
+                active_calculation,
+                'DISTANCEBETWEENPOINTS'
+            )
         if addon_data.calc_result_to_clipboard:
             bpy.context.window_manager.clipboard = str(result)
 
@@ -654,8 +1116,31 @@ class MAPLUS_OT_ComposeNewLineFromPointsBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and not (calc_target_one.kind == 'POINT'
@@ -677,20 +1162,17 @@ class MAPLUS_OT_ComposeNewLineFromPointsBase(bpy.types.Operator):
                      ' set to "Point").')
                 )
 
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_one,
-            kind='POINT'
+        compose_line_from_points(
+            [calc_target_one, calc_target_two],
+            result_item
         )
-        dest_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_two,
-            kind='POINT'
-        )
-        src_pt = src_global_data[0]
-        dest_pt = dest_global_data[0]
-
-        result_item.kind = 'LINE'
-        result_item.line_start = src_pt
-        result_item.line_end = dest_pt
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(active_calculation, 'LINEFROMPOINTS')
+            maplus_storage.record_recipe(
+                result_item,
+                'LINEFROMPOINTS',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -749,8 +1231,31 @@ class MAPLUS_OT_ComposeNewLineVectorAdditionBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and not (calc_target_one.kind == 'LINE'
@@ -772,22 +1277,20 @@ class MAPLUS_OT_ComposeNewLineVectorAdditionBase(bpy.types.Operator):
                      ' set to "Line").')
                 )
 
-        start_loc = mathutils.Vector((0, 0, 0))
-
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_one,
-            kind='LINE'
+        compose_line_vector_addition(
+            [calc_target_one, calc_target_two],
+            result_item
         )
-        dest_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_two,
-            kind='LINE'
-        )
-        src_line = src_global_data[1] - src_global_data[0]
-        dest_line = dest_global_data[1] - dest_global_data[0]
-
-        result_item.kind = 'LINE'
-        result_item.line_start = start_loc
-        result_item.line_end = src_line + dest_line
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(
+                active_calculation,
+                'LINEVECTORADDITION'
+            )
+            maplus_storage.record_recipe(
+                result_item,
+                'LINEVECTORADDITION',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -849,8 +1352,31 @@ class MAPLUS_OT_ComposeNewLineVectorSubtractionBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
 
         if ((not hasattr(self, 'quick_calc_target'))
                 and not (calc_target_one.kind == 'LINE'
@@ -872,22 +1398,20 @@ class MAPLUS_OT_ComposeNewLineVectorSubtractionBase(bpy.types.Operator):
                      ' set to "Line").')
                 )
 
-        start_loc = mathutils.Vector((0, 0, 0))
-
-        src_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_one,
-            kind='LINE'
-        )
-        dest_global_data = maplus_geom.get_modified_global_coords(
-            geometry=calc_target_two,
-            kind='LINE'
+        compose_line_vector_subtraction(
+            [calc_target_one, calc_target_two],
+            result_item
         )
-        src_line = src_global_data[1] - src_global_data[0]
-        dest_line = dest_global_data[1] - dest_global_data[0]
-
-        result_item.kind = 'LINE'
-        result_item.line_start = start_loc
-        result_item.line_end = src_line - dest_line
+        if not hasattr(self, 'quick_calc_target'):
+            maplus_storage.record_recipe(
+                active_calculation,
+                'LINEVECTORSUBTRACTION'
+            )
+            maplus_storage.record_recipe(
+                result_item,
+                'LINEVECTORSUBTRACTION',
+                derived_from=active_calculation
+            )
         if addon_data.calc_result_to_clipboard:
             addon_data.internal_storage_clipboard.kind = 'LINE'
             maplus_storage.copy_source_attribs_to_dest(
@@ -954,8 +1478,31 @@ class MAPLUS_OT_ComposePointIntersectingLinePlaneBase(bpy.types.Operator):
             active_calculation = prims[addon_data.active_list_item]
             bpy.ops.maplus.addnewline()
             result_item = prims[-1]
-            calc_target_one = prims[active_calculation.multi_calc_target_one]
-            calc_target_two = prims[active_calculation.multi_calc_target_two]
+            calc_target_one = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_one'
+            )
+            calc_target_two = maplus_storage.get_reference(
+                active_calculation,
+                'multi_calc_target_two'
+            )
+        if calc_target_one is None or calc_target_two is None:
+            self.report(
+                {'ERROR'},
+                ('Missing operands: a target item was removed from'
+                 ' the list')
+            )
+            return {'CANCELLED'}
+        if not hasattr(self, 'quick_calc_target'):
+            try:
+                get_calc_targets(active_calculation)
+            except maplus_except.DependencyCycleError:
+                self.report(
+                    {'ERROR'},
+                    ('Dependency cycle: a target item depends on the'
+                     ' result of this calculation')
+                )
+                return {'CANCELLED'}
         targets_by_kind = {
             item.kind: item for item in [calc_target_one, calc_target_two]
         }
@@ -968,28 +1515,21 @@ class MAPLUS_OT_ComposePointIntersectingLinePlaneBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
-        line_global_data = maplus_geom.get_modified_global_coords(
-            geometry=targets_by_kind['LINE'],
-            kind='LINE'
-        )
-        plane_global_data = maplus_geom.get_modified_global_coords(
-            geometry=targets_by_kind['PLANE'],
-            kind='PLANE'
-        )
-
-        plane_line_ba = plane_global_data[0] - plane_global_data[1]
-        plane_line_bc = plane_global_data[2] - plane_global_data[1]
-        plane_normal = plane_line_ba.cross(plane_line_bc)
-        intersection = mathutils.geometry.intersect_line_plane(
-            line_global_data[0],
-            line_global_data[1],
-            plane_global_data[1],
-            plane_normal
+        intersection = compose_point_intersecting_line_plane(
+            [calc_target_one, calc_target_two],
+            result_item
         )
-
         if intersection:
-            result_item.kind = 'POINT'
-            result_item.point = intersection
+            if not hasattr(self, 'quick_calc_target'):
+                maplus_storage.record_recipe(
+                    active_calculation,
+                    'POINTINTERSECTINGLINEPLANE'
+                )
+                maplus_storage.record_recipe(
+                    result_item,
+                    'POINTINTERSECTINGLINEPLANE',
+                    derived_from=active_calculation
+                )
             if addon_data.calc_result_to_clipboard:
                 addon_data.internal_storage_clipboard.kind = 'POINT'
                 maplus_storage.copy_source_attribs_to_dest(
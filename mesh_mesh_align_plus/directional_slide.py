@@ -1,20 +1,38 @@
 """Directional Slide tool, internals & UI."""
 
 
-import bmesh
 import bpy
 import mathutils
+import numpy
 
+import mesh_mesh_align_plus.calculate_compose as maplus_calc_compose
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
+import mesh_mesh_align_plus.utils.mesh_targets as maplus_mesh_targets
+import mesh_mesh_align_plus.utils.redo_cache as maplus_redo_cache
+import mesh_mesh_align_plus.utils.spatial as maplus_spatial
 
 
-class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
+class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator,
+                                     maplus_redo_cache.RedoInputsMixin):
     bl_idname = "maplus.directionalslidebase"
     bl_label = "Directional Slide Base"
     bl_description = "Directional slide base class"
     bl_options = {'REGISTER', 'UNDO'}
+    target = None
+    # Journaled (undo-light) variants record their mesh changes in the
+    # addon's journal instead of Blender's undo, see undo_journal.py
+    journal = False
+
+    # Redo panel copy of the transformation item's multiplier, see execute()
+    ds_multiplier: bpy.props.FloatProperty(
+        name="Multiplier",
+        description="Multiply the source line's length by this amount",
+        default=1.0,
+        precision=6,
+        options={'SKIP_SAVE'}
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -24,12 +42,27 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
             active_item = prims[addon_data.active_list_item]
         else:
             active_item = addon_data.quick_directional_slide_transf
+        # Inputs resolved by the run the redo panel is repeating, if any
+        redo_inputs = maplus_redo_cache.get_inputs(self)
+        # The redo panel edits the operator's copy of the multiplier (written
+        # back to the item), a first run copies it from the item
+        if self.redo_token:
+            active_item.ds_multiplier = self.ds_multiplier
+        else:
+            self.ds_multiplier = active_item.ds_multiplier
         # Gather selected Blender object(s) to apply the transform to
-        multi_edit_targets = [
-            item for item in bpy.context.scene.objects if (
-                maplus_geom.get_select_state(item)
-            )
-        ]
+        # (already known when redoing)
+        if redo_inputs:
+            multi_edit_targets = redo_inputs['targets']
+        else:
+            multi_edit_targets = [
+                item for item in bpy.context.scene.objects if (
+                    maplus_geom.get_select_state(item)
+                )
+            ]
+        inputs = redo_inputs or maplus_redo_cache.new_inputs(
+            multi_edit_targets
+        )
         # Check prerequisites for mesh level transforms, need an active/selected object
         if (self.target != 'OBJECT' and not (maplus_geom.get_active_object()
                 and maplus_geom.get_select_state(maplus_geom.get_active_object()))):
@@ -49,29 +82,55 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
                      ' without an active (and selected) object.')
                 )
                 return {'CANCELLED'}
-            if maplus_geom.get_active_object().type != 'MESH':
+            if not maplus_geom.is_grab_source(maplus_geom.get_active_object()):
                 self.report(
                     {'ERROR'},
                     ('Cannot complete: cannot auto-grab source verts '
-                     ' from a non-mesh object.')
+                     ' from this type of object.')
                 )
                 return {'CANCELLED'}
 
         # Proceed only if selected Blender objects are compatible with the transform target
         # (Do not allow mesh-level transforms when there are non-mesh objects selected)
-        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
-                and [item for item in multi_edit_targets if item.type != 'MESH']):
+        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}
+                and maplus_mesh_targets.get_incompatible_targets(
+                    multi_edit_targets,
+                    self.target,
+                    self.journal)):
 
             if not hasattr(self, "quick_op_target"):
-                if prims[active_item.ds_direction].kind != 'LINE':
+                try:
+                    src_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'ds_direction'
+                    )
+                except maplus_except.DependencyCycleError:
+                    self.report(
+                        {'ERROR'},
+                        ('Dependency cycle: an item used by this'
+                         ' transformation depends on itself')
+                    )
+                    return {'CANCELLED'}
+                if not src_item:
+                    self.report(
+                        {'ERROR'},
+                        ('Missing operands: an item used by this'
+                         ' transformation was removed from the list')
+                    )
+                    return {'CANCELLED'}
+                if src_item.kind != 'LINE':
                     self.report(
                         {'ERROR'},
                         'Wrong operand: "Directional Slide" can'
                         ' only operate on a line'
                     )
                     return {'CANCELLED'}
+                active_item.needs_update = False
 
-            if maplus_geom.get_active_object().type == 'MESH':
+            # (Not needed when redoing, nothing is grabbed or read
+            # through a bmesh then)
+            if (not redo_inputs
+                    and maplus_geom.get_active_object().type == 'MESH'):
                 # a bmesh can only be initialized in edit mode...
                 if previous_mode != 'EDIT':
                     bpy.ops.object.editmode_toggle()
@@ -88,21 +147,25 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
             if hasattr(self, 'quick_op_target'):
                 if addon_data.quick_directional_slide_auto_grab_src:
                     vert_attribs_to_set = ('line_start', 'line_end')
-                    try:
-                        vert_data = maplus_geom.return_selected_verts(
-                            maplus_geom.get_active_object(),
-                            len(vert_attribs_to_set),
-                            maplus_geom.get_active_object().matrix_world
-                        )
-                    except maplus_except.InsufficientSelectionError:
-                        self.report({'ERROR'}, 'Not enough vertices selected.')
-                        return {'CANCELLED'}
-                    except maplus_except.NonMeshGrabError:
-                        self.report(
-                            {'ERROR'},
-                            'Cannot grab coords: non-mesh or no active object.'
-                        )
-                        return {'CANCELLED'}
+                    if redo_inputs:
+                        vert_data = redo_inputs['src_verts']
+                    else:
+                        try:
+                            vert_data = maplus_geom.return_selected_verts(
+                                maplus_geom.get_active_object(),
+                                len(vert_attribs_to_set),
+                                maplus_geom.get_active_object().matrix_world
+                            )
+                        except maplus_except.InsufficientSelectionError:
+                            self.report({'ERROR'}, 'Not enough vertices selected.')
+                            return {'CANCELLED'}
+                        except maplus_except.NonMeshGrabError:
+                            self.report(
+                                {'ERROR'},
+                                'Cannot grab coords: non-mesh or no active object.'
+                            )
+                            return {'CANCELLED'}
+                        inputs['src_verts'] = vert_data
 
                     maplus_geom.set_item_coords(
                         addon_data.quick_directional_slide_src,
@@ -117,7 +180,7 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
 
             else:
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.ds_direction],
+                    geometry=src_item,
                     kind='LINE'
                 )
 
@@ -143,7 +206,7 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
 
                     item.location += direction
 
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
+            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}:
                 for item in multi_edit_targets:
                     self.report(
                         {'WARNING'},
@@ -151,9 +214,21 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
                          ' on objects with non-uniform scaling'
                          ' are not currently supported.')
                     )
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
+                    # Init source mesh (not needed when redoing, or for
+                    # array path targets: apply_mesh_transform() reads
+                    # and writes those itself)
+                    use_array_path = (
+                        bool(redo_inputs) or
+                        maplus_mesh_targets.uses_array_path(
+                            self.target,
+                            addon_data,
+                            self.journal,
+                            item
+                        )
+                    )
+                    src_mesh = None
+                    if not use_array_path:
+                        src_mesh = maplus_mesh_targets.load_bmesh(item)
 
                     # Get the object world matrix
                     item_matrix_unaltered_loc = item.matrix_world.copy()
@@ -183,7 +258,10 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
                     direction_loc *= active_item.ds_multiplier
                     dir_slide = mathutils.Matrix.Translation(direction_loc)
 
-                    if self.target == 'MESH_SELECTED':
+                    if src_mesh is None:
+                        # Written by apply_mesh_transform() below
+                        pass
+                    elif self.target == 'MESH_SELECTED':
                         src_mesh.transform(
                             dir_slide,
                             filter={'SELECT'}
@@ -200,8 +278,42 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
 
                     # write and then release the mesh data
                     bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
+                    if not redo_inputs:
+                        inputs['weights'][item.name] = (
+                            maplus_mesh_targets.get_target_weights(
+                                item,
+                                self.target,
+                                addon_data,
+                                bm=src_mesh
+                            )
+                        )
+                    if use_array_path:
+                        key_timings = maplus_mesh_targets.apply_mesh_transform(
+                            item,
+                            dir_slide,
+                            self.target,
+                            addon_data,
+                            journal=self.journal,
+                            weights=inputs['weights'][item.name]
+                        )
+                        if key_timings is None:
+                            self.report(
+                                {'WARNING'},
+                                'Skipped "{0}": no active vertex group.'.format(
+                                    item.name
+                                )
+                            )
+                        elif key_timings:
+                            self.report(
+                                {'INFO'},
+                                maplus_mesh_targets.format_key_timings(
+                                    item,
+                                    key_timings
+                                )
+                            )
+                    else:
+                        src_mesh.to_mesh(item.data)
+                        src_mesh.free()
 
             # Go back to whatever mode we were in before doing this
             bpy.ops.object.mode_set(mode=previous_mode)
@@ -217,6 +329,8 @@ class MAPLUS_OT_DirectionalSlideBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
+        if not redo_inputs:
+            maplus_redo_cache.store_inputs(self, inputs)
         return {'FINISHED'}
 
 
@@ -285,6 +399,24 @@ class MAPLUS_OT_DirectionalSlideWholeMesh(MAPLUS_OT_DirectionalSlideBase):
         return True
 
 
+class MAPLUS_OT_DirectionalSlideVertexGroup(MAPLUS_OT_DirectionalSlideBase):
+    bl_idname = "maplus.directionalslidevertexgroup"
+    bl_label = "Directional Slide Vertex Group"
+    bl_description = (
+        "Translates the verts in the active vertex group (moves"
+        " them in a direction)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
 class MAPLUS_OT_QuickDirectionalSlideMeshSelected(MAPLUS_OT_DirectionalSlideBase):
     bl_idname = "maplus.quickdirectionalslidemeshselected"
     bl_label = "Directional Slide Mesh"
@@ -317,6 +449,163 @@ class MAPLUS_OT_QuickDirectionalSlideWholeMesh(MAPLUS_OT_DirectionalSlideBase):
         return True
 
 
+class MAPLUS_OT_QuickDirectionalSlideVertexGroup(MAPLUS_OT_DirectionalSlideBase):
+    bl_idname = "maplus.quickdirectionalslidevertexgroup"
+    bl_label = "Quick Directional Slide Vertex Group"
+    bl_description = (
+        "Translates the verts in the active vertex group (moves"
+        " them in a direction)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+    quick_op_target = True
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
+class MAPLUS_OT_QuickDirectionalSlideUntilContact(bpy.types.Operator):
+    bl_idname = "maplus.quickdirectionalslideuntilcontact"
+    bl_label = "Slide Until Contact"
+    bl_description = (
+        "Slides the active object along the direction line until it"
+        " touches another (selected or visible) mesh object"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        active_item = addon_data.quick_directional_slide_transf
+        active_object = maplus_geom.get_active_object()
+        if not (active_object
+                and maplus_geom.get_select_state(active_object)
+                and active_object.type == 'MESH'):
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: slide until contact needs an active'
+                 ' (and selected) mesh object.')
+            )
+            return {'CANCELLED'}
+
+        if addon_data.quick_directional_slide_auto_grab_src:
+            vert_attribs_to_set = ('line_start', 'line_end')
+            try:
+                vert_data = maplus_geom.return_selected_verts(
+                    active_object,
+                    len(vert_attribs_to_set),
+                    active_object.matrix_world
+                )
+            except maplus_except.InsufficientSelectionError:
+                self.report({'ERROR'}, 'Not enough vertices selected.')
+                return {'CANCELLED'}
+            except maplus_except.NonMeshGrabError:
+                self.report(
+                    {'ERROR'},
+                    'Cannot grab coords: non-mesh or no active object.'
+                )
+                return {'CANCELLED'}
+
+            maplus_geom.set_item_coords(
+                addon_data.quick_directional_slide_src,
+                vert_attribs_to_set,
+                vert_data
+            )
+
+        dir_start, dir_end = maplus_geom.get_modified_global_coords(
+            geometry=addon_data.quick_directional_slide_src,
+            kind='LINE'
+        )
+        direction = dir_end - dir_start
+        if direction.length == 0:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: the direction line has zero length.'
+            )
+            return {'CANCELLED'}
+        direction.normalize()
+        if active_item.ds_flip_direction:
+            direction.negate()
+
+        if addon_data.quick_ds_contact_obstacles == 'SELECTED':
+            obstacles = [
+                item for item in bpy.context.scene.objects
+                if maplus_geom.get_select_state(item)
+            ]
+        else:
+            obstacles = [
+                item for item in bpy.context.scene.objects
+                if item.visible_get()
+            ]
+        obstacles = [
+            item for item in obstacles
+            if item.type == 'MESH' and item != active_object
+        ]
+        if not obstacles:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: there are no other meshes to slide into.'
+            )
+            return {'CANCELLED'}
+
+        moving_bvh, moving_coords, moving_triangles = (
+            maplus_spatial.get_object_bvh(active_object)
+        )
+        if addon_data.quick_ds_contact_source == 'HULL':
+            moving_bvh, moving_coords, moving_triangles = (
+                maplus_spatial.get_convex_hull_bvh(moving_coords)
+            )
+
+        # Contact is the closest hit of the moving verts against each
+        # obstacle, or of the obstacle's verts (cast backwards) against
+        # the moving mesh (a face of the moving mesh meeting a vert)
+        sweep_direction = numpy.array(direction)
+        contact_distance = numpy.inf
+        for obstacle in obstacles:
+            obstacle_bvh, obstacle_coords, obstacle_triangles = (
+                maplus_spatial.get_object_bvh(obstacle)
+            )
+            contact_distance = maplus_spatial.sweep_distance(
+                moving_coords,
+                sweep_direction,
+                obstacle_bvh,
+                obstacle_coords,
+                obstacle_triangles,
+                contact_distance
+            )
+            contact_distance = maplus_spatial.sweep_distance(
+                obstacle_coords,
+                -sweep_direction,
+                moving_bvh,
+                moving_coords,
+                moving_triangles,
+                contact_distance
+            )
+        if contact_distance == numpy.inf:
+            self.report(
+                {'WARNING'},
+                'No contact: nothing is in the way in that direction.'
+            )
+            return {'CANCELLED'}
+
+        slide_distance = contact_distance - addon_data.quick_ds_contact_gap
+        new_matrix = active_object.matrix_world.copy()
+        new_matrix.translation += direction * slide_distance
+        active_object.matrix_world = new_matrix
+
+        self.report(
+            {'INFO'},
+            'Slid {0:.6g} (contact at {1:.6g})'.format(
+                slide_distance,
+                contact_distance
+            )
+        )
+        return {'FINISHED'}
+
+
 class MAPLUS_PT_QuickDirectionalSlideGUI(bpy.types.Panel):
     bl_idname = "MAPLUS_PT_QuickDirectionalSlideGUI"
     bl_label = "Quick Directional Slide"
@@ -506,6 +795,23 @@ class MAPLUS_PT_QuickDirectionalSlideGUI(bpy.types.Panel):
             'ds_multiplier',
             text='Multiplier'
         )
+        ds_contact = ds_mods.column(align=True)
+        ds_contact_settings = ds_contact.row(align=True)
+        ds_contact_settings.prop(
+            addon_data,
+            'quick_ds_contact_obstacles',
+            text=""
+        )
+        ds_contact_settings.prop(
+            addon_data,
+            'quick_ds_contact_source',
+            text=""
+        )
+        ds_contact.prop(addon_data, 'quick_ds_contact_gap', text="Gap")
+        ds_contact.operator(
+            "maplus.quickdirectionalslideuntilcontact",
+            icon='SNAP_FACE'
+        )
         ds_apply_header = ds_gui.row()
         ds_apply_header.label(text="Apply to:")
         ds_apply_header.prop(
@@ -525,10 +831,29 @@ class MAPLUS_PT_QuickDirectionalSlideGUI(bpy.types.Panel):
         )
         ds_mesh_apply_items = ds_apply_items.column(align=True)
         ds_mesh_apply_items.operator(
-            "maplus.quickdirectionalslidemeshselected",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickdirectionalslidemeshselected",
+                addon_data
+            ),
             text="Mesh Piece"
         )
         ds_mesh_apply_items.operator(
-            "maplus.quickdirectionalslidewholemesh",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickdirectionalslidewholemesh",
+                addon_data
+            ),
             text="Whole Mesh"
         )
+        ds_mesh_apply_items.operator(
+            maplus_guitools.mesh_op_id(
+                "maplus.quickdirectionalslidevertexgroup",
+                addon_data
+            ),
+            text="Vertex Group"
+        )
+        ds_mesh_apply_items.prop(
+            addon_data,
+            'vertex_group_blend',
+            text="Blend Weights"
+        )
+        maplus_guitools.layout_mesh_falloff(ds_mesh_apply_items, addon_data)
@@ -0,0 +1,430 @@
+"""Grabbing from evaluated (Geometry Nodes) instances, internals & UI."""
+
+
+import bpy
+import mathutils
+import numpy
+
+import mesh_mesh_align_plus.object_box as maplus_object_box
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.point_data as maplus_point_data
+
+
+# Instance indices, keyed by depsgraph pointer. They are dropped whenever
+# a depsgraph update moves or changes geometry (or the frame changes), so
+# grabs between updates reuse one walk over the instances
+_instance_indices = {}
+
+# Evaluated object types instances are indexed for (the ones with points)
+GEOMETRY_TYPES = {'MESH'} | maplus_point_data.POINT_OBJECT_TYPES
+
+
+class InstanceIndex(object):
+    '''World space bounds of every geometry instance in a depsgraph.
+
+    Built with one walk over depsgraph.object_instances (instances only
+    exist while it is iterated, so their data is copied out). Each
+    distinct geometry is read once, however many times it is instanced,
+    and every instance keeps its world matrix and the row of its
+    geometry. The bounds of all instances are then computed in a few
+    whole array passes, so queries are vectorized scans.
+
+    Attributes:
+        geometries
+            list of (name, local coords (n, 3), local box), the box as a
+            (center, axes, half_extents) tuple (see object_box.py)
+        geometry_rows
+            (instances,) int array, the geometry of each instance
+        matrices
+            (instances, 4, 4) float64 array of world matrices
+        centers, half_extents
+            (instances, 3) float64 arrays, the world space axis aligned
+            bounds of each instance
+    '''
+
+    def __init__(self, depsgraph):
+        self.geometries = []
+        data_rows = {}
+        geometry_rows = []
+        matrices = []
+        for instance in depsgraph.object_instances:
+            instance_object = instance.object
+            if instance_object.type not in GEOMETRY_TYPES:
+                continue
+            data_key = instance_object.data.as_pointer()
+            if data_key not in data_rows:
+                data_rows[data_key] = self.add_geometry(instance_object)
+            row = data_rows[data_key]
+            if row is None:
+                continue
+            geometry_rows.append(row)
+            matrices.append(instance.matrix_world.copy())
+
+        self.geometry_rows = numpy.array(geometry_rows, dtype=numpy.int64)
+        self.matrices = numpy.array(matrices, dtype=numpy.float64).reshape(
+            -1, 4, 4
+        )
+        local_centers = numpy.array(
+            [box[0] for name, coords, box in self.geometries]
+        ).reshape(-1, 3)[self.geometry_rows]
+        local_half_extents = numpy.array(
+            [box[2] for name, coords, box in self.geometries]
+        ).reshape(-1, 3)[self.geometry_rows]
+        rotations = self.matrices[:, :3, :3]
+        # (The world bounds of a transformed box, per axis: the center
+        # is transformed, the half extents by the absolute rotation)
+        self.centers = (
+            numpy.einsum('nij,nj->ni', rotations, local_centers) +
+            self.matrices[:, :3, 3]
+        )
+        self.half_extents = numpy.einsum(
+            'nij,nj->ni',
+            numpy.abs(rotations),
+            local_half_extents
+        )
+
+    def add_geometry(self, instance_object):
+        # Read an evaluated object's (local) coords, return its geometry
+        # row, or None if it has none
+        if instance_object.type == 'MESH':
+            coords = maplus_geom.get_vert_coords(instance_object.data)
+        else:
+            coords = maplus_point_data.get_point_coords(instance_object)
+        if not len(coords):
+            return None
+        low = coords.min(axis=0)
+        high = coords.max(axis=0)
+        box = ((low + high) / 2, numpy.identity(3), (high - low) / 2)
+        self.geometries.append((instance_object.name, coords, box))
+        return len(self.geometries) - 1
+
+    def __len__(self):
+        return len(self.geometry_rows)
+
+    def get_geometry(self, instance):
+        return self.geometries[self.geometry_rows[instance]]
+
+    def get_world_coords(self, instance):
+        # World coords of every vert/point of one instance
+        name, coords, box = self.get_geometry(instance)
+        return maplus_geom.transform_coords(coords, self.matrices[instance])
+
+    def find_nearest(self, point):
+        '''Find the instance whose bounds are nearest to a point.
+
+        Among instances whose bounds contain the point, the one with the
+        nearest center wins.
+
+        Returns:
+            Return the instance number, or None if there are none.
+        '''
+        if not len(self):
+            return None
+        offsets = numpy.abs(self.centers - point)
+        box_distances = numpy.linalg.norm(
+            numpy.maximum(offsets - self.half_extents, 0.0),
+            axis=1
+        )
+        center_distances = numpy.linalg.norm(offsets, axis=1)
+        return int(numpy.lexsort((center_distances, box_distances))[0])
+
+    def find_ray_hit(self, origin, direction, both_ways=False):
+        '''Find the first instance whose bounds a ray goes through.
+
+        Arguments:
+            origin, direction
+                (3,) arrays, the ray (direction needn't be unit length)
+            both_ways
+                also hit bounds behind the origin (for orthographic views,
+                where the ray is a line through the 3D cursor)
+
+        Returns:
+            Return the instance number, or None if nothing was hit.
+        '''
+        if not len(self):
+            return None
+        parallel = direction == 0
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            inverse_direction = 1.0 / direction
+            low = (self.centers - self.half_extents - origin) * (
+                inverse_direction
+            )
+            high = (self.centers + self.half_extents - origin) * (
+                inverse_direction
+            )
+        # Along an axis the ray doesn't move on, it is inside a slab for
+        # its whole length, or never
+        inside = numpy.abs(self.centers - origin) <= self.half_extents
+        low = numpy.where(parallel, -numpy.inf, low)
+        high = numpy.where(parallel, numpy.inf, high)
+        entries = numpy.minimum(low, high).max(axis=1)
+        exits = numpy.maximum(low, high).min(axis=1)
+        hits = (entries <= exits) & (inside | ~parallel).all(axis=1)
+        if not both_ways:
+            hits &= exits >= 0
+            entries = numpy.maximum(entries, 0.0)
+        if not hits.any():
+            return None
+        hit_instances = numpy.flatnonzero(hits)
+        return int(hit_instances[numpy.argmin(entries[hit_instances])])
+
+
+def get_instance_index(depsgraph):
+    # The index of an evaluated depsgraph, built on first use after each
+    # update
+    key = depsgraph.as_pointer()
+    if key not in _instance_indices:
+        _instance_indices[key] = InstanceIndex(depsgraph)
+    return _instance_indices[key]
+
+
+@bpy.app.handlers.persistent
+def update_instance_indices(scene, depsgraph):
+    # Drop the indices once geometry moves or changes (updates that only
+    # touch settings, like grabbing into an item, keep them)
+    if not _instance_indices:
+        return
+    for update in depsgraph.updates:
+        if (update.is_updated_geometry or update.is_updated_transform
+                or isinstance(update.id, bpy.types.Collection)):
+            _instance_indices.clear()
+            return
+
+
+@bpy.app.handlers.persistent
+def clear_instance_indices(*args):
+    _instance_indices.clear()
+
+
+def get_nearest_coords(coords, count, point, direction=None):
+    '''Pick the coords nearest to a point, or to a line through it.
+
+    Returns:
+        Return the count nearest of (n, 3) coords, nearest first, or None
+        if there are fewer than count.
+    '''
+    if len(coords) < count:
+        return None
+    offsets = coords - point
+    if direction is None:
+        distances = numpy.linalg.norm(offsets, axis=1)
+    else:
+        distances = numpy.linalg.norm(
+            numpy.cross(offsets, direction / numpy.linalg.norm(direction)),
+            axis=1
+        )
+    nearest = numpy.argpartition(distances, count - 1)[:count]
+    return coords[nearest[numpy.argsort(distances[nearest])]]
+
+
+def get_view_ray(context, cursor_location):
+    '''Get the ray from the 3D view's eye through the 3D cursor.
+
+    Returns:
+        Return an (origin, direction, both_ways) tuple (see
+        InstanceIndex.find_ray_hit()), or None outside of a 3D view.
+    '''
+    space = context.space_data
+    if not space or space.type != 'VIEW_3D' or not space.region_3d:
+        return None
+    region_3d = space.region_3d
+    view_matrix = numpy.array(region_3d.view_matrix.inverted())
+    if region_3d.is_perspective:
+        origin = view_matrix[:3, 3]
+        return origin, cursor_location - origin, False
+    return cursor_location, -view_matrix[:3, 2], True
+
+
+class MAPLUS_OT_GrabFromInstanceBase(bpy.types.Operator):
+    bl_idname = "maplus.grabfrominstancebase"
+    bl_label = "Grab From Instance Base Class"
+    bl_description = (
+        "The base class for grabbing geometry from evaluated instances"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # 'POINT', 'LINE' or 'PLANE', the kind of element to grab
+    element_kind = None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        if hasattr(self, "quick_op_target"):
+            item_attrib, auto_grab_attrib = (
+                maplus_object_box.QUICK_TARGET_ITEMS[self.quick_op_target]
+            )
+            active_item = getattr(addon_data, item_attrib)
+        else:
+            if not prims:
+                self.report({'ERROR'}, 'The advanced tools list is empty.')
+                return {'CANCELLED'}
+            active_item = prims[addon_data.active_list_item]
+            auto_grab_attrib = None
+
+        cursor_location = numpy.array(bpy.context.scene.cursor.location)
+        ray = None
+        if addon_data.instance_grab_query == 'VIEW_RAY':
+            ray = get_view_ray(context, cursor_location)
+            if ray is None:
+                self.report(
+                    {'ERROR'},
+                    'Cannot grab: the view ray needs a 3D view.'
+                )
+                return {'CANCELLED'}
+
+        index = get_instance_index(context.evaluated_depsgraph_get())
+        if ray is None:
+            instance = index.find_nearest(cursor_location)
+        else:
+            instance = index.find_ray_hit(*ray)
+        if instance is None:
+            self.report({'ERROR'}, 'Cannot grab: no instance found.')
+            return {'CANCELLED'}
+        name, coords, box = index.get_geometry(instance)
+
+        if addon_data.instance_grab_source == 'BOUNDS':
+            if self.element_kind == 'POINT':
+                element = addon_data.object_box_point
+            elif self.element_kind == 'LINE':
+                element = addon_data.object_box_axis
+            else:
+                element = addon_data.object_box_face
+            local_coords = maplus_object_box.get_box_element(
+                box,
+                self.element_kind,
+                element
+            )
+            grabbed = maplus_geom.transform_coords(
+                numpy.array(local_coords),
+                index.matrices[instance]
+            )
+        else:
+            grabbed = get_nearest_coords(
+                index.get_world_coords(instance),
+                len(maplus_object_box.KIND_ATTRIBS[self.element_kind]),
+                cursor_location,
+                None if ray is None else ray[1]
+            )
+            if grabbed is None:
+                self.report(
+                    {'ERROR'},
+                    'Cannot grab: the instance has too few vertices.'
+                )
+                return {'CANCELLED'}
+
+        active_item.kind = self.element_kind
+        maplus_geom.set_item_coords(
+            active_item,
+            maplus_object_box.KIND_ATTRIBS[self.element_kind],
+            [mathutils.Vector(co) for co in grabbed]
+        )
+        # Auto grab would replace the grabbed geometry with selected verts
+        if auto_grab_attrib:
+            setattr(addon_data, auto_grab_attrib, False)
+
+        self.report(
+            {'INFO'},
+            'Grabbed from an instance of "{0}" ({1} indexed)'.format(
+                name,
+                len(index)
+            )
+        )
+        return {'FINISHED'}
+
+
+GRAB_FROM_INSTANCE_DEFAULTS = {
+    'bl_label': 'Grab From Instance',
+    'bl_description': (
+        "Grabs geometry from the evaluated instance (Geometry Nodes"
+        " instances included) nearest the 3D cursor or hit by the view"
+        " ray"
+    ),
+}
+GRAB_FROM_INSTANCE_VARIANTS = (
+    ('GrabPointFromInstance', {'element_kind': 'POINT'}),
+    ('GrabLineFromInstance', {'element_kind': 'LINE'}),
+    ('GrabPlaneFromInstance', {'element_kind': 'PLANE'}),
+    ('QuickAptSrcGrabFromInstance', {
+        'element_kind': 'POINT',
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAptDestGrabFromInstance', {
+        'element_kind': 'POINT',
+        'quick_op_target': 'APTDEST',
+    }),
+    ('QuickAlnSrcGrabFromInstance', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestGrabFromInstance', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAplSrcGrabFromInstance', {
+        'element_kind': 'PLANE',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabFromInstance', {
+        'element_kind': 'PLANE',
+        'quick_op_target': 'APLDEST',
+    }),
+)
+
+
+# (base operator, shared defaults, variant rows)
+operator_variant_tables = (
+    (
+        MAPLUS_OT_GrabFromInstanceBase,
+        GRAB_FROM_INSTANCE_DEFAULTS,
+        GRAB_FROM_INSTANCE_VARIANTS
+    ),
+)
+
+
+class MAPLUS_PT_QuickInstanceGrabGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_QuickInstanceGrabGUI"
+    bl_label = "Quick Instance References"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Mesh Align Plus"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        addon_data = bpy.context.scene.maplus_data
+
+        layout.label(
+            text="Evaluated instance to grab from:",
+            icon="OUTLINER_OB_GROUP_INSTANCE"
+        )
+        layout.prop(addon_data, 'instance_grab_query', text="Pick")
+        layout.prop(addon_data, 'instance_grab_source', text="Grab")
+        if addon_data.instance_grab_source == 'BOUNDS':
+            layout.label(text="(Box element: see the object box panel)")
+
+        points_row = layout.row(align=True)
+        points_row.operator(
+            "maplus.quickaptsrcgrabfrominstance",
+            text="Align Pts. Src"
+        )
+        points_row.operator(
+            "maplus.quickaptdestgrabfrominstance",
+            text="Dest"
+        )
+        lines_row = layout.row(align=True)
+        lines_row.operator(
+            "maplus.quickalnsrcgrabfrominstance",
+            text="Align Lines Src"
+        )
+        lines_row.operator(
+            "maplus.quickalndestgrabfrominstance",
+            text="Dest"
+        )
+        planes_row = layout.row(align=True)
+        planes_row.operator(
+            "maplus.quickaplsrcgrabfrominstance",
+            text="Align Planes Src"
+        )
+        planes_row.operator(
+            "maplus.quickapldestgrabfrominstance",
+            text="Dest"
+        )
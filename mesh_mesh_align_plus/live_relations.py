@@ -0,0 +1,488 @@
+"""Live alignment relations (depsgraph handler), internals & UI."""
+
+
+import time
+
+import bpy
+import mathutils
+import numpy
+
+import mesh_mesh_align_plus.alignment_bake as maplus_alignment_bake
+import mesh_mesh_align_plus.transformation_stack as maplus_transf_stack
+import mesh_mesh_align_plus.utils.exceptions as maplus_except
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.storage as maplus_storage
+
+
+# Targets closer than this to their aligned matrix are left alone, so the
+# updates caused by writing a target's matrix settle on the next pass
+MATRIX_TOLERANCE = 1e-6
+# Rows of relations left over when an update ran out of time, finished by
+# the timer (or the next update), keyed by scene pointer
+_pending = {}
+# Set while relations are written, the depsgraph updates that causes are
+# handled on the next pass instead of recursively
+_evaluating = False
+# Relation settings and transformation item signatures (see
+# get_transf_signature()) as of the last check, keyed by scene pointer
+_last_checked = {}
+
+
+def matrix_to_floats(matrix):
+    # Flatten a world matrix (row major) for a bind matrix property
+    return [value for row in matrix for value in row]
+
+
+def floats_to_matrix(floats):
+    return numpy.array(floats, dtype=numpy.float64).reshape(4, 4)
+
+
+def get_relation_transform(relation, scene, memo):
+    '''Compute the world transform a relation applies to its target.
+
+    Operand coords are computed once per transformation item, and
+    transforms once per (item, reference object) pair, for each update:
+    any number of targets following one reference share them.
+
+    Returns:
+        Return a (4, 4) float64 array, or None if the relation is broken
+        (removed/wrong item or reference, degenerate operands).
+    '''
+    prims = scene.maplus_data.prim_list
+    row = maplus_storage.get_prim_row(relation.transf_uid, scene)
+    if row is None or not relation.reference:
+        return None
+    transf = prims[row]
+    if (transf.kind != 'TRANSFORMATION'
+            or transf.transf_type not in
+            maplus_transf_stack.TRANSF_OPERAND_KINDS):
+        return None
+
+    transform_key = (
+        relation.transf_uid,
+        relation.reference.name,
+        relation.bind_reference_matrix[:]
+    )
+    if transform_key in memo:
+        return memo[transform_key]
+
+    if relation.transf_uid not in memo:
+        try:
+            memo[relation.transf_uid] = (
+                maplus_transf_stack.get_operand_coords(
+                    transf,
+                    maplus_transf_stack.TRANSF_OPERAND_KINDS[
+                        transf.transf_type
+                    ]
+                )
+            )
+        except maplus_except.DependencyCycleError:
+            memo[relation.transf_uid] = None
+    operand_coords = memo[relation.transf_uid]
+
+    transform = None
+    if operand_coords is not None:
+        motion = (
+            numpy.array(relation.reference.matrix_world) @
+            numpy.linalg.inv(floats_to_matrix(relation.bind_reference_matrix))
+        )
+        transforms = maplus_alignment_bake.get_baked_transforms(
+            transf,
+            operand_coords,
+            motion[numpy.newaxis]
+        )
+        if transforms is not None:
+            transform = transforms[0]
+    memo[transform_key] = transform
+    return transform
+
+
+def get_transf_signature(transf):
+    '''Summarize everything a relation's transform takes from its item.
+
+    That is the item's own settings (the properties of its
+    transformation type) and its operands' global coords, so an edit to
+    the list, or to a mesh items are bound to, only changes the
+    signatures of the items it affects.
+    '''
+    if transf.transf_type not in maplus_transf_stack.TRANSF_OPERAND_KINDS:
+        return (transf.kind, transf.transf_type)
+    prefix = maplus_storage.TRANSF_REFERENCES[transf.transf_type][0]
+    prefix = prefix.split('_')[0] + '_'
+    settings = []
+    for prop in transf.bl_rna.properties:
+        if not prop.identifier.startswith(prefix):
+            continue
+        value = getattr(transf, prop.identifier)
+        if hasattr(value, '__len__') and not isinstance(value, str):
+            value = tuple(value)
+        settings.append(value)
+    try:
+        operand_coords = maplus_transf_stack.get_operand_coords(
+            transf,
+            maplus_transf_stack.TRANSF_OPERAND_KINDS[transf.transf_type]
+        )
+    except maplus_except.DependencyCycleError:
+        operand_coords = None
+    if operand_coords is not None:
+        operand_coords = tuple(
+            tuple(co) for operand in operand_coords for co in operand
+        )
+    return (transf.kind, transf.transf_type, tuple(settings), operand_coords)
+
+
+def get_changed_relations(scene):
+    '''Find the relations whose settings or transformation item changed.
+
+    Relations are compared to their settings as of the last check (so new,
+    re-enabled and re-targeted ones count as changed), and each item used
+    by an enabled relation to its last signature, once per item however
+    many relations use it.
+
+    Returns:
+        Return the set of rows of the relations that changed.
+    '''
+    prims = scene.maplus_data.prim_list
+    relations = scene.maplus_data.relations
+    last = _last_checked.setdefault(
+        scene.as_pointer(),
+        {'relations': [], 'signatures': {}}
+    )
+    states = [
+        (
+            relation.enabled,
+            relation.transf_uid,
+            relation.target.name if relation.target else None,
+            relation.reference.name if relation.reference else None
+        )
+        for relation in relations
+    ]
+    changed_rows = {
+        row for row, state in enumerate(states)
+        if row >= len(last['relations']) or last['relations'][row] != state
+    }
+    last['relations'] = states
+
+    signatures = last['signatures']
+    changed_uids = set()
+    for uid in {relation.transf_uid for relation in relations
+                if relation.enabled}:
+        row = maplus_storage.get_prim_row(uid, scene)
+        signature = None if row is None else get_transf_signature(prims[row])
+        if uid not in signatures or signatures[uid] != signature:
+            signatures[uid] = signature
+            changed_uids.add(uid)
+    changed_rows.update(
+        row for row, relation in enumerate(relations)
+        if relation.transf_uid in changed_uids
+    )
+    return changed_rows
+
+
+def evaluate_relation(relation, scene, memo):
+    '''Move a relation's target to where the relation puts it.
+
+    Returns:
+        Return True if the target was moved.
+    '''
+    if not (relation.enabled and relation.target):
+        return False
+    transform = get_relation_transform(relation, scene, memo)
+    if transform is None:
+        return False
+    world = transform @ floats_to_matrix(relation.bind_target_matrix)
+    if numpy.allclose(
+            world,
+            numpy.array(relation.target.matrix_world),
+            rtol=0.0,
+            atol=MATRIX_TOLERANCE):
+        return False
+    relation.target.matrix_world = mathutils.Matrix(world.tolist())
+    return True
+
+
+def evaluate_pending(scene):
+    '''Evaluate the scene's pending relations, within the time budget.
+
+    Returns:
+        Return True if relations are still pending afterwards.
+    '''
+    global _evaluating
+    addon_data = scene.maplus_data
+    relations = addon_data.relations
+    pending = _pending.get(scene.as_pointer())
+    if not pending:
+        return False
+
+    deadline = time.perf_counter() + addon_data.relation_time_budget / 1000
+    memo = {}
+    _evaluating = True
+    try:
+        while pending and time.perf_counter() < deadline:
+            row = pending.pop()
+            if row < len(relations):
+                evaluate_relation(relations[row], scene, memo)
+    finally:
+        _evaluating = False
+    if not pending:
+        del _pending[scene.as_pointer()]
+        return False
+    return True
+
+
+def continue_pending():
+    # Timer callback: keep going over leftover relations between updates,
+    # stop (return None) once none are left
+    scene = bpy.context.scene
+    if scene and evaluate_pending(scene):
+        return 0.0
+    return None
+
+
+def queue_relations(scene, rows):
+    # Mark relation rows for evaluation, evaluate what fits in the budget
+    # and leave the rest to the timer
+    _pending.setdefault(scene.as_pointer(), set()).update(rows)
+    if (evaluate_pending(scene)
+            and not bpy.app.timers.is_registered(continue_pending)):
+        bpy.app.timers.register(continue_pending, first_interval=0.0)
+
+
+@bpy.app.handlers.persistent
+def update_relations(scene, depsgraph):
+    '''Re-evaluate the relations whose inputs changed in this update.
+
+    A relation is dirty when its target or reference object moved, or
+    when it or its transformation item changed. Those can only change
+    with the scene itself (which holds them) or a mesh that items are
+    bound to, only then are they compared to how they were at the last
+    check (see get_changed_relations()).
+    '''
+    if _evaluating:
+        return
+    addon_data = scene.maplus_data
+    if not (addon_data.relations_live and addon_data.relations):
+        return
+
+    bound_names = {
+        item.bind_object.name for item in addon_data.prim_list
+        if item.bind_object
+    }
+    moved = set()
+    items_changed = False
+    for update in depsgraph.updates:
+        updated_id = update.id.original
+        if isinstance(updated_id, bpy.types.Object):
+            if update.is_updated_transform:
+                moved.add(updated_id.name)
+            if (updated_id.name in bound_names
+                    and (update.is_updated_geometry
+                         or update.is_updated_transform)):
+                items_changed = True
+        elif isinstance(updated_id, bpy.types.Scene):
+            items_changed = True
+    if not (moved or items_changed):
+        return
+
+    changed_rows = get_changed_relations(scene) if items_changed else set()
+    dirty = [
+        row for row, relation in enumerate(addon_data.relations)
+        if relation.enabled and relation.target and relation.reference
+        and (row in changed_rows
+             or relation.target.name in moved
+             or relation.reference.name in moved)
+    ]
+    if dirty:
+        queue_relations(scene, dirty)
+
+
+@bpy.app.handlers.persistent
+def clear_pending_relations(*args):
+    # Pending rows (and last checked relations) refer to the relations of
+    # the previous file
+    _pending.clear()
+    _last_checked.clear()
+
+
+class MAPLUS_OT_AddRelations(bpy.types.Operator):
+    bl_idname = "maplus.addrelations"
+    bl_label = "Add Relations"
+    bl_description = (
+        "Keeps the selected objects aligned (by the active transformation"
+        " item) to the reference object, as it moves"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        scene = bpy.context.scene
+        prims = addon_data.prim_list
+        if not prims:
+            self.report({'ERROR'}, 'The advanced tools list is empty.')
+            return {'CANCELLED'}
+        active_item = prims[addon_data.active_list_item]
+        if (active_item.kind != 'TRANSFORMATION'
+                or active_item.transf_type not in
+                maplus_transf_stack.TRANSF_OPERAND_KINDS):
+            self.report(
+                {'ERROR'},
+                ('Wrong operand: the active item must be a transformation'
+                 ' (transformation stacks are not supported).')
+            )
+            return {'CANCELLED'}
+        reference = addon_data.relation_reference_object
+        if not reference:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: no reference object chosen.'
+            )
+            return {'CANCELLED'}
+        targets = [
+            item for item in scene.objects
+            if maplus_geom.get_select_state(item) and item != reference
+        ]
+        if not targets:
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: select the objects to keep aligned'
+                 ' (other than the reference object).')
+            )
+            return {'CANCELLED'}
+
+        # The targets are bound where they are now, the relation only
+        # moves them once the reference does
+        bind_reference = matrix_to_floats(reference.matrix_world)
+        for item in targets:
+            relation = addon_data.relations.add()
+            relation.transf_uid = active_item.uid
+            relation.target = item
+            relation.reference = reference
+            relation.bind_target_matrix = matrix_to_floats(item.matrix_world)
+            relation.bind_reference_matrix = bind_reference
+        addon_data.relations_active = len(addon_data.relations) - 1
+
+        self.report(
+            {'INFO'},
+            'Added {0} relations'.format(len(targets))
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_RemoveRelation(bpy.types.Operator):
+    bl_idname = "maplus.removerelation"
+    bl_label = "Remove Relation"
+    bl_description = "Removes the selected relation (the target stays put)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        relations = addon_data.relations
+        if not 0 <= addon_data.relations_active < len(relations):
+            self.report({'ERROR'}, 'No relation selected.')
+            return {'CANCELLED'}
+        relations.remove(addon_data.relations_active)
+        # Rows after the removed one have shifted
+        _pending.pop(bpy.context.scene.as_pointer(), None)
+        if addon_data.relations_active >= len(relations):
+            addon_data.relations_active = max(0, len(relations) - 1)
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_UpdateRelations(bpy.types.Operator):
+    bl_idname = "maplus.updaterelations"
+    bl_label = "Update Relations"
+    bl_description = (
+        "Re-evaluates every enabled relation now (ignores the time budget)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        global _evaluating
+        scene = bpy.context.scene
+        memo = {}
+        moved_count = 0
+        _evaluating = True
+        try:
+            for relation in scene.maplus_data.relations:
+                if evaluate_relation(relation, scene, memo):
+                    moved_count += 1
+        finally:
+            _evaluating = False
+        _pending.pop(scene.as_pointer(), None)
+        self.report(
+            {'INFO'},
+            'Moved {0} objects'.format(moved_count)
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_UL_Relations(bpy.types.UIList):
+    bl_idname = "MAPLUS_UL_Relations"
+
+    def draw_item(self,
+                  context,
+                  layout,
+                  data,
+                  item,
+                  icon,
+                  active_data,
+                  active_propname
+                  ):
+        prims = bpy.context.scene.maplus_data.prim_list
+        row = maplus_storage.get_prim_row(item.transf_uid)
+
+        layout.prop(bpy.types.AnyType(item), 'enabled', text="")
+        layout.label(
+            text=item.target.name if item.target else "(removed object)",
+            icon="OBJECT_DATA"
+        )
+        if row is None:
+            layout.label(text="(removed item)", icon="ERROR")
+        else:
+            layout.label(text=prims[row].name, icon="GRAPH")
+
+
+class MAPLUS_PT_LiveRelationsGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_LiveRelationsGUI"
+    bl_label = "Mesh Align Plus Live Relations"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        maplus_data_ptr = bpy.types.AnyType(bpy.context.scene.maplus_data)
+
+        layout.label(text="Keep selected objects aligned by the active")
+        layout.label(text="transformation item, its destination following:")
+        layout.prop(maplus_data_ptr, 'relation_reference_object', text="")
+        layout.operator("maplus.addrelations", icon='CONSTRAINT')
+
+        layout.template_list(
+            "MAPLUS_UL_Relations",
+            "relations",
+            maplus_data_ptr,
+            "relations",
+            maplus_data_ptr,
+            "relations_active",
+            type='DEFAULT'
+        )
+        relation_ops = layout.row(align=True)
+        relation_ops.operator(
+            "maplus.removerelation",
+            icon='REMOVE',
+            text="Remove"
+        )
+        relation_ops.operator(
+            "maplus.updaterelations",
+            icon='FILE_REFRESH',
+            text="Update"
+        )
+        settings_row = layout.row(align=True)
+        settings_row.prop(maplus_data_ptr, 'relations_live', text="Live")
+        settings_row.prop(
+            maplus_data_ptr,
+            'relation_time_budget',
+            text="Budget (ms)"
+        )
@@ -0,0 +1,494 @@
+"""Whole mesh surveys (bulk edge length/angle measurements), internals & UI."""
+
+
+import bpy
+import bpy_extras.io_utils
+import numpy
+
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+
+
+# CSV columns for each survey: 3 element references, the measured value
+# and the outlier flag
+SURVEY_COLUMNS = {
+    'EDGE_LENGTH': ('edge', 'vert_a', 'vert_b', 'length', 'outlier'),
+    'DIHEDRAL': ('edge', 'face_a', 'face_b', 'angle', 'outlier'),
+    'CORNER': ('loop', 'face', 'vert', 'angle', 'outlier'),
+}
+# Element named in outlier lists, for each survey
+SURVEY_ELEMENTS = {
+    'EDGE_LENGTH': 'Edge',
+    'DIHEDRAL': 'Edge',
+    'CORNER': 'Corner',
+}
+# Number of outliers kept (worst first) for display
+OUTLIER_DISPLAY_COUNT = 10
+
+# Results of the last survey, keyed by scene pointer, so the panel can
+# draw them without measuring again
+_survey_results = {}
+
+
+def _unit_vectors(vectors):
+    # Normalize an (n, 3) array, zero length vectors become NaN
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        return vectors / numpy.linalg.norm(vectors, axis=1)[:, numpy.newaxis]
+
+
+def _angles(vectors_a, vectors_b, degrees):
+    # Row-wise angles between two (n, 3) arrays of unit vectors
+    angles = numpy.arccos(
+        numpy.clip((vectors_a * vectors_b).sum(axis=1), -1.0, 1.0)
+    )
+    return numpy.degrees(angles) if degrees else angles
+
+
+def _selected_indices(collection, selected_only):
+    if not selected_only:
+        return numpy.arange(len(collection))
+    return numpy.flatnonzero(
+        maplus_geom.get_mesh_attribute(collection, 'select', bool)
+    )
+
+
+def _edge_length_chunks(mesh, matrix, selected_only, chunk_size, degrees):
+    coords = maplus_geom.get_vert_coords(mesh, matrix)
+    edge_verts = maplus_geom.get_mesh_attribute(
+        mesh.edges,
+        'vertices',
+        numpy.int64,
+        2
+    )
+    edges = _selected_indices(mesh.edges, selected_only)
+    for first in range(0, len(edges), chunk_size):
+        chunk_edges = edges[first:first + chunk_size]
+        chunk_verts = edge_verts[chunk_edges]
+        values = numpy.linalg.norm(
+            coords[chunk_verts[:, 1]] - coords[chunk_verts[:, 0]],
+            axis=1
+        )
+        yield numpy.column_stack((chunk_edges, chunk_verts)), values
+
+
+def _dihedral_chunks(mesh, matrix, selected_only, chunk_size, degrees):
+    normals = maplus_geom.get_mesh_attribute(
+        mesh.polygons,
+        'normal',
+        numpy.float32,
+        3
+    ).astype(numpy.float64)
+    if matrix is not None:
+        # Normals transform with the inverse transpose (correct under
+        # non-uniform scale)
+        normal_matrix = numpy.linalg.inv(
+            numpy.array(matrix, dtype=numpy.float64)[:3, :3]
+        ).T
+        normals = _unit_vectors(normals @ normal_matrix.T)
+
+    # Faces around each edge, from the loops sorted by edge index (no
+    # per edge Python lists)
+    loop_totals = maplus_geom.get_mesh_attribute(
+        mesh.polygons,
+        'loop_total',
+        numpy.int64
+    )
+    loop_faces = numpy.repeat(numpy.arange(len(mesh.polygons)), loop_totals)
+    loop_edges = maplus_geom.get_mesh_attribute(
+        mesh.loops,
+        'edge_index',
+        numpy.int64
+    )
+    loops_by_edge = numpy.argsort(loop_edges, kind='stable')
+    faces_per_edge = numpy.bincount(loop_edges, minlength=len(mesh.edges))
+    first_loop = numpy.cumsum(faces_per_edge) - faces_per_edge
+
+    manifold = faces_per_edge == 2
+    if selected_only:
+        manifold &= maplus_geom.get_mesh_attribute(mesh.edges, 'select', bool)
+    edges = numpy.flatnonzero(manifold)
+    for first in range(0, len(edges), chunk_size):
+        chunk_edges = edges[first:first + chunk_size]
+        face_a = loop_faces[loops_by_edge[first_loop[chunk_edges]]]
+        face_b = loop_faces[loops_by_edge[first_loop[chunk_edges] + 1]]
+        values = _angles(normals[face_a], normals[face_b], degrees)
+        yield numpy.column_stack((chunk_edges, face_a, face_b)), values
+
+
+def _corner_chunks(mesh, matrix, selected_only, chunk_size, degrees):
+    coords = maplus_geom.get_vert_coords(mesh, matrix)
+    loop_verts = maplus_geom.get_mesh_attribute(
+        mesh.loops,
+        'vertex_index',
+        numpy.int64
+    )
+    loop_starts = maplus_geom.get_mesh_attribute(
+        mesh.polygons,
+        'loop_start',
+        numpy.int64
+    )
+    loop_totals = maplus_geom.get_mesh_attribute(
+        mesh.polygons,
+        'loop_total',
+        numpy.int64
+    )
+    faces = _selected_indices(mesh.polygons, selected_only)
+    # Corners (loops) of the surveyed faces and the face of each corner,
+    # the loops of a face are contiguous (loop_start to loop_total)
+    face_totals = loop_totals[faces]
+    corner_faces = numpy.repeat(faces, face_totals)
+    loops = (
+        numpy.repeat(loop_starts[faces], face_totals) +
+        numpy.arange(len(corner_faces)) -
+        numpy.repeat(numpy.cumsum(face_totals) - face_totals, face_totals)
+    )
+    for first in range(0, len(loops), chunk_size):
+        chunk_loops = loops[first:first + chunk_size]
+        chunk_faces = corner_faces[first:first + chunk_size]
+        starts = loop_starts[chunk_faces]
+        totals = loop_totals[chunk_faces]
+        offsets = chunk_loops - starts
+        prev_loops = starts + (offsets - 1) % totals
+        next_loops = starts + (offsets + 1) % totals
+
+        corner_coords = coords[loop_verts[chunk_loops]]
+        values = _angles(
+            _unit_vectors(coords[loop_verts[prev_loops]] - corner_coords),
+            _unit_vectors(coords[loop_verts[next_loops]] - corner_coords),
+            degrees
+        )
+        yield (
+            numpy.column_stack(
+                (chunk_loops, chunk_faces, loop_verts[chunk_loops])
+            ),
+            values
+        )
+
+
+# Chunk generator for each survey
+SURVEY_CHUNKS = {
+    'EDGE_LENGTH': _edge_length_chunks,
+    'DIHEDRAL': _dihedral_chunks,
+    'CORNER': _corner_chunks,
+}
+
+
+def survey_uses_degrees(measure):
+    return (
+        measure != 'EDGE_LENGTH' and
+        bpy.context.scene.unit_settings.system_rotation != 'RADIANS'
+    )
+
+
+def survey_chunks(mesh_object, addon_data):
+    '''Measure the active survey over a mesh object, chunk by chunk.
+
+    The mesh data is read with foreach_get into numpy arrays (edit mode
+    changes are synced first), no per element Python objects are made.
+
+    Yields:
+        Tuples (refs, values): an (n, 3) int64 array of element
+        references (see SURVEY_COLUMNS) and an (n,) float64 array of
+        measured values (NaN for degenerate elements).
+    '''
+    if mesh_object.mode == 'EDIT':
+        mesh_object.update_from_editmode()
+    measure = addon_data.survey_measure
+    return SURVEY_CHUNKS[measure](
+        mesh_object.data,
+        (
+            mesh_object.matrix_world
+            if addon_data.survey_world_space else None
+        ),
+        addon_data.survey_selected_only,
+        addon_data.survey_chunk_size,
+        survey_uses_degrees(measure)
+    )
+
+
+def outlier_mask(values, nominal, tolerance):
+    # Values further than tolerance from nominal (none when the tolerance
+    # is 0), degenerate (NaN) elements are always outliers
+    if tolerance <= 0.0:
+        return numpy.zeros(len(values), dtype=bool)
+    with numpy.errstate(invalid='ignore'):
+        return ~(numpy.abs(values - nominal) <= tolerance)
+
+
+def survey_mesh(mesh_object, addon_data):
+    '''Survey a mesh object with the scene's survey settings.
+
+    Returns:
+        Return a dict with the 'measure' and 'object' (name), the element
+        'count', 'min'/'max'/'mean'/'std' over the valid values (None if
+        there are none), the 'histogram' counts and bin 'edges', the
+        'outlier_count' and the worst outliers as 'outlier_refs' and
+        'outlier_values' (at most OUTLIER_DISPLAY_COUNT).
+    '''
+    nominal = addon_data.survey_nominal
+    tolerance = addon_data.survey_tolerance
+    chunk_values = []
+    outlier_refs = []
+    outlier_values = []
+    for refs, values in survey_chunks(mesh_object, addon_data):
+        chunk_values.append(values)
+        outliers = outlier_mask(values, nominal, tolerance)
+        outlier_refs.append(refs[outliers, 0])
+        outlier_values.append(values[outliers])
+
+    values = (
+        numpy.concatenate(chunk_values) if chunk_values
+        else numpy.zeros(0)
+    )
+    outlier_refs = (
+        numpy.concatenate(outlier_refs) if outlier_refs
+        else numpy.zeros(0, dtype=numpy.int64)
+    )
+    outlier_values = (
+        numpy.concatenate(outlier_values) if outlier_values
+        else numpy.zeros(0)
+    )
+    valid = values[~numpy.isnan(values)]
+
+    results = {
+        'measure': addon_data.survey_measure,
+        'object': mesh_object.name,
+        'count': len(values),
+        'min': None,
+        'max': None,
+        'mean': None,
+        'std': None,
+        'histogram': numpy.zeros(0, dtype=numpy.int64),
+        'edges': numpy.zeros(0),
+        'outlier_count': len(outlier_values),
+    }
+    if len(valid):
+        results['min'] = valid.min()
+        results['max'] = valid.max()
+        results['mean'] = valid.mean()
+        results['std'] = valid.std()
+        results['histogram'], results['edges'] = numpy.histogram(
+            valid,
+            bins=addon_data.survey_bins
+        )
+
+    # Worst outliers first (degenerate elements before everything else)
+    with numpy.errstate(invalid='ignore'):
+        deviation = numpy.nan_to_num(
+            numpy.abs(outlier_values - nominal),
+            nan=numpy.inf
+        )
+    worst = numpy.argsort(-deviation, kind='stable')[:OUTLIER_DISPLAY_COUNT]
+    results['outlier_refs'] = outlier_refs[worst]
+    results['outlier_values'] = outlier_values[worst]
+    return results
+
+
+def format_summary(results):
+    if not results['count']:
+        return 'Nothing to survey (no matching elements)'
+    if results['min'] is None:
+        return '{0} elements, no valid measurements'.format(results['count'])
+    return (
+        '{0} elements, min {1:.6g}, max {2:.6g}, mean {3:.6g},'
+        ' std {4:.6g}, {5} outliers'
+    ).format(
+        results['count'],
+        results['min'],
+        results['max'],
+        results['mean'],
+        results['std'],
+        results['outlier_count']
+    )
+
+
+def get_survey_results(scene=None):
+    scene = scene if scene else bpy.context.scene
+    return _survey_results.get(scene.as_pointer())
+
+
+def get_survey_object(operator):
+    # The active object, if it's a mesh (reports an error otherwise)
+    active_object = maplus_geom.get_active_object()
+    if not active_object or active_object.type != 'MESH':
+        operator.report(
+            {'ERROR'},
+            'Cannot survey: the active object must be a mesh.'
+        )
+        return None
+    return active_object
+
+
+class MAPLUS_OT_MeshSurvey(bpy.types.Operator):
+    bl_idname = "maplus.meshsurvey"
+    bl_label = "Survey Active Mesh"
+    bl_description = (
+        "Measures every edge length, dihedral angle or face corner angle"
+        " of the active mesh, and reports statistics, a histogram and"
+        " the outliers"
+    )
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        mesh_object = get_survey_object(self)
+        if mesh_object is None:
+            return {'CANCELLED'}
+
+        results = survey_mesh(mesh_object, addon_data)
+        _survey_results[bpy.context.scene.as_pointer()] = results
+        if not results['count']:
+            self.report({'ERROR'}, format_summary(results))
+            return {'CANCELLED'}
+        self.report({'INFO'}, format_summary(results))
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_ExportMeshSurveyCSV(bpy.types.Operator,
+                                    bpy_extras.io_utils.ExportHelper):
+    bl_idname = "maplus.exportmeshsurveycsv"
+    bl_label = "Export Survey (CSV)"
+    bl_description = (
+        "Surveys the active mesh and writes every measured element (with"
+        " its outlier flag) to a CSV file, chunk by chunk"
+    )
+    bl_options = {'REGISTER'}
+    filename_ext = ".csv"
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.csv",
+        options={'HIDDEN'}
+    )
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        mesh_object = get_survey_object(self)
+        if mesh_object is None:
+            return {'CANCELLED'}
+
+        # Rows are written as each chunk is measured, the full survey is
+        # never held in memory
+        row_count = 0
+        outlier_count = 0
+        with open(self.filepath, 'w', newline='') as export_file:
+            export_file.write(
+                ','.join(SURVEY_COLUMNS[addon_data.survey_measure]) + '\n'
+            )
+            for refs, values in survey_chunks(mesh_object, addon_data):
+                outliers = outlier_mask(
+                    values,
+                    addon_data.survey_nominal,
+                    addon_data.survey_tolerance
+                )
+                numpy.savetxt(
+                    export_file,
+                    numpy.column_stack((refs, values, outliers)),
+                    fmt=('%d', '%d', '%d', '%.9g', '%d'),
+                    delimiter=','
+                )
+                row_count += len(values)
+                outlier_count += numpy.count_nonzero(outliers)
+
+        self.report(
+            {'INFO'},
+            '{0} elements, {1} outliers (exported to {2})'.format(
+                row_count,
+                outlier_count,
+                bpy.path.basename(self.filepath)
+            )
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_PT_MeshSurveyGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_MeshSurveyGUI"
+    bl_label = "Mesh Align Plus Mesh Survey"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        maplus_data_ptr = bpy.types.AnyType(bpy.context.scene.maplus_data)
+
+        layout.prop(maplus_data_ptr, 'survey_measure', text="")
+        options_row = layout.row()
+        options_row.prop(
+            maplus_data_ptr,
+            'survey_selected_only',
+            text="Selected Only"
+        )
+        options_row.prop(
+            maplus_data_ptr,
+            'survey_world_space',
+            text="Global"
+        )
+        tolerance_row = layout.row(align=True)
+        tolerance_row.prop(maplus_data_ptr, 'survey_nominal', text="Nominal")
+        tolerance_row.prop(
+            maplus_data_ptr,
+            'survey_tolerance',
+            text="Tolerance"
+        )
+        settings_row = layout.row(align=True)
+        settings_row.prop(maplus_data_ptr, 'survey_bins', text="Bins")
+        settings_row.prop(
+            maplus_data_ptr,
+            'survey_chunk_size',
+            text="Chunk"
+        )
+        survey_row = layout.row(align=True)
+        survey_row.operator("maplus.meshsurvey", icon='VIEWZOOM')
+        survey_row.operator(
+            "maplus.exportmeshsurveycsv",
+            icon='EXPORT',
+            text="Export CSV"
+        )
+
+        results = get_survey_results()
+        if not results or results['min'] is None:
+            return
+        results_box = layout.box()
+        results_box.label(
+            text="{0}: {1}".format(
+                results['object'],
+                format_summary(results)
+            )
+        )
+
+        # Text histogram, bars are scaled to the largest bin
+        histogram_col = results_box.column(align=True)
+        largest_bin = max(results['histogram'].max(), 1)
+        for bin_count, low, high in zip(
+                results['histogram'].tolist(),
+                results['edges'][:-1].tolist(),
+                results['edges'][1:].tolist()):
+            bin_row = histogram_col.split(factor=0.4)
+            bin_row.label(text="{0:.4g} - {1:.4g}".format(low, high))
+            bin_row.label(
+                text="{0} {1}".format(
+                    '|' * int(round(30 * bin_count / largest_bin)),
+                    bin_count
+                )
+            )
+
+        if not results['outlier_count']:
+            return
+        outliers_col = results_box.column(align=True)
+        outliers_col.label(
+            text="Worst outliers ({0} total):".format(
+                results['outlier_count']
+            ),
+            icon='ERROR'
+        )
+        for element, value in zip(
+                results['outlier_refs'].tolist(),
+                results['outlier_values'].tolist()):
+            outliers_col.label(
+                text="{0} {1}: {2:.6g}".format(
+                    SURVEY_ELEMENTS[results['measure']],
+                    element,
+                    value
+                )
+            )
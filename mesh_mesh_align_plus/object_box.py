@@ -0,0 +1,470 @@
+"""Object box (oriented bounding box) references, internals & UI."""
+
+
+import itertools
+
+import bpy
+import mathutils
+import mathutils.geometry
+import numpy
+
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.spatial as maplus_spatial
+
+
+# Boxes (local space) of mesh data, keyed by mesh pointer. Each entry
+# stores the signature (vert count + coords digest) of the mesh version it
+# was computed for, so repeated grabs from an unchanged mesh are free
+_box_cache = {}
+
+# Box faces, as (axis, side)
+BOX_FACES = {
+    'NEG_X': (0, -1.0),
+    'POS_X': (0, 1.0),
+    'NEG_Y': (1, -1.0),
+    'POS_Y': (1, 1.0),
+    'NEG_Z': (2, -1.0),
+    'POS_Z': (2, 1.0),
+}
+BOX_AXES = {
+    'X': 0,
+    'Y': 1,
+    'Z': 2,
+}
+# Item attribs set for each element kind
+KIND_ATTRIBS = {
+    'POINT': ('point',),
+    'LINE': ('line_start', 'line_end'),
+    'PLANE': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+}
+# Quick tool geometry (and the auto grab setting that would overwrite it)
+# for each quick_op_target
+QUICK_TARGET_ITEMS = {
+    'APTSRC': ('quick_align_pts_src', 'quick_align_pts_auto_grab_src'),
+    'APTDEST': ('quick_align_pts_dest', None),
+    'ALNSRC': ('quick_align_lines_src', 'quick_align_lines_auto_grab_src'),
+    'ALNDEST': ('quick_align_lines_dest', None),
+    'APLSRC': ('quick_align_planes_src', 'quick_align_planes_auto_grab_src'),
+    'APLDEST': ('quick_align_planes_dest', None),
+    'AXRSRC': ('quick_axis_rotate_src', 'quick_axis_rotate_auto_grab_src'),
+    'DSSRC': (
+        'quick_directional_slide_src',
+        'quick_directional_slide_auto_grab_src'
+    ),
+    'SMESRC': (
+        'quick_scale_match_edge_src',
+        'quick_scale_match_edge_auto_grab_src'
+    ),
+    'SMEDEST': ('quick_scale_match_edge_dest', None),
+}
+# Hull face directions tried as box axes (the ones covering the largest
+# hull area), and how many projected values are scored at once
+BOX_HULL_CANDIDATES = 32
+BOX_SCORE_CHUNK = 1 << 22
+
+
+def _min_area_rotation(flat_points):
+    # Direction of the minimum area rectangle around 2D points (rotating
+    # calipers: one side of the best rectangle is flush with a hull edge)
+    ring = mathutils.geometry.convex_hull_2d(flat_points.tolist())
+    if len(ring) < 2:
+        return None
+    ring_points = flat_points[ring]
+    edges = numpy.roll(ring_points, -1, axis=0) - ring_points
+    lengths = numpy.linalg.norm(edges, axis=1)
+    edges = edges[lengths > 0] / lengths[lengths > 0, numpy.newaxis]
+    if not len(edges):
+        return None
+    normals = numpy.column_stack((-edges[:, 1], edges[:, 0]))
+    along = ring_points @ edges.T
+    across = ring_points @ normals.T
+    areas = numpy.ptp(along, axis=0) * numpy.ptp(across, axis=0)
+    return edges[areas.argmin()]
+
+
+def compute_oriented_box(coords):
+    '''Compute a tight oriented bounding box around points.
+
+    Candidate orientations are the principal axes (PCA), the input's
+    own axes, and, for the BOX_HULL_CANDIDATES convex hull face
+    directions with the largest total face area, the minimum area
+    rectangle of the hull projected along that direction. The candidate
+    with the smallest volume wins.
+
+    Returns:
+        Return a tuple (center, axes, half_extents): the (3,) center,
+        the (3, 3) unit box axes (rows, each matched to the closest input
+        axis, pointing the same way) and the (3,) half sizes.
+    '''
+    candidates = [numpy.eye(3)]
+    if len(coords) > 1:
+        candidates.append(
+            numpy.linalg.eigh(numpy.cov(coords.T))[1].T
+        )
+
+    points = coords
+    if len(coords) >= 4:
+        hull_coords, hull_triangles = maplus_spatial.get_convex_hull(coords)
+        if len(hull_triangles):
+            points = hull_coords
+            corners = hull_coords[hull_triangles]
+            normals = numpy.cross(
+                corners[:, 1] - corners[:, 0],
+                corners[:, 2] - corners[:, 0]
+            )
+            lengths = numpy.linalg.norm(normals, axis=1)
+            face_areas = lengths[lengths > 0]
+            normals = normals[lengths > 0] / face_areas[:, numpy.newaxis]
+            # n and -n give the same box, keep each direction once (with
+            # the total area of its faces)
+            leading = normals[
+                numpy.arange(len(normals)),
+                numpy.abs(normals).argmax(axis=1)
+            ]
+            normals *= numpy.sign(leading)[:, numpy.newaxis]
+            normals, inverse = numpy.unique(
+                numpy.round(normals, 6),
+                axis=0,
+                return_inverse=True
+            )
+            direction_areas = numpy.bincount(
+                inverse.ravel(),
+                weights=face_areas,
+                minlength=len(normals)
+            )
+            normals = normals[
+                direction_areas.argsort()[::-1][:BOX_HULL_CANDIDATES]
+            ]
+            normals /= numpy.linalg.norm(normals, axis=1)[:, numpy.newaxis]
+            for normal in normals:
+                basis = maplus_spatial.get_perpendicular_basis(normal)
+                direction = _min_area_rotation(points @ basis.T)
+                if direction is None:
+                    continue
+                side = direction @ basis
+                candidates.append(
+                    numpy.stack((normal, side, numpy.cross(normal, side)))
+                )
+
+    # Score the candidates (in chunks, memory stays bounded on dense
+    # hulls), smallest volume (then area) first
+    candidates = numpy.array(candidates)
+    chunk_size = max(1, BOX_SCORE_CHUNK // (3 * len(points)))
+    low = numpy.empty((len(candidates), 3))
+    high = numpy.empty((len(candidates), 3))
+    for start in range(0, len(candidates), chunk_size):
+        chunk = candidates[start:start + chunk_size]
+        projected = (points @ chunk.reshape(-1, 3).T).reshape(
+            len(points),
+            len(chunk),
+            3
+        )
+        low[start:start + chunk_size] = projected.min(axis=0)
+        high[start:start + chunk_size] = projected.max(axis=0)
+    sizes = high - low
+    volumes = sizes.prod(axis=1)
+    areas = (
+        sizes[:, 0] * sizes[:, 1] +
+        sizes[:, 1] * sizes[:, 2] +
+        sizes[:, 2] * sizes[:, 0]
+    )
+    best = numpy.lexsort((areas, volumes))[0]
+    axes = candidates[best]
+    center = ((low[best] + high[best]) / 2) @ axes
+    half_extents = sizes[best] / 2
+
+    # Match the box axes to the input axes, so box faces can be named
+    # (bottom is -Z, and so on)
+    order = max(
+        itertools.permutations(range(3)),
+        key=lambda perm: sum(abs(axes[perm[i], i]) for i in range(3))
+    )
+    axes = axes[list(order)]
+    half_extents = half_extents[list(order)]
+    axes *= numpy.where(numpy.diag(axes) < 0, -1.0, 1.0)[:, numpy.newaxis]
+    return center, axes, half_extents
+
+
+def get_object_box(mesh_object):
+    '''Return the (cached) local space box of a mesh object.
+
+    Returns:
+        Return a tuple (center, axes, half_extents), see
+        compute_oriented_box(), or None for a mesh without verts.
+    '''
+    if mesh_object.mode == 'EDIT':
+        mesh_object.update_from_editmode()
+    mesh = mesh_object.data
+    coords = maplus_geom.get_vert_coords(mesh)
+    if not len(coords):
+        return None
+    signature = (len(coords), hash(coords.tobytes()))
+
+    key = mesh.as_pointer()
+    cached = _box_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    box = compute_oriented_box(coords)
+    _box_cache[key] = (signature, box)
+    return box
+
+
+@bpy.app.handlers.persistent
+def clear_box_cache(*args):
+    _box_cache.clear()
+
+
+def get_box_element(box, kind, element):
+    '''Return the local coords of one element of a box.
+
+    Arguments:
+        box
+            a (center, axes, half_extents) tuple
+        kind
+            'POINT' (element is 'CENTER' or a face, for the face's
+            center), 'LINE' (element is an axis, for the center line
+            between opposite face centers) or 'PLANE' (element is a face,
+            for 3 of its corners, with the plane normal facing out)
+        element
+            see object_box_point/object_box_axis/object_box_face
+
+    Returns:
+        Return a list of 1 to 3 (3,) arrays.
+    '''
+    center, axes, half_extents = box
+    offsets = axes * half_extents[:, numpy.newaxis]
+    if kind == 'POINT':
+        if element == 'CENTER':
+            return [center]
+        axis, side = BOX_FACES[element]
+        return [center + side * offsets[axis]]
+    if kind == 'LINE':
+        axis = BOX_AXES[element]
+        return [center - offsets[axis], center + offsets[axis]]
+
+    axis, side = BOX_FACES[element]
+    first = offsets[(axis + 1) % 3]
+    second = offsets[(axis + 2) % 3]
+    face_center = center + side * offsets[axis]
+    corners = [
+        face_center - first - second,
+        face_center + first - second,
+        face_center + first + second,
+    ]
+    # Plane normals are (A - B) x (C - B), see align planes
+    normal = numpy.cross(corners[0] - corners[1], corners[2] - corners[1])
+    if normal @ (side * offsets[axis]) < 0:
+        corners.reverse()
+    return corners
+
+
+class MAPLUS_OT_GrabFromObjectBoxBase(bpy.types.Operator):
+    bl_idname = "maplus.grabfromobjectboxbase"
+    bl_label = "Grab From Object Box Base Class"
+    bl_description = (
+        "The base class for grabbing geometry from the active object's"
+        " oriented bounding box"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # 'POINT', 'LINE' or 'PLANE', the kind of box element to grab
+    element_kind = None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        if hasattr(self, "quick_op_target"):
+            item_attrib, auto_grab_attrib = QUICK_TARGET_ITEMS[
+                self.quick_op_target
+            ]
+            active_item = getattr(addon_data, item_attrib)
+        else:
+            if not prims:
+                self.report({'ERROR'}, 'The advanced tools list is empty.')
+                return {'CANCELLED'}
+            active_item = prims[addon_data.active_list_item]
+            auto_grab_attrib = None
+
+        active_object = maplus_geom.get_active_object()
+        if not active_object or active_object.type != 'MESH':
+            self.report(
+                {'ERROR'},
+                'Cannot grab box: non-mesh or no active object.'
+            )
+            return {'CANCELLED'}
+        box = get_object_box(active_object)
+        if box is None:
+            self.report({'ERROR'}, 'Cannot grab box: the mesh is empty.')
+            return {'CANCELLED'}
+
+        if self.element_kind == 'POINT':
+            element = addon_data.object_box_point
+        elif self.element_kind == 'LINE':
+            element = addon_data.object_box_axis
+        else:
+            element = addon_data.object_box_face
+        vert_data = [
+            active_object.matrix_world @ mathutils.Vector(coords)
+            for coords in get_box_element(box, self.element_kind, element)
+        ]
+
+        active_item.kind = self.element_kind
+        maplus_geom.set_item_coords(
+            active_item,
+            KIND_ATTRIBS[self.element_kind],
+            vert_data
+        )
+        # Auto grab would replace the box geometry with selected verts
+        if auto_grab_attrib:
+            setattr(addon_data, auto_grab_attrib, False)
+
+        return {'FINISHED'}
+
+
+GRAB_FROM_OBJECT_BOX_DEFAULTS = {
+    'bl_label': 'Grab From Object Box',
+    'bl_description': (
+        "Grabs geometry from the active object's oriented bounding box"
+    ),
+}
+GRAB_FROM_OBJECT_BOX_VARIANTS = (
+    ('GrabPointFromObjectBox', {'element_kind': 'POINT'}),
+    ('GrabLineFromObjectBox', {'element_kind': 'LINE'}),
+    ('GrabPlaneFromObjectBox', {'element_kind': 'PLANE'}),
+    ('QuickAptSrcGrabFromObjectBox', {
+        'element_kind': 'POINT',
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAptDestGrabFromObjectBox', {
+        'element_kind': 'POINT',
+        'quick_op_target': 'APTDEST',
+    }),
+    ('QuickAlnSrcGrabFromObjectBox', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestGrabFromObjectBox', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcGrabFromObjectBox', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcGrabFromObjectBox', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickSmeSrcGrabFromObjectBox', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestGrabFromObjectBox', {
+        'element_kind': 'LINE',
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('QuickAplSrcGrabFromObjectBox', {
+        'element_kind': 'PLANE',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabFromObjectBox', {
+        'element_kind': 'PLANE',
+        'quick_op_target': 'APLDEST',
+    }),
+)
+
+
+# (base operator, shared defaults, variant rows)
+operator_variant_tables = (
+    (
+        MAPLUS_OT_GrabFromObjectBoxBase,
+        GRAB_FROM_OBJECT_BOX_DEFAULTS,
+        GRAB_FROM_OBJECT_BOX_VARIANTS
+    ),
+)
+
+
+class MAPLUS_PT_QuickObjectBoxGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_QuickObjectBoxGUI"
+    bl_label = "Quick Object Box References"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Mesh Align Plus"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        addon_data = bpy.context.scene.maplus_data
+
+        layout.label(text="Active object's box:", icon="MESH_CUBE")
+
+        points_box = layout.box()
+        points_box.prop(addon_data, 'object_box_point', text="Point")
+        points_row = points_box.row(align=True)
+        points_row.operator(
+            "maplus.quickaptsrcgrabfromobjectbox",
+            text="Align Pts. Src"
+        )
+        points_row.operator(
+            "maplus.quickaptdestgrabfromobjectbox",
+            text="Dest"
+        )
+
+        lines_box = layout.box()
+        lines_box.prop(addon_data, 'object_box_axis', text="Line")
+        lines_row = lines_box.row(align=True)
+        lines_row.operator(
+            "maplus.quickalnsrcgrabfromobjectbox",
+            text="Align Lines Src"
+        )
+        lines_row.operator(
+            "maplus.quickalndestgrabfromobjectbox",
+            text="Dest"
+        )
+        sme_row = lines_box.row(align=True)
+        sme_row.operator(
+            "maplus.quicksmesrcgrabfromobjectbox",
+            text="Scale Match Src"
+        )
+        sme_row.operator(
+            "maplus.quicksmedestgrabfromobjectbox",
+            text="Dest"
+        )
+        other_lines_row = lines_box.row(align=True)
+        other_lines_row.operator(
+            "maplus.quickaxrsrcgrabfromobjectbox",
+            text="Axis Rotate"
+        )
+        other_lines_row.operator(
+            "maplus.quickdssrcgrabfromobjectbox",
+            text="Dir. Slide"
+        )
+
+        planes_box = layout.box()
+        planes_box.prop(addon_data, 'object_box_face', text="Face")
+        planes_row = planes_box.row(align=True)
+        planes_row.operator(
+            "maplus.quickaplsrcgrabfromobjectbox",
+            text="Align Planes Src"
+        )
+        planes_row.operator(
+            "maplus.quickapldestgrabfromobjectbox",
+            text="Dest"
+        )
+
+        list_row = layout.row(align=True)
+        list_row.label(text="Active List Item:")
+        list_row.operator(
+            "maplus.grabpointfromobjectbox",
+            icon='LAYER_ACTIVE',
+            text=""
+        )
+        list_row.operator(
+            "maplus.grablinefromobjectbox",
+            icon='LIGHT_SUN',
+            text=""
+        )
+        list_row.operator(
+            "maplus.grabplanefromobjectbox",
+            icon='OUTLINER_OB_MESH',
+            text=""
+        )
@@ -0,0 +1,197 @@
+"""Packed reference library (compact geometry storage), internals & UI."""
+
+
+import bpy
+import numpy
+
+import mesh_mesh_align_plus.advanced_tools as maplus_adv_tools
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.packed_storage as maplus_packed
+import mesh_mesh_align_plus.utils.storage as maplus_storage
+
+
+class MAPLUS_OT_PackAdvToolsGeometry(bpy.types.Operator):
+    bl_idname = "maplus.packadvtoolsgeometry"
+    bl_label = "Pack Geometry Items"
+    bl_description = (
+        "Copies all point, line and plane items from the advanced tools"
+        " list into the packed library (item modifiers are applied)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove_packed: bpy.props.BoolProperty(
+        name="Remove From List",
+        description=(
+            "Remove the packed items from the advanced tools list"
+            " (transformation/calculation items using them will report"
+            " a missing item)"
+        ),
+        default=False
+    )
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+
+        packed_indices = [
+            index for index, item in enumerate(prims)
+            if item.kind in maplus_packed.PACKED_KINDS
+        ]
+        if not packed_indices:
+            self.report({'WARNING'}, 'No geometry items to pack.')
+            return {'CANCELLED'}
+
+        kinds = []
+        names = []
+        coords = numpy.zeros(
+            (len(packed_indices), maplus_packed.POINTS_PER_ITEM, 3)
+        )
+        for row, index in enumerate(packed_indices):
+            item = prims[index]
+            global_data = maplus_geom.get_modified_global_coords(
+                geometry=item,
+                kind=item.kind
+            )
+            coords[row, :len(global_data)] = [vec[:] for vec in global_data]
+            kinds.append(item.kind)
+            names.append(item.name)
+
+        library = maplus_packed.get_library()
+        library.add(kinds, coords, names)
+
+        if self.remove_packed:
+            maplus_storage.remove_prims(packed_indices)
+            addon_data.active_list_item = max(
+                min(addon_data.active_list_item, len(prims) - 1),
+                0
+            )
+
+        self.report(
+            {'INFO'},
+            '{0} items packed ({1} in library)'.format(
+                len(packed_indices),
+                len(library)
+            )
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_UnpackActivePacked(bpy.types.Operator):
+    bl_idname = "maplus.unpackactivepacked"
+    bl_label = "Unpack Active Item"
+    bl_description = (
+        "Adds the active packed library item to the advanced tools list,"
+        " so it can be used with the transformations/calculations"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    new_kind = 'POINT'
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        item_id = maplus_packed.active_packed_id(addon_data)
+        if item_id is None:
+            self.report({'ERROR'}, 'The packed library is empty.')
+            return {'CANCELLED'}
+        library = maplus_packed.get_library()
+
+        new_item = maplus_adv_tools.MAPLUS_OT_AddListItemBase.add_new_named(
+            self
+        )
+        maplus_packed.set_primitive_from_packed(new_item, library, item_id)
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_RemoveActivePacked(bpy.types.Operator):
+    bl_idname = "maplus.removeactivepacked"
+    bl_label = "Remove Active Item"
+    bl_description = "Removes the active item from the packed library"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        item_id = maplus_packed.active_packed_id(addon_data)
+        if item_id is None:
+            self.report({'WARNING'}, "Nothing to remove")
+            return {'CANCELLED'}
+        library = maplus_packed.get_library()
+        library.remove([item_id])
+        addon_data.packed_active_index = max(
+            min(addon_data.packed_active_index, len(library) - 1),
+            0
+        )
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_ClearPackedLibrary(bpy.types.Operator):
+    bl_idname = "maplus.clearpackedlibrary"
+    bl_label = "Clear Packed Library"
+    bl_description = "Removes every item from the packed library"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        maplus_packed.get_library().clear()
+        addon_data.packed_active_index = 0
+
+        return {'FINISHED'}
+
+
+class MAPLUS_PT_PackedLibraryGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_PackedLibraryGUI"
+    bl_label = "Mesh Align Plus Packed Library"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "scene"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        maplus_data_ptr = bpy.types.AnyType(bpy.context.scene.maplus_data)
+        addon_data = bpy.context.scene.maplus_data
+
+        pack_row = layout.row(align=True)
+        pack_row.operator(
+            "maplus.packadvtoolsgeometry",
+            text="Pack Advanced Tools Geometry"
+        )
+        pack_row.operator(
+            "maplus.clearpackedlibrary",
+            icon='X',
+            text=""
+        )
+
+        item_id = maplus_packed.active_packed_id(addon_data)
+        if item_id is None:
+            layout.label(text="The packed library is empty")
+            return
+        library = maplus_packed.get_library()
+        kind = library.kind(item_id)
+
+        layout.label(
+            text="{0} items, active ID: {1} ({2})".format(
+                len(library),
+                item_id,
+                kind.title()
+            )
+        )
+        active_row = layout.row(align=True)
+        active_row.prop(maplus_data_ptr, 'packed_active_index', text="Item")
+        active_row.operator(
+            "maplus.removeactivepacked",
+            icon='X',
+            text=""
+        )
+        layout.prop(maplus_data_ptr, 'packed_active_name', text="")
+
+        coords_col = layout.column(align=True)
+        coords_col.prop(maplus_data_ptr, 'packed_active_pt_a', text="")
+        if kind in {'LINE', 'PLANE'}:
+            coords_col.prop(maplus_data_ptr, 'packed_active_pt_b', text="")
+        if kind == 'PLANE':
+            coords_col.prop(maplus_data_ptr, 'packed_active_pt_c', text="")
+        layout.operator(
+            "maplus.unpackactivepacked",
+            text="Unpack to Advanced Tools List"
+        )
@@ -1,21 +1,37 @@
 """Scale Match Edge tool, internals & UI."""
 
 
-import bmesh
 import bpy
 import mathutils
+import numpy
 
+import mesh_mesh_align_plus.calculate_compose as maplus_calc_compose
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
 import mesh_mesh_align_plus.utils.geom as maplus_geom
 import mesh_mesh_align_plus.utils.gui_tools as maplus_guitools
+import mesh_mesh_align_plus.utils.mesh_targets as maplus_mesh_targets
+import mesh_mesh_align_plus.utils.redo_cache as maplus_redo_cache
 
 
-class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
+class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator,
+                                   maplus_redo_cache.RedoInputsMixin):
     bl_idname = "maplus.scalematchedgebase"
     bl_label = "Scale Match Edge Base"
     bl_description = "Scale match edge base class"
     bl_options = {'REGISTER', 'UNDO'}
     target = None
+    # Journaled (undo-light) variants record their mesh changes in the
+    # addon's journal instead of Blender's undo, see undo_journal.py
+    journal = False
+
+    # Redo panel copy of the numeric mode length, see execute()
+    quick_sme_numeric_length: bpy.props.FloatProperty(
+        name="Length",
+        description="Desired length for the target edge",
+        default=1,
+        precision=6,
+        options={'SKIP_SAVE'}
+    )
 
     def execute(self, context):
         addon_data = bpy.context.scene.maplus_data
@@ -25,12 +41,31 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
             active_item = addon_data.quick_scale_match_edge_transf
         else:
             active_item = prims[addon_data.active_list_item]
-        # Gather selected Blender object(s) to apply the transform to
-        multi_edit_targets = [
-            item for item in bpy.context.scene.objects if (
-                maplus_geom.get_select_state(item)
+        # Inputs resolved by the run the redo panel is repeating, if any
+        redo_inputs = maplus_redo_cache.get_inputs(self)
+        # The redo panel edits the operator's copy of the numeric mode
+        # length (written back to the addon data), a first run copies it
+        if self.redo_token:
+            addon_data.quick_sme_numeric_length = (
+                self.quick_sme_numeric_length
+            )
+        else:
+            self.quick_sme_numeric_length = (
+                addon_data.quick_sme_numeric_length
             )
-        ]
+        # Gather selected Blender object(s) to apply the transform to
+        # (already known when redoing)
+        if redo_inputs:
+            multi_edit_targets = redo_inputs['targets']
+        else:
+            multi_edit_targets = [
+                item for item in bpy.context.scene.objects if (
+                    maplus_geom.get_select_state(item)
+                )
+            ]
+        inputs = redo_inputs or maplus_redo_cache.new_inputs(
+            multi_edit_targets
+        )
         # Check prerequisites for mesh level transforms, need an active/selected object
         if (self.target != 'OBJECT' and not (maplus_geom.get_active_object()
                 and maplus_geom.get_select_state(maplus_geom.get_active_object()))):
@@ -50,30 +85,59 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                      ' without an active (and selected) object.')
                 )
                 return {'CANCELLED'}
-            if maplus_geom.get_active_object().type != 'MESH':
+            if not maplus_geom.is_grab_source(maplus_geom.get_active_object()):
                 self.report(
                     {'ERROR'},
                     ('Cannot complete: cannot auto-grab source verts '
-                     ' from a non-mesh object.')
+                     ' from this type of object.')
                 )
                 return {'CANCELLED'}
 
         # Proceed only if selected Blender objects are compatible with the transform target
         # (Do not allow mesh-level transforms when there are non-mesh objects selected)
-        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}
-                and [item for item in multi_edit_targets if item.type != 'MESH']):
+        if not (self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}
+                and maplus_mesh_targets.get_incompatible_targets(
+                    multi_edit_targets,
+                    self.target,
+                    self.journal)):
 
             if not hasattr(self, "quick_op_target"):
-                if (prims[active_item.sme_edge_one].kind != 'LINE' or
-                        prims[active_item.sme_edge_two].kind != 'LINE'):
+                try:
+                    src_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'sme_edge_one'
+                    )
+                    dest_item = maplus_calc_compose.get_evaluated_reference(
+                        active_item,
+                        'sme_edge_two'
+                    )
+                except maplus_except.DependencyCycleError:
+                    self.report(
+                        {'ERROR'},
+                        ('Dependency cycle: an item used by this'
+                         ' transformation depends on itself')
+                    )
+                    return {'CANCELLED'}
+                if not (src_item and dest_item):
+                    self.report(
+                        {'ERROR'},
+                        ('Missing operands: an item used by this'
+                         ' transformation was removed from the list')
+                    )
+                    return {'CANCELLED'}
+                if src_item.kind != 'LINE' or dest_item.kind != 'LINE':
                     self.report(
                         {'ERROR'},
                         ('Wrong operands: "Scale Match Edge" can only'
                          ' operate on two lines')
                     )
                     return {'CANCELLED'}
+                active_item.needs_update = False
 
-            if maplus_geom.get_active_object().type == 'MESH':
+            # (Not needed when redoing, nothing is grabbed or read
+            # through a bmesh then)
+            if (not redo_inputs
+                    and maplus_geom.get_active_object().type == 'MESH'):
                 # a bmesh can only be initialized in edit mode...
                 if previous_mode != 'EDIT':
                     bpy.ops.object.editmode_toggle()
@@ -93,25 +157,30 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                 if addon_data.quick_sme_numeric_mode:
                     if addon_data.quick_sme_numeric_auto:
                         vert_attribs_to_set = ('line_start', 'line_end')
-                        try:
-                            vert_data = maplus_geom.return_selected_verts(
-                                maplus_geom.get_active_object(),
-                                len(vert_attribs_to_set),
-                                maplus_geom.get_active_object().matrix_world
-                            )
-                        except maplus_except.InsufficientSelectionError:
-                            self.report(
-                                {'ERROR'},
-                                'Not enough vertices selected.'
-                            )
-                            return {'CANCELLED'}
-                        except maplus_except.NonMeshGrabError:
-                            self.report(
-                                {'ERROR'},
-                                ('Cannot grab coords: non-mesh'
-                                 ' or no active object.')
-                            )
-                            return {'CANCELLED'}
+                        if redo_inputs:
+                            vert_data = redo_inputs['src_verts']
+                        else:
+                            try:
+                                grab_object = maplus_geom.get_active_object()
+                                vert_data = maplus_geom.return_selected_verts(
+                                    grab_object,
+                                    len(vert_attribs_to_set),
+                                    grab_object.matrix_world
+                                )
+                            except maplus_except.InsufficientSelectionError:
+                                self.report(
+                                    {'ERROR'},
+                                    'Not enough vertices selected.'
+                                )
+                                return {'CANCELLED'}
+                            except maplus_except.NonMeshGrabError:
+                                self.report(
+                                    {'ERROR'},
+                                    ('Cannot grab coords: non-mesh'
+                                     ' or no active object.')
+                                )
+                                return {'CANCELLED'}
+                            inputs['src_verts'] = vert_data
 
                         maplus_geom.set_item_coords(
                             addon_data.quick_sme_numeric_src,
@@ -144,25 +213,30 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                 else:
                     if addon_data.quick_scale_match_edge_auto_grab_src:
                         vert_attribs_to_set = ('line_start', 'line_end')
-                        try:
-                            vert_data = maplus_geom.return_selected_verts(
-                                maplus_geom.get_active_object(),
-                                len(vert_attribs_to_set),
-                                maplus_geom.get_active_object().matrix_world
-                            )
-                        except maplus_except.InsufficientSelectionError:
-                            self.report(
-                                {'ERROR'},
-                                'Not enough vertices selected.'
-                            )
-                            return {'CANCELLED'}
-                        except maplus_except.NonMeshGrabError:
-                            self.report(
-                                {'ERROR'},
-                                ('Cannot grab coords: non-mesh'
-                                 ' or no active object.')
-                            )
-                            return {'CANCELLED'}
+                        if redo_inputs:
+                            vert_data = redo_inputs['src_verts']
+                        else:
+                            try:
+                                grab_object = maplus_geom.get_active_object()
+                                vert_data = maplus_geom.return_selected_verts(
+                                    grab_object,
+                                    len(vert_attribs_to_set),
+                                    grab_object.matrix_world
+                                )
+                            except maplus_except.InsufficientSelectionError:
+                                self.report(
+                                    {'ERROR'},
+                                    'Not enough vertices selected.'
+                                )
+                                return {'CANCELLED'}
+                            except maplus_except.NonMeshGrabError:
+                                self.report(
+                                    {'ERROR'},
+                                    ('Cannot grab coords: non-mesh'
+                                     ' or no active object.')
+                                )
+                                return {'CANCELLED'}
+                            inputs['src_verts'] = vert_data
 
                         maplus_geom.set_item_coords(
                             addon_data.quick_scale_match_edge_src,
@@ -182,11 +256,11 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
             # Else, operate on data from the advanced tools
             else:
                 src_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.sme_edge_one],
+                    geometry=src_item,
                     kind='LINE'
                 )
                 dest_global_data = maplus_geom.get_modified_global_coords(
-                    geometry=prims[active_item.sme_edge_two],
+                    geometry=dest_item,
                     kind='LINE'
                 )
 
@@ -247,7 +321,7 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                     )
                     bpy.context.view_layer.update()
 
-            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'OBJECT_ORIGIN'}:
+            if self.target in {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP', 'OBJECT_ORIGIN'}:
                 for item in multi_edit_targets:
                     # (Note that there are no transformation modifiers for this
                     # transformation type, so that section is omitted here)
@@ -258,9 +332,21 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                          ' are not currently supported.')
                     )
 
-                    # Init source mesh
-                    src_mesh = bmesh.new()
-                    src_mesh.from_mesh(item.data)
+                    # Init source mesh (not needed when redoing, or for
+                    # array path targets: apply_mesh_transform() reads
+                    # and writes those itself)
+                    use_array_path = (
+                        bool(redo_inputs) or
+                        maplus_mesh_targets.uses_array_path(
+                            self.target,
+                            addon_data,
+                            self.journal,
+                            item
+                        )
+                    )
+                    src_mesh = None
+                    if not use_array_path:
+                        src_mesh = maplus_mesh_targets.load_bmesh(item)
 
                     item_matrix_unaltered_loc = item.matrix_world.copy()
                     unaltered_inverse_loc = item_matrix_unaltered_loc.copy()
@@ -297,7 +383,10 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
                     # Get combined scale + move
                     match_transf = new_to_old_pivot @ scaling_match
 
-                    if self.target == 'MESH_SELECTED':
+                    if src_mesh is None:
+                        # Written by apply_mesh_transform() below
+                        pass
+                    elif self.target == 'MESH_SELECTED':
                         src_mesh.transform(
                             match_transf,
                             filter={'SELECT'}
@@ -314,8 +403,42 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
 
                     # write and then release the mesh data
                     bpy.ops.object.mode_set(mode='OBJECT')
-                    src_mesh.to_mesh(item.data)
-                    src_mesh.free()
+                    if not redo_inputs:
+                        inputs['weights'][item.name] = (
+                            maplus_mesh_targets.get_target_weights(
+                                item,
+                                self.target,
+                                addon_data,
+                                bm=src_mesh
+                            )
+                        )
+                    if use_array_path:
+                        key_timings = maplus_mesh_targets.apply_mesh_transform(
+                            item,
+                            match_transf,
+                            self.target,
+                            addon_data,
+                            journal=self.journal,
+                            weights=inputs['weights'][item.name]
+                        )
+                        if key_timings is None:
+                            self.report(
+                                {'WARNING'},
+                                'Skipped "{0}": no active vertex group.'.format(
+                                    item.name
+                                )
+                            )
+                        elif key_timings:
+                            self.report(
+                                {'INFO'},
+                                maplus_mesh_targets.format_key_timings(
+                                    item,
+                                    key_timings
+                                )
+                            )
+                    else:
+                        src_mesh.to_mesh(item.data)
+                        src_mesh.free()
 
             # Go back to whatever mode we were in before doing this
             bpy.ops.object.mode_set(mode=previous_mode)
@@ -331,8 +454,16 @@ class MAPLUS_OT_ScaleMatchEdgeBase(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
+        if not redo_inputs:
+            maplus_redo_cache.store_inputs(self, inputs)
         return {'FINISHED'}
 
+    def draw(self, context):
+        # Only numeric mode has a length to adjust from the redo panel
+        if (hasattr(self, 'quick_op_target')
+                and context.scene.maplus_data.quick_sme_numeric_mode):
+            self.layout.prop(self, 'quick_sme_numeric_length')
+
 
 class MAPLUS_OT_ScaleMatchEdgeObject(MAPLUS_OT_ScaleMatchEdgeBase):
     bl_idname = "maplus.scalematchedgeobject"
@@ -428,6 +559,24 @@ class MAPLUS_OT_ScaleMatchEdgeWholeMesh(MAPLUS_OT_ScaleMatchEdgeBase):
         return True
 
 
+class MAPLUS_OT_ScaleMatchEdgeVertexGroup(MAPLUS_OT_ScaleMatchEdgeBase):
+    bl_idname = "maplus.scalematchedgevertexgroup"
+    bl_label = "Scale Match Edge Vertex Group"
+    bl_description = (
+        "Scales the verts in the active vertex group so one edge"
+        " matches the length of another"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
 class MAPLUS_OT_QuickScaleMatchEdgeWholeMesh(MAPLUS_OT_ScaleMatchEdgeBase):
     bl_idname = "maplus.quickscalematchedgewholemesh"
     bl_label = "Scale Match Edge Whole Mesh"
@@ -447,6 +596,176 @@ class MAPLUS_OT_QuickScaleMatchEdgeWholeMesh(MAPLUS_OT_ScaleMatchEdgeBase):
         return True
 
 
+class MAPLUS_OT_QuickScaleMatchEdgeVertexGroup(MAPLUS_OT_ScaleMatchEdgeBase):
+    bl_idname = "maplus.quickscalematchedgevertexgroup"
+    bl_label = "Quick Scale Match Edge Vertex Group"
+    bl_description = (
+        "Scales the verts in the active vertex group so one edge"
+        " matches the length of another"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+    quick_op_target = True
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
+def island_reference_edges(edge_lengths, edge_select, labels, island_count,
+                           rule):
+    '''Pick the reference edge of every island by rule.
+
+    Arguments:
+        edge_lengths
+            (n,) array of edge lengths
+        edge_select
+            (n,) bool array of edge selection states
+        labels
+            (n,) array with the island of every edge
+        island_count
+            number of islands
+        rule
+            'LONGEST', 'SHORTEST' or 'SELECTED' (see quick_sme_batch_rule)
+
+    Returns:
+        Return an int64 array with the reference edge of every island,
+        -1 for islands without a usable (non-zero length) edge.
+    '''
+    candidates = edge_lengths > 0
+    if rule == 'SELECTED':
+        candidates &= edge_select
+    candidates = numpy.flatnonzero(candidates)
+    # Sort the candidates by island, then best first within each island
+    if rule == 'SHORTEST':
+        sort_key = edge_lengths[candidates]
+    else:
+        sort_key = -edge_lengths[candidates]
+    ordered = candidates[numpy.lexsort((sort_key, labels[candidates]))]
+    islands, first = numpy.unique(labels[ordered], return_index=True)
+
+    reference_edges = numpy.full(island_count, -1, dtype=numpy.int64)
+    reference_edges[islands] = ordered[first]
+    return reference_edges
+
+
+class MAPLUS_OT_QuickScaleMatchEdgeBatchNumeric(bpy.types.Operator):
+    bl_idname = "maplus.quickscalematchedgebatchnumeric"
+    bl_label = "Scale Each Island"
+    bl_description = (
+        "Scales every island (connected piece) of the active mesh so that"
+        " its reference edge matches the numeric target length"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        active_object = maplus_geom.get_active_object()
+        if not (active_object
+                and maplus_geom.get_select_state(active_object)):
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: cannot perform mesh-level transform'
+                 ' without an active (and selected) object.')
+            )
+            return {'CANCELLED'}
+        if active_object.type != 'MESH':
+            self.report(
+                {'ERROR'},
+                'Cannot complete: the active object must be a mesh.'
+            )
+            return {'CANCELLED'}
+        target_length = addon_data.quick_sme_numeric_length
+        if target_length <= 0:
+            self.report(
+                {'ERROR'},
+                'Cannot complete: the target length must be positive.'
+            )
+            return {'CANCELLED'}
+
+        # Leave edit mode so the mesh data is current and writable
+        previous_mode = active_object.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        mesh = active_object.data
+
+        local_coords = maplus_geom.get_vert_coords(mesh)
+        global_coords = maplus_geom.transform_coords(
+            local_coords,
+            active_object.matrix_world
+        )
+        edge_verts = maplus_geom.get_mesh_attribute(
+            mesh.edges,
+            'vertices',
+            numpy.int64,
+            2
+        )
+        labels, island_count = maplus_geom.get_vert_islands(
+            len(local_coords),
+            edge_verts
+        )
+        # Lengths are measured in global space, like numeric mode. A
+        # uniform local scale scales the global edge by the same factor
+        # (even when the object itself is scaled non-uniformly)
+        edge_lengths = numpy.linalg.norm(
+            global_coords[edge_verts[:, 1]] - global_coords[edge_verts[:, 0]],
+            axis=1
+        )
+        reference_edges = island_reference_edges(
+            edge_lengths,
+            maplus_geom.get_mesh_attribute(mesh.edges, 'select', bool),
+            labels[edge_verts[:, 0]],
+            island_count,
+            addon_data.quick_sme_batch_rule
+        )
+        scaled = reference_edges >= 0
+        if not scaled.any():
+            bpy.ops.object.mode_set(mode=previous_mode)
+            self.report(
+                {'ERROR'},
+                'Cannot complete: no island has a usable reference edge.'
+            )
+            return {'CANCELLED'}
+
+        # Per island scale matrix, a uniform scale about the start of the
+        # reference edge (like scale match edge), kept as scale factor +
+        # pivot so the verts are transformed in one vectorized pass
+        scale_factors = numpy.ones(island_count)
+        scale_factors[scaled] = (
+            target_length / edge_lengths[reference_edges[scaled]]
+        )
+        pivots = numpy.zeros((island_count, 3))
+        pivots[scaled] = local_coords[edge_verts[reference_edges[scaled], 0]]
+        vert_pivots = pivots[labels]
+        vert_scales = scale_factors[labels][:, numpy.newaxis]
+
+        def scale_islands(coords):
+            return vert_pivots + vert_scales * (coords - vert_pivots)
+
+        maplus_geom.set_vert_coords(mesh, scale_islands(local_coords))
+        if mesh.shape_keys:
+            maplus_geom.move_reference_key(mesh, scale_islands)
+
+        bpy.ops.object.mode_set(mode=previous_mode)
+        self.report(
+            {'INFO'},
+            '{0} of {1} islands scaled'.format(
+                numpy.count_nonzero(scaled),
+                island_count
+            )
+        )
+        return {'FINISHED'}
+
+
 class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
     bl_idname = "MAPLUS_PT_QuickSMEGUI"
     bl_label = "Quick Scale Match Edge"
@@ -766,6 +1085,12 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
             'quick_sme_numeric_length',
             text='Target Length'
         )
+        numeric_batch = numeric_settings.row(align=True)
+        numeric_batch.prop(addon_data, 'quick_sme_batch_rule', text="")
+        numeric_batch.operator(
+            "maplus.quickscalematchedgebatchnumeric",
+            icon='PIVOT_INDIVIDUAL'
+        )
 
         # Disable relevant items depending on whether numeric mode
         # is enabled or not
@@ -793,10 +1118,29 @@ class MAPLUS_PT_QuickSMEGUI(bpy.types.Panel):
         )
         sme_mesh_apply_items = sme_apply_items.column(align=True)
         sme_mesh_apply_items.operator(
-            "maplus.quickscalematchedgemeshselected",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickscalematchedgemeshselected",
+                addon_data
+            ),
             text="Mesh Piece"
         )
         sme_mesh_apply_items.operator(
-            "maplus.quickscalematchedgewholemesh",
+            maplus_guitools.mesh_op_id(
+                "maplus.quickscalematchedgewholemesh",
+                addon_data
+            ),
             text="Whole Mesh"
         )
+        sme_mesh_apply_items.operator(
+            maplus_guitools.mesh_op_id(
+                "maplus.quickscalematchedgevertexgroup",
+                addon_data
+            ),
+            text="Vertex Group"
+        )
+        sme_mesh_apply_items.prop(
+            addon_data,
+            'vertex_group_blend',
+            text="Blend Weights"
+        )
+        maplus_guitools.layout_mesh_falloff(sme_mesh_apply_items, addon_data)
@@ -0,0 +1,239 @@
+"""Binding items to mesh elements (topology references), operators & UI."""
+
+
+import bmesh
+import bpy
+import numpy
+
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.topology_refs as maplus_topology
+
+
+def get_selected_vert_indices(mesh_object, count):
+    '''Get the indices of up to count selected verts of a mesh object.
+
+    Verts are taken in the same order as grabs take them: the selection
+    history first, then the other selected verts by index.
+    '''
+    # Flush edit mode changes to the mesh data (as the grabs do)
+    bpy.ops.object.editmode_toggle()
+    bpy.ops.object.editmode_toggle()
+
+    src_mesh = bmesh.new()
+    src_mesh.from_mesh(mesh_object.data)
+    src_mesh.select_history.validate()
+    indices = []
+    for element in src_mesh.select_history:
+        if isinstance(element, bmesh.types.BMVert):
+            element_verts = [element]
+        else:
+            element_verts = element.verts
+        for vert in element_verts:
+            if vert.index not in indices:
+                indices.append(vert.index)
+    src_mesh.free()
+
+    selected = numpy.flatnonzero(
+        maplus_geom.get_mesh_attribute(
+            mesh_object.data.vertices,
+            'select',
+            bool
+        )
+    )
+    for index in selected.tolist():
+        if len(indices) >= count:
+            break
+        if index not in indices:
+            indices.append(index)
+    return indices[:count]
+
+
+def get_selected_face_index(mesh_object):
+    # The active face if it is selected, else the first selected face (or
+    # None)
+    bpy.ops.object.editmode_toggle()
+    bpy.ops.object.editmode_toggle()
+
+    src_mesh = bmesh.new()
+    src_mesh.from_mesh(mesh_object.data)
+    active_face = src_mesh.faces.active
+    active_index = (
+        active_face.index if active_face and active_face.select else None
+    )
+    src_mesh.free()
+    if active_index is not None:
+        return active_index
+    selected = numpy.flatnonzero(
+        maplus_geom.get_mesh_attribute(
+            mesh_object.data.polygons,
+            'select',
+            bool
+        )
+    )
+    return int(selected[0]) if len(selected) else None
+
+
+class MAPLUS_OT_BindItemBase(bpy.types.Operator):
+    bl_idname = "maplus.binditembase"
+    bl_label = "Bind Item Base Class"
+    bl_description = (
+        "The base class for binding the active item to mesh elements"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    # 'VERT' or 'FACE', the element type to bind to
+    bind_element = None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        if not prims:
+            self.report({'ERROR'}, 'The advanced tools list is empty.')
+            return {'CANCELLED'}
+        active_item = prims[addon_data.active_list_item]
+        if active_item.kind not in maplus_topology.COORD_ATTRIBS:
+            self.report(
+                {'ERROR'},
+                ('Wrong operand: only point, line and plane items can be'
+                 ' bound to mesh elements')
+            )
+            return {'CANCELLED'}
+        active_object = maplus_geom.get_active_object()
+        if not (active_object
+                and maplus_geom.get_select_state(active_object)
+                and active_object.type == 'MESH'):
+            self.report(
+                {'ERROR'},
+                ('Cannot bind: needs an active (and selected) mesh'
+                 ' object.')
+            )
+            return {'CANCELLED'}
+
+        if self.bind_element == 'VERT':
+            point_count = len(maplus_topology.COORD_ATTRIBS[active_item.kind])
+            indices = get_selected_vert_indices(active_object, point_count)
+            if len(indices) < point_count:
+                self.report({'ERROR'}, 'Not enough vertices selected.')
+                return {'CANCELLED'}
+        else:
+            face_index = get_selected_face_index(active_object)
+            if face_index is None:
+                self.report({'ERROR'}, 'No face selected.')
+                return {'CANCELLED'}
+            indices = [face_index]
+
+        active_item.bind_object = active_object
+        active_item.bind_element = self.bind_element
+        active_item.bind_indices = (indices + [-1, -1, -1])[:3]
+        # Show the coords the item now resolves to
+        maplus_topology.store_resolved_coords([active_item])
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_BindItemToVerts(MAPLUS_OT_BindItemBase):
+    bl_idname = "maplus.binditemtoverts"
+    bl_label = "Bind to Verts"
+    bl_description = (
+        "Makes the active item follow the selected verts of the active"
+        " mesh (one per point of the item), instead of storing coords"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    bind_element = 'VERT'
+
+
+class MAPLUS_OT_BindItemToFace(MAPLUS_OT_BindItemBase):
+    bl_idname = "maplus.binditemtoface"
+    bl_label = "Bind to Face"
+    bl_description = (
+        "Makes the active item follow the active face of the active mesh"
+        " (its center, normal or first 3 verts), instead of storing coords"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    bind_element = 'FACE'
+
+
+class MAPLUS_OT_UnbindItem(bpy.types.Operator):
+    bl_idname = "maplus.unbinditem"
+    bl_label = "Unbind"
+    bl_description = (
+        "Freezes the active item at the coords it currently resolves to"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        if not prims:
+            self.report({'ERROR'}, 'The advanced tools list is empty.')
+            return {'CANCELLED'}
+        active_item = prims[addon_data.active_list_item]
+        if not active_item.bind_object:
+            self.report({'ERROR'}, 'The active item is not bound.')
+            return {'CANCELLED'}
+        maplus_topology.store_resolved_coords([active_item])
+        active_item.bind_object = None
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_RefreshBoundItems(bpy.types.Operator):
+    bl_idname = "maplus.refreshbounditems"
+    bl_label = "Refresh Bound Items"
+    bl_description = (
+        "Updates the stored coords of every bound item from its mesh"
+        " (bound items are always resolved when used, this refreshes"
+        " what the panels show)"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        prims = bpy.context.scene.maplus_data.prim_list
+        bound_items = [item for item in prims if item.bind_object]
+        broken_count = maplus_topology.store_resolved_coords(bound_items)
+        if broken_count:
+            self.report(
+                {'WARNING'},
+                ('{0} item(s) could not be resolved, their vertex/face'
+                 ' indices are out of range').format(broken_count)
+            )
+        else:
+            self.report(
+                {'INFO'},
+                'Refreshed {0} bound items'.format(len(bound_items))
+            )
+        return {'FINISHED'}
+
+
+class MAPLUS_PT_TopologyBindingGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_TopologyBindingGUI"
+    bl_label = "Mesh Element Binding"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Mesh Align Plus"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+
+        if prims:
+            active_item = prims[addon_data.active_list_item]
+            layout.label(
+                text='Active item: "{0}"'.format(active_item.name),
+                icon="LINKED"
+            )
+            if active_item.bind_object:
+                layout.label(
+                    text='Bound to "{0}" {1} {2}'.format(
+                        active_item.bind_object.name,
+                        active_item.bind_element.lower(),
+                        [index for index in active_item.bind_indices
+                         if index >= 0]
+                    )
+                )
+                layout.operator("maplus.unbinditem", icon='UNLINKED')
+            else:
+                layout.label(text="Not bound (stored coords)")
+        bind_row = layout.row(align=True)
+        bind_row.operator("maplus.binditemtoverts", icon='VERTEXSEL')
+        bind_row.operator("maplus.binditemtoface", icon='FACESEL')
+        layout.operator("maplus.refreshbounditems", icon='FILE_REFRESH')
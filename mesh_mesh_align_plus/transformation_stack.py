@@ -0,0 +1,553 @@
+"""Transformation stack (multi-step transformations), internals & UI."""
+
+
+import math
+
+import bpy
+import mathutils
+
+import mesh_mesh_align_plus.calculate_compose as maplus_calc_compose
+import mesh_mesh_align_plus.utils.exceptions as maplus_except
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.mesh_targets as maplus_mesh_targets
+import mesh_mesh_align_plus.utils.storage as maplus_storage
+
+
+# Every transformation type moves its targets by a world space affine
+# transform that only depends on the stored (global) geometry it refers
+# to, so a sequence of transformations collapses into a single matrix.
+# These functions build that matrix for one transformation item (the
+# same math as the object mode branch of each transformation operator),
+# from its operands' current coords or from operand_coords (as returned
+# by get_operand_coords(), see alignment_bake.py)
+def get_operand_coords(transf, kind):
+    # Global coords of each operand of transf, or None if an operand is
+    # missing or isn't the expected kind
+    operand_coords = []
+    for attrib in maplus_storage.TRANSF_REFERENCES[transf.transf_type]:
+        operand = maplus_calc_compose.get_evaluated_reference(transf, attrib)
+        if operand is None or operand.kind != kind:
+            return None
+        operand_coords.append(
+            maplus_geom.get_modified_global_coords(
+                geometry=operand,
+                kind=kind
+            )
+        )
+    return operand_coords
+
+
+def _about_pivot(matrix, src_pivot, dest_pivot):
+    # Apply matrix (rotation/scale) around src_pivot, then move the pivot
+    # onto dest_pivot
+    return (
+        mathutils.Matrix.Translation(dest_pivot) @
+        matrix @
+        mathutils.Matrix.Translation(-src_pivot)
+    )
+
+
+def align_points_matrix(transf, operand_coords=None):
+    if operand_coords is None:
+        operand_coords = get_operand_coords(transf, 'POINT')
+    if operand_coords is None:
+        return None
+    src_pt = operand_coords[0][0]
+    dest_pt = operand_coords[1][0]
+
+    align_points = dest_pt - src_pt
+    if transf.apt_make_unit_vector:
+        align_points.normalize()
+    if transf.apt_flip_direction:
+        align_points.negate()
+    align_points *= transf.apt_multiplier
+    return mathutils.Matrix.Translation(align_points)
+
+
+def directional_slide_matrix(transf, operand_coords=None):
+    if operand_coords is None:
+        operand_coords = get_operand_coords(transf, 'LINE')
+    if operand_coords is None:
+        return None
+    dir_start, dir_end = operand_coords[0]
+
+    direction = dir_end - dir_start
+    if transf.ds_make_unit_vec:
+        direction.normalize()
+    if transf.ds_flip_direction:
+        direction.negate()
+    direction *= transf.ds_multiplier
+    return mathutils.Matrix.Translation(direction)
+
+
+def scale_match_edge_matrix(transf, operand_coords=None):
+    if operand_coords is None:
+        operand_coords = get_operand_coords(transf, 'LINE')
+    if operand_coords is None:
+        return None
+    src_start, src_end = operand_coords[0]
+    dest_start, dest_end = operand_coords[1]
+
+    src_edge = src_end - src_start
+    dest_edge = dest_end - dest_start
+    if dest_edge.length == 0 or src_edge.length == 0:
+        return None
+    scale_factor = dest_edge.length / src_edge.length
+    return _about_pivot(
+        mathutils.Matrix.Scale(scale_factor, 4),
+        src_start,
+        src_start
+    )
+
+
+def align_lines_matrix(transf, operand_coords=None):
+    if operand_coords is None:
+        operand_coords = get_operand_coords(transf, 'LINE')
+    if operand_coords is None:
+        return None
+    src_start, src_end = operand_coords[0]
+    dest_start, dest_end = operand_coords[1]
+
+    src_line = src_end - src_start
+    dest_line = dest_end - dest_start
+    if transf.aln_flip_direction:
+        src_line.negate()
+    parallelize_lines = src_line.rotation_difference(dest_line).to_matrix()
+    parallelize_lines.resize_4x4()
+    return _about_pivot(parallelize_lines, src_start, dest_start)
+
+
+def axis_rotate_matrix(transf, operand_coords=None):
+    if operand_coords is None:
+        operand_coords = get_operand_coords(transf, 'LINE')
+    if operand_coords is None:
+        return None
+    axis_start, axis_end = operand_coords[0]
+
+    # Get rotation in proper units (radians)
+    if (bpy.context.scene.unit_settings.system_rotation == 'RADIANS'):
+        converted_rot_amount = transf.axr_amount
+    else:
+        converted_rot_amount = math.radians(transf.axr_amount)
+    axis_rot = mathutils.Matrix.Rotation(
+        converted_rot_amount,
+        4,
+        axis_end - axis_start
+    )
+    return _about_pivot(axis_rot, axis_start, axis_start)
+
+
+def align_planes_matrix(transf, operand_coords=None):
+    if operand_coords is None:
+        operand_coords = get_operand_coords(transf, 'PLANE')
+    if operand_coords is None:
+        return None
+    src_global_data, dest_global_data = operand_coords
+
+    if transf.apl_alternate_pivot:
+        src_pt_a, src_pt_b = src_global_data[1], src_global_data[0]
+        dest_pt_a, dest_pt_b = dest_global_data[1], dest_global_data[0]
+    else:
+        src_pt_a, src_pt_b = src_global_data[0], src_global_data[1]
+        dest_pt_a, dest_pt_b = dest_global_data[0], dest_global_data[1]
+    src_pt_c = src_global_data[2]
+    dest_pt_c = dest_global_data[2]
+
+    src_pln_ln_BA = src_pt_a - src_pt_b
+    src_normal = src_pln_ln_BA.cross(src_pt_c - src_pt_b)
+    if transf.apl_flip_normal:
+        src_normal.negate()
+    dest_pln_ln_BA = dest_pt_a - dest_pt_b
+    dest_normal = dest_pln_ln_BA.cross(dest_pt_c - dest_pt_b)
+
+    # Make the planes parallel, then align the leading edges
+    rotational_diff = src_normal.rotation_difference(dest_normal)
+    new_lead_edge_orientation = src_pln_ln_BA.copy()
+    new_lead_edge_orientation.rotate(rotational_diff)
+    parallelize_edges = new_lead_edge_orientation.rotation_difference(
+        dest_pln_ln_BA
+    )
+    coplanar = (
+        parallelize_edges.to_matrix() @ rotational_diff.to_matrix()
+    )
+    coplanar.resize_4x4()
+    return _about_pivot(coplanar, src_pt_b, dest_pt_b)
+
+
+# Kind of every operand of each transformation type
+TRANSF_OPERAND_KINDS = {
+    'ALIGNPOINTS': 'POINT',
+    'DIRECTIONALSLIDE': 'LINE',
+    'SCALEMATCHEDGE': 'LINE',
+    'ALIGNLINES': 'LINE',
+    'AXISROTATE': 'LINE',
+    'ALIGNPLANES': 'PLANE',
+}
+TRANSF_MATRICES = {
+    'ALIGNPOINTS': align_points_matrix,
+    'DIRECTIONALSLIDE': directional_slide_matrix,
+    'SCALEMATCHEDGE': scale_match_edge_matrix,
+    'ALIGNLINES': align_lines_matrix,
+    'AXISROTATE': axis_rotate_matrix,
+    'ALIGNPLANES': align_planes_matrix,
+}
+
+
+def get_stack_steps(stack, scene=None):
+    # The transformation items of the enabled steps of a stack, in order
+    # (None in place of items that were removed from the list)
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    steps = []
+    for step in stack.transf_stack:
+        if not step.enabled:
+            continue
+        row = maplus_storage.get_prim_row(step.uid, scene)
+        steps.append(prims[row] if row is not None else None)
+    return steps
+
+
+def get_stack_matrix(stack, step_count=0, scene=None):
+    '''Compose the steps of a transformation stack into one matrix.
+
+    Arguments:
+        stack
+            a TRANSFORMATION item with transf_type 'TRANSFSTACK'
+        step_count
+            only compose the first step_count enabled steps (0 composes
+            every step)
+
+    Returns:
+        Return a 4x4 world space mathutils.Matrix equivalent to running
+        each step's transformation (object mode) in order.
+
+    Raises TransfStackError (with a message for the user) if a step can't
+    be evaluated, and DependencyCycleError for cyclic step inputs.
+    '''
+    steps = get_stack_steps(stack, scene)
+    if step_count:
+        steps = steps[:step_count]
+    if not steps:
+        raise maplus_except.TransfStackError(
+            'The transformation stack has no enabled steps.'
+        )
+
+    stack_matrix = mathutils.Matrix.Identity(4)
+    for step_number, transf in enumerate(steps, 1):
+        if transf is None:
+            raise maplus_except.TransfStackError(
+                'Missing step: the item for step {0} was removed from'
+                ' the list'.format(step_number)
+            )
+        build_matrix = TRANSF_MATRICES.get(transf.transf_type)
+        step_matrix = build_matrix(transf) if build_matrix else None
+        if step_matrix is None:
+            raise maplus_except.TransfStackError(
+                'Invalid step: "{0}" (step {1}) is missing operands or'
+                ' has operands of the wrong type'.format(
+                    transf.name,
+                    step_number
+                )
+            )
+        stack_matrix = step_matrix @ stack_matrix
+    return stack_matrix
+
+
+class MAPLUS_OT_ApplyTransfStackBase(bpy.types.Operator):
+    bl_idname = "maplus.applytransfstackbase"
+    bl_label = "Apply Transformation Stack Base"
+    bl_description = "Apply transformation stack base class"
+    bl_options = {'REGISTER', 'UNDO'}
+    target = None
+    # Journaled (undo-light) variants record their mesh changes in the
+    # addon's journal instead of Blender's undo, see undo_journal.py
+    journal = False
+
+    step_count: bpy.props.IntProperty(
+        name="Steps",
+        description=(
+            "Only apply the first N enabled steps, change this from the"
+            " redo panel to preview the stack step by step (0 applies"
+            " every step)"
+        ),
+        min=0,
+        default=0
+    )
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        active_item = prims[addon_data.active_list_item]
+        if (active_item.kind != 'TRANSFORMATION'
+                or active_item.transf_type != 'TRANSFSTACK'):
+            self.report(
+                {'ERROR'},
+                'Wrong item: the active item is not a transformation stack'
+            )
+            return {'CANCELLED'}
+
+        # Gather selected Blender object(s) to apply the transform to
+        multi_edit_targets = [
+            item for item in bpy.context.scene.objects if (
+                maplus_geom.get_select_state(item)
+            )
+        ]
+        if (self.target != 'OBJECT'
+                and maplus_mesh_targets.get_incompatible_targets(
+                    multi_edit_targets,
+                    self.target,
+                    self.journal)):
+            self.report(
+                {'ERROR'},
+                ('Cannot complete: Cannot apply mesh-level'
+                 ' transformations to selected non-mesh objects.')
+            )
+            return {'CANCELLED'}
+
+        try:
+            stack_matrix = get_stack_matrix(active_item, self.step_count)
+        except maplus_except.TransfStackError as stack_error:
+            self.report({'ERROR'}, str(stack_error))
+            return {'CANCELLED'}
+        except maplus_except.DependencyCycleError:
+            self.report(
+                {'ERROR'},
+                ('Dependency cycle: an item used by this'
+                 ' transformation depends on itself')
+            )
+            return {'CANCELLED'}
+
+        if self.target == 'OBJECT':
+            for item in multi_edit_targets:
+                item.matrix_world = stack_matrix @ item.matrix_world
+        else:
+            # Mesh data is only in sync with the edit mesh in object mode,
+            # switch once for every target
+            active_object = maplus_geom.get_active_object()
+            previous_mode = active_object.mode if active_object else None
+            if previous_mode and previous_mode != 'OBJECT':
+                bpy.ops.object.mode_set(mode='OBJECT')
+            for item in multi_edit_targets:
+                # Bring the world space matrix into the object's local space
+                local_matrix = (
+                    item.matrix_world.inverted() @
+                    stack_matrix @
+                    item.matrix_world
+                )
+                key_timings = maplus_mesh_targets.apply_mesh_transform(
+                    item,
+                    local_matrix,
+                    self.target,
+                    addon_data,
+                    journal=self.journal
+                )
+                if key_timings is None:
+                    self.report(
+                        {'WARNING'},
+                        'Skipped "{0}": no active vertex group.'.format(
+                            item.name
+                        )
+                    )
+                elif key_timings:
+                    self.report(
+                        {'INFO'},
+                        maplus_mesh_targets.format_key_timings(
+                            item,
+                            key_timings
+                        )
+                    )
+            if previous_mode and previous_mode != 'OBJECT':
+                bpy.ops.object.mode_set(mode=previous_mode)
+
+        if not self.step_count:
+            active_item.needs_update = False
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_ApplyTransfStackObject(MAPLUS_OT_ApplyTransfStackBase):
+    bl_idname = "maplus.applytransfstackobject"
+    bl_label = "Apply Transformation Stack to Object"
+    bl_description = (
+        "Applies every step of the transformation stack to the selected"
+        " objects in a single pass"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'OBJECT'
+
+
+class MAPLUS_OT_ApplyTransfStackMeshSelected(MAPLUS_OT_ApplyTransfStackBase):
+    bl_idname = "maplus.applytransfstackmeshselected"
+    bl_label = "Apply Transformation Stack to Mesh Selected"
+    bl_description = (
+        "Applies every step of the transformation stack to the selected"
+        " verts of the selected meshes in a single pass"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'MESH_SELECTED'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
+class MAPLUS_OT_ApplyTransfStackWholeMesh(MAPLUS_OT_ApplyTransfStackBase):
+    bl_idname = "maplus.applytransfstackwholemesh"
+    bl_label = "Apply Transformation Stack to Whole Mesh"
+    bl_description = (
+        "Applies every step of the transformation stack to the selected"
+        " meshes in a single pass"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'WHOLE_MESH'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
+class MAPLUS_OT_ApplyTransfStackVertexGroup(MAPLUS_OT_ApplyTransfStackBase):
+    bl_idname = "maplus.applytransfstackvertexgroup"
+    bl_label = "Apply Transformation Stack to Vertex Group"
+    bl_description = (
+        "Applies every step of the transformation stack to the active"
+        " vertex group of the selected meshes in a single pass"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+    target = 'VERTEX_GROUP'
+
+    @classmethod
+    def poll(cls, context):
+        addon_data = bpy.context.scene.maplus_data
+        if not addon_data.use_experimental:
+            return False
+        return True
+
+
+class MAPLUS_OT_AddTransfStackStep(bpy.types.Operator):
+    bl_idname = "maplus.addtransfstackstep"
+    bl_label = "Add Step"
+    bl_description = (
+        "Adds the picked transformation item to the end of the stack"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        active_item = prims[addon_data.active_list_item]
+        if not 0 <= active_item.transf_stack_pick < len(prims):
+            self.report({'ERROR'}, 'Pick a transformation item to add.')
+            return {'CANCELLED'}
+        picked_item = prims[active_item.transf_stack_pick]
+        if (picked_item.kind != 'TRANSFORMATION'
+                or picked_item.transf_type in {'TRANSFSTACK', 'UNDEFINED'}):
+            self.report(
+                {'ERROR'},
+                ('Wrong operand: stack steps must be transformations'
+                 ' (other than a stack) with a type set')
+            )
+            return {'CANCELLED'}
+
+        maplus_storage.ensure_prim_uids()
+        new_step = active_item.transf_stack.add()
+        new_step.uid = picked_item.uid
+        active_item.transf_stack_active = len(active_item.transf_stack) - 1
+        maplus_storage.references_changed()
+        maplus_storage.mark_dirty(active_item)
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_RemoveTransfStackStep(bpy.types.Operator):
+    bl_idname = "maplus.removetransfstackstep"
+    bl_label = "Remove Step"
+    bl_description = "Removes the selected step from the stack"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        active_item = prims[addon_data.active_list_item]
+        steps = active_item.transf_stack
+        if not 0 <= active_item.transf_stack_active < len(steps):
+            self.report({'WARNING'}, "Nothing to remove")
+            return {'CANCELLED'}
+
+        steps.remove(active_item.transf_stack_active)
+        active_item.transf_stack_active = max(
+            min(active_item.transf_stack_active, len(steps) - 1),
+            0
+        )
+        maplus_storage.references_changed()
+        maplus_storage.mark_dirty(active_item)
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_MoveTransfStackStepBase(bpy.types.Operator):
+    bl_idname = "maplus.movetransfstackstepbase"
+    bl_label = "Move a step"
+    bl_options = {'REGISTER', 'UNDO'}
+    # Offset to move the selected step by, provided by derived classes
+    offset = None
+
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        active_item = prims[addon_data.active_list_item]
+        steps = active_item.transf_stack
+
+        new_row = active_item.transf_stack_active + self.offset
+        if len(steps) == 0 or not 0 <= new_row < len(steps):
+            return {'CANCELLED'}
+        steps.move(active_item.transf_stack_active, new_row)
+        active_item.transf_stack_active = new_row
+        maplus_storage.mark_dirty(active_item)
+
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_MoveTransfStackStepUp(MAPLUS_OT_MoveTransfStackStepBase):
+    bl_idname = "maplus.movetransfstackstepup"
+    bl_label = "Move step up"
+    bl_description = "Moves the selected step up (earlier) in the stack"
+    bl_options = {'REGISTER', 'UNDO'}
+    offset = -1
+
+
+class MAPLUS_OT_MoveTransfStackStepDown(MAPLUS_OT_MoveTransfStackStepBase):
+    bl_idname = "maplus.movetransfstackstepdown"
+    bl_label = "Move step down"
+    bl_description = "Moves the selected step down (later) in the stack"
+    bl_options = {'REGISTER', 'UNDO'}
+    offset = 1
+
+
+class MAPLUS_UL_TransfStackSteps(bpy.types.UIList):
+    bl_idname = "MAPLUS_UL_TransfStackSteps"
+
+    def draw_item(self,
+                  context,
+                  layout,
+                  data,
+                  item,
+                  icon,
+                  active_data,
+                  active_propname
+                  ):
+        prims = bpy.context.scene.maplus_data.prim_list
+        row = maplus_storage.get_prim_row(item.uid)
+
+        layout.prop(bpy.types.AnyType(item), 'enabled', text="")
+        if row is None:
+            layout.label(text="(removed item)", icon="ERROR")
+        else:
+            layout.label(text=prims[row].name, icon="GRAPH")
+
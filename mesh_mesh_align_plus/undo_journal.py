@@ -0,0 +1,196 @@
+"""Undo-light (journaled) mesh level transforms, journal operators & UI."""
+
+
+import bpy
+
+import mesh_mesh_align_plus.align_lines as maplus_aln
+import mesh_mesh_align_plus.align_planes as maplus_apl
+import mesh_mesh_align_plus.align_points as maplus_apt
+import mesh_mesh_align_plus.axis_rotate as maplus_axr
+import mesh_mesh_align_plus.directional_slide as maplus_ds
+import mesh_mesh_align_plus.scale_match_edge as maplus_sme
+import mesh_mesh_align_plus.transformation_stack as maplus_transf_stack
+import mesh_mesh_align_plus.utils.exceptions as maplus_except
+import mesh_mesh_align_plus.utils.mesh_journal as maplus_journal
+
+
+# Tool bases (and their modules) that get journaled variants of their
+# mesh level operators. Object origin ops are left out, they move the
+# objects too, which the journal doesn't record
+JOURNALED_TOOLS = (
+    (maplus_apt, maplus_apt.MAPLUS_OT_AlignPointsBase),
+    (maplus_aln, maplus_aln.MAPLUS_OT_AlignLinesBase),
+    (maplus_apl, maplus_apl.MAPLUS_OT_AlignPlanesBase),
+    (maplus_axr, maplus_axr.MAPLUS_OT_AxisRotateBase),
+    (maplus_ds, maplus_ds.MAPLUS_OT_DirectionalSlideBase),
+    (maplus_sme, maplus_sme.MAPLUS_OT_ScaleMatchEdgeBase),
+    (
+        maplus_transf_stack,
+        maplus_transf_stack.MAPLUS_OT_ApplyTransfStackBase
+    ),
+)
+JOURNALED_TARGETS = {'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP'}
+# Operator class attributes not carried over to the journaled variants
+# (the variant generator sets its own id/options)
+SKIPPED_ATTRIBS = {
+    '__module__', '__qualname__', '__doc__', '__dict__', '__weakref__',
+    'bl_idname', 'bl_options',
+}
+
+
+def get_journaled_variants(module, base):
+    '''Build the variant table rows for one tool's mesh level operators.
+
+    Each row copies a hand-written operator (target, quick op marker,
+    poll, labels) with the MAPLUS_OT_ prefix dropped and 'Journaled'
+    appended to its name, so 'maplus.alignpointswholemesh' gets a
+    'maplus.alignpointswholemeshjournaled' variant.
+    '''
+    variants = []
+    for name, cls in vars(module).items():
+        if not (isinstance(cls, type) and issubclass(cls, base)
+                and getattr(cls, 'target', None) in JOURNALED_TARGETS):
+            continue
+        variants.append((
+            name[len('MAPLUS_OT_'):] + 'Journaled',
+            {
+                attrib: value for attrib, value in vars(cls).items()
+                if attrib not in SKIPPED_ATTRIBS
+            }
+        ))
+    return tuple(variants)
+
+
+# Journaled variants skip Blender's undo (no 'UNDO' option, so no full
+# mesh copy is pushed per step), their steps go in the addon's journal
+operator_variant_tables = tuple(
+    (
+        base,
+        {'bl_options': {'REGISTER'}, 'journal': True},
+        get_journaled_variants(module, base)
+    )
+    for module, base in JOURNALED_TOOLS
+)
+
+
+def enter_object_mode():
+    # Journal steps write mesh data directly, which needs object mode,
+    # return the mode to go back to (or None)
+    active_object = bpy.context.active_object
+    if not active_object or active_object.mode == 'OBJECT':
+        return None
+    previous_mode = active_object.mode
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return previous_mode
+
+
+def restore_mode(previous_mode):
+    if previous_mode:
+        bpy.ops.object.mode_set(mode=previous_mode)
+
+
+class MAPLUS_OT_JournalUndo(bpy.types.Operator):
+    bl_idname = "maplus.journalundo"
+    bl_label = "Journal Undo"
+    bl_description = "Reverts the last journaled mesh level transform"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(maplus_journal.get_journal().steps)
+
+    def execute(self, context):
+        previous_mode = enter_object_mode()
+        try:
+            step = maplus_journal.get_journal().undo()
+        except maplus_except.JournalError as journal_error:
+            self.report({'ERROR'}, str(journal_error))
+            return {'CANCELLED'}
+        finally:
+            restore_mode(previous_mode)
+        self.report(
+            {'INFO'},
+            'Undid a step on "{0}"'.format(step.object_name)
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_JournalRedo(bpy.types.Operator):
+    bl_idname = "maplus.journalredo"
+    bl_label = "Journal Redo"
+    bl_description = "Replays the last undone journaled mesh transform"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(maplus_journal.get_journal().undone)
+
+    def execute(self, context):
+        previous_mode = enter_object_mode()
+        try:
+            step = maplus_journal.get_journal().redo()
+        except maplus_except.JournalError as journal_error:
+            self.report({'ERROR'}, str(journal_error))
+            return {'CANCELLED'}
+        finally:
+            restore_mode(previous_mode)
+        self.report(
+            {'INFO'},
+            'Redid a step on "{0}"'.format(step.object_name)
+        )
+        return {'FINISHED'}
+
+
+class MAPLUS_OT_ClearJournal(bpy.types.Operator):
+    bl_idname = "maplus.clearjournal"
+    bl_label = "Clear Journal"
+    bl_description = "Drops every journaled step (frees their memory)"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        maplus_journal.get_journal().clear()
+        return {'FINISHED'}
+
+
+class MAPLUS_PT_MeshJournalGUI(bpy.types.Panel):
+    bl_idname = "MAPLUS_PT_MeshJournalGUI"
+    bl_label = "Mesh Journal (Undo-Light)"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Mesh Align Plus"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        maplus_data_ptr = bpy.types.AnyType(bpy.context.scene.maplus_data)
+        journal = maplus_journal.get_journal()
+
+        layout.prop(
+            maplus_data_ptr,
+            'mesh_journal_use',
+            text="Journal Mesh Transforms"
+        )
+        layout.prop(
+            maplus_data_ptr,
+            'mesh_journal_max_steps',
+            text="Max Steps"
+        )
+        layout.label(
+            text='{0} undo / {1} redo ({2:.1f} KiB)'.format(
+                len(journal.steps),
+                len(journal.undone),
+                journal.size() / 1024
+            )
+        )
+        history_row = layout.row(align=True)
+        history_row.operator(
+            "maplus.journalundo",
+            icon='LOOP_BACK',
+            text="Undo"
+        )
+        history_row.operator(
+            "maplus.journalredo",
+            icon='LOOP_FORWARDS',
+            text="Redo"
+        )
+        layout.operator("maplus.clearjournal", icon='TRASH')
@@ -1,14 +1,26 @@
 """Exceptions/errors generated by the addon."""
 
 
-# Exception when adding new items, if we can't get a unique name
-class UniqueNameError(Exception):
+class NonMeshGrabError(Exception):
     pass
 
 
-class NonMeshGrabError(Exception):
+class InsufficientSelectionError(Exception):
     pass
 
 
-class InsufficientSelectionError(Exception):
+# Exception when evaluating items, if an item (indirectly) depends on itself
+class DependencyCycleError(Exception):
+    pass
+
+
+# Exception when composing a transformation stack, if a step can't be
+# evaluated (the message is reported to the user)
+class TransfStackError(Exception):
+    pass
+
+
+# Exception when reverting/replaying a journaled mesh transform, if the
+# object or its mesh no longer match the step (the message is reported)
+class JournalError(Exception):
     pass
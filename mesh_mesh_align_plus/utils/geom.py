@@ -6,11 +6,16 @@ import collections
 import bmesh
 import bpy
 import mathutils
+import numpy
 
 import mesh_mesh_align_plus.utils.exceptions as maplus_except
+import mesh_mesh_align_plus.utils.point_data as maplus_point_data
+import mesh_mesh_align_plus.utils.topology_refs as maplus_topology
 
 
 def set_item_coords(item, coords_to_set, coords):
+    # (Bound items are unbound, see maplus_topology.unbind_item())
+    maplus_topology.unbind_item(item)
     target_data = collections.OrderedDict(
         zip(coords_to_set, coords)
     )
@@ -39,6 +44,41 @@ def scale_mat_from_vec(vec):
     )
 
 
+def get_selected_point_coords(point_object, global_matrix_multiplier=None):
+    '''Read the selected points of a point data object in one pass.
+
+    Points have no selection history, they are listed in data order
+    (see maplus_point_data.get_point_blocks()).
+
+    Returns:
+        Return an (n, 3) float64 array of the selected points' coords,
+        transformed by global_matrix_multiplier if one is given.
+    '''
+    maplus_point_data.sync_edit_data(point_object)
+    blocks = maplus_point_data.get_point_blocks(point_object)
+    coords = maplus_point_data.get_point_coords(point_object, blocks)
+    coords = coords[
+        maplus_point_data.get_point_selection(point_object, blocks)
+    ]
+    if global_matrix_multiplier:
+        coords = transform_coords(coords, global_matrix_multiplier)
+    return coords
+
+
+def fit_point_plane(coords):
+    '''Least squares plane through (n, 3) coords (n >= 3).
+
+    Returns:
+        Return the centroid and unit normal, as float64 arrays, or None if
+        the points are collinear (or coincident).
+    '''
+    centroid = coords.mean(axis=0)
+    singular_values, axes = numpy.linalg.svd(coords - centroid)[1:]
+    if singular_values[1] <= 1e-9 * max(singular_values[0], 1e-30):
+        return None
+    return centroid, axes[2]
+
+
 def return_selected_verts(mesh_object,
                           verts_to_grab,
                           global_matrix_multiplier=None):
@@ -94,6 +134,14 @@ def return_selected_verts(mesh_object,
             return selection
         else:
             raise maplus_except.InsufficientSelectionError()
+    elif maplus_point_data.is_point_object(mesh_object):
+        coords = get_selected_point_coords(
+            mesh_object,
+            global_matrix_multiplier
+        )
+        if len(coords) < verts_to_grab:
+            raise maplus_except.InsufficientSelectionError()
+        return [mathutils.Vector(co) for co in coords[:verts_to_grab]]
     else:
         raise maplus_except.NonMeshGrabError(mesh_object)
 
@@ -147,6 +195,21 @@ def return_normal_coords(mesh_object,
         )
         return normal
 
+    elif maplus_point_data.is_point_object(mesh_object):
+        # Points have no faces, the normal is that of the plane fit
+        # through the selected points (in local space, like a face's)
+        coords = get_selected_point_coords(mesh_object)
+        plane = fit_point_plane(coords) if len(coords) >= 3 else None
+        if plane is None:
+            raise maplus_except.InsufficientSelectionError()
+        centroid, plane_normal = plane
+        normal = [
+            mathutils.Vector(centroid),
+            mathutils.Vector(centroid + plane_normal)
+        ]
+        if global_matrix_multiplier:
+            normal = [global_matrix_multiplier @ co for co in normal]
+        return normal
     else:
         raise maplus_except.NonMeshGrabError(mesh_object)
 
@@ -182,6 +245,14 @@ def return_avg_vert_pos(mesh_object,
             return [average_position]
         else:
             raise maplus_except.InsufficientSelectionError()
+    elif maplus_point_data.is_point_object(mesh_object):
+        coords = get_selected_point_coords(
+            mesh_object,
+            global_matrix_multiplier
+        )
+        if not len(coords):
+            raise maplus_except.InsufficientSelectionError()
+        return [mathutils.Vector(coords.mean(axis=0))]
     else:
         raise maplus_except.NonMeshGrabError(mesh_object)
 
@@ -241,6 +312,14 @@ def return_at_least_one_selected_vert(mesh_object,
             return selection
         else:
             raise maplus_except.InsufficientSelectionError()
+    elif maplus_point_data.is_point_object(mesh_object):
+        coords = get_selected_point_coords(
+            mesh_object,
+            global_matrix_multiplier
+        )
+        if not len(coords):
+            raise maplus_except.InsufficientSelectionError()
+        return [mathutils.Vector(co) for co in coords[:3]]
     else:
         raise maplus_except.NonMeshGrabError(mesh_object)
 
@@ -634,10 +713,10 @@ class MAPLUS_OT_GrabFromCursorBase(bpy.types.Operator):
         else:
             active_item = prims[addon_data.active_list_item]
 
-        setattr(
+        set_item_coords(
             active_item,
-            self.vert_attrib_to_set,
-            bpy.context.scene.cursor.location
+            (self.vert_attrib_to_set,),
+            (bpy.context.scene.cursor.location,)
         )
         return {'FINISHED'}
 
@@ -700,3962 +779,196 @@ class MAPLUS_OT_SendCoordToCursorBase(bpy.types.Operator):
         return {'FINISHED'}
 
 
-class MAPLUS_OT_GrabAllSlot1(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballslot1"
-    bl_label = "Grab Global Coordinates From Selected Vertices"
-    bl_description = (
-        "Grabs global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    multiply_by_world_matrix = True
-    target = 'SLOT1'
-
-
-class MAPLUS_OT_GrabAllSlot1Loc(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballslot1loc"
-    bl_label = "Grab Global Coordinates From Selected Vertices"
-    bl_description = (
-        "Grabs global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    multiply_by_world_matrix = False
-    target = 'SLOT1'
-
-
-class MAPLUS_OT_GrabAllSlot2(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballslot2"
-    bl_label = "Grab Global Coordinates From Selected Vertices"
-    bl_description = (
-        "Grabs global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    multiply_by_world_matrix = True
-    target = 'SLOT2'
-
-
-class MAPLUS_OT_GrabAllSlot2Loc(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballslot2loc"
-    bl_label = "Grab Global Coordinates From Selected Vertices"
-    bl_description = (
-        "Grabs global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    multiply_by_world_matrix = False
-    target = 'SLOT2'
-
-
-class MAPLUS_OT_GrabAllCalcResult(MAPLUS_OT_GrabAndSetItemKindBase):
-    bl_idname = "maplus.graballcalcresult"
-    bl_label = "Grab Global Coordinates From Selected Vertices"
-    bl_description = (
-        "Grabs global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    multiply_by_world_matrix = True
-    target = 'CALCRESULT'
-
-
-class MAPLUS_OT_GrabPointFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.grabpointfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'point'
-
-
-class MAPLUS_OT_Slot1GrabPointFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot1grabpointfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'point'
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot2GrabPointFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot2grabpointfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
+# Coordinate swapper, present on all geometry primitives
+# that have multiple points (line, plane)
+class MAPLUS_OT_SwapPointsBase(bpy.types.Operator):
+    bl_idname = "maplus.swappointsbase"
+    bl_label = "Swap Points Base"
+    bl_description = "Swap points base class"
     bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'point'
-    quick_op_target = "SLOT2"
+    targets = None
 
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        if hasattr(self, "quick_op_target"):
+            if self.quick_op_target == "DSSRC":
+                active_item = addon_data.quick_directional_slide_src
 
-class MAPLUS_OT_CalcResultGrabPointFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.calcresultgrabpointfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'point'
-    quick_op_target = "CALCRESULT"
+            elif self.quick_op_target == "SMESRC":
+                active_item = addon_data.quick_scale_match_edge_src
+            elif self.quick_op_target == "SMEDEST":
+                active_item = addon_data.quick_scale_match_edge_dest
 
+            elif self.quick_op_target == "ALNSRC":
+                active_item = addon_data.quick_align_lines_src
+            elif self.quick_op_target == "ALNDEST":
+                active_item = addon_data.quick_align_lines_dest
 
-class MAPLUS_OT_QuickAptSrcGrabPointFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaptsrcgrabpointfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'point'
-    quick_op_target = 'APTSRC'
+            elif self.quick_op_target == "AXRSRC":
+                active_item = addon_data.quick_axis_rotate_src
 
+            elif self.quick_op_target == "APLSRC":
+                active_item = addon_data.quick_align_planes_src
+            elif self.quick_op_target == "APLDEST":
+                active_item = addon_data.quick_align_planes_dest
+            elif self.quick_op_target == "APL_SET_ORIGIN_MODE_DEST":
+                active_item = addon_data.quick_align_planes_set_origin_mode_dest
 
-class MAPLUS_OT_QuickAptDestGrabPointFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaptdestgrabpointfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'point'
-    quick_op_target = 'APTDEST'
+            elif self.quick_op_target == "SLOT1":
+                active_item = addon_data.internal_storage_slot_1
+            elif self.quick_op_target == "SLOT2":
+                active_item = addon_data.internal_storage_slot_2
+            elif self.quick_op_target == "CALCRESULT":
+                active_item = addon_data.quick_calc_result_item
 
+        else:
+            active_item = prims[addon_data.active_list_item]
 
-class MAPLUS_OT_GrabPointFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
+        maplus_topology.unbind_item(active_item)
+        source = getattr(active_item, self.targets[0])
+        source = mathutils.Vector(
+            (source[0],
+             source[1],
+             source[2])
+        )
+        dest = getattr(active_item, self.targets[1])
+        dest = mathutils.Vector(
+            (dest[0],
+             dest[1],
+             dest[2])
         )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = False
-
 
-class MAPLUS_OT_GrabPointFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
+        setattr(
+            active_item,
+            self.targets[0],
+            dest
+        )
+        setattr(
+            active_item,
+            self.targets[1],
+            source
+        )
+        return {'FINISHED'}
 
 
-class MAPLUS_OT_GrabPointSlot1(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointslot1"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
+# Every x/y/z coordinate component has these functions on each of the
+# geometry primitives (lets users move in one direction easily, etc.)
+class MAPLUS_OT_SetOtherComponentsBase(bpy.types.Operator):
+    bl_idname = "maplus.setotherbase"
+    bl_label = ""
+    bl_description = ""
     bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
+    # A tuple containing the geometry attribute name (a string), the
+    # coord type in ['X', 'Y', 'Z'], and the value to set (currently
+    # 0 and 1 are the planned uses for this...to make building one
+    # dimensional moves etc. possible)
+    target_info = None
 
-class MAPLUS_OT_GrabPointSlot1Loc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointslot1loc"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = False
-    quick_op_target = "SLOT1"
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        active_item = prims[addon_data.active_list_item]
+        maplus_topology.unbind_item(active_item)
 
+        if self.target_info[1] == 'X':
+            setattr(
+                active_item,
+                self.target_info[0],
+                (getattr(active_item, self.target_info[0])[0],
+                 self.target_info[2],
+                 self.target_info[2]
+                 )
+            )
+        elif self.target_info[1] == 'Y':
+            setattr(
+                active_item,
+                self.target_info[0],
+                (self.target_info[2],
+                 getattr(active_item, self.target_info[0])[1],
+                 self.target_info[2]
+                 )
+            )
+        elif self.target_info[1] == 'Z':
+            setattr(
+                active_item,
+                self.target_info[0],
+                (self.target_info[2],
+                 self.target_info[2],
+                 getattr(active_item, self.target_info[0])[2]
+                 )
+            )
 
-class MAPLUS_OT_GrabPointCalcResult(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointcalcresult"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
+        return {'FINISHED'}
 
 
-class MAPLUS_OT_GrabPointCalcResultLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointcalcresultloc"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = False
-    quick_op_target = "CALCRESULT"
+def get_modified_global_coords(geometry, kind):
+    '''Get global coordinates for geometry items with modifiers applied.
 
+    Arguments:
+        geometry
+            a maplus primitive
+        kind
+            the type of the geometry item, in ('POINT', 'LINE', 'PLANE')
 
-class MAPLUS_OT_GrabPointSlot2(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointslot2"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
+    Items bound to mesh elements have their coords resolved here, see
+    maplus_topology.get_item_coords().
 
+    Returns:
+        Return a list of vectors, where len(list) is in [1, 3]. If
+        the kind isn't correct, return an empty list.
+    '''
+    global_modified = []
+    coords = maplus_topology.get_item_coords(geometry, kind)
+    if kind == 'POINT':
+        global_modified.append(mathutils.Vector(coords[0]))
 
-class MAPLUS_OT_GrabPointSlot2Loc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabpointslot2loc"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = False
-    quick_op_target = "SLOT2"
+        if geometry.pt_make_unit_vec:
+            global_modified[0].normalize()
+        if geometry.pt_flip_direction:
+            global_modified[0].negate()
+        global_modified[0] *= geometry.pt_multiplier
 
+    elif kind == 'LINE':
+        global_modified.append(mathutils.Vector(coords[0]))
+        global_modified.append(mathutils.Vector(coords[1]))
 
-class MAPLUS_OT_PointGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.pointgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
+        line = mathutils.Vector(
+            global_modified[1] -
+            global_modified[0]
+        )
+        if geometry.ln_make_unit_vec:
+            line.normalize()
+        if geometry.ln_flip_direction:
+            line.negate()
+        line *= geometry.ln_multiplier
+        global_modified[1] = (
+            global_modified[0] +
+            line
+        )
 
+    elif kind == 'PLANE':
+        global_modified.extend(mathutils.Vector(co) for co in coords)
+    else:
+        return list()
 
-class MAPLUS_OT_LineStartGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.linestartgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
+    return global_modified
 
 
-class MAPLUS_OT_LineEndGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.lineendgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
+class MAPLUS_OT_ApplyGeomModifiers(bpy.types.Operator):
+    bl_idname = "maplus.applygeommodifiers"
+    bl_label = "Apply Modifiers"
+    bl_description = "Applies modifiers on the current geometry item."
     bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
 
-
-class MAPLUS_OT_PlaneAGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.planeagrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_PlaneBGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.planebgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_PlaneCGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.planecgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_Slot1PointGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot1pointgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot2PointGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot2pointgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_CalcResultPointGrabAvg(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.calcresultpointgrabavg"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_QuickAptGrabAvgSrc(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaptgrabavgsrc"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APTSRC"
-
-
-class MAPLUS_OT_QuickAptGrabAvgDest(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaptgrabavgdest"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APTDEST"
-
-
-class MAPLUS_OT_QuickAlignPointsGrabSrc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignpointsgrabsrc"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APTSRC"
-
-
-class MAPLUS_OT_QuickAlignPointsGrabDest(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignpointsgrabdest"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APTDEST"
-
-
-class MAPLUS_OT_QuickAlignPointsGrabSrcLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignpointsgrabsrcloc"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = False
-    quick_op_target = "APTSRC"
-
-
-class MAPLUS_OT_QuickAlignPointsGrabDestLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignpointsgrabdestloc"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('point',)
-    multiply_by_world_matrix = False
-    quick_op_target = "APTDEST"
-
-
-class MAPLUS_OT_SendPointToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.sendpointtocursor"
-    bl_label = "Sends Point to Cursor"
-    bl_description = "Sends Point Coordinates to the 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'point'
-
-
-class MAPLUS_OT_Slot1SendPointToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot1sendpointtocursor"
-    bl_label = "Sends Point to Cursor"
-    bl_description = "Sends Point Coordinates to the 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'point'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2SendPointToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot2sendpointtocursor"
-    bl_label = "Sends Point to Cursor"
-    bl_description = "Sends Point Coordinates to the 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'point'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultSendPointToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.calcresultsendpointtocursor"
-    bl_label = "Sends Point to Cursor"
-    bl_description = "Sends Point Coordinates to the 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'point'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAptSrcSendPointToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaptsrcsendpointtocursor"
-    bl_label = "Sends Point to Cursor"
-    bl_description = "Sends Point Coordinates to the 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'point'
-    quick_op_target = 'APTSRC'
-
-
-class MAPLUS_OT_QuickAptDestSendPointToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaptdestsendpointtocursor"
-    bl_label = "Sends Point to Cursor"
-    bl_description = "Sends Point Coordinates to the 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'point'
-    quick_op_target = 'APTDEST'
-
-
-class MAPLUS_OT_GrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.grablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-
-
-class MAPLUS_OT_Slot1GrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot1grablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot1grablineendfromcursor"
-    bl_label = "Grab Line End From Cursor"
-    bl_description = "Grabs line end coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2GrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot2grablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot2grablineendfromcursor"
-    bl_label = "Grab Line End From Cursor"
-    bl_description = "Grabs line end coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.calcresultgrablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.calcresultgrablineendfromcursor"
-    bl_label = "Grab Line End From Cursor"
-    bl_description = "Grabs line end coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAlnSrcGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickalnsrcgrablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickalndestgrablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaxrsrcgrablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickdssrcgrablinestartfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsDestGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickdsdestgrablinestartfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickSmeSrcGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quicksmesrcgrablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestGrabLineStartFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quicksmedestgrablinestartfromcursor"
-    bl_label = "Grab Line Start From Cursor"
-    bl_description = "Grabs line start coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_start'
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_GrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_Slot1GrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2GrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_Slot1GrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2GrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_Slot1GrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2GrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_Slot1GrabAvgLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot1grabavglinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot2GrabAvgLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot2grabavglinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_CalcResultGrabAvgLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.calcresultgrabavglinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_Slot1GrabAvgLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot1grabavglineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot2GrabAvgLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot2grabavglineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_CalcResultGrabAvgLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.calcresultgrabavglineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_QuickAlnGrabAvgSrcLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickalngrabavgsrclinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNSRC"
-
-
-class MAPLUS_OT_QuickAlnGrabAvgDestLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickalngrabavgdestlinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNDEST"
-
-
-class MAPLUS_OT_QuickAlnGrabAvgSrcLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickalngrabavgsrclineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNSRC"
-
-
-class MAPLUS_OT_QuickAlnGrabAvgDestLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickalngrabavgdestlineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNDEST"
-
-
-class MAPLUS_OT_QuickAxrGrabAvgSrcLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaxrgrabavgsrclinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "AXRSRC"
-
-
-class MAPLUS_OT_QuickAxrGrabAvgSrcLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaxrgrabavgsrclineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "AXRSRC"
-
-
-class MAPLUS_OT_QuickDsGrabAvgSrcLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickdsgrabavgsrclinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "DSSRC"
-
-
-class MAPLUS_OT_QuickDsGrabAvgSrcLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickdsgrabavgsrclineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "DSSRC"
-
-
-class MAPLUS_OT_QuickSmeGrabAvgSrcLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quicksmegrabavgsrclinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SMESRC"
-
-
-class MAPLUS_OT_QuickSmeGrabAvgDestLineStart(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quicksmegrabavgdestlinestart"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SMEDEST"
-
-
-class MAPLUS_OT_QuickSmeGrabAvgSrcLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quicksmegrabavgsrclineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SMESRC"
-
-
-class MAPLUS_OT_QuickSmeGrabAvgDestLineEnd(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quicksmegrabavgdestlineend"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SMEDEST"
-
-
-class MAPLUS_OT_QuickAlnSrcGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalnsrcgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnSrcGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalnsrcgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalndestgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAlnDestGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalndestgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaxrsrcgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickAxrSrcGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaxrsrcgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdssrcgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsSrcGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdssrcgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsDestGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdsdestgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickDsDestGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdsdestgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickSmeSrcGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmesrcgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeSrcGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmesrcgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestGrabLineStartFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmedestgrablinestartfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_QuickSmeDestGrabLineStartFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmedestgrablinestartfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line Start From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line start from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_SendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.sendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-
-
-class MAPLUS_OT_Slot1SendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot1sendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1SendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot1sendlineendtocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2SendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot2sendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2SendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot2sendlineendtocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.calcresultsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.calcresultsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAlnSrcSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickalnsrcsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickalndestsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaxrsrcsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickdssrcsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsDestSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickdsdestsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickSmeSrcSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quicksmesrcsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestSendLineStartToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quicksmedestsendlinestarttocursor"
-    bl_label = "Sends Line Start to Cursor"
-    bl_description = "Sends Line Start Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_start'
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_GrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.grablineendfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-
-
-class MAPLUS_OT_QuickAlnSrcGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickalnsrcgrablineendfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickalndestgrablineendfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaxrsrcgrablineendfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickdssrcgrablineendfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsDestGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickdsdestgrablineendfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickSmeSrcGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quicksmesrcgrablineendfromcursor"
-    bl_label = "Grab Line End From Cursor"
-    bl_description = "Grabs line end coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestGrabLineEndFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quicksmedestgrablineendfromcursor"
-    bl_label = "Grab Line End From Cursor"
-    bl_description = "Grabs line end coordinates from the 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'line_end'
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_GrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablineendfromactivelocal"
-    bl_label = "Grab From Active Point"
-    bl_description = "Grabs coordinates from selected vertex in edit mode"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_QuickAlnSrcGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalnsrcgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnSrcGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalnsrcgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalndestgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAlnDestGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalndestgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaxrsrcgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickAxrSrcGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaxrsrcgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdssrcgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsSrcGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdssrcgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsDestGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdsdestgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickDsDestGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdsdestgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickSmeSrcGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmesrcgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeSrcGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmesrcgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestGrabLineEndFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmedestgrablineendfromactivelocal"
-    bl_label = "Grab Local Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs local coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_QuickSmeDestGrabLineEndFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quicksmedestgrablineendfromactiveglobal"
-    bl_label = "Grab Global Coordinate for Line End From Active Point"
-    bl_description = (
-        "Grabs global coordinates for line end from selected vertex"
-        "in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_end',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_SendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.sendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-
-
-class MAPLUS_OT_QuickAlnSrcSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickalnsrcsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickalndestsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaxrsrcsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickdssrcsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickDsDestSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickdsdestsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'DSDEST'
-
-
-class MAPLUS_OT_QuickSmeSrcSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quicksmesrcsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestSendLineEndToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quicksmedestsendlineendtocursor"
-    bl_label = "Sends Line End to Cursor"
-    bl_description = "Sends Line End Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'line_end'
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_GrabAllVertsLineLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.graballvertslinelocal"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabAllVertsLineGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.graballvertslineglobal"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_GrabLineSlot1(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablineslot1"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_GrabLineSlot1Loc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablineslot1loc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_GrabLineSlot2(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablineslot2"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_GrabLineSlot2Loc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablineslot2loc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_GrabLineCalcResult(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablinecalcresult"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_GrabLineCalcResultLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grablinecalcresultloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-        )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_GrabNormal(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.grabnormal"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_Slot1GrabNormal(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.slot1grabnormal"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot2GrabNormal(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.slot2grabnormal"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_CalcResultGrabNormal(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.calcresultgrabnormal"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_QuickAlnGrabNormalSrc(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.quickalngrabnormalsrc"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNSRC"
-
-
-class MAPLUS_OT_QuickAlnGrabNormalDest(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.quickalngrabnormaldest"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNDEST"
-
-
-class MAPLUS_OT_QuickAxrGrabNormalSrc(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.quickaxrgrabnormalsrc"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "AXRSRC"
-
-
-class MAPLUS_OT_QuickDsGrabNormalSrc(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.quickdsgrabnormalsrc"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "DSSRC"
-
-
-class MAPLUS_OT_QuickSmeGrabNormalSrc(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.quicksmegrabnormalsrc"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SMESRC"
-
-
-class MAPLUS_OT_QuickSmeGrabNormalDest(MAPLUS_OT_GrabNormalBase):
-    bl_idname = "maplus.quicksmegrabnormaldest"
-    bl_label = "Grab Normal Coords from Selected Face"
-    bl_description = (
-        "Grabs normal coordinates from selected face in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SMEDEST"
-
-
-class MAPLUS_OT_QuickAlignLinesGrabSrc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignlinesgrabsrc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNSRC"
-
-
-class MAPLUS_OT_QuickAlignLinesGrabSrcLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignlinesgrabsrcloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "ALNSRC"
-
-
-class MAPLUS_OT_QuickAlignLinesGrabDest(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignlinesgrabdest"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "ALNDEST"
-
-
-class MAPLUS_OT_QuickAlignLinesGrabDestLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignlinesgrabdestloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "ALNDEST"
-
-
-class MAPLUS_OT_QuickScaleMatchEdgeGrabSrc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickscalematchedgegrabsrc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SMESRC"
-
-
-class MAPLUS_OT_QuickScaleMatchEdgeGrabSrcLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickscalematchedgegrabsrcloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "SMESRC"
-
-
-class MAPLUS_OT_QuickScaleMatchEdgeGrabDest(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickscalematchedgegrabdest"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "SMEDEST"
-
-
-class MAPLUS_OT_QuickScaleMatchEdgeGrabDestLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickscalematchedgegrabdestloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "SMEDEST"
-
-
-class MAPLUS_OT_QuickAxisRotateGrabSrc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaxisrotategrabsrc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "AXRSRC"
-
-
-class MAPLUS_OT_QuickAxisRotateGrabSrcLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaxisrotategrabsrcloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "AXRSRC"
-
-
-class MAPLUS_OT_QuickDirectionalSlideGrabSrc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdirectionalslidegrabsrc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = True
-    quick_op_target = "DSSRC"
-
-
-class MAPLUS_OT_QuickDirectionalSlideGrabSrcLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickdirectionalslidegrabsrcloc"
-    bl_label = "Grab Line from Selected Verts"
-    bl_description = (
-        "Grabs line coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('line_start', 'line_end')
-    multiply_by_world_matrix = False
-    quick_op_target = "DSSRC"
-
-
-class MAPLUS_OT_GrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.grabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-
-
-class MAPLUS_OT_Slot1GrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot1grabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot1grabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot1grabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2GrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot2grabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot2grabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.slot2grabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.calcresultgrabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.calcresultgrabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.calcresultgrabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaplsrcgrabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickapldestgrabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneAFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplaneafromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_a'
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_GrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_Slot1GrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1GrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot1grabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2GrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2GrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.slot2grabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultGrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.calcresultgrabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_Slot1GrabAvgPlaneA(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot1grabavgplanea"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot1GrabAvgPlaneB(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot1grabavgplaneb"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot1GrabAvgPlaneC(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot1grabavgplanec"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_Slot2GrabAvgPlaneA(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot2grabavgplanea"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_Slot2GrabAvgPlaneB(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot2grabavgplaneb"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_Slot2GrabAvgPlaneC(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.slot2grabavgplanec"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_CalcResultGrabAvgPlaneA(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.calcresultgrabavgplanea"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_CalcResultGrabAvgPlaneB(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.calcresultgrabavgplaneb"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_CalcResultGrabAvgPlaneC(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.calcresultgrabavgplanec"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_QuickAplGrabAvgSrcPlaneA(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgsrcplanea"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APLSRC"
-
-
-class MAPLUS_OT_QuickAplGrabAvgDestPlaneA(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgdestplanea"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APLDEST"
-
-
-class MAPLUS_OT_QuickAplSetOriginModeGrabAvgDestPlaneA(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplsetoriginmodegrabavgdestplanea"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APL_SET_ORIGIN_MODE_DEST"
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsrcgrabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsrcgrabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickapldestgrabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneAFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplaneafromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickapldestgrabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneAFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplaneafromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_SendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.sendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-
-
-class MAPLUS_OT_Slot1SendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot1sendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1SendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot1sendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1SendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot1sendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2SendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot2sendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2SendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot2sendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2SendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.slot2sendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultSendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.calcresultsendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultSendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.calcresultsendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultSendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.calcresultsendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAplSrcSendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaplsrcsendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestSendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickapldestsendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestSendPlaneAToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestsendplaneatocursor"
-    bl_label = "Sends Plane Point A to Cursor"
-    bl_description = "Sends Plane Point A Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_a'
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_GrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.grabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaplsrcgrabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickapldestgrabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneBFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplanebfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_b'
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_GrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_QuickAplGrabAvgSrcPlaneB(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgsrcplaneb"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APLSRC"
-
-
-class MAPLUS_OT_QuickAplGrabAvgDestPlaneB(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgdestplaneb"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APLDEST"
-
-
-class MAPLUS_OT_QuickAplGrabAvgSetOriginModeDestPlaneB(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgsetoriginmodedestplaneb"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APL_SET_ORIGIN_MODE_DEST"
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsrcgrabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsrcgrabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickapldestgrabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneBFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplanebfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickapldestgrabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneBFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplanebfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_b',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_SendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.sendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-
-
-class MAPLUS_OT_QuickAplSrcSendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaplsrcsendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestSendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickapldestsendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestSendPlaneBToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestsendplanebtocursor"
-    bl_label = "Sends Plane Point B to Cursor"
-    bl_description = "Sends Plane Point B Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_b'
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_GrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.grabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaplsrcgrabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickapldestgrabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneCFromCursor(MAPLUS_OT_GrabFromCursorBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplanecfromcursor"
-    bl_label = "Grab From Cursor"
-    bl_description = "Grabs coordinates from 3D cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attrib_to_set = 'plane_pt_c'
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_GrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_QuickAplGrabAvgSrcPlaneC(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgsrcplanec"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APLSRC"
-
-
-class MAPLUS_OT_QuickAplGrabAvgDestPlaneC(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplgrabavgdestplanec"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APLDEST"
-
-
-class MAPLUS_OT_QuickAplSetOriginModeGrabAvgDestPlaneC(MAPLUS_OT_GrabAverageLocationBase):
-    bl_idname = "maplus.quickaplsetoriginmodegrabavgdestplanec"
-    bl_label = "Grab Average Global Coordinates From Selected Points"
-    bl_description = (
-        "Grabs average global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = "APL_SET_ORIGIN_MODE_DEST"
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsrcgrabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplSrcGrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsrcgrabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickapldestgrabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneCFromActiveLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplanecfromactivelocal"
-    bl_label = "Grab Local Coordinates From Active Point"
-    bl_description = (
-        "Grabs local coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = False
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_QuickAplDestGrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickapldestgrabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestGrabPlaneCFromActiveGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestgrabplanecfromactiveglobal"
-    bl_label = "Grab Global Coordinates From Active Point"
-    bl_description = (
-        "Grabs global coordinates from selected vertex in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_c',)
-    multiply_by_world_matrix = True
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_SendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.sendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-
-
-class MAPLUS_OT_QuickAplSrcSendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaplsrcsendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestSendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickapldestsendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestSendPlaneCToCursor(MAPLUS_OT_SendCoordToCursorBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestsendplanectocursor"
-    bl_label = "Sends Plane Point C to Cursor"
-    bl_description = "Sends Plane Point C Coordinates to 3D Cursor"
-    bl_options = {'REGISTER', 'UNDO'}
-    source_coord_attrib = 'plane_pt_c'
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_GrabAllVertsPlaneLocal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.graballvertsplanelocal"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-
-
-class MAPLUS_OT_GrabAllVertsPlaneGlobal(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.graballvertsplaneglobal"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-
-
-class MAPLUS_OT_GrabPlaneSlot1Loc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplaneslot1loc"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_GrabPlaneSlot1(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplaneslot1"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT1"
-
-
-class MAPLUS_OT_GrabPlaneSlot2Loc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplaneslot2loc"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_GrabPlaneSlot2(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplaneslot2"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-    quick_op_target = "SLOT2"
-
-
-class MAPLUS_OT_GrabPlaneCalcResultLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplanecalcresultloc"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_GrabPlaneCalcResult(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.grabplanecalcresult"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-    quick_op_target = "CALCRESULT"
-
-
-class MAPLUS_OT_QuickAlignPlanesGrabSrc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignplanesgrabsrc"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-    quick_op_target = "APLSRC"
-
-
-class MAPLUS_OT_QuickAlignPlanesGrabDest(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignplanesgrabdest"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-    quick_op_target = "APLDEST"
-
-
-class MAPLUS_OT_QuickAlignPlanesSetOriginModeGrabDest(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignplanessetoriginmodegrabdest"
-    bl_label = "Grab Plane Global Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane global coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = True
-    quick_op_target = "APL_SET_ORIGIN_MODE_DEST"
-
-
-class MAPLUS_OT_QuickAlignPlanesGrabSrcLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignplanesgrabsrcloc"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-    quick_op_target = "APLSRC"
-
-
-class MAPLUS_OT_QuickAlignPlanesGrabDestLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignplanesgrabdestloc"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-    quick_op_target = "APLDEST"
-
-
-class MAPLUS_OT_QuickAlignPlanesSetOriginModeGrabDestLoc(MAPLUS_OT_GrabFromGeometryBase):
-    bl_idname = "maplus.quickalignplanessetoriginmodegrabdestloc"
-    bl_label = "Grab Plane Local Coordinates from Selected Verts"
-    bl_description = (
-        "Grabs plane local coordinates from selected vertices in edit mode"
-    )
-    bl_options = {'REGISTER', 'UNDO'}
-    vert_attribs_to_set = ('plane_pt_a', 'plane_pt_b', 'plane_pt_c')
-    multiply_by_world_matrix = False
-    quick_op_target = "APL_SET_ORIGIN_MODE_DEST"
-
-
-# Coordinate swapper, present on all geometry primitives
-# that have multiple points (line, plane)
-class MAPLUS_OT_SwapPointsBase(bpy.types.Operator):
-    bl_idname = "maplus.swappointsbase"
-    bl_label = "Swap Points Base"
-    bl_description = "Swap points base class"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = None
-
-    def execute(self, context):
-        addon_data = bpy.context.scene.maplus_data
-        prims = addon_data.prim_list
-        if hasattr(self, "quick_op_target"):
-            if self.quick_op_target == "DSSRC":
-                active_item = addon_data.quick_directional_slide_src
-
-            elif self.quick_op_target == "SMESRC":
-                active_item = addon_data.quick_scale_match_edge_src
-            elif self.quick_op_target == "SMEDEST":
-                active_item = addon_data.quick_scale_match_edge_dest
-
-            elif self.quick_op_target == "ALNSRC":
-                active_item = addon_data.quick_align_lines_src
-            elif self.quick_op_target == "ALNDEST":
-                active_item = addon_data.quick_align_lines_dest
-
-            elif self.quick_op_target == "AXRSRC":
-                active_item = addon_data.quick_axis_rotate_src
-
-            elif self.quick_op_target == "APLSRC":
-                active_item = addon_data.quick_align_planes_src
-            elif self.quick_op_target == "APLDEST":
-                active_item = addon_data.quick_align_planes_dest
-            elif self.quick_op_target == "APL_SET_ORIGIN_MODE_DEST":
-                active_item = addon_data.quick_align_planes_set_origin_mode_dest
-
-            elif self.quick_op_target == "SLOT1":
-                active_item = addon_data.internal_storage_slot_1
-            elif self.quick_op_target == "SLOT2":
-                active_item = addon_data.internal_storage_slot_2
-            elif self.quick_op_target == "CALCRESULT":
-                active_item = addon_data.quick_calc_result_item
-
-        else:
-            active_item = prims[addon_data.active_list_item]
-
-        source = getattr(active_item, self.targets[0])
-        source = mathutils.Vector(
-            (source[0],
-             source[1],
-             source[2])
-        )
-        dest = getattr(active_item, self.targets[1])
-        dest = mathutils.Vector(
-            (dest[0],
-             dest[1],
-             dest[2])
-        )
-
-        setattr(
-            active_item,
-            self.targets[0],
-            dest
-        )
-        setattr(
-            active_item,
-            self.targets[1],
-            source
-        )
-        return {'FINISHED'}
-
-
-class MAPLUS_OT_SwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.swaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-
-
-class MAPLUS_OT_Slot1SwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot1swaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2SwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot2swaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.calcresultswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAlnSrcSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickalnsrcswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_QuickAlnDestSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickalndestswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_QuickAxrSrcSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaxrsrcswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_QuickDsSrcSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickdssrcswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_QuickSmeSrcSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quicksmesrcswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_QuickSmeDestSwapLinePoints(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quicksmedestswaplinepoints"
-    bl_label = "Swap Line Points"
-    bl_description = "Swap line points"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('line_start', 'line_end')
-    quick_op_target = 'SMEDEST'
-
-
-class MAPLUS_OT_SwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.swapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-
-
-class MAPLUS_OT_SwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.swapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-
-
-class MAPLUS_OT_SwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.swapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-
-
-class MAPLUS_OT_Slot1SwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot1swapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1SwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot1swapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot1SwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot1swapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_Slot2SwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot2swapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2SwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot2swapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_Slot2SwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.slot2swapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_CalcResultSwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.calcresultswapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultSwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.calcresultswapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_CalcResultSwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.calcresultswapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_QuickAplSrcSwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaplsrcswapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplSrcSwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaplsrcswapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplSrcSwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaplsrcswapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_QuickAplDestSwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickapldestswapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestSwapPlaneAPlaneB(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestswapplaneaplaneb"
-    bl_label = "Swap Plane Point A with Plane Point B"
-    bl_description = "Swap plane points A and B"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_b')
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_QuickAplDestSwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickapldestswapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestSwapPlaneAPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestswapplaneaplanec"
-    bl_label = "Swap Plane Point A with Plane Point C"
-    bl_description = "Swap plane points A and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_a', 'plane_pt_c')
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_QuickAplDestSwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickapldestswapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_QuickAplSetOriginModeDestSwapPlaneBPlaneC(MAPLUS_OT_SwapPointsBase):
-    bl_idname = "maplus.quickaplsetoriginmodedestswapplanebplanec"
-    bl_label = "Swap Plane Point B with Plane Point C"
-    bl_description = "Swap plane points B and C"
-    bl_options = {'REGISTER', 'UNDO'}
-    targets = ('plane_pt_b', 'plane_pt_c')
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-# Every x/y/z coordinate component has these functions on each of the
-# geometry primitives (lets users move in one direction easily, etc.)
-class MAPLUS_OT_SetOtherComponentsBase(bpy.types.Operator):
-    bl_idname = "maplus.setotherbase"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple containing the geometry attribute name (a string), the
-    # coord type in ['X', 'Y', 'Z'], and the value to set (currently
-    # 0 and 1 are the planned uses for this...to make building one
-    # dimensional moves etc. possible)
-    target_info = None
-
-    def execute(self, context):
-        addon_data = bpy.context.scene.maplus_data
-        prims = addon_data.prim_list
-        active_item = prims[addon_data.active_list_item]
-
-        if self.target_info[1] == 'X':
-            setattr(
-                active_item,
-                self.target_info[0],
-                (getattr(active_item, self.target_info[0])[0],
-                 self.target_info[2],
-                 self.target_info[2]
-                 )
-            )
-        elif self.target_info[1] == 'Y':
-            setattr(
-                active_item,
-                self.target_info[0],
-                (self.target_info[2],
-                 getattr(active_item, self.target_info[0])[1],
-                 self.target_info[2]
-                 )
-            )
-        elif self.target_info[1] == 'Z':
-            setattr(
-                active_item,
-                self.target_info[0],
-                (self.target_info[2],
-                 self.target_info[2],
-                 getattr(active_item, self.target_info[0])[2]
-                 )
-            )
-
-        return {'FINISHED'}
-
-
-class MAPLUS_OT_ZeroOtherPointX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherpointx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('point', 'X', 0)
-
-
-class MAPLUS_OT_ZeroOtherPointY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherpointy"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('point', 'Y', 0)
-
-
-class MAPLUS_OT_ZeroOtherPointZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherpointz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('point', 'Z', 0)
-
-
-class MAPLUS_OT_ZeroOtherLineStartX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherlinestartx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_start', 'X', 0)
-
-
-class MAPLUS_OT_ZeroOtherLineStartY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherlinestarty"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_start', 'Y', 0)
-
-
-class MAPLUS_OT_ZeroOtherLineStartZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherlinestartz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_start', 'Z', 0)
-
-
-class MAPLUS_OT_ZeroOtherLineEndX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherlineendx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_end', 'X', 0)
-
-
-class MAPLUS_OT_ZeroOtherLineEndY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherlineendy"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_end', 'Y', 0)
-
-
-class MAPLUS_OT_ZeroOtherLineEndZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherlineendz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_end', 'Z', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointAX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointax"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_a', 'X', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointAY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointay"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_a', 'Y', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointAZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointaz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_a', 'Z', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointBX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointbx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_b', 'X', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointBY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointby"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_b', 'Y', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointBZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointbz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_b', 'Z', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointCX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointcx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_c', 'X', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointCY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointcy"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_c', 'Y', 0)
-
-
-class MAPLUS_OT_ZeroOtherPlanePointCZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.zerootherplanepointcz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_c', 'Z', 0)
-
-
-class MAPLUS_OT_OneOtherPointX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherpointx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('point', 'X', 1)
-
-
-class MAPLUS_OT_OneOtherPointY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherpointy"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('point', 'Y', 1)
-
-
-class MAPLUS_OT_OneOtherPointZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherpointz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('point', 'Z', 1)
-
-
-class MAPLUS_OT_OneOtherLineStartX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherlinestartx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_start', 'X', 1)
-
-
-class MAPLUS_OT_OneOtherLineStartY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherlinestarty"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_start', 'Y', 1)
-
-
-class MAPLUS_OT_OneOtherLineStartZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherlinestartz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_start', 'Z', 1)
-
-
-class MAPLUS_OT_OneOtherLineEndX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherlineendx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_end', 'X', 1)
-
-
-class MAPLUS_OT_OneOtherLineEndY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherlineendy"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_end', 'Y', 1)
-
-
-class MAPLUS_OT_OneOtherLineEndZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherlineendz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('line_end', 'Z', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointAX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointax"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_a', 'X', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointAY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointay"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_a', 'Y', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointAZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointaz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_a', 'Z', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointBX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointbx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_b', 'X', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointBY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointby"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_b', 'Y', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointBZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointbz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_b', 'Z', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointCX(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointcx"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_c', 'X', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointCY(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointcy"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_c', 'Y', 1)
-
-
-class MAPLUS_OT_OneOtherPlanePointCZ(MAPLUS_OT_SetOtherComponentsBase):
-    bl_idname = "maplus.oneotherplanepointcz"
-    bl_label = ""
-    bl_description = ""
-    bl_options = {'REGISTER', 'UNDO'}
-    target_info = ('plane_pt_c', 'Z', 1)
-
-
-def get_modified_global_coords(geometry, kind):
-    '''Get global coordinates for geometry items with modifiers applied.
-
-    Arguments:
-        geometry
-            a maplus primitive
-        kind
-            the type of the geometry item, in ('POINT', 'LINE', 'PLANE')
-
-    Returns:
-        Return a list of vectors, where len(list) is in [1, 3]. If
-        the kind isn't correct, return an empty list.
-    '''
-    global_modified = []
-    if kind == 'POINT':
-        global_modified.append(mathutils.Vector(geometry.point))
-
-        if geometry.pt_make_unit_vec:
-            global_modified[0].normalize()
-        if geometry.pt_flip_direction:
-            global_modified[0].negate()
-        global_modified[0] *= geometry.pt_multiplier
-
-    elif kind == 'LINE':
-        global_modified.append(mathutils.Vector(geometry.line_start))
-        global_modified.append(mathutils.Vector(geometry.line_end))
-
-        line = mathutils.Vector(
-            global_modified[1] -
-            global_modified[0]
-        )
-        if geometry.ln_make_unit_vec:
-            line.normalize()
-        if geometry.ln_flip_direction:
-            line.negate()
-        line *= geometry.ln_multiplier
-        global_modified[1] = (
-            global_modified[0] +
-            line
-        )
-
-    elif kind == 'PLANE':
-        global_modified.append(mathutils.Vector(geometry.plane_pt_a))
-        global_modified.append(mathutils.Vector(geometry.plane_pt_b))
-        global_modified.append(mathutils.Vector(geometry.plane_pt_c))
-    else:
-        return list()
-
-    return global_modified
-
-
-class MAPLUS_OT_ApplyGeomModifiers(bpy.types.Operator):
-    bl_idname = "maplus.applygeommodifiers"
-    bl_label = "Apply Modifiers"
-    bl_description = "Applies modifiers on the current geometry item."
-    bl_options = {'REGISTER', 'UNDO'}
-
-    def execute(self, context):
-        addon_data = bpy.context.scene.maplus_data
-        prims = addon_data.prim_list
-        previous_mode = get_active_object().mode
-        active_item = prims[addon_data.active_list_item]
+    def execute(self, context):
+        addon_data = bpy.context.scene.maplus_data
+        prims = addon_data.prim_list
+        previous_mode = get_active_object().mode
+        active_item = prims[addon_data.active_list_item]
+        # Bake the modifiers into the coords the item resolves to, and
+        # keep them (a bound item would resolve from the mesh again)
+        maplus_topology.unbind_item(active_item)
 
         if active_item.kind == 'POINT':
             if active_item.pt_make_unit_vec:
@@ -4730,6 +1043,241 @@ class MAPLUS_OT_ApplyGeomModifiers(bpy.types.Operator):
         return {'FINISHED'}
 
 
+# Bulk mesh data access (foreach_get/foreach_set into numpy arrays), for
+# tools that work on every vert/edge of a mesh without bmesh or per
+# element Python objects
+def transform_coords(coords, matrix):
+    '''Apply a 4x4 matrix (mathutils or array-like) to (n, 3) coords.'''
+    np_matrix = numpy.array(matrix, dtype=numpy.float64)
+    return coords @ np_matrix[:3, :3].T + np_matrix[:3, 3]
+
+
+def get_vert_coords(mesh, matrix=None):
+    '''Return the vert coords of a mesh as an (n, 3) float64 array.
+
+    The coords are local, or transformed by matrix (4x4) if one is given
+    (pass the object's matrix_world for global coords).
+    '''
+    vert_count = len(mesh.vertices)
+    coords = numpy.empty(vert_count * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape(vert_count, 3).astype(numpy.float64)
+    if matrix is not None:
+        coords = transform_coords(coords, matrix)
+    return coords
+
+
+def set_vert_coords(mesh, coords):
+    # Write (n, 3) local coords back to a mesh (object mode data)
+    mesh.vertices.foreach_set(
+        'co',
+        numpy.asarray(coords, dtype=numpy.float32).ravel()
+    )
+    mesh.update()
+
+
+def transform_mesh_coords(mesh, matrix, weights=None, blend=False):
+    '''Transform the vert coords of a mesh (object mode data) in one pass.
+
+    Arguments:
+        mesh
+            the mesh data to transform
+        matrix
+            a 4x4 matrix, in the mesh's local space
+        weights
+            optional (n,) array of per vert weights, only verts with a
+            weight above 0 are moved (see get_vertex_group_weights())
+        blend
+            with weights, move each vert by its weight, from where it is
+            (weight 0) to its fully transformed location (weight 1)
+    '''
+    coords = get_vert_coords(mesh)
+    if weights is not None:
+        moved = weights > 0
+    else:
+        moved = numpy.ones(len(coords), dtype=bool)
+    new_coords = transform_coords(coords[moved], matrix)
+    if weights is not None and blend:
+        new_coords = (
+            coords[moved] +
+            (new_coords - coords[moved]) * weights[moved, numpy.newaxis]
+        )
+    coords[moved] = new_coords
+    set_vert_coords(mesh, coords)
+
+
+def move_reference_key(mesh, transform):
+    '''Move the reference shape key of a mesh along with its verts.
+
+    A mesh with shape keys is shown (and loaded into edit mode) from its
+    key blocks, so vert coords written without the reference key are
+    lost. The reference key is moved by transform and every other key
+    gets the same offsets, so each key keeps its offsets from the key it
+    is relative to.
+
+    Arguments:
+        mesh
+            the mesh data (object mode), must have shape keys
+        transform
+            a function taking the (n, 3) local coords of the reference
+            key and returning their new coords
+    '''
+    coords = get_mesh_attribute(
+        mesh.shape_keys.reference_key.data,
+        'co',
+        numpy.float32,
+        3
+    ).astype(numpy.float64)
+    offsets = transform(coords) - coords
+    for key_block in mesh.shape_keys.key_blocks:
+        key_coords = get_mesh_attribute(
+            key_block.data,
+            'co',
+            numpy.float32,
+            3
+        ).astype(numpy.float64)
+        key_block.data.foreach_set(
+            'co',
+            (key_coords + offsets).astype(numpy.float32).ravel()
+        )
+    mesh.update()
+
+
+def get_vertex_group_weights(bm, group_index):
+    '''Return the weights of one vertex group as an (n,) float64 array.
+
+    Verts outside the group weigh 0. Deform weights have no foreach_get
+    access, so they are read in a single pass over the bmesh deform layer
+    (bm must be loaded from the same mesh, so vert indices match).
+    '''
+    weights = numpy.zeros(len(bm.verts), dtype=numpy.float64)
+    deform_layer = bm.verts.layers.deform.active
+    if deform_layer is None or group_index < 0:
+        return weights
+    weights[:] = numpy.fromiter(
+        (vert[deform_layer].get(group_index, 0.0) for vert in bm.verts),
+        dtype=numpy.float64,
+        count=len(bm.verts)
+    )
+    return weights
+
+
+def get_mesh_attribute(collection, attribute, dtype, width=1):
+    # Read one attribute of every element of a mesh collection (vertices,
+    # edges, loops, polygons) into a numpy array
+    values = numpy.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attribute, values)
+    return values.reshape(-1, width) if width > 1 else values
+
+
+def get_vert_islands(vert_count, edge_verts):
+    '''Label the connected islands of a mesh (vectorized union-find).
+
+    Every vert is hooked onto the smallest label among its edge
+    neighbors, then the label chains are shortened by pointer jumping,
+    until nothing changes (a handful of whole array passes, no per vert
+    Python loop).
+
+    Arguments:
+        vert_count
+            number of verts in the mesh
+        edge_verts
+            (n, 2) int array of edge vert indices
+
+    Returns:
+        Return a tuple (labels, island_count), labels is an int64 array
+        with the island (0 to island_count - 1) of every vert.
+    '''
+    labels = numpy.arange(vert_count, dtype=numpy.int64)
+    vert_a = edge_verts[:, 0]
+    vert_b = edge_verts[:, 1]
+    while True:
+        edge_labels = numpy.minimum(labels[vert_a], labels[vert_b])
+        hooked = labels.copy()
+        numpy.minimum.at(hooked, vert_a, edge_labels)
+        numpy.minimum.at(hooked, vert_b, edge_labels)
+        # Hook the roots too, so whole trees merge in one pass
+        numpy.minimum.at(hooked, labels, hooked)
+        while True:
+            jumped = hooked[hooked]
+            if numpy.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if numpy.array_equal(hooked, labels):
+            break
+        labels = hooked
+    roots, labels = numpy.unique(labels, return_inverse=True)
+    return labels.astype(numpy.int64), len(roots)
+
+
+def get_rotations_between(vectors_a, vectors_b):
+    '''Build the shortest arc rotations from vectors_a to vectors_b.
+
+    Arguments:
+        vectors_a, vectors_b
+            (n, 3) arrays of unit vectors
+
+    Returns:
+        Return an (n, 3, 3) array of rotation matrices (identity for
+        parallel vectors, a half turn for opposite ones).
+    '''
+    axes = numpy.cross(vectors_a, vectors_b)
+    sines = numpy.linalg.norm(axes, axis=1)
+    cosines = (vectors_a * vectors_b).sum(axis=1)
+
+    # Opposite vectors: turn around any axis perpendicular to vectors_a
+    opposite = (sines < 1e-12) & (cosines < 0)
+    if opposite.any():
+        helpers = numpy.eye(3)[
+            numpy.abs(vectors_a[opposite]).argmin(axis=1)
+        ]
+        axes[opposite] = numpy.cross(vectors_a[opposite], helpers)
+        sines[opposite] = 0.0
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        units = axes / numpy.linalg.norm(axes, axis=1)[:, numpy.newaxis]
+    units[~numpy.isfinite(units).all(axis=1)] = 0.0
+
+    # Rodrigues' formula, for every rotation at once
+    cross = numpy.zeros((len(units), 3, 3))
+    cross[:, 0, 1] = -units[:, 2]
+    cross[:, 0, 2] = units[:, 1]
+    cross[:, 1, 0] = units[:, 2]
+    cross[:, 1, 2] = -units[:, 0]
+    cross[:, 2, 0] = -units[:, 1]
+    cross[:, 2, 1] = units[:, 0]
+    return (
+        numpy.eye(3) +
+        sines[:, numpy.newaxis, numpy.newaxis] * cross +
+        (1 - cosines)[:, numpy.newaxis, numpy.newaxis] * (cross @ cross)
+    )
+
+
+def get_parent_depth(item):
+    depth = 0
+    while item.parent:
+        item = item.parent
+        depth += 1
+    return depth
+
+
+def set_world_matrices(objects, matrices):
+    # Write many world matrices in one pass (no view layer updates in
+    # between). Parents are written before their children, so each
+    # child's new world matrix is applied relative to its new parent
+    ordered = sorted(
+        zip(objects, numpy.asarray(matrices).tolist()),
+        key=lambda entry: get_parent_depth(entry[0])
+    )
+    for item, matrix in ordered:
+        item.matrix_world = mathutils.Matrix(matrix)
+
+
+def is_grab_source(item):
+    # Whether coords can be grabbed from an object's data (mesh verts, or
+    # the points of curves, point clouds and Grease Pencil strokes)
+    return item.type == 'MESH' or maplus_point_data.is_point_object(item)
+
+
 # TODO: Refactor from old deprecated 2.7x compatibility design
 def get_active_object():
     return bpy.context.view_layer.objects.active
@@ -4818,113 +1366,2168 @@ class MAPLUS_OT_ShowHideQuickGeomBaseClass(bpy.types.Operator):
         return {'FINISHED'}
 
 
-class MAPLUS_OT_ShowHideQuickCalcSlot1Geom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickcalcslot1geom"
-    bl_label = "Show/hide slot 1 geometry"
-    bl_description = "Show/hide slot 1 geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'SLOT1'
-
-
-class MAPLUS_OT_ShowHideQuickCalcSlot2Geom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickcalcslot2geom"
-    bl_label = "Show/hide slot 2 geometry"
-    bl_description = "Show/hide slot 2 geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'SLOT2'
-
-
-class MAPLUS_OT_ShowHideQuickCalcResultGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickcalcresultgeom"
-    bl_label = "Show/hide calculation result geometry"
-    bl_description = "Show/hide calculation result geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'CALCRESULT'
-
-
-class MAPLUS_OT_ShowHideQuickAptSrcGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickaptsrcgeom"
-    bl_label = "Show/hide quick align points source geometry"
-    bl_description = "Show/hide quick align points source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'APTSRC'
-
-
-class MAPLUS_OT_ShowHideQuickAptDestGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickaptdestgeom"
-    bl_label = "Show/hide quick align points destination geometry"
-    bl_description = "Show/hide quick align points destination geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'APTDEST'
-
-
-class MAPLUS_OT_ShowHideQuickAlnSrcGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickalnsrcgeom"
-    bl_label = "Show/hide quick align lines source geometry"
-    bl_description = "Show/hide quick align lines source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'ALNSRC'
-
-
-class MAPLUS_OT_ShowHideQuickAlnDestGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickalndestgeom"
-    bl_label = "Show/hide quick align lines destination geometry"
-    bl_description = "Show/hide quick align lines destination geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'ALNDEST'
-
-
-class MAPLUS_OT_ShowHideQuickAplSrcGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickaplsrcgeom"
-    bl_label = "Show/hide quick align planes source geometry"
-    bl_description = "Show/hide quick align planes source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'APLSRC'
-
-
-class MAPLUS_OT_ShowHideQuickAplDestGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickapldestgeom"
-    bl_label = "Show/hide quick align planes destination geometry"
-    bl_description = "Show/hide quick align planes destination geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'APLDEST'
-
-
-class MAPLUS_OT_ShowHideQuickAplSetOriginModeDestGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickaplsetoriginmodedestgeom"
-    bl_label = "Show/hide quick align planes destination geometry"
-    bl_description = "Show/hide quick align planes destination geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'APL_SET_ORIGIN_MODE_DEST'
-
-
-class MAPLUS_OT_ShowHideQuickAxrSrcGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickaxrsrcgeom"
-    bl_label = "Show/hide quick axis rotate source geometry"
-    bl_description = "Show/hide quick axis rotate source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'AXRSRC'
-
-
-class MAPLUS_OT_ShowHideQuickDsSrcGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequickdssrcgeom"
-    bl_label = "Show/hide quick directional slide source geometry"
-    bl_description = "Show/hide quick directional slide source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'DSSRC'
-
-
-class MAPLUS_OT_ShowHideQuickSmeSrcGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequicksmesrcgeom"
-    bl_label = "Show/hide quick scale match edge source geometry"
-    bl_description = "Show/hide quick scale match edge source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'SMESRC'
-
-
-class MAPLUS_OT_ShowHideQuickSmeDestGeom(MAPLUS_OT_ShowHideQuickGeomBaseClass):
-    bl_idname = "maplus.showhidequicksmedestgeom"
-    bl_label = "Show/hide quick scale match edge source geometry"
-    bl_description = "Show/hide quick scale match edge source geometry"
-    bl_options = {'REGISTER', 'UNDO'}
-    quick_op_target = 'SMEDEST'
+# Declarative tables for the many near-identical operator variants (one per
+# quick tool/slot/attribute combination). Each table row is a class name
+# (without the MAPLUS_OT_ prefix) and the class attributes that differ from
+# the table defaults; bl_idname is derived from the class name. The actual
+# operator classes are only built when the addon is registered, see
+# utils/system.py
+
+GRAB_AND_SET_ITEM_KIND_DEFAULTS = {
+    'bl_label': 'Grab Global Coordinates From Selected Vertices',
+    'bl_description': (
+        'Grabs global coordinates from selected vertices in edit mode'
+    ),
+}
+GRAB_AND_SET_ITEM_KIND_VARIANTS = (
+    ('GrabAllSlot1', {'multiply_by_world_matrix': True, 'target': 'SLOT1'}),
+    ('GrabAllSlot1Loc', {
+        'multiply_by_world_matrix': False,
+        'target': 'SLOT1',
+    }),
+    ('GrabAllSlot2', {'multiply_by_world_matrix': True, 'target': 'SLOT2'}),
+    ('GrabAllSlot2Loc', {
+        'multiply_by_world_matrix': False,
+        'target': 'SLOT2',
+    }),
+    ('GrabAllCalcResult', {
+        'multiply_by_world_matrix': True,
+        'target': 'CALCRESULT',
+    }),
+)
+
+
+GRAB_FROM_CURSOR_DEFAULTS = {
+    'bl_label': 'Grab From Cursor',
+    'bl_description': 'Grabs coordinates from 3D cursor',
+}
+GRAB_FROM_CURSOR_VARIANTS = (
+    ('GrabPointFromCursor', {'vert_attrib_to_set': 'point'}),
+    ('Slot1GrabPointFromCursor', {
+        'vert_attrib_to_set': 'point',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabPointFromCursor', {
+        'vert_attrib_to_set': 'point',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabPointFromCursor', {
+        'vert_attrib_to_set': 'point',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAptSrcGrabPointFromCursor', {
+        'vert_attrib_to_set': 'point',
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAptDestGrabPointFromCursor', {
+        'vert_attrib_to_set': 'point',
+        'quick_op_target': 'APTDEST',
+    }),
+    ('GrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+    }),
+    ('Slot1GrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabLineEndFromCursor', {
+        'bl_label': 'Grab Line End From Cursor',
+        'bl_description': 'Grabs line end coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabLineEndFromCursor', {
+        'bl_label': 'Grab Line End From Cursor',
+        'bl_description': 'Grabs line end coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabLineEndFromCursor', {
+        'bl_label': 'Grab Line End From Cursor',
+        'bl_description': 'Grabs line end coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlnSrcGrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestGrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcGrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcGrabLineStartFromCursor', {
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsDestGrabLineStartFromCursor', {
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickSmeSrcGrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestGrabLineStartFromCursor', {
+        'bl_label': 'Grab Line Start From Cursor',
+        'bl_description': 'Grabs line start coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_start',
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('GrabLineEndFromCursor', {'vert_attrib_to_set': 'line_end'}),
+    ('QuickAlnSrcGrabLineEndFromCursor', {
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestGrabLineEndFromCursor', {
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcGrabLineEndFromCursor', {
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcGrabLineEndFromCursor', {
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsDestGrabLineEndFromCursor', {
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickSmeSrcGrabLineEndFromCursor', {
+        'bl_label': 'Grab Line End From Cursor',
+        'bl_description': 'Grabs line end coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestGrabLineEndFromCursor', {
+        'bl_label': 'Grab Line End From Cursor',
+        'bl_description': 'Grabs line end coordinates from the 3D cursor',
+        'vert_attrib_to_set': 'line_end',
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('GrabPlaneAFromCursor', {'vert_attrib_to_set': 'plane_pt_a'}),
+    ('Slot1GrabPlaneAFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_a',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneBFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_b',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneCFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_c',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabPlaneAFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_a',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneBFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_b',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneCFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_c',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabPlaneAFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_a',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneBFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_b',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneCFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_c',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAplSrcGrabPlaneAFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_a',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabPlaneAFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_a',
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneAFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_a',
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('GrabPlaneBFromCursor', {'vert_attrib_to_set': 'plane_pt_b'}),
+    ('QuickAplSrcGrabPlaneBFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_b',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabPlaneBFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_b',
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneBFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_b',
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('GrabPlaneCFromCursor', {'vert_attrib_to_set': 'plane_pt_c'}),
+    ('QuickAplSrcGrabPlaneCFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_c',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabPlaneCFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_c',
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneCFromCursor', {
+        'vert_attrib_to_set': 'plane_pt_c',
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+)
+
+
+GRAB_FROM_GEOMETRY_DEFAULTS = {
+    'bl_label': 'Grab Local Coordinates From Active Point',
+    'bl_description': (
+        'Grabs global coordinates from selected vertex in edit mode'
+    ),
+}
+GRAB_FROM_GEOMETRY_VARIANTS = (
+    ('GrabPointFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabPointFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('GrabPointSlot1', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('GrabPointSlot1Loc', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('GrabPointCalcResult', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('GrabPointCalcResultLoc', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('GrabPointSlot2', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('GrabPointSlot2Loc', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('QuickAlignPointsGrabSrc', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAlignPointsGrabDest', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APTDEST',
+    }),
+    ('QuickAlignPointsGrabSrcLoc', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAlignPointsGrabDestLoc', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APTDEST',
+    }),
+    ('GrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('Slot1GrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('Slot1GrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('Slot1GrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlnSrcGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnSrcGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAlnDestGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickAxrSrcGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsSrcGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsDestGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickDsDestGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickSmeSrcGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeSrcGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestGrabLineStartFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('QuickSmeDestGrabLineStartFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line Start From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line start from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('GrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab From Active Point',
+        'bl_description': (
+            'Grabs coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('QuickAlnSrcGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnSrcGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAlnDestGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickAxrSrcGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsSrcGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsDestGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickDsDestGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickSmeSrcGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeSrcGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestGrabLineEndFromActiveLocal', {
+        'bl_label': 'Grab Local Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs local coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('QuickSmeDestGrabLineEndFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinate for Line End From Active Point',
+        'bl_description': (
+            'Grabs global coordinates for line end from selected vertexin edit mode'
+        ),
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('GrabAllVertsLineLocal', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabAllVertsLineGlobal', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+    }),
+    ('GrabLineSlot1', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('GrabLineSlot1Loc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('GrabLineSlot2', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('GrabLineSlot2Loc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('GrabLineCalcResult', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('GrabLineCalcResultLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlignLinesGrabSrc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlignLinesGrabSrcLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlignLinesGrabDest', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAlignLinesGrabDestLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickScaleMatchEdgeGrabSrc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickScaleMatchEdgeGrabSrcLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickScaleMatchEdgeGrabDest', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('QuickScaleMatchEdgeGrabDestLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('QuickAxisRotateGrabSrc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickAxisRotateGrabSrcLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDirectionalSlideGrabSrc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDirectionalSlideGrabSrcLoc', {
+        'bl_label': 'Grab Line from Selected Verts',
+        'bl_description': (
+            'Grabs line coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('GrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('Slot1GrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAplSrcGrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplSrcGrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneAFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplDestGrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneAFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('GrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('QuickAplSrcGrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplSrcGrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneBFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplDestGrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneBFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('GrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('QuickAplSrcGrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplSrcGrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestGrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneCFromActiveLocal', {
+        'bl_description': (
+            'Grabs local coordinates from selected vertex in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplDestGrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestGrabPlaneCFromActiveGlobal', {
+        'bl_label': 'Grab Global Coordinates From Active Point',
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('GrabAllVertsPlaneLocal', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+    }),
+    ('GrabAllVertsPlaneGlobal', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+    }),
+    ('GrabPlaneSlot1Loc', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('GrabPlaneSlot1', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('GrabPlaneSlot2Loc', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('GrabPlaneSlot2', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('GrabPlaneCalcResultLoc', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('GrabPlaneCalcResult', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlignPlanesGrabSrc', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAlignPlanesGrabDest', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAlignPlanesSetOriginModeGrabDest', {
+        'bl_label': 'Grab Plane Global Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane global coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAlignPlanesGrabSrcLoc', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAlignPlanesGrabDestLoc', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAlignPlanesSetOriginModeGrabDestLoc', {
+        'bl_label': 'Grab Plane Local Coordinates from Selected Verts',
+        'bl_description': (
+            'Grabs plane local coordinates from selected vertices in edit mode'
+        ),
+        'vert_attribs_to_set': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+        'multiply_by_world_matrix': False,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+)
+
+
+GRAB_AVERAGE_LOCATION_DEFAULTS = {
+    'bl_label': 'Grab Average Global Coordinates From Selected Points',
+    'bl_description': (
+        'Grabs average global coordinates from selected vertices in edit mode'
+    ),
+}
+GRAB_AVERAGE_LOCATION_VARIANTS = (
+    ('PointGrabAvg', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('LineStartGrabAvg', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('LineEndGrabAvg', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('PlaneAGrabAvg', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('PlaneBGrabAvg', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('PlaneCGrabAvg', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+    }),
+    ('Slot1PointGrabAvg', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2PointGrabAvg', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultPointGrabAvg', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAptGrabAvgSrc', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAptGrabAvgDest', {
+        'vert_attribs_to_set': ('point',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APTDEST',
+    }),
+    ('Slot1GrabAvgLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabAvgLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabAvgLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('Slot1GrabAvgLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabAvgLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabAvgLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlnGrabAvgSrcLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnGrabAvgDestLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAlnGrabAvgSrcLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnGrabAvgDestLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrGrabAvgSrcLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickAxrGrabAvgSrcLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsGrabAvgSrcLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsGrabAvgSrcLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickSmeGrabAvgSrcLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeGrabAvgDestLineStart', {
+        'vert_attribs_to_set': ('line_start',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('QuickSmeGrabAvgSrcLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeGrabAvgDestLineEnd', {
+        'vert_attribs_to_set': ('line_end',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('Slot1GrabAvgPlaneA', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabAvgPlaneB', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1GrabAvgPlaneC', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabAvgPlaneA', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabAvgPlaneB', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2GrabAvgPlaneC', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabAvgPlaneA', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabAvgPlaneB', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultGrabAvgPlaneC', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAplGrabAvgSrcPlaneA', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplGrabAvgDestPlaneA', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeGrabAvgDestPlaneA', {
+        'vert_attribs_to_set': ('plane_pt_a',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplGrabAvgSrcPlaneB', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplGrabAvgDestPlaneB', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplGrabAvgSetOriginModeDestPlaneB', {
+        'vert_attribs_to_set': ('plane_pt_b',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplGrabAvgSrcPlaneC', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplGrabAvgDestPlaneC', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeGrabAvgDestPlaneC', {
+        'vert_attribs_to_set': ('plane_pt_c',),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+)
+
+
+GRAB_NORMAL_DEFAULTS = {
+    'bl_label': 'Grab Normal Coords from Selected Face',
+    'bl_description': (
+        'Grabs normal coordinates from selected face in edit mode'
+    ),
+}
+GRAB_NORMAL_VARIANTS = (
+    ('GrabNormal', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+    }),
+    ('Slot1GrabNormal', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2GrabNormal', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultGrabNormal', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlnGrabNormalSrc', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnGrabNormalDest', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrGrabNormalSrc', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsGrabNormalSrc', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickSmeGrabNormalSrc', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeGrabNormalDest', {
+        'vert_attribs_to_set': ('line_start', 'line_end'),
+        'multiply_by_world_matrix': True,
+        'quick_op_target': 'SMEDEST',
+    }),
+)
+
+
+SEND_COORD_TO_CURSOR_DEFAULTS = {
+    'bl_label': 'Sends Line Start to Cursor',
+    'bl_description': 'Sends Line Start Coordinates to 3D Cursor',
+}
+SEND_COORD_TO_CURSOR_VARIANTS = (
+    ('SendPointToCursor', {
+        'bl_label': 'Sends Point to Cursor',
+        'bl_description': 'Sends Point Coordinates to the 3D Cursor',
+        'source_coord_attrib': 'point',
+    }),
+    ('Slot1SendPointToCursor', {
+        'bl_label': 'Sends Point to Cursor',
+        'bl_description': 'Sends Point Coordinates to the 3D Cursor',
+        'source_coord_attrib': 'point',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2SendPointToCursor', {
+        'bl_label': 'Sends Point to Cursor',
+        'bl_description': 'Sends Point Coordinates to the 3D Cursor',
+        'source_coord_attrib': 'point',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultSendPointToCursor', {
+        'bl_label': 'Sends Point to Cursor',
+        'bl_description': 'Sends Point Coordinates to the 3D Cursor',
+        'source_coord_attrib': 'point',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAptSrcSendPointToCursor', {
+        'bl_label': 'Sends Point to Cursor',
+        'bl_description': 'Sends Point Coordinates to the 3D Cursor',
+        'source_coord_attrib': 'point',
+        'quick_op_target': 'APTSRC',
+    }),
+    ('QuickAptDestSendPointToCursor', {
+        'bl_label': 'Sends Point to Cursor',
+        'bl_description': 'Sends Point Coordinates to the 3D Cursor',
+        'source_coord_attrib': 'point',
+        'quick_op_target': 'APTDEST',
+    }),
+    ('SendLineStartToCursor', {'source_coord_attrib': 'line_start'}),
+    ('Slot1SendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1SendLineEndToCursor', {
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2SendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2SendLineEndToCursor', {
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlnSrcSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsDestSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickSmeSrcSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestSendLineStartToCursor', {
+        'source_coord_attrib': 'line_start',
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('SendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+    }),
+    ('QuickAlnSrcSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickDsDestSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'DSDEST',
+    }),
+    ('QuickSmeSrcSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestSendLineEndToCursor', {
+        'bl_label': 'Sends Line End to Cursor',
+        'bl_description': 'Sends Line End Coordinates to 3D Cursor',
+        'source_coord_attrib': 'line_end',
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('SendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+    }),
+    ('Slot1SendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1SendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1SendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2SendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2SendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2SendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultSendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultSendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultSendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAplSrcSendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestSendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestSendPlaneAToCursor', {
+        'bl_label': 'Sends Plane Point A to Cursor',
+        'bl_description': 'Sends Plane Point A Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_a',
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('SendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+    }),
+    ('QuickAplSrcSendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestSendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestSendPlaneBToCursor', {
+        'bl_label': 'Sends Plane Point B to Cursor',
+        'bl_description': 'Sends Plane Point B Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_b',
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('SendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+    }),
+    ('QuickAplSrcSendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestSendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestSendPlaneCToCursor', {
+        'bl_label': 'Sends Plane Point C to Cursor',
+        'bl_description': 'Sends Plane Point C Coordinates to 3D Cursor',
+        'source_coord_attrib': 'plane_pt_c',
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+)
+
+
+SWAP_POINTS_DEFAULTS = {
+    'bl_label': 'Swap Line Points',
+    'bl_description': 'Swap line points',
+}
+SWAP_POINTS_VARIANTS = (
+    ('SwapLinePoints', {'targets': ('line_start', 'line_end')}),
+    ('Slot1SwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2SwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAlnSrcSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('QuickAlnDestSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('QuickAxrSrcSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('QuickDsSrcSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'DSSRC',
+    }),
+    ('QuickSmeSrcSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'SMESRC',
+    }),
+    ('QuickSmeDestSwapLinePoints', {
+        'targets': ('line_start', 'line_end'),
+        'quick_op_target': 'SMEDEST',
+    }),
+    ('SwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+    }),
+    ('SwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+    }),
+    ('SwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+    }),
+    ('Slot1SwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1SwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot1SwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+        'quick_op_target': 'SLOT1',
+    }),
+    ('Slot2SwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2SwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+        'quick_op_target': 'SLOT2',
+    }),
+    ('Slot2SwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+        'quick_op_target': 'SLOT2',
+    }),
+    ('CalcResultSwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultSwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('CalcResultSwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('QuickAplSrcSwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplSrcSwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplSrcSwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+        'quick_op_target': 'APLSRC',
+    }),
+    ('QuickAplDestSwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestSwapPlaneAPlaneB', {
+        'bl_label': 'Swap Plane Point A with Plane Point B',
+        'bl_description': 'Swap plane points A and B',
+        'targets': ('plane_pt_a', 'plane_pt_b'),
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplDestSwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestSwapPlaneAPlaneC', {
+        'bl_label': 'Swap Plane Point A with Plane Point C',
+        'bl_description': 'Swap plane points A and C',
+        'targets': ('plane_pt_a', 'plane_pt_c'),
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('QuickAplDestSwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+        'quick_op_target': 'APLDEST',
+    }),
+    ('QuickAplSetOriginModeDestSwapPlaneBPlaneC', {
+        'bl_label': 'Swap Plane Point B with Plane Point C',
+        'bl_description': 'Swap plane points B and C',
+        'targets': ('plane_pt_b', 'plane_pt_c'),
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+)
+
+
+SET_OTHER_COMPONENTS_DEFAULTS = {
+    'bl_label': '',
+    'bl_description': '',
+}
+SET_OTHER_COMPONENTS_VARIANTS = (
+    ('ZeroOtherPointX', {'target_info': ('point', 'X', 0)}),
+    ('ZeroOtherPointY', {'target_info': ('point', 'Y', 0)}),
+    ('ZeroOtherPointZ', {'target_info': ('point', 'Z', 0)}),
+    ('ZeroOtherLineStartX', {'target_info': ('line_start', 'X', 0)}),
+    ('ZeroOtherLineStartY', {'target_info': ('line_start', 'Y', 0)}),
+    ('ZeroOtherLineStartZ', {'target_info': ('line_start', 'Z', 0)}),
+    ('ZeroOtherLineEndX', {'target_info': ('line_end', 'X', 0)}),
+    ('ZeroOtherLineEndY', {'target_info': ('line_end', 'Y', 0)}),
+    ('ZeroOtherLineEndZ', {'target_info': ('line_end', 'Z', 0)}),
+    ('ZeroOtherPlanePointAX', {'target_info': ('plane_pt_a', 'X', 0)}),
+    ('ZeroOtherPlanePointAY', {'target_info': ('plane_pt_a', 'Y', 0)}),
+    ('ZeroOtherPlanePointAZ', {'target_info': ('plane_pt_a', 'Z', 0)}),
+    ('ZeroOtherPlanePointBX', {'target_info': ('plane_pt_b', 'X', 0)}),
+    ('ZeroOtherPlanePointBY', {'target_info': ('plane_pt_b', 'Y', 0)}),
+    ('ZeroOtherPlanePointBZ', {'target_info': ('plane_pt_b', 'Z', 0)}),
+    ('ZeroOtherPlanePointCX', {'target_info': ('plane_pt_c', 'X', 0)}),
+    ('ZeroOtherPlanePointCY', {'target_info': ('plane_pt_c', 'Y', 0)}),
+    ('ZeroOtherPlanePointCZ', {'target_info': ('plane_pt_c', 'Z', 0)}),
+    ('OneOtherPointX', {'target_info': ('point', 'X', 1)}),
+    ('OneOtherPointY', {'target_info': ('point', 'Y', 1)}),
+    ('OneOtherPointZ', {'target_info': ('point', 'Z', 1)}),
+    ('OneOtherLineStartX', {'target_info': ('line_start', 'X', 1)}),
+    ('OneOtherLineStartY', {'target_info': ('line_start', 'Y', 1)}),
+    ('OneOtherLineStartZ', {'target_info': ('line_start', 'Z', 1)}),
+    ('OneOtherLineEndX', {'target_info': ('line_end', 'X', 1)}),
+    ('OneOtherLineEndY', {'target_info': ('line_end', 'Y', 1)}),
+    ('OneOtherLineEndZ', {'target_info': ('line_end', 'Z', 1)}),
+    ('OneOtherPlanePointAX', {'target_info': ('plane_pt_a', 'X', 1)}),
+    ('OneOtherPlanePointAY', {'target_info': ('plane_pt_a', 'Y', 1)}),
+    ('OneOtherPlanePointAZ', {'target_info': ('plane_pt_a', 'Z', 1)}),
+    ('OneOtherPlanePointBX', {'target_info': ('plane_pt_b', 'X', 1)}),
+    ('OneOtherPlanePointBY', {'target_info': ('plane_pt_b', 'Y', 1)}),
+    ('OneOtherPlanePointBZ', {'target_info': ('plane_pt_b', 'Z', 1)}),
+    ('OneOtherPlanePointCX', {'target_info': ('plane_pt_c', 'X', 1)}),
+    ('OneOtherPlanePointCY', {'target_info': ('plane_pt_c', 'Y', 1)}),
+    ('OneOtherPlanePointCZ', {'target_info': ('plane_pt_c', 'Z', 1)}),
+)
+
+
+SHOW_HIDE_QUICK_GEOM_DEFAULTS = {
+    'bl_label': 'Show/hide quick align planes destination geometry',
+    'bl_description': 'Show/hide quick align planes destination geometry',
+}
+SHOW_HIDE_QUICK_GEOM_VARIANTS = (
+    ('ShowHideQuickCalcSlot1Geom', {
+        'bl_label': 'Show/hide slot 1 geometry',
+        'bl_description': 'Show/hide slot 1 geometry',
+        'quick_op_target': 'SLOT1',
+    }),
+    ('ShowHideQuickCalcSlot2Geom', {
+        'bl_label': 'Show/hide slot 2 geometry',
+        'bl_description': 'Show/hide slot 2 geometry',
+        'quick_op_target': 'SLOT2',
+    }),
+    ('ShowHideQuickCalcResultGeom', {
+        'bl_label': 'Show/hide calculation result geometry',
+        'bl_description': 'Show/hide calculation result geometry',
+        'quick_op_target': 'CALCRESULT',
+    }),
+    ('ShowHideQuickAptSrcGeom', {
+        'bl_label': 'Show/hide quick align points source geometry',
+        'bl_description': 'Show/hide quick align points source geometry',
+        'quick_op_target': 'APTSRC',
+    }),
+    ('ShowHideQuickAptDestGeom', {
+        'bl_label': 'Show/hide quick align points destination geometry',
+        'bl_description': 'Show/hide quick align points destination geometry',
+        'quick_op_target': 'APTDEST',
+    }),
+    ('ShowHideQuickAlnSrcGeom', {
+        'bl_label': 'Show/hide quick align lines source geometry',
+        'bl_description': 'Show/hide quick align lines source geometry',
+        'quick_op_target': 'ALNSRC',
+    }),
+    ('ShowHideQuickAlnDestGeom', {
+        'bl_label': 'Show/hide quick align lines destination geometry',
+        'bl_description': 'Show/hide quick align lines destination geometry',
+        'quick_op_target': 'ALNDEST',
+    }),
+    ('ShowHideQuickAplSrcGeom', {
+        'bl_label': 'Show/hide quick align planes source geometry',
+        'bl_description': 'Show/hide quick align planes source geometry',
+        'quick_op_target': 'APLSRC',
+    }),
+    ('ShowHideQuickAplDestGeom', {'quick_op_target': 'APLDEST'}),
+    ('ShowHideQuickAplSetOriginModeDestGeom', {
+        'quick_op_target': 'APL_SET_ORIGIN_MODE_DEST',
+    }),
+    ('ShowHideQuickAxrSrcGeom', {
+        'bl_label': 'Show/hide quick axis rotate source geometry',
+        'bl_description': 'Show/hide quick axis rotate source geometry',
+        'quick_op_target': 'AXRSRC',
+    }),
+    ('ShowHideQuickDsSrcGeom', {
+        'bl_label': 'Show/hide quick directional slide source geometry',
+        'bl_description': 'Show/hide quick directional slide source geometry',
+        'quick_op_target': 'DSSRC',
+    }),
+    ('ShowHideQuickSmeSrcGeom', {
+        'bl_label': 'Show/hide quick scale match edge source geometry',
+        'bl_description': 'Show/hide quick scale match edge source geometry',
+        'quick_op_target': 'SMESRC',
+    }),
+    ('ShowHideQuickSmeDestGeom', {
+        'bl_label': 'Show/hide quick scale match edge source geometry',
+        'bl_description': 'Show/hide quick scale match edge source geometry',
+        'quick_op_target': 'SMEDEST',
+    }),
+)
+
+
+# (base operator, shared defaults, variant rows)
+operator_variant_tables = (
+    (MAPLUS_OT_GrabAndSetItemKindBase, GRAB_AND_SET_ITEM_KIND_DEFAULTS, GRAB_AND_SET_ITEM_KIND_VARIANTS),
+    (MAPLUS_OT_GrabFromCursorBase, GRAB_FROM_CURSOR_DEFAULTS, GRAB_FROM_CURSOR_VARIANTS),
+    (MAPLUS_OT_GrabFromGeometryBase, GRAB_FROM_GEOMETRY_DEFAULTS, GRAB_FROM_GEOMETRY_VARIANTS),
+    (MAPLUS_OT_GrabAverageLocationBase, GRAB_AVERAGE_LOCATION_DEFAULTS, GRAB_AVERAGE_LOCATION_VARIANTS),
+    (MAPLUS_OT_GrabNormalBase, GRAB_NORMAL_DEFAULTS, GRAB_NORMAL_VARIANTS),
+    (MAPLUS_OT_SendCoordToCursorBase, SEND_COORD_TO_CURSOR_DEFAULTS, SEND_COORD_TO_CURSOR_VARIANTS),
+    (MAPLUS_OT_SwapPointsBase, SWAP_POINTS_DEFAULTS, SWAP_POINTS_VARIANTS),
+    (MAPLUS_OT_SetOtherComponentsBase, SET_OTHER_COMPONENTS_DEFAULTS, SET_OTHER_COMPONENTS_VARIANTS),
+    (MAPLUS_OT_ShowHideQuickGeomBaseClass, SHOW_HIDE_QUICK_GEOM_DEFAULTS, SHOW_HIDE_QUICK_GEOM_VARIANTS),
+)
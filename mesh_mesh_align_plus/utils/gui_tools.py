@@ -76,6 +76,33 @@ def layout_coordvec(parent_layout,
     )
 
 
+def layout_mesh_falloff(parent_layout, addon_data):
+    # Shape key and proportional falloff (for "Mesh Piece") settings
+    # for mesh level transforms
+    falloff_layout = parent_layout.column(align=True)
+    falloff_layout.prop(
+        addon_data,
+        'mesh_transform_shape_keys',
+        text="Shape Keys"
+    )
+    falloff_layout.prop(addon_data, 'mesh_falloff_use', text="Falloff")
+    if addon_data.mesh_falloff_use:
+        falloff_layout.prop(addon_data, 'mesh_falloff_curve', text="")
+        falloff_layout.prop(
+            addon_data,
+            'mesh_falloff_radius',
+            text="Radius"
+        )
+
+
+def mesh_op_id(op_id, addon_data):
+    # The journaled (undo-light) variant of a mesh level operator, when
+    # the addon's mesh journal is on (see undo_journal.py)
+    if addon_data.mesh_journal_use:
+        return op_id + 'journaled'
+    return op_id
+
+
 def specials_menu_items(self, context):
     self.layout.separator()
     self.layout.label(text='Add Mesh Align Plus items')
@@ -0,0 +1,238 @@
+"""Addon-side undo journal for mesh level transforms (matrix + vert deltas)."""
+
+
+import zlib
+
+import bpy
+import numpy
+
+import mesh_mesh_align_plus.utils.exceptions as maplus_except
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+
+
+# Verts transformed at once when a step has per vert weights (each vert
+# gets its own 3x3 system to solve when reverting)
+WEIGHTED_CHUNK_SIZE = 65536
+
+
+def pack_indices(indices):
+    # Sorted vert indices as zlib compressed uint32 deltas (runs of
+    # neighbouring verts, like most selections, compress to almost nothing)
+    deltas = numpy.diff(indices, prepend=0).astype(numpy.uint32)
+    return zlib.compress(deltas.tobytes(), 1)
+
+
+def unpack_indices(packed):
+    deltas = numpy.frombuffer(zlib.decompress(packed), dtype=numpy.uint32)
+    return numpy.cumsum(deltas, dtype=numpy.int64)
+
+
+def get_coords_digest(coords):
+    # Checksum of coords as the mesh stores them (float32), to tell whether
+    # verts were moved outside the journal
+    return zlib.crc32(numpy.asarray(coords, dtype=numpy.float32).tobytes())
+
+
+def transform_weighted(coords, matrix, weights=None, inverse=False):
+    '''Apply (or revert) a weighted transform to (n, 3) coords.
+
+    The forward transform moves each vert by its weight from where it is
+    to its fully transformed location, as in
+    maplus_geom.transform_mesh_coords(). A vert with weight w sees the
+    affine map ((1 - w) I + w L, w t), so reverting solves that map per
+    vert (in chunks, to bound memory).
+    '''
+    matrix = numpy.asarray(matrix, dtype=numpy.float64)
+    if weights is None:
+        return maplus_geom.transform_coords(
+            coords,
+            numpy.linalg.inv(matrix) if inverse else matrix
+        )
+    if not inverse:
+        return coords + (
+            (maplus_geom.transform_coords(coords, matrix) - coords) *
+            weights[:, numpy.newaxis]
+        )
+
+    result = numpy.empty_like(coords)
+    for start in range(0, len(coords), WEIGHTED_CHUNK_SIZE):
+        chunk_weights = weights[start:start + WEIGHTED_CHUNK_SIZE]
+        chunk_weights = chunk_weights[:, numpy.newaxis, numpy.newaxis]
+        linear = (
+            (1.0 - chunk_weights) * numpy.eye(3) +
+            chunk_weights * matrix[:3, :3]
+        )
+        offsets = chunk_weights[:, :, 0] * matrix[:3, 3]
+        result[start:start + WEIGHTED_CHUNK_SIZE] = numpy.linalg.solve(
+            linear,
+            (coords[start:start + WEIGHTED_CHUNK_SIZE] - offsets)[
+                :, :, numpy.newaxis
+            ]
+        )[:, :, 0]
+    return result
+
+
+class JournalStep(object):
+    '''One journaled mesh level transform.
+
+    Only the (local space) matrix, the indices of the moved verts and,
+    for partial moves, their weights are kept, all compressed, instead of
+    a copy of the mesh. A digest of the moved verts' coords, as the step
+    left them (or as undoing it did), is checked before the step is
+    applied again, so it is never applied to verts moved in the meantime.
+    '''
+
+    def __init__(self, mesh_object, matrix, weights, shape_keys):
+        self.object_name = mesh_object.name
+        self.vert_count = len(weights)
+        self.matrix = numpy.array(matrix, dtype=numpy.float64)
+        self.shape_keys = shape_keys
+        moved = numpy.flatnonzero(weights > 0)
+        self.indices = pack_indices(moved)
+        self.digest = get_coords_digest(
+            maplus_geom.get_vert_coords(mesh_object.data)[moved]
+        )
+        moved_weights = weights[moved]
+        if (moved_weights == 1.0).all():
+            self.weights = None
+        else:
+            self.weights = zlib.compress(
+                moved_weights.astype(numpy.float32).tobytes(),
+                1
+            )
+
+    def size(self):
+        # Approximate memory use, in bytes
+        return (
+            len(self.indices) +
+            (len(self.weights) if self.weights else 0) +
+            self.matrix.nbytes
+        )
+
+    def unpack(self):
+        weights = None
+        if self.weights:
+            weights = numpy.frombuffer(
+                zlib.decompress(self.weights),
+                dtype=numpy.float32
+            ).astype(numpy.float64)
+        return unpack_indices(self.indices), weights
+
+    def apply(self, inverse=False):
+        '''Revert (inverse=True) or replay this step on its object.
+
+        Must be called in object mode. Raises a JournalError if the object
+        is gone or its mesh no longer matches the recorded step.
+        '''
+        mesh_object = bpy.data.objects.get(self.object_name)
+        if not mesh_object or mesh_object.type != 'MESH':
+            raise maplus_except.JournalError(
+                'Journal: object "{0}" is missing or not a mesh'.format(
+                    self.object_name
+                )
+            )
+        mesh = mesh_object.data
+        indices, weights = self.unpack()
+        coords = None
+        if len(mesh.vertices) == self.vert_count:
+            coords = maplus_geom.get_vert_coords(mesh)
+        if (coords is None or
+                get_coords_digest(coords[indices]) != self.digest):
+            raise maplus_except.JournalError(
+                'Journal: the mesh of "{0}" was edited since this step'
+                ' was recorded'.format(self.object_name)
+            )
+
+        def transform(coords):
+            coords = coords.copy()
+            coords[indices] = transform_weighted(
+                coords[indices],
+                self.matrix,
+                weights,
+                inverse
+            )
+            return coords
+
+        coords = transform(coords)
+        maplus_geom.set_vert_coords(mesh, coords)
+        self.digest = get_coords_digest(coords[indices])
+        if not mesh.shape_keys:
+            return
+        if not self.shape_keys:
+            maplus_geom.move_reference_key(mesh, transform)
+            return
+        for key_block in mesh.shape_keys.key_blocks:
+            key_coords = maplus_geom.get_mesh_attribute(
+                key_block.data,
+                'co',
+                numpy.float32,
+                3
+            ).astype(numpy.float64)
+            key_block.data.foreach_set(
+                'co',
+                transform(key_coords).astype(numpy.float32).ravel()
+            )
+        mesh.update()
+
+
+class MeshJournal(object):
+    '''Undo/redo stacks of journaled mesh level transforms.'''
+
+    def __init__(self):
+        self.steps = []
+        self.undone = []
+
+    def record(self, step, max_steps):
+        # A new step invalidates anything that was undone
+        self.steps.append(step)
+        self.undone = []
+        del self.steps[:max(len(self.steps) - max_steps, 0)]
+
+    def undo(self):
+        step = self.steps[-1]
+        step.apply(inverse=True)
+        self.undone.append(self.steps.pop())
+        return step
+
+    def redo(self):
+        step = self.undone[-1]
+        step.apply()
+        self.steps.append(self.undone.pop())
+        return step
+
+    def clear(self):
+        self.steps = []
+        self.undone = []
+
+    def size(self):
+        return sum(step.size() for step in self.steps + self.undone)
+
+
+_journal = MeshJournal()
+
+
+def get_journal():
+    return _journal
+
+
+def record_step(mesh_object, matrix, weights, addon_data):
+    # Journal one mesh level transform (see mesh_targets), once its verts
+    # are written
+    _journal.record(
+        JournalStep(
+            mesh_object,
+            matrix,
+            weights,
+            bool(addon_data.mesh_transform_shape_keys
+                 and mesh_object.data.shape_keys)
+        ),
+        addon_data.mesh_journal_max_steps
+    )
+
+
+@bpy.app.handlers.persistent
+def clear_journal(*args):
+    # Steps refer to objects by name and to the mesh data they were
+    # recorded on, they don't carry over to other files or past Blender's
+    # own undo/redo
+    _journal.clear()
@@ -0,0 +1,258 @@
+"""Mesh level transform targets, written in one array pass per mesh."""
+
+
+import time
+
+import bmesh
+import numpy
+
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+import mesh_mesh_align_plus.utils.mesh_journal as maplus_journal
+import mesh_mesh_align_plus.utils.point_data as maplus_point_data
+import mesh_mesh_align_plus.utils.spatial as maplus_spatial
+
+
+def uses_array_path(target, addon_data, journal=False, mesh_object=None):
+    # Whether a mesh level transform has to be written with
+    # apply_mesh_transform() (plain selected/whole mesh transforms can
+    # go through bmesh.to_mesh, point data objects never can)
+    return (
+        journal or
+        maplus_point_data.is_point_object(mesh_object) or
+        target == 'VERTEX_GROUP' or
+        (target == 'MESH_SELECTED' and addon_data.mesh_falloff_use) or
+        addon_data.mesh_transform_shape_keys
+    )
+
+
+def get_incompatible_targets(objects, target, journal=False):
+    '''List the objects a mesh level transform can't be applied to.
+
+    Meshes take every target. Curves, point clouds and Grease Pencil
+    objects take the selected/whole data and origin targets, but have no
+    vertex groups, and their steps can't be journaled.
+    '''
+    return [
+        item for item in objects
+        if not (item.type == 'MESH' or (
+            maplus_point_data.is_point_object(item)
+            and target != 'VERTEX_GROUP'
+            and not journal
+        ))
+    ]
+
+
+def load_bmesh(mesh_object):
+    # Load a bmesh from a target's mesh data. Point data objects get an
+    # empty one (transforming it is a no-op), their points are written by
+    # apply_mesh_transform()
+    bm = bmesh.new()
+    if not maplus_point_data.is_point_object(mesh_object):
+        bm.from_mesh(mesh_object.data)
+    return bm
+
+
+def get_target_weights(mesh_object, target, addon_data, bm=None):
+    '''Get how far each vert moves for a mesh level transform target.
+
+    Arguments:
+        mesh_object
+            the object (object mode, its mesh data is read)
+        target
+            'MESH_SELECTED', 'WHOLE_MESH', 'VERTEX_GROUP' or
+            'OBJECT_ORIGIN'
+        addon_data
+            the scene's MAPlusData (vertex group/falloff settings)
+        bm
+            optional bmesh already loaded from the object's mesh, to read
+            vertex group weights from
+
+    For point data objects (see maplus_point_data) the weights are per
+    point, the selection or all ones (there is no falloff for them).
+
+    Returns:
+        Return an (n,) float64 array (0 stays, 1 moves fully), or None
+        for a vertex group target on an object without an active group.
+    '''
+    if maplus_point_data.is_point_object(mesh_object):
+        if target == 'VERTEX_GROUP':
+            return None
+        selected = maplus_point_data.get_point_selection(mesh_object)
+        if target == 'MESH_SELECTED':
+            return selected.astype(numpy.float64)
+        return numpy.ones(len(selected), dtype=numpy.float64)
+    mesh = mesh_object.data
+    if target == 'VERTEX_GROUP':
+        vertex_group = mesh_object.vertex_groups.active
+        if vertex_group is None:
+            return None
+        if bm is None:
+            weights_mesh = bmesh.new()
+            weights_mesh.from_mesh(mesh)
+            weights = maplus_geom.get_vertex_group_weights(
+                weights_mesh,
+                vertex_group.index
+            )
+            weights_mesh.free()
+        else:
+            weights = maplus_geom.get_vertex_group_weights(
+                bm,
+                vertex_group.index
+            )
+        if not addon_data.vertex_group_blend:
+            weights = (weights > 0).astype(numpy.float64)
+        return weights
+    if target == 'MESH_SELECTED':
+        if addon_data.mesh_falloff_use:
+            return maplus_spatial.get_falloff_weights(
+                mesh_object,
+                addon_data.mesh_falloff_radius,
+                addon_data.mesh_falloff_curve
+            )
+        return maplus_geom.get_mesh_attribute(
+            mesh.vertices,
+            'select',
+            bool
+        ).astype(numpy.float64)
+    return numpy.ones(len(mesh.vertices), dtype=numpy.float64)
+
+
+def transform_shape_keys(mesh, matrix, weights):
+    '''Apply a (local space) matrix to every shape key of a mesh.
+
+    Key blocks store absolute positions (relative keys too, their offsets
+    are taken from the reference key when evaluated), so the same
+    matrix and weights keep every key consistent with the transformed
+    mesh. Blocks are processed one at a time, so memory stays at one
+    block's coords even with many keys on a dense mesh.
+
+    Returns:
+        Return a list of (key block name, seconds) tuples.
+    '''
+    timings = []
+    for key_block in mesh.shape_keys.key_blocks:
+        start_time = time.perf_counter()
+        coords = maplus_geom.get_mesh_attribute(
+            key_block.data,
+            'co',
+            numpy.float32,
+            3
+        ).astype(numpy.float64)
+        coords += (
+            (maplus_geom.transform_coords(coords, matrix) - coords) *
+            weights[:, numpy.newaxis]
+        )
+        key_block.data.foreach_set(
+            'co',
+            coords.astype(numpy.float32).ravel()
+        )
+        timings.append((key_block.name, time.perf_counter() - start_time))
+    return timings
+
+
+def transform_point_data(point_object, matrix, weights):
+    '''Apply a (local space) matrix to a point data object's points.
+
+    Every block of points (see maplus_point_data.get_point_blocks()) is
+    read, moved by its points' weights and written back with one
+    foreach_get/foreach_set per coord property. Bezier handles move with
+    their control point, NURBS weights (w) are kept.
+    '''
+    offset = 0
+    for block in maplus_point_data.get_point_blocks(point_object):
+        block_weights = weights[offset:offset + block.size, numpy.newaxis]
+        offset += block.size
+        if not block_weights.any():
+            continue
+        for coords_index in range(len(block.coords)):
+            coords = maplus_point_data.read_block_coords(block, coords_index)
+            xyz = coords[:, :3]
+            xyz += (
+                (maplus_geom.transform_coords(xyz, matrix) - xyz) *
+                block_weights
+            )
+            maplus_point_data.write_block_coords(block, coords, coords_index)
+    maplus_point_data.tag_points_changed(point_object)
+
+
+def apply_mesh_transform(mesh_object, matrix, target, addon_data, bm=None,
+                         journal=False, weights=None):
+    '''Transform a mesh object's data for a mesh level target.
+
+    The verts (and, if enabled, every shape key) are read, moved by
+    their target weights and written back in one pass each. Otherwise
+    shape keys (if any) follow the reference key's offsets, see
+    maplus_geom.move_reference_key(). Point data objects are transformed
+    with transform_point_data() (their steps are not journaled, see
+    get_incompatible_targets()).
+
+    Arguments:
+        mesh_object
+            the object (object mode), its mesh data is written to
+        matrix
+            a 4x4 matrix, in the object's local space (for 'OBJECT_ORIGIN'
+            the inverse is applied, the object itself is moved instead)
+        target
+            see get_target_weights()
+        addon_data
+            the scene's MAPlusData
+        bm
+            see get_target_weights()
+        journal
+            record the step in the undo journal (see mesh_journal)
+        weights
+            optional target weights already computed for this object
+            (see get_target_weights()), they are computed when omitted
+
+    Returns:
+        Return None if the target doesn't apply to this object (no active
+        vertex group), else a list of shape key timings (empty if shape
+        keys were not transformed), see transform_shape_keys().
+    '''
+    matrix = numpy.array(matrix, dtype=numpy.float64)
+    if target == 'OBJECT_ORIGIN':
+        matrix = numpy.linalg.inv(matrix)
+    if weights is None:
+        weights = get_target_weights(mesh_object, target, addon_data, bm)
+    if weights is None:
+        return None
+    if maplus_point_data.is_point_object(mesh_object):
+        transform_point_data(mesh_object, matrix, weights)
+        return []
+
+    mesh = mesh_object.data
+    maplus_geom.transform_mesh_coords(
+        mesh,
+        matrix,
+        weights=weights,
+        blend=True
+    )
+    if journal:
+        maplus_journal.record_step(mesh_object, matrix, weights, addon_data)
+    if not mesh.shape_keys:
+        return []
+    if not addon_data.mesh_transform_shape_keys:
+        maplus_geom.move_reference_key(
+            mesh,
+            lambda coords: maplus_journal.transform_weighted(
+                coords,
+                matrix,
+                weights
+            )
+        )
+        return []
+    timings = transform_shape_keys(mesh, matrix, weights)
+    mesh.update()
+    return timings
+
+
+def format_key_timings(mesh_object, timings):
+    # One line report of the time spent on each key block
+    return 'Shape keys on "{0}" ({1:.1f} ms): {2}'.format(
+        mesh_object.name,
+        sum(seconds for name, seconds in timings) * 1000,
+        ', '.join(
+            '{0} {1:.1f} ms'.format(name, seconds * 1000)
+            for name, seconds in timings
+        )
+    )
@@ -0,0 +1,342 @@
+"""Compact, array-backed storage for large reference geometry libraries."""
+
+
+import bpy
+import numpy
+
+
+# Packed kinds, only plain geometry (no calcs/transfs) can be packed
+PACKED_KINDS = ('POINT', 'LINE', 'PLANE')
+KIND_CODES = {kind: code for code, kind in enumerate(PACKED_KINDS)}
+# Every packed item reserves room for 3 points (a plane), points and
+# lines ignore the unused rows
+POINTS_PER_ITEM = 3
+# ID-property group on the scene that holds the packed buffers
+LIBRARY_KEY = 'maplus_packed_library'
+# Names are stored as a single string to avoid one ID-property per item
+NAME_SEPARATOR = '\n'
+
+# Unpacked (numpy) copies of the ID-property buffers, keyed by scene
+# pointer, so repeated reads don't convert the buffers again. Each entry
+# is validated against the library revision before use
+_library_cache = {}
+# Writes touching more rows than this fraction of the library rewrite the
+# whole coords buffer (one conversion) instead of one slice per row
+SLICE_WRITE_FRACTION = 0.125
+
+
+class PackedLibrary(object):
+    '''Packed geometry library stored in ID-properties on a scene.
+
+    Coordinates live in one flat float64 buffer (3 points per item), kinds
+    and stable IDs in int buffers, so a library with tens of thousands of
+    items costs a handful of ID-properties instead of one full
+    MAPlusPrimitive per item. Items are addressed by stable ID; IDs are
+    never reused, even after removal.
+    '''
+
+    def __init__(self, scene):
+        self.scene = scene
+        if LIBRARY_KEY not in scene:
+            scene[LIBRARY_KEY] = {
+                'revision': 0,
+                'next_id': 1,
+                'ids': [],
+                'kinds': [],
+                'coords': [],
+                'names': '',
+            }
+        self.group = scene[LIBRARY_KEY]
+        self._load()
+
+    def _load(self):
+        key = self.scene.as_pointer()
+        cached = _library_cache.get(key)
+        if cached and cached['revision'] == self.group['revision']:
+            self.ids = cached['ids']
+            self.kinds = cached['kinds']
+            self.coords = cached['coords']
+            self.names = cached['names']
+            self.rows_by_id = cached['rows_by_id']
+            return
+
+        self.ids = numpy.array(self.group['ids'], dtype=numpy.int64)
+        self.kinds = numpy.array(self.group['kinds'], dtype=numpy.int8)
+        self.coords = numpy.array(
+            self.group['coords'],
+            dtype=numpy.float64
+        ).reshape(-1, POINTS_PER_ITEM, 3)
+        self.names = (
+            self.group['names'].split(NAME_SEPARATOR)
+            if len(self.ids) else []
+        )
+        self._index_rows()
+        self._update_cache()
+
+    def _index_rows(self):
+        self.rows_by_id = {
+            item_id: row for row, item_id in enumerate(self.ids.tolist())
+        }
+
+    def _update_cache(self):
+        _library_cache[self.scene.as_pointer()] = {
+            'revision': self.group['revision'],
+            'ids': self.ids,
+            'kinds': self.kinds,
+            'coords': self.coords,
+            'names': self.names,
+            'rows_by_id': self.rows_by_id,
+        }
+
+    def _flush(self):
+        # Write every buffer back in one go (one conversion per buffer,
+        # regardless of how many items changed)
+        self.group['ids'] = self.ids.tolist()
+        self.group['kinds'] = self.kinds.tolist()
+        self.group['coords'] = self.coords.ravel().tolist()
+        self.group['names'] = NAME_SEPARATOR.join(self.names)
+        self._commit()
+
+    def _flush_coord_rows(self, rows):
+        # Write back the coords of some rows only, as slices of the
+        # ID-property buffer (the other buffers are left untouched)
+        rows = numpy.unique(rows)
+        if len(rows) > SLICE_WRITE_FRACTION * len(self.ids):
+            self.group['coords'] = self.coords.ravel().tolist()
+        else:
+            buffer = self.group['coords']
+            row_size = POINTS_PER_ITEM * 3
+            for row in rows.tolist():
+                buffer[row * row_size:(row + 1) * row_size] = (
+                    self.coords[row].ravel().tolist()
+                )
+        self._commit()
+
+    def _commit(self):
+        self.group['revision'] += 1
+        self._update_cache()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, item_id):
+        return item_id in self.rows_by_id
+
+    def rows(self, ids):
+        '''Return an array of buffer rows for an iterable of stable IDs.
+
+        Raises KeyError for unknown IDs.
+        '''
+        return numpy.fromiter(
+            (self.rows_by_id[item_id] for item_id in ids),
+            dtype=numpy.int64
+        )
+
+    def add(self, kinds, coords, names=None):
+        '''Append many items in one write.
+
+        Arguments:
+            kinds
+                a sequence of kind strings (in PACKED_KINDS), or a single
+                kind string applied to every item
+            coords
+                array-like of shape (n, 3), (n, 2, 3) or (n, 3, 3)
+                (points, lines or planes), missing points are zeroed
+            names
+                optional sequence of n names, defaults to 'Packed.<id>'
+
+        Returns:
+            Return an int64 array with the new stable IDs.
+        '''
+        coords = numpy.asarray(coords, dtype=numpy.float64)
+        if coords.ndim == 2:
+            coords = coords[:, numpy.newaxis, :]
+        count = coords.shape[0]
+        if isinstance(kinds, str):
+            kinds = [kinds] * count
+        if len(kinds) != count:
+            raise ValueError('Packed library: kinds/coords length mismatch.')
+
+        padded = numpy.zeros((count, POINTS_PER_ITEM, 3))
+        padded[:, :coords.shape[1], :] = coords[:, :POINTS_PER_ITEM, :]
+        new_ids = numpy.arange(
+            self.group['next_id'],
+            self.group['next_id'] + count,
+            dtype=numpy.int64
+        )
+        if names is None:
+            names = ['Packed.{0}'.format(item_id) for item_id in new_ids]
+        elif len(names) != count:
+            raise ValueError('Packed library: names/coords length mismatch.')
+
+        self.ids = numpy.concatenate((self.ids, new_ids))
+        self.kinds = numpy.concatenate((
+            self.kinds,
+            numpy.array([KIND_CODES[k] for k in kinds], dtype=numpy.int8)
+        ))
+        self.coords = numpy.concatenate((self.coords, padded))
+        self.names = self.names + [
+            name.replace(NAME_SEPARATOR, ' ') for name in names
+        ]
+        self.group['next_id'] += count
+        self._index_rows()
+        self._flush()
+        return new_ids
+
+    def remove(self, ids):
+        '''Remove many items (by stable ID) in one write.'''
+        keep = numpy.ones(len(self.ids), dtype=bool)
+        keep[self.rows(ids)] = False
+        self.ids = self.ids[keep]
+        self.kinds = self.kinds[keep]
+        self.coords = self.coords[keep]
+        self.names = [
+            name for name, kept in zip(self.names, keep.tolist()) if kept
+        ]
+        self._index_rows()
+        self._flush()
+
+    def clear(self):
+        self.remove(self.ids.tolist())
+
+    def read(self, ids=None):
+        '''Return a (n, 3, 3) float64 copy of the coordinates of ids.
+
+        All items are returned (in storage order) when ids is None.
+        '''
+        if ids is None:
+            return self.coords.copy()
+        return self.coords[self.rows(ids)]
+
+    def write(self, ids, coords):
+        '''Overwrite the coordinates of many items in one write.'''
+        coords = numpy.asarray(coords, dtype=numpy.float64)
+        if coords.ndim == 2:
+            coords = coords[:, numpy.newaxis, :]
+        rows = self.rows(ids)
+        self.coords[rows, :coords.shape[1], :] = coords
+        self._flush_coord_rows(rows)
+
+    def kind(self, item_id):
+        return PACKED_KINDS[self.kinds[self.rows_by_id[item_id]]]
+
+    def name(self, item_id):
+        return self.names[self.rows_by_id[item_id]]
+
+    def rename(self, item_id, name):
+        self.names[self.rows_by_id[item_id]] = name.replace(
+            NAME_SEPARATOR,
+            ' '
+        )
+        self.group['names'] = NAME_SEPARATOR.join(self.names)
+        self._commit()
+
+    def coords_by_kind(self, kind):
+        '''Return (ids, coords) for every item of one kind.'''
+        mask = self.kinds == KIND_CODES[kind]
+        return self.ids[mask], self.coords[mask]
+
+
+def get_library(scene=None):
+    return PackedLibrary(scene if scene else bpy.context.scene)
+
+
+@bpy.app.handlers.persistent
+def clear_library_cache(*args):
+    # Scene pointers (and revisions) of the previous file can be reused by
+    # the scenes of a newly loaded one
+    _library_cache.clear()
+
+
+def primitive_coords(item):
+    # The raw coordinates of a plain geometry MAPlusPrimitive, as a list of
+    # 1 to 3 points (matching the kind)
+    if item.kind == 'POINT':
+        return [item.point[:]]
+    elif item.kind == 'LINE':
+        return [item.line_start[:], item.line_end[:]]
+    elif item.kind == 'PLANE':
+        return [item.plane_pt_a[:], item.plane_pt_b[:], item.plane_pt_c[:]]
+    return []
+
+
+def set_primitive_from_packed(item, library, item_id):
+    kind = library.kind(item_id)
+    coords = library.read([item_id])[0]
+    item.kind = kind
+    if kind == 'POINT':
+        item.point = coords[0]
+    elif kind == 'LINE':
+        item.line_start = coords[0]
+        item.line_end = coords[1]
+    elif kind == 'PLANE':
+        item.plane_pt_a = coords[0]
+        item.plane_pt_b = coords[1]
+        item.plane_pt_c = coords[2]
+
+
+# Lightweight RNA view for the UI: properties on MAPlusData that read from
+# and write to the active packed item only (nothing is copied per item)
+def active_packed_id(addon_data):
+    # Don't create the library here, these are called while drawing the UI
+    if LIBRARY_KEY not in bpy.context.scene:
+        return None
+    library = get_library()
+    if not len(library):
+        return None
+    row = min(max(addon_data.packed_active_index, 0), len(library) - 1)
+    return int(library.ids[row])
+
+
+def _get_active_packed_point(addon_data, point_index):
+    library = get_library()
+    item_id = active_packed_id(addon_data)
+    if item_id is None:
+        return (0.0, 0.0, 0.0)
+    return library.coords[library.rows_by_id[item_id], point_index].tolist()
+
+
+def _set_active_packed_point(addon_data, point_index, value):
+    library = get_library()
+    item_id = active_packed_id(addon_data)
+    if item_id is None:
+        return
+    # Only the active item's slice of the coords buffer is rewritten
+    coords = library.read([item_id])
+    coords[0, point_index] = value
+    library.write([item_id], coords)
+
+
+def get_packed_pt_a(self):
+    return _get_active_packed_point(self, 0)
+
+
+def set_packed_pt_a(self, value):
+    _set_active_packed_point(self, 0, value)
+
+
+def get_packed_pt_b(self):
+    return _get_active_packed_point(self, 1)
+
+
+def set_packed_pt_b(self, value):
+    _set_active_packed_point(self, 1, value)
+
+
+def get_packed_pt_c(self):
+    return _get_active_packed_point(self, 2)
+
+
+def set_packed_pt_c(self, value):
+    _set_active_packed_point(self, 2, value)
+
+
+def get_packed_name(self):
+    item_id = active_packed_id(self)
+    return get_library().name(item_id) if item_id is not None else ''
+
+
+def set_packed_name(self, value):
+    item_id = active_packed_id(self)
+    if item_id is not None:
+        get_library().rename(item_id, value)
@@ -0,0 +1,222 @@
+"""Bulk point access for curves, point clouds and Grease Pencil data."""
+
+
+import collections
+
+import bpy
+import numpy
+
+
+# Object types whose data is a set of points (control points, cloud
+# points, stroke points) that can be grabbed from and transformed
+POINT_OBJECT_TYPES = {
+    'CURVE', 'CURVES', 'POINTCLOUD', 'GPENCIL', 'GREASEPENCIL',
+}
+# Point domain attributes moved along with the positions (bezier handles
+# of curves/Grease Pencil strokes, where present)
+COORD_ATTRIBUTES = ('position', 'handle_left', 'handle_right')
+SELECTION_ATTRIBUTE = '.selection'
+
+# A run of points in one RNA collection (a spline, a stroke, a drawing's
+# attributes), read and written with one foreach_get/foreach_set each.
+#   size: number of points
+#   width: floats per coord (x, y, z first, NURBS points carry a w)
+#   coords: (collection, property) pairs, the point positions first, then
+#       coords moved with them (handles)
+#   selection: (collection, property, dtype, counts) or None (when no
+#       selection is stored, every point is selected). counts repeats each
+#       value that many times, for selections stored per curve/stroke
+PointBlock = collections.namedtuple(
+    'PointBlock',
+    ['size', 'width', 'coords', 'selection']
+)
+
+
+def is_point_object(item):
+    return getattr(item, 'type', None) in POINT_OBJECT_TYPES
+
+
+def sync_edit_data(point_object):
+    # Legacy curves only write edit mode changes back to their data on
+    # leaving edit mode (the other types edit their data directly)
+    if point_object.type == 'CURVE' and point_object.mode == 'EDIT':
+        bpy.ops.object.editmode_toggle()
+        bpy.ops.object.editmode_toggle()
+
+
+def get_curve_blocks(curve):
+    for spline in curve.splines:
+        if spline.type == 'BEZIER':
+            points = spline.bezier_points
+            yield PointBlock(
+                len(points),
+                3,
+                [
+                    (points, 'co'),
+                    (points, 'handle_left'),
+                    (points, 'handle_right'),
+                ],
+                (points, 'select_control_point', bool, None)
+            )
+        else:
+            points = spline.points
+            yield PointBlock(
+                len(points),
+                4,
+                [(points, 'co')],
+                (points, 'select', bool, None)
+            )
+
+
+def get_legacy_stroke_blocks(gpencil):
+    for layer in gpencil.layers:
+        for frame in layer.frames:
+            for stroke in frame.strokes:
+                points = stroke.points
+                yield PointBlock(
+                    len(points),
+                    3,
+                    [(points, 'co')],
+                    (points, 'select', bool, None)
+                )
+
+
+def get_curve_point_counts(container):
+    # Points per curve of a curves/drawing container (for selections
+    # stored on the curve domain), from its curve offsets
+    offsets_collection = getattr(container, 'curve_offset_data', None)
+    if offsets_collection is None:
+        offsets_collection = container.curve_offsets
+    offsets = numpy.empty(len(offsets_collection), dtype=numpy.int32)
+    offsets_collection.foreach_get('value', offsets)
+    return numpy.diff(offsets)
+
+
+def get_attribute_block(container):
+    '''Describe the points of an attribute based container.
+
+    Curves, point clouds and Grease Pencil drawings store their points as
+    generic attributes, positions in 'position' and the selection in
+    '.selection' (on the point or curve domain, boolean or float).
+
+    Returns:
+        Return a PointBlock, or None if the container has no points.
+    '''
+    attributes = container.attributes
+    position = attributes.get('position')
+    if position is None or not len(position.data):
+        return None
+    coords = [
+        (attributes[name].data, 'vector') for name in COORD_ATTRIBUTES
+        if name in attributes and attributes[name].domain == 'POINT'
+    ]
+
+    selection = None
+    selection_attribute = attributes.get(SELECTION_ATTRIBUTE)
+    if selection_attribute is not None:
+        counts = None
+        if selection_attribute.domain == 'CURVE':
+            counts = get_curve_point_counts(container)
+        selection = (
+            selection_attribute.data,
+            'value',
+            bool if selection_attribute.data_type == 'BOOLEAN'
+            else numpy.float32,
+            counts
+        )
+    return PointBlock(len(position.data), 3, coords, selection)
+
+
+def get_drawing_blocks(grease_pencil):
+    # Frames can share a drawing, each drawing is listed once
+    seen = set()
+    for layer in grease_pencil.layers:
+        for frame in layer.frames:
+            drawing = frame.drawing
+            if drawing is None or drawing.as_pointer() in seen:
+                continue
+            seen.add(drawing.as_pointer())
+            block = get_attribute_block(drawing)
+            if block:
+                yield block
+
+
+def get_point_blocks(point_object):
+    '''Split a point object's data into runs of bulk accessible points.
+
+    Points are always listed in the same order (splines/strokes in order,
+    then point index), the flat point index used by the coords, selection
+    and weights arrays of this module.
+
+    Returns:
+        Return a list of PointBlock.
+    '''
+    data = point_object.data
+    if point_object.type == 'CURVE':
+        return list(get_curve_blocks(data))
+    if point_object.type == 'GPENCIL':
+        return list(get_legacy_stroke_blocks(data))
+    if point_object.type == 'GREASEPENCIL':
+        return list(get_drawing_blocks(data))
+    block = get_attribute_block(data)
+    return [block] if block else []
+
+
+def read_block_coords(block, coords_index=0):
+    # Read one coord property of a block as a (size, width) float64 array
+    collection, attribute = block.coords[coords_index]
+    values = numpy.empty(block.size * block.width, dtype=numpy.float32)
+    collection.foreach_get(attribute, values)
+    return values.reshape(block.size, block.width).astype(numpy.float64)
+
+
+def write_block_coords(block, coords, coords_index=0):
+    collection, attribute = block.coords[coords_index]
+    collection.foreach_set(
+        attribute,
+        numpy.asarray(coords, dtype=numpy.float32).ravel()
+    )
+
+
+def read_block_selection(block):
+    # Read a block's selection state as a (size,) bool array
+    if block.selection is None:
+        return numpy.ones(block.size, dtype=bool)
+    collection, attribute, dtype, counts = block.selection
+    values = numpy.empty(len(collection), dtype=dtype)
+    collection.foreach_get(attribute, values)
+    selected = values > 0
+    if counts is not None:
+        selected = numpy.repeat(selected, counts)
+    return selected
+
+
+def get_point_coords(point_object, blocks=None):
+    '''Return the (local) point positions of an object as (n, 3) float64.'''
+    blocks = get_point_blocks(point_object) if blocks is None else blocks
+    if not blocks:
+        return numpy.empty((0, 3), dtype=numpy.float64)
+    return numpy.concatenate(
+        [read_block_coords(block)[:, :3] for block in blocks]
+    )
+
+
+def get_point_selection(point_object, blocks=None):
+    '''Return which points of an object are selected, as (n,) bool.'''
+    blocks = get_point_blocks(point_object) if blocks is None else blocks
+    if not blocks:
+        return numpy.empty(0, dtype=bool)
+    return numpy.concatenate(
+        [read_block_selection(block) for block in blocks]
+    )
+
+
+def tag_points_changed(point_object):
+    # Let Blender know the positions were written (drawings cache their
+    # evaluated positions separately)
+    if point_object.type == 'GREASEPENCIL':
+        for layer in point_object.data.layers:
+            for frame in layer.frames:
+                if frame.drawing is not None:
+                    frame.drawing.tag_positions_changed()
+    point_object.data.update_tag()
@@ -0,0 +1,81 @@
+"""Resolved operator inputs, reused when the redo panel re-runs an op."""
+
+
+import itertools
+
+import bpy
+
+
+# Inputs resolved by the last run of a redo capable operator (only the
+# last operator can be redone), keyed by the token stored on it
+_redo_inputs = {}
+_tokens = itertools.count(1)
+# Set by Blender's undo (the redo panel undoes before re-running the
+# operator), cached inputs only match the scene an undo just restored
+_undone = False
+
+
+class RedoInputsMixin(object):
+    # The token is set on the first run. Blender keeps it whenever it
+    # re-runs the operator with the same properties (the redo panel, but
+    # also Repeat Last, without an undo) and drops it for new runs
+    # (SKIP_SAVE), so get_inputs() also requires an undo
+    redo_token: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+
+def new_inputs(targets):
+    '''Start the inputs record of a first (non redo) operator run.
+
+    Objects are kept by name, undo rebuilds them before a redo. Callers
+    add their own resolved data, like auto-grabbed source verts
+    ('src_verts') and the mesh level weights of each target, by object
+    name ('weights', see maplus_mesh_targets.get_target_weights()).
+    '''
+    return {
+        'target_names': [item.name for item in targets],
+        'weights': {},
+    }
+
+
+def get_inputs(operator):
+    '''Return the inputs cached by the run a redo repeats.
+
+    Inputs are only handed out to the first run after an undo (a repeat
+    without one, like Repeat Last, resolves everything again: the scene,
+    selection and source verts may have changed since).
+
+    Returns:
+        Return the inputs dict, with 'targets' set to the target objects,
+        or None for a first run (or if a target object is gone).
+    '''
+    global _undone
+    undone = _undone
+    _undone = False
+    inputs = _redo_inputs.get(operator.redo_token)
+    if not (undone and operator.redo_token) or inputs is None:
+        return None
+    targets = [bpy.data.objects.get(name) for name in inputs['target_names']]
+    if not all(targets):
+        return None
+    return dict(inputs, targets=targets)
+
+
+def store_inputs(operator, inputs):
+    # Keep the inputs of this run, replacing those of the previous one
+    token = str(next(_tokens))
+    _redo_inputs.clear()
+    _redo_inputs[token] = inputs
+    operator.redo_token = token
+
+
+@bpy.app.handlers.persistent
+def mark_undone(*args):
+    global _undone
+    _undone = True
+
+
+@bpy.app.handlers.persistent
+def clear_redo_inputs(*args):
+    global _undone
+    _redo_inputs.clear()
+    _undone = False
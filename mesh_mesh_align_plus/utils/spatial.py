@@ -0,0 +1,517 @@
+"""Cached spatial queries (BVH trees, grid searches) over mesh objects."""
+
+
+import math
+import sys
+
+import bmesh
+import bpy
+import mathutils
+import mathutils.bvhtree
+import numpy
+
+import mesh_mesh_align_plus.utils.geom as maplus_geom
+
+
+# Global space BVH trees (with coords and triangles) of mesh objects,
+# keyed by object pointer. Each
+# entry stores the signature (world matrix + coords digest) it was built
+# for, and is rebuilt when the object moves or its mesh changes
+_bvh_cache = {}
+
+# Cells per axis (at most) of the grids sweep_distance() bins target
+# triangles into, and the most (triangle, cell) pairs a grid may hold
+# before it is made coarser
+SWEEP_GRID_RESOLUTION = 256
+SWEEP_GRID_MAX_ENTRIES = 4000000
+
+# Sources per leaf of the trees get_nearest_distances() builds, and the
+# most (point, source) pairs it measures at once
+NEAREST_LEAF_SIZE = 32
+NEAREST_MAX_PAIRS = 4000000
+
+# Proportional falloff curves, weight from t (1 at the selection, 0 at
+# the falloff radius), matching Blender's proportional editing
+FALLOFF_CURVES = {
+    'SMOOTH': lambda t: 3 * t ** 2 - 2 * t ** 3,
+    'SPHERE': lambda t: numpy.sqrt(2 * t - t ** 2),
+    'ROOT': numpy.sqrt,
+    'SHARP': lambda t: t ** 2,
+    'LINEAR': lambda t: t,
+}
+
+
+def get_mesh_triangles(mesh):
+    # (n, 3) int array of the vert indices of every loop triangle
+    mesh.calc_loop_triangles()
+    return maplus_geom.get_mesh_attribute(
+        mesh.loop_triangles,
+        'vertices',
+        numpy.int64,
+        3
+    )
+
+
+def get_object_bvh(mesh_object):
+    '''Return a cached global space BVH tree for a mesh object.
+
+    Returns:
+        Return a tuple (bvh, coords, triangles): the BVHTree (built from
+        the loop triangles of the object's mesh data, in global space),
+        the (n, 3) float64 array of the object's global vert coords and
+        the (t, 3) int64 array of its triangles' vert indices.
+    '''
+    if mesh_object.mode == 'EDIT':
+        mesh_object.update_from_editmode()
+    mesh = mesh_object.data
+    world_matrix = numpy.array(mesh_object.matrix_world, dtype=numpy.float64)
+    local_coords = maplus_geom.get_vert_coords(mesh)
+    signature = (
+        world_matrix.tobytes(),
+        hash(local_coords.tobytes()),
+        len(mesh.polygons),
+    )
+
+    key = mesh_object.as_pointer()
+    cached = _bvh_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1:]
+
+    coords = maplus_geom.transform_coords(local_coords, world_matrix)
+    triangles = get_mesh_triangles(mesh)
+    bvh = mathutils.bvhtree.BVHTree.FromPolygons(
+        coords.tolist(),
+        triangles.tolist(),
+        all_triangles=True
+    )
+    _bvh_cache[key] = (signature, bvh, coords, triangles)
+    return bvh, coords, triangles
+
+
+def get_convex_hull(coords):
+    '''Compute the convex hull of a point cloud.
+
+    Returns:
+        Return a tuple (hull_coords, hull_triangles): an (h, 3) float64
+        array of the hull verts and a (t, 3) int64 array of triangles
+        indexing into it (empty when the points are flat or too few to
+        make a solid hull).
+    '''
+    hull_mesh = bmesh.new()
+    for co in coords.tolist():
+        hull_mesh.verts.new(co)
+    hull = bmesh.ops.convex_hull(hull_mesh, input=hull_mesh.verts[:])
+    # Only keep the hull itself (drop the interior/unused verts)
+    bmesh.ops.delete(
+        hull_mesh,
+        geom=list(set(hull['geom_interior'] + hull['geom_unused'])),
+        context='VERTS'
+    )
+    bmesh.ops.triangulate(hull_mesh, faces=hull_mesh.faces[:])
+    hull_mesh.verts.index_update()
+    hull_coords = numpy.array(
+        [vert.co[:] for vert in hull_mesh.verts],
+        dtype=numpy.float64
+    ).reshape(-1, 3)
+    hull_triangles = numpy.array(
+        [[vert.index for vert in face.verts] for face in hull_mesh.faces],
+        dtype=numpy.int64
+    ).reshape(-1, 3)
+    hull_mesh.free()
+    return hull_coords, hull_triangles
+
+
+def get_convex_hull_bvh(coords):
+    '''Return a tuple (bvh, hull_coords, hull_triangles) for the convex
+    hull of coords.'''
+    hull_coords, hull_triangles = get_convex_hull(coords)
+    bvh = mathutils.bvhtree.BVHTree.FromPolygons(
+        hull_coords.tolist(),
+        hull_triangles.tolist(),
+        all_triangles=True
+    )
+    return bvh, hull_coords, hull_triangles
+
+
+def spread_bits(values):
+    # Interleave 10 bit ints with zero bit pairs (3D Morton code axes)
+    values = values.astype(numpy.int64) & 0x3ff
+    values = (values | (values << 16)) & 0x30000ff
+    values = (values | (values << 8)) & 0x300f00f
+    values = (values | (values << 4)) & 0x30c30c3
+    values = (values | (values << 2)) & 0x9249249
+    return values
+
+
+def get_morton_codes(coords, scale):
+    # Z-order curve codes of coords (relative to their tree's low corner)
+    cells = numpy.clip(coords * scale, 0, 1023)
+    return (
+        (spread_bits(cells[:, 0]) << 2) |
+        (spread_bits(cells[:, 1]) << 1) |
+        spread_bits(cells[:, 2])
+    )
+
+
+def get_box_distances(points, lows, highs):
+    # Squared distances from points to axis aligned boxes (0 inside)
+    gaps = (
+        numpy.maximum(lows - points, 0.0) +
+        numpy.maximum(points - highs, 0.0)
+    )
+    return numpy.einsum('ij,ij->i', gaps, gaps)
+
+
+def get_nearest_distances(points, sources, radius):
+    '''Find the distance from each point to its nearest source point.
+
+    Vectorized, with no per point Python calls. Sources are sorted along
+    a Z-order curve and cut into leaves of NEAREST_LEAF_SIZE, with a
+    binary tree of bounding boxes over them (a linear BVH). All points
+    first get an upper bound from the leaf a greedy descent ends in and
+    from their neighbors along the curve. Then they descend the tree
+    together, keeping only the nodes that can hold a closer source, and
+    the leaves reached are measured at most NEAREST_MAX_PAIRS pairs at a
+    time. A million sources with 200k points in range take a few
+    seconds.
+
+    Arguments:
+        points
+            (n, 3) float64 array
+        sources
+            (m, 3) float64 array
+        radius
+            the largest distance of interest (farther sources are
+            ignored)
+
+    Returns:
+        Return an (n,) float64 array, the distance to the nearest source,
+        or inf where no source is within radius.
+    '''
+    best = numpy.full(len(points), radius ** 2)
+    sources = sources[
+        (sources >= points.min(axis=0) - radius).all(axis=1) &
+        (sources <= points.max(axis=0) + radius).all(axis=1)
+    ]
+    if not len(sources):
+        return numpy.full(len(points), numpy.inf)
+    # Relative float32 coords (the leaf scans are the bulk of the work)
+    low = sources.min(axis=0)
+    sources = (sources - low).astype(numpy.float32)
+    points = (points - low).astype(numpy.float32)
+    scale = 1023.0 / max(numpy.ptp(sources, axis=0).max(), 1e-12)
+    codes = get_morton_codes(sources, scale)
+    order = numpy.argsort(codes, kind='stable')
+    codes = codes[order]
+    sources = sources[order]
+
+    # Leaf boxes, then every level above joins pairs of nodes (an odd
+    # node out is paired with an empty box), up to a single root
+    leaf_size = NEAREST_LEAF_SIZE
+    leaf_starts = numpy.arange(0, len(sources), leaf_size)
+    leaf_count = len(leaf_starts)
+    levels = [(
+        numpy.minimum.reduceat(sources, leaf_starts),
+        numpy.maximum.reduceat(sources, leaf_starts)
+    )]
+    while len(levels[-1][0]) > 1:
+        lows, highs = levels[-1]
+        if len(lows) % 2:
+            lows = numpy.vstack((lows, numpy.full((1, 3), numpy.inf)))
+            highs = numpy.vstack((highs, numpy.full((1, 3), -numpy.inf)))
+        levels.append((
+            numpy.minimum(lows[0::2], lows[1::2]),
+            numpy.maximum(highs[0::2], highs[1::2])
+        ))
+    # Sources padded to whole leaves (the far away padding never wins)
+    leaf_sources = numpy.full(
+        (leaf_count * leaf_size, 3),
+        1e30,
+        dtype=numpy.float32
+    )
+    leaf_sources[:len(sources)] = sources
+    leaf_sources = leaf_sources.reshape(leaf_count, leaf_size, 3)
+
+    def scan_leaves(rows, leaves):
+        # Measure points (rows, in ascending order) against every source
+        # of a leaf each
+        step = max(1, NEAREST_MAX_PAIRS // leaf_size)
+        for first in range(0, len(rows), step):
+            chunk_rows = rows[first:first + step]
+            offsets = (
+                leaf_sources[leaves[first:first + step]] -
+                points[chunk_rows, numpy.newaxis, :]
+            )
+            squared = numpy.einsum('ijk,ijk->ij', offsets, offsets)
+            row_starts = numpy.flatnonzero(numpy.diff(chunk_rows, prepend=-1))
+            nearest = numpy.minimum.reduceat(squared.min(axis=1), row_starts)
+            unique_rows = chunk_rows[row_starts]
+            best[unique_rows] = numpy.minimum(best[unique_rows], nearest)
+
+    # Upper bounds: the leaf of a greedy descent (into the closer child)
+    # and the leaf each point falls in along the curve
+    all_rows = numpy.arange(len(points))
+    nodes = numpy.zeros(len(points), dtype=numpy.int64)
+    for lows, highs in reversed(levels[:-1]):
+        first_child = nodes * 2
+        second_child = numpy.minimum(first_child + 1, len(lows) - 1)
+        nodes = numpy.where(
+            get_box_distances(points, lows[second_child],
+                              highs[second_child]) <
+            get_box_distances(points, lows[first_child],
+                              highs[first_child]),
+            second_child,
+            first_child
+        )
+    scan_leaves(all_rows, nodes)
+    scan_leaves(
+        all_rows,
+        numpy.minimum(
+            numpy.searchsorted(codes, get_morton_codes(points, scale)) //
+            leaf_size,
+            leaf_count - 1
+        )
+    )
+
+    # Descend from the root together, keeping the nodes that can hold a
+    # closer source than the bound
+    rows = all_rows
+    nodes = numpy.zeros(len(points), dtype=numpy.int64)
+    for lows, highs in reversed(levels[:-1]):
+        rows = numpy.repeat(rows, 2)
+        nodes = numpy.repeat(nodes * 2, 2) + numpy.tile([0, 1], len(nodes))
+        keep = nodes < len(lows)
+        rows = rows[keep]
+        nodes = nodes[keep]
+        keep = (
+            get_box_distances(points[rows], lows[nodes], highs[nodes]) <
+            best[rows]
+        )
+        rows = rows[keep]
+        nodes = nodes[keep]
+    scan_leaves(rows, nodes)
+
+    distances = numpy.sqrt(best)
+    distances[best >= radius ** 2] = numpy.inf
+    return distances
+
+
+def get_falloff_weights(mesh_object, radius, curve):
+    '''Compute proportional falloff weights around a mesh's selection.
+
+    Selected verts weigh 1, unselected verts within radius (global
+    distance to the nearest selected vert) get a falloff weight and the
+    rest weigh 0. Verts that can't be in range are culled vectorized
+    (outside the selection's bounds grown by radius), the others are
+    measured with get_nearest_distances().
+
+    Arguments:
+        mesh_object
+            the object (object mode, its mesh data is read)
+        radius
+            falloff radius, in global units
+        curve
+            a FALLOFF_CURVES key
+
+    Returns:
+        Return an (n,) float64 array of weights, see
+        maplus_geom.transform_mesh_coords().
+    '''
+    mesh = mesh_object.data
+    selected = maplus_geom.get_mesh_attribute(mesh.vertices, 'select', bool)
+    weights = selected.astype(numpy.float64)
+    if radius <= 0 or selected.all() or not selected.any():
+        return weights
+
+    coords = maplus_geom.get_vert_coords(mesh, mesh_object.matrix_world)
+    selected_coords = coords[selected]
+    low = selected_coords.min(axis=0) - radius
+    high = selected_coords.max(axis=0) + radius
+    candidates = numpy.flatnonzero(
+        ~selected &
+        (coords >= low).all(axis=1) &
+        (coords <= high).all(axis=1)
+    )
+    if not len(candidates):
+        return weights
+
+    distances = get_nearest_distances(
+        coords[candidates],
+        selected_coords,
+        radius
+    )
+    t = numpy.clip(1.0 - distances / radius, 0.0, 1.0)
+    weights[candidates] = FALLOFF_CURVES[curve](t)
+    return weights
+
+
+@bpy.app.handlers.persistent
+def clear_bvh_cache(*args):
+    _bvh_cache.clear()
+
+
+def get_perpendicular_basis(direction):
+    # Two unit vectors perpendicular to (unit) direction and each other
+    helper = numpy.eye(3)[numpy.abs(direction).argmin()]
+    first = numpy.cross(direction, helper)
+    first /= numpy.linalg.norm(first)
+    return numpy.stack((first, numpy.cross(direction, first)))
+
+
+def get_sweep_cells(triangle_across, triangle_along, margin):
+    '''Bin target triangles into a grid across a sweep direction.
+
+    Every cell gets the lowest and highest position (along the sweep) of
+    the triangles whose bounds (across the sweep) overlap it, so a ray
+    starting in a cell can only hit the target between those positions.
+
+    Arguments:
+        triangle_across
+            (t, 3, 2) array, the triangles' verts projected across
+        triangle_along
+            (t, 3) array, the triangles' verts projected along
+        margin
+            distance triangle bounds are grown by
+
+    Returns:
+        Return a tuple (low, cell_size, resolution, cell_min, cell_max):
+        the grid's lower corner and cell size (2 floats each), its cells
+        per axis and (resolution, resolution) arrays of the positions
+        (inf/-inf for empty cells).
+    '''
+    tri_low = triangle_across.min(axis=1) - margin
+    tri_high = triangle_across.max(axis=1) + margin
+    tri_min = triangle_along.min(axis=1)
+    tri_max = triangle_along.max(axis=1)
+    low = tri_low.min(axis=0)
+    extent = numpy.maximum(tri_high.max(axis=0) - low, margin)
+
+    resolution = int(
+        min(SWEEP_GRID_RESOLUTION, max(1, math.sqrt(len(tri_min))))
+    )
+    while True:
+        cell_size = extent / resolution
+        first_cells = numpy.clip(
+            ((tri_low - low) // cell_size).astype(numpy.int64),
+            0,
+            resolution - 1
+        )
+        last_cells = numpy.clip(
+            ((tri_high - low) // cell_size).astype(numpy.int64),
+            0,
+            resolution - 1
+        )
+        spans = last_cells - first_cells + 1
+        counts = spans[:, 0] * spans[:, 1]
+        if resolution == 1 or counts.sum() <= SWEEP_GRID_MAX_ENTRIES:
+            break
+        # Large triangles cover too many cells, use bigger cells
+        resolution = max(1, resolution // 2)
+
+    # One entry per (triangle, covered cell) pair
+    triangles = numpy.repeat(numpy.arange(len(counts)), counts)
+    offsets = (
+        numpy.arange(counts.sum()) -
+        numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    )
+    cell_x = first_cells[triangles, 0] + offsets % spans[triangles, 0]
+    cell_y = first_cells[triangles, 1] + offsets // spans[triangles, 0]
+    cells = cell_x * resolution + cell_y
+
+    cell_min = numpy.full(resolution * resolution, numpy.inf)
+    cell_max = numpy.full(resolution * resolution, -numpy.inf)
+    numpy.minimum.at(cell_min, cells, tri_min[triangles])
+    numpy.maximum.at(cell_max, cells, tri_max[triangles])
+    return (
+        low,
+        cell_size,
+        resolution,
+        cell_min.reshape(resolution, resolution),
+        cell_max.reshape(resolution, resolution)
+    )
+
+
+def sweep_distance(origins, direction, bvh, target_coords,
+                   target_triangles, limit=math.inf):
+    '''Find how far points can travel along a direction before a hit.
+
+    Rays are only cast from the points that can possibly hit the target
+    (the broad phase is vectorized). The target's triangles are binned
+    into a grid across the direction (see get_sweep_cells()), which gives
+    every point a lower bound on its hit distance from the triangles
+    under it. Points over empty cells, or ahead of every triangle under
+    them, are culled. The rest are cast nearest bound first, stopping
+    once no remaining bound can beat the closest hit so far. Against
+    uneven targets the bounds stay local, so rays are mostly cast near
+    the actual contact, but the worst case (a target matching the
+    moving shape) still casts one ray per point.
+
+    Arguments:
+        origins
+            (n, 3) array of global point coords
+        direction
+            unit direction (3 floats)
+        bvh
+            global space BVHTree of the target
+        target_coords
+            (m, 3) array of the target's global vert coords
+        target_triangles
+            (t, 3) int array of the target's triangles (for culling)
+        limit
+            maximum distance to search
+
+    Returns:
+        Return the smallest hit distance, or limit if nothing is hit.
+    '''
+    if not len(origins) or not len(target_triangles):
+        return limit
+    direction = numpy.asarray(direction, dtype=numpy.float64)
+    basis = get_perpendicular_basis(direction)
+    margin = 1e-6 * max(
+        numpy.ptp(target_coords, axis=0).max(),
+        numpy.ptp(origins, axis=0).max(),
+        1.0
+    )
+
+    triangle_coords = target_coords[target_triangles]
+    low, cell_size, resolution, cell_min, cell_max = get_sweep_cells(
+        triangle_coords @ basis.T,
+        triangle_coords @ direction,
+        margin
+    )
+    across = origins @ basis.T
+    along = origins @ direction
+    outside = (
+        (across < low - margin) |
+        (across > low + cell_size * resolution + margin)
+    ).any(axis=1)
+    origin_cells = numpy.clip(
+        ((across - low) // cell_size).astype(numpy.int64),
+        0,
+        resolution - 1
+    )
+    origin_min = cell_min[origin_cells[:, 0], origin_cells[:, 1]]
+    origin_max = cell_max[origin_cells[:, 0], origin_cells[:, 1]]
+    lower_bounds = numpy.maximum(origin_min - along, 0.0)
+    candidates = numpy.flatnonzero(
+        ~outside &
+        (along <= origin_max + margin) &
+        (lower_bounds < limit)
+    )
+    candidates = candidates[numpy.argsort(lower_bounds[candidates])]
+
+    closest = limit
+    ray_direction = mathutils.Vector(direction)
+    for lower_bound, origin in zip(
+            lower_bounds[candidates].tolist(),
+            origins[candidates].tolist()):
+        if lower_bound >= closest:
+            break
+        hit_distance = bvh.ray_cast(
+            mathutils.Vector(origin),
+            ray_direction,
+            min(closest, sys.float_info.max)
+        )[3]
+        if hit_distance is not None and hit_distance < closest:
+            closest = hit_distance
+    return closest
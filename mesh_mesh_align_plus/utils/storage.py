@@ -1,18 +1,446 @@
 """Data structures & tools for storing, modifying, and moving addon data."""
 
 
+import collections
+
 import bpy
 
+import mesh_mesh_align_plus.utils.packed_storage as maplus_packed
+
+
+# Unique name allocation for prim_list items. Each scene gets a name index
+# (the set of names in use and a per-base-name counter) so new names are
+# found in constant time instead of probing the whole list on every add.
+# Names that are no longer in use may linger in the set (e.g. after a
+# rename), that only makes the index conservative, never wrong. The index
+# is rebuilt whenever the list size no longer matches (items added or
+# removed outside of the addon) and after undo/redo/file loads
+class PrimNameIndex(object):
+    num_format = '{0}.{1:0>3}'
+
+    def __init__(self, prims):
+        self.names = {item.name for item in prims}
+        self.counters = {}
+        self.size = len(prims)
+
+    def allocate(self, base_name='Item'):
+        # Same naming scheme as Blender: Base, Base.001, Base.002...
+        if base_name not in self.names:
+            new_name = base_name
+        else:
+            counter = self.counters.get(base_name, 1)
+            new_name = self.num_format.format(base_name, counter)
+            while new_name in self.names:
+                counter += 1
+                new_name = self.num_format.format(base_name, counter)
+            self.counters[base_name] = counter + 1
+        self.names.add(new_name)
+        return new_name
+
+    def allocate_many(self, count, base_name='Item'):
+        return [self.allocate(base_name) for _ in range(count)]
+
+    def discard(self, name):
+        self.names.discard(name)
+
+
+_name_indices = {}
+
+
+def get_name_index(scene=None):
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    index = _name_indices.get(scene.as_pointer())
+    if index is None or index.size != len(prims):
+        index = PrimNameIndex(prims)
+        _name_indices[scene.as_pointer()] = index
+    return index
+
+
+@bpy.app.handlers.persistent
+def clear_prim_indices(*args):
+    _name_indices.clear()
+    _id_indices.clear()
+    _dependency_indices.clear()
+
+
+def prim_name_changed(self, context):
+    # Renames (from the UI or scripts) just claim the new name, see above
+    index = _name_indices.get(context.scene.as_pointer())
+    if index is not None:
+        index.names.add(self.name)
+
+
+# Transformation/calculation items point at other items through an index
+# into prim_list (needed for the UI lists) *and* the stable ID (uid) of the
+# target item. The uid is authoritative, indices are re-synced from it
+# whenever the list is edited
+TRANSF_REFERENCES = {
+    'ALIGNPOINTS': ('apt_pt_one', 'apt_pt_two'),
+    'DIRECTIONALSLIDE': ('ds_direction',),
+    'SCALEMATCHEDGE': ('sme_edge_one', 'sme_edge_two'),
+    'ALIGNLINES': ('aln_src_line', 'aln_dest_line'),
+    'AXISROTATE': ('axr_axis',),
+    'ALIGNPLANES': ('apl_src_plane', 'apl_dest_plane'),
+    'TRANSFSTACK': (),
+    'UNDEFINED': (),
+}
+CALC_REFERENCES = {
+    'SINGLEITEM': ('single_calc_target',),
+    'MULTIITEM': ('multi_calc_target_one', 'multi_calc_target_two'),
+}
+REFERENCE_ATTRIBS = tuple(
+    attrib
+    for references in (TRANSF_REFERENCES, CALC_REFERENCES)
+    for attribs in references.values()
+    for attrib in attribs
+)
+
+
+def reference_updater(attrib):
+    # Keep the stable ID in sync when the user picks a new target item
+    def update_reference_uid(self, context):
+        prims = context.scene.maplus_data.prim_list
+        index = getattr(self, attrib)
+        uid = prims[index].uid if 0 <= index < len(prims) else 0
+        if getattr(self, attrib + '_uid') != uid:
+            setattr(self, attrib + '_uid', uid)
+            references_changed()
+            mark_dirty(self, context.scene)
+    return update_reference_uid
+
+
+# Hash index of uid -> row in prim_list, one per scene. It is updated
+# incrementally by the addon's add/move operators (and rebuilt once after
+# a batch of removals, which shift rows anyway), and every lookup
+# is verified against the item's uid (a mismatch, from edits made outside
+# of the addon, triggers a rebuild)
+class PrimIdIndex(object):
+
+    def __init__(self, prims):
+        self.rows = {
+            item.uid: row for row, item in enumerate(prims) if item.uid
+        }
+        self.size = len(prims)
+
+    def added(self, uid):
+        self.rows[uid] = self.size
+        self.size += 1
+
+    def moved(self, from_row, to_row, prims):
+        # prims.move() shifts every item between the two rows by one
+        low, high = sorted((from_row, to_row))
+        for row in range(low, high + 1):
+            if prims[row].uid:
+                self.rows[prims[row].uid] = row
+
+
+_id_indices = {}
+
+
+def get_id_index(scene=None):
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    index = _id_indices.get(scene.as_pointer())
+    if index is None or index.size != len(prims):
+        index = PrimIdIndex(prims)
+        _id_indices[scene.as_pointer()] = index
+    return index
+
+
+def get_prim_row(uid, scene=None):
+    '''Get the row of the item with this stable ID, in O(1).
+
+    Returns:
+        Return the index into prim_list, or None if the item no longer
+        exists.
+    '''
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    index = get_id_index(scene)
+    row = index.rows.get(uid)
+    if row is None or row >= len(prims) or prims[row].uid != uid:
+        index = PrimIdIndex(prims)
+        _id_indices[scene.as_pointer()] = index
+        row = index.rows.get(uid)
+    return row
+
+
+def get_reference(item, attrib, scene=None):
+    # Resolve a reference attrib (like 'apl_src_plane') on a transformation
+    # or calculation item to the item it points to (None if it was removed)
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    uid = getattr(item, attrib + '_uid')
+    if not uid:
+        # Data from before stable IDs were introduced
+        row = getattr(item, attrib)
+    else:
+        row = get_prim_row(uid, scene)
+    if row is None or not 0 <= row < len(prims):
+        return None
+    return prims[row]
+
+
+def has_missing_references(item, scene=None):
+    if item.kind == 'TRANSFORMATION':
+        attribs = TRANSF_REFERENCES[item.transf_type]
+    elif item.kind == 'CALCULATION':
+        attribs = CALC_REFERENCES[item.calc_type]
+    else:
+        attribs = ()
+    return any(
+        get_reference(item, attrib, scene) is None for attrib in attribs
+    )
+
+
+def new_prim_uid(scene=None):
+    scene = scene if scene else bpy.context.scene
+    scene.maplus_data.prim_uid_counter += 1
+    return scene.maplus_data.prim_uid_counter
+
+
+def ensure_prim_uids(scene=None):
+    # Give stable IDs to items (and references) from older files
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    if len(get_id_index(scene).rows) == len(prims):
+        return
+    for item in prims:
+        if not item.uid:
+            item.uid = new_prim_uid(scene)
+    for item in prims:
+        if item.kind not in {'TRANSFORMATION', 'CALCULATION'}:
+            continue
+        for attrib in REFERENCE_ATTRIBS:
+            row = getattr(item, attrib)
+            if not getattr(item, attrib + '_uid') and 0 <= row < len(prims):
+                setattr(item, attrib + '_uid', prims[row].uid)
+    _id_indices[scene.as_pointer()] = PrimIdIndex(prims)
+    references_changed()
+
+
+def add_prim(name, kind, scene=None):
+    # Add an item to prim_list, keeping the name/ID indices up to date
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    ensure_prim_uids(scene)
+    name_index = get_name_index(scene)
+    id_index = get_id_index(scene)
+    new_item = prims.add()
+    name_index.size += 1
+    new_item.uid = new_prim_uid(scene)
+    id_index.added(new_item.uid)
+    new_item.name = name
+    new_item.kind = kind
+    return new_item
+
+
+def remove_prims(rows, scene=None):
+    # Remove items from prim_list, keeping the name/ID indices up to date
+    # and re-pointing references at their (moved) targets afterwards
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    ensure_prim_uids(scene)
+    name_index = get_name_index(scene)
+    rows = sorted(set(rows), reverse=True)
+    # Dependents are found while the ID index still matches the list
+    for row in rows:
+        mark_dependents_dirty(prims[row], scene)
+    for row in rows:
+        name_index.discard(prims[row].name)
+        prims.remove(row)
+        name_index.size -= 1
+    # Every row after a removed one shifted, rebuild the ID index once for
+    # the whole batch (instead of shifting it per removed row)
+    _id_indices[scene.as_pointer()] = PrimIdIndex(prims)
+    references_changed()
+    sync_references(scene)
+
+
+def move_prim(from_row, to_row, scene=None):
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    ensure_prim_uids(scene)
+    prims.move(from_row, to_row)
+    get_id_index(scene).moved(from_row, to_row, prims)
+    sync_references(scene)
+
+
+# Dependency graph over prim_list items. An item depends on the items its
+# references point to, and composed (derived) items depend on the
+# calculation item that produced them. Edits to an item mark everything
+# downstream as needing an update (needs_update); the values themselves
+# are recomputed lazily when read, see calculate_compose.evaluate_item()
+reference_revision = 0
+
+
+def references_changed():
+    global reference_revision
+    reference_revision += 1
+
+
+class DependencyIndex(object):
+
+    def __init__(self, prims):
+        # uid -> set of uids of the items that consume it
+        self.dependents = collections.defaultdict(set)
+        for item in prims:
+            if not item.uid:
+                continue
+            if item.kind in {'TRANSFORMATION', 'CALCULATION'}:
+                for attrib in REFERENCE_ATTRIBS:
+                    input_uid = getattr(item, attrib + '_uid')
+                    if input_uid:
+                        self.dependents[input_uid].add(item.uid)
+                for step in item.transf_stack:
+                    if step.uid:
+                        self.dependents[step.uid].add(item.uid)
+            if item.derived_from_uid:
+                self.dependents[item.derived_from_uid].add(item.uid)
+        self.revision = reference_revision
+
+
+_dependency_indices = {}
+
+
+def get_dependency_index(scene=None):
+    # Items added since the last build can't have dependents yet, so only
+    # reference changes (and removals) invalidate the index
+    scene = scene if scene else bpy.context.scene
+    index = _dependency_indices.get(scene.as_pointer())
+    if index is None or index.revision != reference_revision:
+        index = DependencyIndex(scene.maplus_data.prim_list)
+        _dependency_indices[scene.as_pointer()] = index
+    return index
+
+
+def mark_dirty(item, scene=None):
+    '''Mark item and everything downstream of it as needing an update.'''
+    scene = scene if scene else bpy.context.scene
+    if not item.uid:
+        return
+    prims = scene.maplus_data.prim_list
+    dependents = get_dependency_index(scene).dependents
+    if item.calc_recipe and not item.needs_update:
+        item.needs_update = True
+    pending = list(dependents.get(item.uid, ()))
+    seen = set()
+    while pending:
+        uid = pending.pop()
+        if uid in seen:
+            continue
+        seen.add(uid)
+        row = get_prim_row(uid, scene)
+        if row is None:
+            continue
+        # Already dirty items had their dependents marked before
+        if prims[row].needs_update:
+            continue
+        prims[row].needs_update = True
+        pending.extend(dependents.get(uid, ()))
+
+
+def mark_dependents_dirty(item, scene=None):
+    scene = scene if scene else bpy.context.scene
+    if not item.uid:
+        return
+    prims = scene.maplus_data.prim_list
+    for uid in get_dependency_index(scene).dependents.get(item.uid, ()):
+        row = get_prim_row(uid, scene)
+        if row is not None and not prims[row].needs_update:
+            mark_dirty(prims[row], scene)
+
+
+def geometry_changed(self, context):
+    mark_dependents_dirty(self, context.scene)
+
+
+def record_recipe(item, recipe, derived_from=None):
+    # Remember how a calculation result/composed item was computed so the
+    # dependency graph can recompute it later
+    item.calc_recipe = recipe
+    derived_from_uid = derived_from.uid if derived_from else 0
+    if item.derived_from_uid != derived_from_uid:
+        item.derived_from_uid = derived_from_uid
+        references_changed()
+    item.needs_update = False
+
+
+def sync_references(scene=None):
+    # Point every list index back at its (stable ID) target after items
+    # were removed or moved. Targets that no longer exist keep their old
+    # index but are reported as missing by has_missing_references()
+    scene = scene if scene else bpy.context.scene
+    prims = scene.maplus_data.prim_list
+    index = get_id_index(scene)
+    for item in prims:
+        if item.kind not in {'TRANSFORMATION', 'CALCULATION'}:
+            continue
+        for attrib in REFERENCE_ATTRIBS:
+            uid = getattr(item, attrib + '_uid')
+            row = index.rows.get(uid) if uid else None
+            if row is not None and getattr(item, attrib) != row:
+                # Setting the index re-runs the updater with the same uid
+                setattr(item, attrib, row)
+
+
+# One step of a transformation stack, refers to a transformation item in
+# prim_list by stable ID
+class MAPlusStackStep(bpy.types.PropertyGroup):
+    uid: bpy.props.IntProperty(
+        description="Stable ID of the transformation item for this step",
+        default=0
+    )
+    enabled: bpy.props.BoolProperty(
+        description="Include this step when the stack is applied",
+        default=True
+    )
+
+
+# A live alignment relation: keeps a target object aligned, by a
+# transformation item in prim_list (referred to by stable ID), to a
+# reference object that its destination operand follows
+class MAPlusRelation(bpy.types.PropertyGroup):
+    transf_uid: bpy.props.IntProperty(
+        description="Stable ID of the transformation item for this relation",
+        default=0
+    )
+    target: bpy.props.PointerProperty(
+        type=bpy.types.Object,
+        description="Object kept aligned by this relation"
+    )
+    reference: bpy.props.PointerProperty(
+        type=bpy.types.Object,
+        description="Object the transformation's destination follows"
+    )
+    enabled: bpy.props.BoolProperty(
+        description="Keep this relation updated",
+        default=True
+    )
+    # World matrices of the target and reference when the relation was
+    # made (flattened, row major)
+    bind_target_matrix: bpy.props.FloatVectorProperty(size=16)
+    bind_reference_matrix: bpy.props.FloatVectorProperty(size=16)
+
 
 # This is the basic data structure for the addon. The item can be a point,
 # line, plane, calc, or transf (only one at a time), chosen by the user
 # (defaults to point). A MAPlusPrimitive always has data slots for each of
 # these types, regardless of which 'kind' the item is currently
 class MAPlusPrimitive(bpy.types.PropertyGroup):
+    uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of this item, other items refer to it by this ID"
+            " (0 for items that are not in the list)"
+        ),
+        default=0
+    )
     name: bpy.props.StringProperty(
         name="Item name",
         description="The name of this item",
-        default="Name"
+        default="Name",
+        update=prim_name_changed
     )
     kind: bpy.props.EnumProperty(
         items=[
@@ -27,20 +455,46 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
         description="The type of this item"
     )
 
+    # Dependency graph data, see mark_dirty()
+    calc_recipe: bpy.props.StringProperty(
+        description=(
+            "The calculation that produced this item's result (empty"
+            " for items that aren't computed from other items)"
+        ),
+        default=""
+    )
+    derived_from_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the calculation item this item was composed"
+            " from (0 if it wasn't composed)"
+        ),
+        default=0
+    )
+    needs_update: bpy.props.BoolProperty(
+        description=(
+            "An item this one depends on has changed since it was last"
+            " computed/applied"
+        ),
+        default=False
+    )
+
     # Point primitive data/settings
     # DuplicateItemBase depends on a complete list of these attribs
     point: bpy.props.FloatVectorProperty(
         description="Point primitive coordinates",
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
     pt_make_unit_vec: bpy.props.BoolProperty(
-        description="Treat the point like a vector of length 1"
+        description="Treat the point like a vector of length 1",
+        update=geometry_changed
     )
     pt_flip_direction: bpy.props.BoolProperty(
         description=(
             "Treat the point like a vector pointing in"
             " the opposite direction"
-        )
+        ),
+        update=geometry_changed
     )
     pt_multiplier: bpy.props.FloatProperty(
         description=(
@@ -48,44 +502,87 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             " its length by this value"
         ),
         default=1.0,
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
 
     # Line primitive data/settings
     # DuplicateItemBase depends on a complete list of these attribs
     line_start: bpy.props.FloatVectorProperty(
         description="Line primitive, starting point coordinates",
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
     line_end: bpy.props.FloatVectorProperty(
         description="Line primitive, ending point coordinates",
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
     ln_make_unit_vec: bpy.props.BoolProperty(
-        description="Make the line's length 1"
+        description="Make the line's length 1",
+        update=geometry_changed
     )
     ln_flip_direction: bpy.props.BoolProperty(
-        description="Point the line in the opposite direction"
+        description="Point the line in the opposite direction",
+        update=geometry_changed
     )
     ln_multiplier: bpy.props.FloatProperty(
         description="Multiply the line's length by this amount",
         default=1.0,
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
 
     # Plane primitive data
     # DuplicateItemBase depends on a complete list of these attribs
     plane_pt_a: bpy.props.FloatVectorProperty(
         description="Plane primitive, point A coordinates",
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
     plane_pt_b: bpy.props.FloatVectorProperty(
         description="Plane primitive, point B coordinates",
-        precision=6
+        precision=6,
+        update=geometry_changed
     )
     plane_pt_c: bpy.props.FloatVectorProperty(
         description="Plane primitive, point C coordinates",
-        precision=6
+        precision=6,
+        update=geometry_changed
+    )
+
+    # Topology binding (point, line and plane items), see
+    # utils/topology_refs.py. A bound item's coords are resolved from the
+    # mesh when read, the stored coords are its last resolved ones
+    bind_object: bpy.props.PointerProperty(
+        type=bpy.types.Object,
+        description=(
+            "Mesh object this item's coords follow (none: the stored"
+            " coords are used)"
+        ),
+        update=geometry_changed
+    )
+    bind_element: bpy.props.EnumProperty(
+        items=[
+            ('VERT',
+             'Vertices',
+             'Bound to 1 to 3 vertices (one per point of the item)'),
+            ('FACE',
+             'Face',
+             'Bound to a face (its center, normal or first 3 vertices)')
+        ],
+        name="Bound Element",
+        description="The type of mesh element the item is bound to",
+        default='VERT',
+        update=geometry_changed
+    )
+    bind_indices: bpy.props.IntVectorProperty(
+        description=(
+            "Indices of the bound vertices (or the face, first index only)"
+        ),
+        size=3,
+        default=(-1, -1, -1),
+        update=geometry_changed
     )
 
     # Calculation primitive data/settings
@@ -108,6 +605,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             "Pointer to an item in the list, the item that"
             " the calculation will be based on."
         ),
+        default=0,
+        update=reference_updater('single_calc_target')
+    )
+    single_calc_target_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     # active item indices for the multi item calc lists
@@ -116,6 +621,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             "Pointer to an item in the list, the first item that"
             " the calculation will be based on."
         ),
+        default=0,
+        update=reference_updater('multi_calc_target_one')
+    )
+    multi_calc_target_one_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     multi_calc_target_two: bpy.props.IntProperty(
@@ -123,6 +636,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             "Pointer to an item in the list, the second item that"
             " the calculation will be based on."
         ),
+        default=0,
+        update=reference_updater('multi_calc_target_two')
+    )
+    multi_calc_target_two_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
 
@@ -158,6 +679,9 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             ('ALIGNPLANES',
              'Align Planes',
              'Make planes coplanar'),
+            ('TRANSFSTACK',
+             'Transformation Stack',
+             'Apply a sequence of transformations in one pass'),
             ('UNDEFINED',
              'Undefined',
              'The transformation type has not been set')
@@ -173,6 +697,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             "Pointer to an item in the list, the source point"
             " (this point will be 'moved' to match the destination)."
         ),
+        default=0,
+        update=reference_updater('apt_pt_one')
+    )
+    apt_pt_one_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     apt_pt_two: bpy.props.IntProperty(
@@ -181,6 +713,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             " (this is a fixed reference location, where"
             " the source point will be 'moved' to)."
         ),
+        default=0,
+        update=reference_updater('apt_pt_two')
+    )
+    apt_pt_two_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     apt_make_unit_vector: bpy.props.BoolProperty(
@@ -203,6 +743,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             "Pointer to an item in the list, the source plane"
             " (this plane will be 'moved' to match the destination)."
         ),
+        default=0,
+        update=reference_updater('apl_src_plane')
+    )
+    apl_src_plane_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     apl_dest_plane: bpy.props.IntProperty(
@@ -211,6 +759,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             " (this is a fixed reference location, where"
             " the source plane will be 'moved' to)."
         ),
+        default=0,
+        update=reference_updater('apl_dest_plane')
+    )
+    apl_dest_plane_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     apl_flip_normal: bpy.props.BoolProperty(
@@ -239,6 +795,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             "Pointer to an item in the list, the source line"
             " (this line will be 'moved' to match the destination)."
         ),
+        default=0,
+        update=reference_updater('aln_src_line')
+    )
+    aln_src_line_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     aln_dest_line: bpy.props.IntProperty(
@@ -247,6 +811,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             " (this is a fixed reference location, where"
             " the source line will be 'moved' to)."
         ),
+        default=0,
+        update=reference_updater('aln_dest_line')
+    )
+    aln_dest_line_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     aln_flip_direction: bpy.props.BoolProperty(
@@ -257,6 +829,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
     # "Axis rotate" (transformation) data/settings
     axr_axis: bpy.props.IntProperty(
         description="The axis to rotate around",
+        default=0,
+        update=reference_updater('axr_axis')
+    )
+    axr_axis_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     axr_amount: bpy.props.FloatProperty(
@@ -272,12 +852,20 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
     # "Directional slide" (transformation) data/settings
     ds_direction: bpy.props.IntProperty(
         description="The direction to move",
-        default=0
+        default=0,
+        update=reference_updater('ds_direction')
     )  # This is a list item pointer
     ds_make_unit_vec: bpy.props.BoolProperty(
         description="Make the line's length 1",
         default=False
     )
+    ds_direction_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
+        default=0
+    )
     ds_flip_direction: bpy.props.BoolProperty(
         description="Flip source line direction",
         default=False
@@ -295,6 +883,14 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             " (this edge will be scaled to match"
             " the destination edge's length)."
         ),
+        default=0,
+        update=reference_updater('sme_edge_one')
+    )
+    sme_edge_one_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
         default=0
     )
     sme_edge_two: bpy.props.IntProperty(
@@ -304,6 +900,28 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
             " how much to scale the source edge so that its length"
             " matches the length of this edge)."
         ),
+        default=0,
+        update=reference_updater('sme_edge_two')
+    )
+    sme_edge_two_uid: bpy.props.IntProperty(
+        description=(
+            "Stable ID of the referenced item (keeps the reference"
+            " intact when items are added, removed or moved)"
+        ),
+        default=0
+    )
+
+    # "Transformation Stack" (transformation) data/settings
+    transf_stack: bpy.props.CollectionProperty(type=MAPlusStackStep)
+    transf_stack_active: bpy.props.IntProperty(
+        description="The selected step in the transformation stack",
+        default=0
+    )
+    transf_stack_pick: bpy.props.IntProperty(
+        description=(
+            "Pointer to an item in the list, the transformation to add"
+            " to the stack as a new step"
+        ),
         default=0
     )
 
@@ -311,6 +929,8 @@ class MAPlusPrimitive(bpy.types.PropertyGroup):
 # Defines one instance of the addon data (one per scene)
 class MAPlusData(bpy.types.PropertyGroup):
     prim_list: bpy.props.CollectionProperty(type=MAPlusPrimitive)
+    # last stable ID handed out to a prim_list item (IDs are never reused)
+    prim_uid_counter: bpy.props.IntProperty(default=0)
     # stores index of active primitive in my UIList
     active_list_item: bpy.props.IntProperty()
     use_experimental: bpy.props.BoolProperty(
@@ -322,6 +942,64 @@ class MAPlusData(bpy.types.PropertyGroup):
             ' until non-uniform scaling is supported.'
         )
     )
+    mesh_falloff_use: bpy.props.BoolProperty(
+        description=(
+            'Proportional falloff for "Mesh Piece" transforms: unselected'
+            ' verts near the selection move part of the way, blending'
+            ' into the rest of the mesh'
+        ),
+        default=False
+    )
+    mesh_falloff_radius: bpy.props.FloatProperty(
+        description=(
+            "Falloff radius (global units, measured from the nearest"
+            " selected vert)"
+        ),
+        default=1.0,
+        min=0.0,
+        precision=6
+    )
+    mesh_falloff_curve: bpy.props.EnumProperty(
+        items=[
+            ('SMOOTH', 'Smooth', 'Smooth falloff'),
+            ('SPHERE', 'Sphere', 'Spherical falloff'),
+            ('ROOT', 'Root', 'Root falloff'),
+            ('SHARP', 'Sharp', 'Sharp falloff'),
+            ('LINEAR', 'Linear', 'Linear falloff')
+        ],
+        name="Falloff",
+        description="Falloff curve, like proportional editing's",
+        default='SMOOTH'
+    )
+    mesh_transform_shape_keys: bpy.props.BoolProperty(
+        description=(
+            'Apply mesh level transforms to every shape key too, so'
+            ' shape keys stay consistent with the transformed mesh'
+        ),
+        default=False
+    )
+    mesh_journal_use: bpy.props.BoolProperty(
+        description=(
+            'Undo-light mesh ops: mesh level transforms skip Blender\'s'
+            ' undo (no full mesh copy per step) and record only their'
+            ' matrix and moved verts in the addon\'s own journal, undo'
+            ' and redo them from the journal panel'
+        ),
+        default=False
+    )
+    mesh_journal_max_steps: bpy.props.IntProperty(
+        description="Number of journaled steps kept (oldest are dropped)",
+        default=32,
+        min=1
+    )
+    vertex_group_blend: bpy.props.BoolProperty(
+        description=(
+            'Blend vertex group transforms by weight: each vert moves'
+            ' part of the way, by its weight (otherwise every vert in'
+            ' the group gets the full transform)'
+        ),
+        default=False
+    )
 
     # Items for the quick operators
     quick_align_pts_show: bpy.props.BoolProperty(
@@ -384,6 +1062,40 @@ class MAPlusData(bpy.types.PropertyGroup):
     quick_directional_slide_transf: bpy.props.PointerProperty(
         type=MAPlusPrimitive
     )
+    quick_ds_contact_obstacles: bpy.props.EnumProperty(
+        items=[
+            ('SELECTED',
+             'Selected Meshes',
+             'Slide the active object until it hits another selected'
+             ' mesh object'),
+            ('VISIBLE',
+             'Visible Meshes',
+             'Slide the active object until it hits any other visible'
+             ' mesh object')
+        ],
+        name="Obstacles",
+        description="Objects the active object slides into",
+        default='SELECTED'
+    )
+    quick_ds_contact_source: bpy.props.EnumProperty(
+        items=[
+            ('VERTS',
+             'Mesh',
+             "Test contact with the active object's mesh"),
+            ('HULL',
+             'Convex Hull',
+             "Test contact with the convex hull of the active object's"
+             " mesh (faster for dense meshes, less exact)")
+        ],
+        name="Contact Shape",
+        description="Shape of the sliding object used for contact tests",
+        default='VERTS'
+    )
+    quick_ds_contact_gap: bpy.props.FloatProperty(
+        description="Distance to stop short of the contact point",
+        default=0.0,
+        precision=6
+    )
 
     quick_scale_match_edge_show: bpy.props.BoolProperty(
         description=(
@@ -446,6 +1158,29 @@ class MAPlusData(bpy.types.PropertyGroup):
     quick_sme_numeric_dest: bpy.props.PointerProperty(
         type=MAPlusPrimitive
     )
+    quick_sme_batch_rule: bpy.props.EnumProperty(
+        items=[
+            ('LONGEST',
+             'Longest Edge',
+             'Scale each island so its longest edge matches the target'
+             ' length'),
+            ('SHORTEST',
+             'Shortest Edge',
+             'Scale each island so its shortest (non-zero) edge matches'
+             ' the target length'),
+            ('SELECTED',
+             'Selected Edge',
+             'Scale each island so its selected edge (the longest, if'
+             ' several are selected) matches the target length, islands'
+             ' without a selected edge are left alone')
+        ],
+        name="Reference Edge",
+        description=(
+            "Which edge of each island is matched to the target length"
+            " in batch (per island) mode"
+        ),
+        default='SELECTED'
+    )
 
     quick_align_lines_show: bpy.props.BoolProperty(
         description=(
@@ -500,6 +1235,33 @@ class MAPlusData(bpy.types.PropertyGroup):
     )
     quick_axis_rotate_src: bpy.props.PointerProperty(type=MAPlusPrimitive)
     quick_axis_rotate_transf: bpy.props.PointerProperty(type=MAPlusPrimitive)
+    quick_axr_batch_axis: bpy.props.EnumProperty(
+        items=[
+            ('LOCAL_X',
+             'Local X',
+             "Each object's local X axis, through its origin"),
+            ('LOCAL_Y',
+             'Local Y',
+             "Each object's local Y axis, through its origin"),
+            ('LOCAL_Z',
+             'Local Z',
+             "Each object's local Z axis, through its origin"),
+            ('BOUND_BOX',
+             'Longest Bound Box Edge',
+             "The direction of the longest edge of each object's bounding"
+             " box, through the bounding box center"),
+            ('STORED',
+             'Stored Axis',
+             'An axis line stored on each object (objects without one'
+             ' are skipped)')
+        ],
+        name="Axis",
+        description=(
+            "Axis each object is rotated around, when rotating each"
+            " object around its own axis"
+        ),
+        default='LOCAL_Z'
+    )
 
     quick_align_planes_show: bpy.props.BoolProperty(
         description=(
@@ -608,6 +1370,430 @@ class MAPlusData(bpy.types.PropertyGroup):
     internal_storage_slot_2: bpy.props.PointerProperty(type=MAPlusPrimitive)
     internal_storage_clipboard: bpy.props.PointerProperty(type=MAPlusPrimitive)
 
+    # Packed reference library, these are views on the active packed item
+    # (the items themselves live in packed buffers, see packed_storage.py)
+    packed_active_index: bpy.props.IntProperty(
+        description="Index of the active item in the packed library",
+        default=0,
+        min=0
+    )
+    packed_active_name: bpy.props.StringProperty(
+        description="Name of the active packed library item",
+        get=maplus_packed.get_packed_name,
+        set=maplus_packed.set_packed_name
+    )
+    packed_active_pt_a: bpy.props.FloatVectorProperty(
+        description="Active packed item, first point coordinates",
+        get=maplus_packed.get_packed_pt_a,
+        set=maplus_packed.set_packed_pt_a,
+        precision=6
+    )
+    packed_active_pt_b: bpy.props.FloatVectorProperty(
+        description="Active packed item, second point coordinates",
+        get=maplus_packed.get_packed_pt_b,
+        set=maplus_packed.set_packed_pt_b,
+        precision=6
+    )
+    packed_active_pt_c: bpy.props.FloatVectorProperty(
+        description="Active packed item, third point coordinates",
+        get=maplus_packed.get_packed_pt_c,
+        set=maplus_packed.set_packed_pt_c,
+        precision=6
+    )
+
+    # Object box (oriented bounding box) reference settings, see
+    # object_box.py. Box axes are matched to the object's local axes
+    object_box_point: bpy.props.EnumProperty(
+        items=[
+            ('CENTER', 'Center', 'The center of the box'),
+            ('NEG_Z',
+             '-Z Face (Bottom)',
+             'The center of the bottom face of the box'),
+            ('POS_Z',
+             '+Z Face (Top)',
+             'The center of the top face of the box'),
+            ('NEG_X', '-X Face', 'The center of the -X face of the box'),
+            ('POS_X', '+X Face', 'The center of the +X face of the box'),
+            ('NEG_Y', '-Y Face', 'The center of the -Y face of the box'),
+            ('POS_Y', '+Y Face', 'The center of the +Y face of the box')
+        ],
+        name="Box Point",
+        description="Point of the active object's box to grab",
+        default='CENTER'
+    )
+    object_box_axis: bpy.props.EnumProperty(
+        items=[
+            ('X',
+             'X Axis',
+             'The X center line of the box (as long as the box)'),
+            ('Y',
+             'Y Axis',
+             'The Y center line of the box (as long as the box)'),
+            ('Z',
+             'Z Axis',
+             'The Z center line of the box (as long as the box)')
+        ],
+        name="Box Line",
+        description="Line of the active object's box to grab",
+        default='Z'
+    )
+    object_box_face: bpy.props.EnumProperty(
+        items=[
+            ('NEG_Z', '-Z Face (Bottom)', 'The bottom face of the box'),
+            ('POS_Z', '+Z Face (Top)', 'The top face of the box'),
+            ('NEG_X', '-X Face', 'The -X face of the box'),
+            ('POS_X', '+X Face', 'The +X face of the box'),
+            ('NEG_Y', '-Y Face', 'The -Y face of the box'),
+            ('POS_Y', '+Y Face', 'The +Y face of the box')
+        ],
+        name="Box Face",
+        description=(
+            "Face of the active object's box to grab (as a plane facing"
+            " out of the box)"
+        ),
+        default='NEG_Z'
+    )
+
+    # Instance grab settings, see instance_grab.py
+    instance_grab_query: bpy.props.EnumProperty(
+        items=[
+            ('CURSOR',
+             '3D Cursor',
+             'The instance nearest the 3D cursor'),
+            ('VIEW_RAY',
+             'View Ray',
+             'The first instance hit by the view ray through the 3D cursor')
+        ],
+        name="Instance Query",
+        description="How the instance to grab from is picked",
+        default='CURSOR'
+    )
+    instance_grab_source: bpy.props.EnumProperty(
+        items=[
+            ('BOUNDS',
+             'Bounds',
+             "An element of the instance's bounding box (see the box"
+             " settings)"),
+            ('VERTICES',
+             'Vertices',
+             'The instance vertices (or points) nearest the query')
+        ],
+        name="Instance Source",
+        description="What to grab from the picked instance",
+        default='BOUNDS'
+    )
+
+    # Bounds align/distribute settings (quick align objects)
+    quick_bounds_axis: bpy.props.EnumProperty(
+        items=[
+            ('X', 'X', 'Lay objects out along the global X axis'),
+            ('Y', 'Y', 'Lay objects out along the global Y axis'),
+            ('Z', 'Z', 'Lay objects out along the global Z axis')
+        ],
+        name="Axis",
+        description="Global axis to align/distribute along",
+        default='X'
+    )
+    quick_bounds_anchor: bpy.props.EnumProperty(
+        items=[
+            ('MIN', 'Min', 'Line up the low sides of the bounds'),
+            ('CENTER', 'Center', 'Line up the centers of the bounds'),
+            ('MAX', 'Max', 'Line up the high sides of the bounds')
+        ],
+        name="Anchor",
+        description="Part of each bounding box to line up",
+        default='MIN'
+    )
+    quick_bounds_align_to: bpy.props.EnumProperty(
+        items=[
+            ('SELECTION',
+             'Selection',
+             'Line up with the bounds of the whole selection'),
+            ('ACTIVE',
+             'Active',
+             'Line up with the bounds of the active object')
+        ],
+        name="Align To",
+        description="Bounds the objects are lined up with",
+        default='SELECTION'
+    )
+    quick_bounds_spacing: bpy.props.EnumProperty(
+        items=[
+            ('CENTERS',
+             'Even Spacing',
+             'Equal distance between object centers'),
+            ('GAPS',
+             'Even Gaps',
+             'Equal empty space between neighbouring objects')
+        ],
+        name="Spacing",
+        description="How distributed objects are spaced",
+        default='GAPS'
+    )
+
+    # Drop to surface settings (quick align objects)
+    quick_drop_direction: bpy.props.EnumProperty(
+        items=[
+            ('NEG_Z', '-Z (Down)', 'Drop along the global -Z axis'),
+            ('POS_Z', '+Z (Up)', 'Drop along the global +Z axis'),
+            ('NEG_X', '-X', 'Drop along the global -X axis'),
+            ('POS_X', '+X', 'Drop along the global +X axis'),
+            ('NEG_Y', '-Y', 'Drop along the global -Y axis'),
+            ('POS_Y', '+Y', 'Drop along the global +Y axis')
+        ],
+        name="Direction",
+        description="Direction the selected objects are dropped in",
+        default='NEG_Z'
+    )
+    quick_drop_align_normal: bpy.props.BoolProperty(
+        description=(
+            "Tilt each dropped object to match the surface normal at the"
+            " point where it lands"
+        ),
+        default=False
+    )
+    quick_drop_offset: bpy.props.FloatProperty(
+        description=(
+            "Distance to keep between each object and the surface"
+            " (negative values sink the objects in)"
+        ),
+        default=0.0,
+        precision=6
+    )
+
+    # Batch (all-pairs) measurement settings, see batch_measure.py
+    batch_measure_kind: bpy.props.EnumProperty(
+        items=[
+            ('DISTANCE',
+             'Point Distances',
+             'Distance between every pair of point items'),
+            ('ANGLE',
+             'Line Angles',
+             'Angle between every pair of line items')
+        ],
+        name="Measurement",
+        description="What to measure between every pair of items",
+        default='DISTANCE'
+    )
+    batch_measure_source: bpy.props.EnumProperty(
+        items=[
+            ('LIST',
+             'Advanced Tools List',
+             'Measure the items in the advanced tools list'),
+            ('PACKED',
+             'Packed Library',
+             'Measure the items in the packed library')
+        ],
+        name="Items",
+        description="Where to take the measured items from",
+        default='LIST'
+    )
+    batch_measure_filter: bpy.props.EnumProperty(
+        items=[
+            ('ALL',
+             'All Pairs',
+             'Keep every pair'),
+            ('WITHIN',
+             'Within Tolerance',
+             'Keep pairs whose value is within tolerance of the nominal'
+             ' value'),
+            ('OUTSIDE',
+             'Outside Tolerance',
+             'Keep pairs whose value is not within tolerance of the'
+             ' nominal value')
+        ],
+        name="Filter",
+        description="Which pairs to keep in the results",
+        default='ALL'
+    )
+    batch_measure_nominal: bpy.props.FloatProperty(
+        description="Nominal value for the tolerance filter",
+        default=0.0,
+        precision=6
+    )
+    batch_measure_tolerance: bpy.props.FloatProperty(
+        description="Allowed deviation from the nominal value",
+        default=0.0,
+        min=0.0,
+        precision=6
+    )
+    batch_measure_chunk_size: bpy.props.IntProperty(
+        description=(
+            "Number of matrix rows computed at once (bounds memory use"
+            " for large item counts)"
+        ),
+        default=256,
+        min=1
+    )
+
+    # Whole mesh survey settings, see mesh_survey.py
+    survey_measure: bpy.props.EnumProperty(
+        items=[
+            ('EDGE_LENGTH',
+             'Edge Lengths',
+             'Length of every edge'),
+            ('DIHEDRAL',
+             'Dihedral Angles',
+             'Angle between the face normals of every manifold edge'
+             ' (edges with exactly two faces)'),
+            ('CORNER',
+             'Face Corner Angles',
+             'Interior angle of every face corner')
+        ],
+        name="Survey",
+        description="What to measure over the active mesh",
+        default='EDGE_LENGTH'
+    )
+    survey_selected_only: bpy.props.BoolProperty(
+        description=(
+            "Only survey selected edges (edge lengths/dihedral angles)"
+            " or selected faces (corner angles)"
+        ),
+        default=True
+    )
+    survey_world_space: bpy.props.BoolProperty(
+        description=(
+            "Measure in global space (object transforms are applied),"
+            " otherwise measure in the object's local space"
+        ),
+        default=True
+    )
+    survey_bins: bpy.props.IntProperty(
+        description="Number of histogram bins",
+        default=20,
+        min=1,
+        max=200
+    )
+    survey_nominal: bpy.props.FloatProperty(
+        description="Nominal (spec) value, for finding outliers",
+        default=0.0,
+        precision=6
+    )
+    survey_tolerance: bpy.props.FloatProperty(
+        description=(
+            "Allowed deviation from the nominal value, values further"
+            " away are outliers (0 disables the outlier check)"
+        ),
+        default=0.0,
+        min=0.0,
+        precision=6
+    )
+    survey_chunk_size: bpy.props.IntProperty(
+        description=(
+            "Number of elements processed at once (bounds memory use"
+            " on very large meshes)"
+        ),
+        default=65536,
+        min=1
+    )
+
+    # Array pattern settings, see array_pattern.py
+    pattern_count_a: bpy.props.IntProperty(
+        description=(
+            "Number of stations along the line (or along the plane's"
+            " B to A edge)"
+        ),
+        default=5,
+        min=1
+    )
+    pattern_count_b: bpy.props.IntProperty(
+        description=(
+            "Number of stations across the plane (toward pt C), unused"
+            " for lines"
+        ),
+        default=1,
+        min=1
+    )
+    pattern_spacing_mode: bpy.props.EnumProperty(
+        items=[
+            ('FIT',
+             'Fit to Item',
+             'Spread the stations evenly over the full line/plane'),
+            ('DISTANCE',
+             'Fixed Distance',
+             'Fixed distance between neighbouring stations')
+        ],
+        name="Spacing",
+        description="How the pattern's stations are spaced",
+        default='FIT'
+    )
+    pattern_spacing_a: bpy.props.FloatProperty(
+        description="Distance between stations along the rows",
+        default=1.0,
+        precision=6
+    )
+    pattern_spacing_b: bpy.props.FloatProperty(
+        description="Distance between stations along the columns",
+        default=1.0,
+        precision=6
+    )
+    pattern_output: bpy.props.EnumProperty(
+        items=[
+            ('LINKED',
+             'Linked Duplicates',
+             'Copies of the active object, sharing its object data'),
+            ('INSTANCE',
+             'Collection Instances',
+             'Empties instancing a collection')
+        ],
+        name="Output",
+        description="What to place at each station",
+        default='LINKED'
+    )
+    pattern_instance_collection: bpy.props.PointerProperty(
+        type=bpy.types.Collection,
+        description="Collection to instance at each station"
+    )
+
+    # Alignment bake settings, see alignment_bake.py
+    bake_reference_object: bpy.props.PointerProperty(
+        type=bpy.types.Object,
+        description=(
+            "Animated object the destination of the active"
+            " transformation item moves with"
+        )
+    )
+    bake_use_scene_range: bpy.props.BoolProperty(
+        description="Bake the scene's frame range",
+        default=True
+    )
+    bake_frame_start: bpy.props.IntProperty(
+        description="First frame to bake",
+        default=1
+    )
+    bake_frame_end: bpy.props.IntProperty(
+        description="Last frame to bake",
+        default=250
+    )
+    bake_frame_step: bpy.props.IntProperty(
+        description="Number of frames between baked keys",
+        default=1,
+        min=1
+    )
+
+    # Live alignment relations, see live_relations.py
+    relations: bpy.props.CollectionProperty(type=MAPlusRelation)
+    relations_active: bpy.props.IntProperty(
+        description="The selected relation",
+        default=0
+    )
+    relations_live: bpy.props.BoolProperty(
+        description="Re-evaluate relations when their inputs change",
+        default=True
+    )
+    relation_reference_object: bpy.props.PointerProperty(
+        type=bpy.types.Object,
+        description="Reference object for new relations"
+    )
+    relation_time_budget: bpy.props.FloatProperty(
+        description=(
+            "Time (in milliseconds) relations may take per update, the"
+            " rest are finished on the following updates"
+        ),
+        default=5.0,
+        min=0.1
+    )
+
 
 def copy_source_attribs_to_dest(source, dest, set_attribs=None):
     if set_attribs:
@@ -765,272 +1951,126 @@ class MAPLUS_OT_CopyToOtherBase(bpy.types.Operator):
         return {'FINISHED'}
 
 
-
-class MAPLUS_OT_PasteIntoAdvToolsActive(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoadvtoolsactive"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'ADVTOOLSACTIVE')
-
-
-class MAPLUS_OT_CopyFromAdvToolsActive(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromadvtoolsactive"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('ADVTOOLSACTIVE', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoSlot1(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoslot1"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'SLOT1')
-
-
-class MAPLUS_OT_CopyFromSlot1(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromslot1"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('SLOT1', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoSlot2(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoslot2"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'SLOT2')
-
-
-class MAPLUS_OT_CopyFromSlot2(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromslot2"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('SLOT2', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_CopyFromCalcResult(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromcalcresult"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('CALCRESULT', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoCalcResult(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintocalcresult"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'CALCRESULT')
-
-
-class MAPLUS_OT_PasteIntoAptSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoaptsrc"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'APTSRC')
-
-
-class MAPLUS_OT_CopyFromAptSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromaptsrc"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('APTSRC', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoAptDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoaptdest"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'APTDEST')
-
-
-class MAPLUS_OT_CopyFromAptDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromaptdest"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('APTDEST', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoAlnSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoalnsrc"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'ALNSRC')
-
-
-class MAPLUS_OT_CopyFromAlnSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromalnsrc"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('ALNSRC', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoAlnDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoalndest"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'ALNDEST')
-
-
-class MAPLUS_OT_CopyFromAlnDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromalndest"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('ALNDEST', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoAplSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoaplsrc"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'APLSRC')
-
-
-class MAPLUS_OT_CopyFromAplSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromaplsrc"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('APLSRC', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoAplDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoapldest"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'APLDEST')
-
-
-class MAPLUS_OT_PasteIntoAplSetOriginModeDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoaplsetoriginmodedest"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'APL_SET_ORIGIN_MODE_DEST')
-
-
-class MAPLUS_OT_CopyFromAplDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromapldest"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('APLDEST', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_CopyFromAplSetOriginModeDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromaplsetoriginmodedest"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('APL_SET_ORIGIN_MODE_DEST', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoAxrSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintoaxrsrc"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'AXRSRC')
-
-
-class MAPLUS_OT_CopyFromAxrSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromaxrsrc"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('AXRSRC', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoDsSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintodssrc"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'DSSRC')
-
-
-class MAPLUS_OT_CopyFromDsSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromdssrc"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('DSSRC', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoSmeSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintosmesrc"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'SMESRC')
-
-
-class MAPLUS_OT_CopyFromSmeSrc(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromsmesrc"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('SMESRC', 'INTERNALCLIPBOARD')
-
-
-class MAPLUS_OT_PasteIntoSmeDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.pasteintosmedest"
-    bl_label = "Paste into this item"
-    bl_description = "Pastes from the internal clipboard into this item"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('INTERNALCLIPBOARD', 'SMEDEST')
-
-
-class MAPLUS_OT_CopyFromSmeDest(MAPLUS_OT_CopyToOtherBase):
-    bl_idname = "maplus.copyfromsmedest"
-    bl_label = "Copy from this item"
-    bl_description = "Copies this item into the internal clipboard"
-    bl_options = {'REGISTER', 'UNDO'}
-    # A tuple of strings indicating the source and destination
-    source_dest_pair = ('SMEDEST', 'INTERNALCLIPBOARD')
+# Declarative tables for the many near-identical operator variants (one per
+# quick tool/slot/attribute combination). Each table row is a class name
+# (without the MAPLUS_OT_ prefix) and the class attributes that differ from
+# the table defaults; bl_idname is derived from the class name. The actual
+# operator classes are only built when the addon is registered, see
+# utils/system.py
+
+COPY_TO_OTHER_DEFAULTS = {
+    'bl_label': 'Paste into this item',
+    'bl_description': 'Pastes from the internal clipboard into this item',
+}
+COPY_TO_OTHER_VARIANTS = (
+    ('PasteIntoAdvToolsActive', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'ADVTOOLSACTIVE'),
+    }),
+    ('CopyFromAdvToolsActive', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('ADVTOOLSACTIVE', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoSlot1', {'source_dest_pair': ('INTERNALCLIPBOARD', 'SLOT1')}),
+    ('CopyFromSlot1', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('SLOT1', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoSlot2', {'source_dest_pair': ('INTERNALCLIPBOARD', 'SLOT2')}),
+    ('CopyFromSlot2', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('SLOT2', 'INTERNALCLIPBOARD'),
+    }),
+    ('CopyFromCalcResult', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('CALCRESULT', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoCalcResult', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'CALCRESULT'),
+    }),
+    ('PasteIntoAptSrc', {'source_dest_pair': ('INTERNALCLIPBOARD', 'APTSRC')}),
+    ('CopyFromAptSrc', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('APTSRC', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoAptDest', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'APTDEST'),
+    }),
+    ('CopyFromAptDest', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('APTDEST', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoAlnSrc', {'source_dest_pair': ('INTERNALCLIPBOARD', 'ALNSRC')}),
+    ('CopyFromAlnSrc', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('ALNSRC', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoAlnDest', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'ALNDEST'),
+    }),
+    ('CopyFromAlnDest', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('ALNDEST', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoAplSrc', {'source_dest_pair': ('INTERNALCLIPBOARD', 'APLSRC')}),
+    ('CopyFromAplSrc', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('APLSRC', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoAplDest', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'APLDEST'),
+    }),
+    ('PasteIntoAplSetOriginModeDest', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'APL_SET_ORIGIN_MODE_DEST'),
+    }),
+    ('CopyFromAplDest', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('APLDEST', 'INTERNALCLIPBOARD'),
+    }),
+    ('CopyFromAplSetOriginModeDest', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('APL_SET_ORIGIN_MODE_DEST', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoAxrSrc', {'source_dest_pair': ('INTERNALCLIPBOARD', 'AXRSRC')}),
+    ('CopyFromAxrSrc', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('AXRSRC', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoDsSrc', {'source_dest_pair': ('INTERNALCLIPBOARD', 'DSSRC')}),
+    ('CopyFromDsSrc', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('DSSRC', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoSmeSrc', {'source_dest_pair': ('INTERNALCLIPBOARD', 'SMESRC')}),
+    ('CopyFromSmeSrc', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('SMESRC', 'INTERNALCLIPBOARD'),
+    }),
+    ('PasteIntoSmeDest', {
+        'source_dest_pair': ('INTERNALCLIPBOARD', 'SMEDEST'),
+    }),
+    ('CopyFromSmeDest', {
+        'bl_label': 'Copy from this item',
+        'bl_description': 'Copies this item into the internal clipboard',
+        'source_dest_pair': ('SMEDEST', 'INTERNALCLIPBOARD'),
+    }),
+)
+
+
+# (base operator, shared defaults, variant rows)
+operator_variant_tables = (
+    (MAPLUS_OT_CopyToOtherBase, COPY_TO_OTHER_DEFAULTS, COPY_TO_OTHER_VARIANTS),
+)
@@ -0,0 +1,256 @@
+"""Topology bound items, their coords resolved from mesh elements on read."""
+
+
+import bpy
+import numpy
+
+
+# Element data of bound mesh objects (see MeshElements), keyed by object
+# pointer. An entry is dropped when a depsgraph update changes its
+# object's geometry or transform, and rebuilt on the next read
+_mesh_elements = {}
+
+# Stored coords attribs of each geometry kind, one per point
+COORD_ATTRIBS = {
+    'POINT': ('point',),
+    'LINE': ('line_start', 'line_end'),
+    'PLANE': ('plane_pt_a', 'plane_pt_b', 'plane_pt_c'),
+}
+
+
+class MeshElements(object):
+    '''World space element data of one mesh object, read in bulk.
+
+    Vert coords are read with one foreach_get when the object is first
+    resolved, face data (centers, normals, vert lists) on the first face
+    lookup. Any number of items bound to the object share them.
+    '''
+
+    def __init__(self, mesh_object):
+        if mesh_object.mode == 'EDIT':
+            mesh_object.update_from_editmode()
+        self.mesh = mesh_object.data
+        self.matrix = numpy.array(mesh_object.matrix_world)
+        self.vert_coords = self.transform(
+            self.read(self.mesh.vertices, 'co', numpy.float32, 3)
+        )
+        self.faces = None
+
+    @staticmethod
+    def read(collection, attribute, dtype, width=1):
+        values = numpy.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        return values.reshape(-1, width) if width > 1 else values
+
+    def transform(self, coords):
+        return (
+            coords.astype(numpy.float64) @ self.matrix[:3, :3].T +
+            self.matrix[:3, 3]
+        )
+
+    def get_faces(self):
+        '''Return (centers, unit normals, loop starts, loop totals, loop
+        verts) arrays of the mesh's faces, world space.'''
+        if self.faces is None:
+            polygons = self.mesh.polygons
+            normals = (
+                self.read(polygons, 'normal', numpy.float32, 3) @
+                numpy.linalg.inv(self.matrix[:3, :3])
+            )
+            lengths = numpy.linalg.norm(normals, axis=1)[:, numpy.newaxis]
+            self.faces = (
+                self.transform(
+                    self.read(polygons, 'center', numpy.float32, 3)
+                ),
+                normals / numpy.where(lengths > 0, lengths, 1.0),
+                self.read(polygons, 'loop_start', numpy.int32),
+                self.read(polygons, 'loop_total', numpy.int32),
+                self.read(self.mesh.loops, 'vertex_index', numpy.int32),
+            )
+        return self.faces
+
+    def resolve(self, element, indices, kind):
+        '''Resolve many items bound to this mesh at once.
+
+        Arguments:
+            element
+                'VERT' or 'FACE', see MAPlusPrimitive.bind_element
+            indices
+                (items, 3) int array of the items' bind_indices
+            kind
+                'POINT', 'LINE' or 'PLANE', the kind of all the items
+
+        Returns:
+            Return an (items, points, 3) float64 array and an (items,)
+            bool array, False where an index is out of range (the coords
+            of those items are garbage).
+        '''
+        point_count = len(COORD_ATTRIBS[kind])
+        if element == 'VERT':
+            vert_indices = indices[:, :point_count]
+            valid = (
+                (vert_indices >= 0) &
+                (vert_indices < len(self.vert_coords))
+            ).all(axis=1)
+            if not valid.any():
+                return numpy.zeros((len(indices), point_count, 3)), valid
+            vert_indices = numpy.where(
+                valid[:, numpy.newaxis],
+                vert_indices,
+                0
+            )
+            return self.vert_coords[vert_indices], valid
+
+        centers, normals, loop_starts, loop_totals, loop_verts = (
+            self.get_faces()
+        )
+        face_indices = indices[:, 0]
+        valid = (face_indices >= 0) & (face_indices < len(centers))
+        face_indices = numpy.where(valid, face_indices, 0)
+        if kind == 'PLANE':
+            valid &= loop_totals[face_indices] >= 3
+        if not valid.any():
+            return numpy.zeros((len(indices), point_count, 3)), valid
+        if kind == 'POINT':
+            return centers[face_indices][:, numpy.newaxis], valid
+        if kind == 'LINE':
+            return numpy.stack(
+                (
+                    centers[face_indices],
+                    centers[face_indices] + normals[face_indices]
+                ),
+                axis=1
+            ), valid
+        # The face's first 3 verts, in reverse (align planes takes
+        # (A - B) x (C - B) as the normal, which then matches the face's)
+        loops = (
+            loop_starts[face_indices][:, numpy.newaxis] +
+            numpy.arange(2, -1, -1)
+        )
+        loops = numpy.where(valid[:, numpy.newaxis], loops, 0)
+        return self.vert_coords[loop_verts[loops]], valid
+
+
+def get_mesh_elements(mesh_object):
+    key = mesh_object.as_pointer()
+    if key not in _mesh_elements:
+        _mesh_elements[key] = MeshElements(mesh_object)
+    return _mesh_elements[key]
+
+
+def resolve_items(items, kind):
+    '''Resolve the world coords of many bound items of one kind.
+
+    Items are grouped by bound object and element type, every group is
+    resolved with a single array lookup.
+
+    Returns:
+        Return a list with, for each item, its list of (3,) coord arrays,
+        or None if it isn't bound or its binding is broken (the object is
+        gone/not a mesh, or an index is out of range).
+    '''
+    resolved = [None] * len(items)
+    groups = {}
+    for position, item in enumerate(items):
+        mesh_object = getattr(item, 'bind_object', None)
+        if not mesh_object or mesh_object.type != 'MESH':
+            continue
+        groups.setdefault(
+            (mesh_object.as_pointer(), item.bind_element),
+            (mesh_object, [])
+        )[1].append(position)
+
+    for (pointer, element), (mesh_object, positions) in groups.items():
+        indices = numpy.array(
+            [items[position].bind_indices[:] for position in positions],
+            dtype=numpy.int64
+        ).reshape(-1, 3)
+        coords, valid = get_mesh_elements(mesh_object).resolve(
+            element,
+            indices,
+            kind
+        )
+        for position, item_coords, item_valid in zip(
+                positions, coords, valid.tolist()):
+            if item_valid:
+                resolved[position] = list(item_coords)
+    return resolved
+
+
+def get_item_coords(item, kind):
+    '''Return an item's coords for a kind, resolved if it is bound.
+
+    Bound items with a broken binding fall back to their stored coords
+    (the ones last resolved).
+
+    Returns:
+        Return a list of 1 to 3 coords (vectors or (3,) arrays), or None
+        for a kind that has no coords.
+    '''
+    if kind not in COORD_ATTRIBS:
+        return None
+    if getattr(item, 'bind_object', None):
+        coords = resolve_items([item], kind)[0]
+        if coords is not None:
+            return coords
+    return [getattr(item, attrib) for attrib in COORD_ATTRIBS[kind]]
+
+
+def store_resolved_coords(items):
+    '''Write the resolved coords of bound items into their stored coords.
+
+    Returns:
+        Return the number of items whose binding is broken (left as
+        they were).
+    '''
+    broken_count = 0
+    by_kind = {}
+    for item in items:
+        by_kind.setdefault(item.kind, []).append(item)
+    for kind, kind_items in by_kind.items():
+        if kind not in COORD_ATTRIBS:
+            continue
+        for item, coords in zip(kind_items, resolve_items(kind_items, kind)):
+            if coords is None:
+                broken_count += 1
+                continue
+            for attrib, co in zip(COORD_ATTRIBS[kind], coords):
+                setattr(item, attrib, co)
+    return broken_count
+
+
+def unbind_item(item):
+    '''Freeze a bound item at its resolved coords and drop its binding.
+
+    Called before an item's stored coords are written (grabbed, swapped,
+    modifiers applied), otherwise the next read would resolve from the
+    mesh again and the written coords would be lost. Points that aren't
+    written keep the coords they resolved to. A broken binding keeps the
+    coords last stored.
+    '''
+    if not getattr(item, 'bind_object', None):
+        return
+    store_resolved_coords([item])
+    item.bind_object = None
+
+
+@bpy.app.handlers.persistent
+def update_mesh_elements(scene, depsgraph):
+    # Drop the element data of objects whose geometry or transform changed
+    if not _mesh_elements:
+        return
+    for update in depsgraph.updates:
+        if not (update.is_updated_geometry or update.is_updated_transform):
+            continue
+        updated_id = update.id.original
+        if isinstance(updated_id, bpy.types.Object):
+            _mesh_elements.pop(updated_id.as_pointer(), None)
+        else:
+            # (Mesh data can be shared by several objects)
+            _mesh_elements.clear()
+            return
+
+
+@bpy.app.handlers.persistent
+def clear_mesh_elements(*args):
+    _mesh_elements.clear()